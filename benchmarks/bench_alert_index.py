@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Evaluate a large alert book against one batch of quotes.
+
+Compares the per-alert Python loop that check_alerts used to run with the
+price-level index (one NumPy pass over all alerts), and times bisect
+lookups of newly crossed levels for single streaming quotes.
+
+Usage:
+    python -m benchmarks.bench_alert_index
+    python -m benchmarks.bench_alert_index --alerts 100000 --tickers 5000
+"""
+
+import argparse
+import random
+import time
+
+from vfinance_news.alert_index import AlertIndex
+
+
+def _timed(fn, repeat: int) -> float:
+    """Best wall time of `repeat` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def linear_scan(alerts: list[dict], prices: dict) -> int:
+    triggered = 0
+    for alert in alerts:
+        price = prices.get(alert["ticker"])
+        if price is not None and price <= alert["target_price"]:
+            triggered += 1
+    return triggered
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alert index benchmark")
+    parser.add_argument("--alerts", type=int, default=100_000)
+    parser.add_argument("--tickers", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    tickers = [f"T{i:05d}" for i in range(args.tickers)]
+    base = {t: rng.uniform(5, 500) for t in tickers}
+    alerts = [
+        {"ticker": t, "target_price": base[t] * rng.uniform(0.7, 1.05)}
+        for t in (rng.choice(tickers) for _ in range(args.alerts))
+    ]
+    prices = {t: p * rng.uniform(0.95, 1.05) for t, p in base.items()}
+    prev_prices = {t: p * rng.uniform(0.95, 1.05) for t, p in base.items()}
+
+    build_ms = _timed(lambda: AlertIndex(alerts), args.repeat)
+    index = AlertIndex(alerts)
+    linear_ms = _timed(lambda: linear_scan(alerts, prices), args.repeat)
+    evaluate_ms = _timed(lambda: index.evaluate(prices, prev_prices), args.repeat)
+
+    sample = rng.sample(tickers, 1000)
+    for t in sample:
+        index.levels(t)  # warm the per-ticker level lists
+    bisect_ms = _timed(lambda: [index.newly_triggered(t, prices[t], prev_prices[t]) for t in sample], args.repeat)
+
+    evaluation = index.evaluate(prices, prev_prices)
+    assert int(evaluation.triggered.sum()) == linear_scan(alerts, prices)
+
+    print(f"{args.alerts:,} alerts across {args.tickers:,} tickers "
+          f"({int(evaluation.triggered.sum()):,} triggered, {int(evaluation.new.sum()):,} new)")
+    print(f"  build index          {build_ms:8.1f} ms")
+    print(f"  linear scan          {linear_ms:8.1f} ms")
+    print(f"  vectorized evaluate  {evaluate_ms:8.1f} ms")
+    print(f"  1,000 bisect lookups {bisect_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Evaluate rule alerts over a year of daily closes.
+
+Writes synthetic history for every ticker into a temporary price store,
+sets one alert of each rule type per ticker (20-day high drop, 50- and
+200-day MA cross, 52-week low, drawdown from cost), and times loading the
+close matrix from the store and the vectorized rule evaluation.
+
+Usage:
+    python -m benchmarks.bench_alert_rules
+    python -m benchmarks.bench_alert_rules --tickers 5000 --days 500
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from vfinance_news import alert_rules, price_store
+
+
+def _timed(fn, repeat: int) -> float:
+    """Best wall time of `repeat` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rule alert benchmark")
+    parser.add_argument("--tickers", type=int, default=1_000)
+    # One year of sessions plus today, so the 52-week low has a full window
+    parser.add_argument("--days", type=int, default=253)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    tickers = [f"T{i:05d}" for i in range(args.tickers)]
+    closes = 100 * np.cumprod(1 + rng.normal(0, 0.02, (args.tickers, args.days)), axis=1)
+    days = [date(2025, 1, 1) + timedelta(days=i) for i in range(args.days)]
+
+    alerts = []
+    for i, ticker in enumerate(tickers):
+        alerts += [
+            {"ticker": ticker, "rule": "drop_from_high", "window": 20, "threshold_pct": 10.0},
+            {"ticker": ticker, "rule": "ma_cross_below", "window": 50},
+            {"ticker": ticker, "rule": "ma_cross_below", "window": 200},
+            {"ticker": ticker, "rule": "low_52w"},
+            {"ticker": ticker, "rule": "drawdown_from_cost", "cost_basis": float(closes[i, 0]), "threshold_pct": 15.0},
+        ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        price_store.PRICE_STORE_DIR = Path(tmp)
+        for ticker, row in zip(tickers, closes):
+            price_store.record_closes(ticker, list(zip(days, row.tolist())))
+
+        rows = np.repeat(np.arange(args.tickers), 5)
+        load_ms = _timed(lambda: price_store.load_close_matrix(tickers, args.days), args.repeat)
+        matrix = price_store.load_close_matrix(tickers, args.days)
+        compute_ms = _timed(lambda: alert_rules.evaluate_matrix(alerts, rows, matrix), args.repeat)
+        total_ms = _timed(lambda: alert_rules.evaluate_rules(alerts), args.repeat)
+        triggered, watching, _ = alert_rules.evaluate_rules(alerts)
+
+    print(f"{len(alerts):,} rule alerts across {args.tickers:,} tickers x {args.days} sessions "
+          f"({len(triggered):,} triggered, {len(watching):,} watching)")
+    print(f"  load close matrix    {load_ms:8.1f} ms")
+    print(f"  vectorized rules     {compute_ms:8.1f} ms")
+    print(f"  evaluate_rules total {total_ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Earnings queries for large portfolios.
+
+Compares the scan check_earnings used to run (every entry parsed and
+matched to its portfolio row with a linear search) with building the
+date/ticker index once and answering today / this week / next week
+with bisects.
+
+Usage:
+    python -m benchmarks.bench_earnings_index
+    python -m benchmarks.bench_earnings_index --symbols 20000
+"""
+
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from vfinance_news.earnings import EarningsIndex
+
+
+def _timed(fn, repeat: int) -> float:
+    """Best wall time of `repeat` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def linear_scan(earnings: dict, portfolio: list[dict], today: date) -> tuple[int, int]:
+    week_end = today + timedelta(days=7)
+    today_count = week_count = 0
+    for ticker, data in earnings.items():
+        ed = datetime.strptime(data["date"], "%Y-%m-%d").date()
+        stock = next((s for s in portfolio if s["symbol"] == ticker), None)
+        _ = stock["name"] if stock else ticker
+        if ed == today:
+            today_count += 1
+        elif today < ed <= week_end:
+            week_count += 1
+    return today_count, week_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Earnings index benchmark")
+    parser.add_argument("--symbols", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    today = date(2026, 10, 19)
+    portfolio = [{"symbol": f"T{i:05d}", "name": f"Company {i}", "category": "Tech"} for i in range(args.symbols)]
+    earnings = {
+        stock["symbol"]: {
+            "date": (today + timedelta(days=rng.randint(-14, 90))).isoformat(),
+            "time": rng.choice(["bmo", "amc", ""]),
+            "eps_estimate": round(rng.uniform(-1, 5), 2),
+        }
+        for stock in portfolio
+    }
+
+    def indexed():
+        index = EarningsIndex(earnings, portfolio)
+        return len(index.on(today)), len(index.this_week(today)), len(index.next_week(today)[2])
+
+    scan_ms = _timed(lambda: linear_scan(earnings, portfolio, today), args.repeat)
+    build_ms = _timed(lambda: EarningsIndex(earnings, portfolio), args.repeat)
+    index = EarningsIndex(earnings, portfolio)
+    query_ms = _timed(lambda: (index.on(today), index.this_week(today), index.next_week(today)), args.repeat)
+    today_count, week_count, next_week_count = indexed()
+    assert (today_count, week_count) == linear_scan(earnings, portfolio, today)
+
+    print(f"{args.symbols:,} portfolio symbols ({today_count} today, {week_count} this week, "
+          f"{next_week_count} next week)")
+    print(f"  linear scan          {scan_ms:8.1f} ms")
+    print(f"  build index          {build_ms:8.1f} ms")
+    print(f"  3 indexed queries    {query_ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Memory held per article, quote and portfolio entry.
+
+Builds the same synthetic records as plain dicts (the shape fetch_rss,
+ranking and _build_quote produce) and as the slotted models, decoding them
+from JSON so every record owns its strings the way parsed feeds do, and
+reports the bytes retained per record with tracemalloc.
+
+Usage:
+    python -m benchmarks.bench_models_memory
+    python -m benchmarks.bench_models_memory --articles 200000
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+
+from vfinance_news.models import Article, PortfolioEntry, Quote
+
+SOURCES = ["Reuters", "Bloomberg", "CNBC", "Yahoo Finance", "MarketWatch", "WSJ", "Financial Times", "Barron's"]
+CATEGORIES = [["macro"], ["tech", "company_specific"], ["energy"], ["equity_broad"], ["general"]]
+
+
+def _retained(build) -> tuple[int, object]:
+    """Bytes still allocated after build() returns (the result is kept alive)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def _articles_payload(count: int) -> bytes:
+    return json.dumps([
+        {
+            "title": f"Headline number {i} moves markets",
+            "link": f"https://news.example.com/articles/{i}",
+            "date": "Mon, 19 Oct 2026 07:30:00 GMT",
+            "published_at": 1792395000.0 + i,
+            "description": f"Short description for story {i}.",
+            "source": SOURCES[i % len(SOURCES)],
+            "feed": "top",
+            "_score": 0.5,
+            "_impact": 0.45,
+            "_novelty": 0.8,
+            "_categories": CATEGORIES[i % len(CATEGORIES)],
+            "_pure_company_specific": False,
+        }
+        for i in range(count)
+    ]).encode("utf-8")
+
+
+def _quotes_payload(count: int) -> bytes:
+    return json.dumps([
+        {"price": 100.0 + i, "change_percent": 1.25, "prev_close": 99.0 + i, "symbol": f"T{i:05d}"}
+        for i in range(count)
+    ]).encode("utf-8")
+
+
+def _portfolio_payload(count: int) -> bytes:
+    return json.dumps([
+        {"symbol": f"T{i:05d}", "name": f"Company {i}", "category": f"Sector {i % 11}", "notes": "",
+         "type": "Holding" if i % 3 else "Watchlist"}
+        for i in range(count)
+    ]).encode("utf-8")
+
+
+def _report(label: str, count: int, payload: bytes, to_model) -> None:
+    dict_bytes, dicts = _retained(lambda: json.loads(payload))
+    del dicts
+    model_bytes, models = _retained(lambda: [to_model(d) for d in json.loads(payload)])
+    # Models must round-trip to the dict shape
+    assert [m.to_dict() for m in models[:3]] == json.loads(payload)[:3]
+    del models
+    saved = 100 * (1 - model_bytes / dict_bytes) if dict_bytes else 0.0
+    print(f"  {label:<16} {dict_bytes / count:8.0f} B/dict  {model_bytes / count:8.0f} B/model  ({saved:.0f}% less)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model memory benchmark")
+    parser.add_argument("--articles", type=int, default=50_000)
+    parser.add_argument("--quotes", type=int, default=5_000)
+    parser.add_argument("--portfolio", type=int, default=5_000)
+    args = parser.parse_args()
+
+    print(f"{args.articles:,} articles, {args.quotes:,} quotes, {args.portfolio:,} portfolio entries")
+    _report("article", args.articles, _articles_payload(args.articles), Article.from_dict)
+    _report("quote", args.quotes, _quotes_payload(args.quotes), Quote.from_dict)
+    _report("portfolio entry", args.portfolio, _portfolio_payload(args.portfolio), PortfolioEntry.from_row)
+
+
+if __name__ == "__main__":
+    main()
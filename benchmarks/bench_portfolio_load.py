@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Load a large portfolio CSV through the compiled snapshot.
+
+Writes a synthetic portfolio CSV and times compiling it (one parse and
+validation pass, snapshot written), loading the pickled snapshot as a new
+process would, and the in-process hit every later call gets.
+
+Usage:
+    python -m benchmarks.bench_portfolio_load
+    python -m benchmarks.bench_portfolio_load --symbols 20000
+"""
+
+import argparse
+import csv
+import tempfile
+import time
+from pathlib import Path
+
+from vfinance_news import portfolio
+
+
+def _timed(fn, repeat: int) -> float:
+    """Best wall time of `repeat` runs, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Portfolio load benchmark")
+    parser.add_argument("--symbols", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "portfolio.csv"
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(portfolio.DEFAULT_COLUMNS)
+            for i in range(args.symbols):
+                writer.writerow([f"T{i:05d}", f"Company {i}", f"Sector {i % 11}", "", "Holding" if i % 3 else "Watchlist"])
+        portfolio.SNAPSHOT_DIR = Path(tmp) / "snapshots"
+
+        def compile_fresh():
+            portfolio._loaded.clear()
+            for snapshot in portfolio.SNAPSHOT_DIR.glob("*.pickle"):
+                snapshot.unlink()
+            portfolio.load_snapshot(csv_path)
+
+        def load_pickled():
+            portfolio._loaded.clear()
+            portfolio.load_snapshot(csv_path)
+
+        compile_us = _timed(compile_fresh, args.repeat)
+        pickle_us = _timed(load_pickled, args.repeat)
+        memory_us = _timed(lambda: portfolio.load_snapshot(csv_path), args.repeat)
+        symbols_us = _timed(lambda: portfolio.portfolio_symbols(csv_path), args.repeat)
+
+    print(f"{args.symbols:,} portfolio rows")
+    print(f"  parse + validate + write snapshot {compile_us / 1000:8.2f} ms")
+    print(f"  load pickled snapshot             {pickle_us / 1000:8.2f} ms")
+    print(f"  in-process snapshot hit           {memory_us:8.1f} us")
+    print(f"  portfolio_symbols()               {symbols_us:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Bulk watchlist import into stocks.json.
+
+Times adding N tickers one add_to_watchlist() call at a time (each call
+loads, updates and rewrites the whole file) against one StocksStore batch
+that applies every add and writes the file once.
+
+Usage:
+    python -m benchmarks.bench_stocks_store
+    python -m benchmarks.bench_stocks_store --tickers 5000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from vfinance_news import stocks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stocks store benchmark")
+    parser.add_argument("--tickers", type=int, default=1_000)
+    args = parser.parse_args()
+    tickers = [f"T{i:05d}" for i in range(args.tickers)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stocks.STOCKS_FILE = Path(tmp) / "per_call.json"
+        start = time.perf_counter()
+        for ticker in tickers:
+            stocks.add_to_watchlist(ticker, target=100.0)
+        per_call = time.perf_counter() - start
+
+        batch_file = Path(tmp) / "batch.json"
+        start = time.perf_counter()
+        with stocks.StocksStore(batch_file) as store:
+            for ticker in tickers:
+                store.add_to_watchlist(ticker, target=100.0)
+        batch = time.perf_counter() - start
+
+        assert len(stocks.load_stocks(batch_file)["watchlist"]) == args.tickers
+
+    print(f"{args.tickers:,} watchlist adds")
+    print(f"  one write per add   {per_call * 1000:10.1f} ms")
+    print(f"  one batched write   {batch * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
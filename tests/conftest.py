@@ -0,0 +1,16 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_alert_log(tmp_path, monkeypatch):
+    """Keep alert checks from appending to the real cache/alert_log."""
+    from vfinance_news import alert_log
+    monkeypatch.setattr(alert_log, "LOG_DIR", tmp_path / "alert_log")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_portfolio_snapshots(tmp_path, monkeypatch):
+    """Compile portfolio snapshots into the test's tmp dir, not cache/portfolio."""
+    from vfinance_news import portfolio
+    monkeypatch.setattr(portfolio, "SNAPSHOT_DIR", tmp_path / "portfolio_snapshots")
+    monkeypatch.setattr(portfolio, "_loaded", {})
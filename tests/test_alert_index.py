@@ -0,0 +1,61 @@
+"""Tests for the price-level alert index."""
+import numpy as np
+import pytest
+
+from vfinance_news.alert_index import AlertIndex
+
+
+@pytest.fixture
+def index():
+    return AlertIndex([
+        {"ticker": "MSFT", "target_price": 300.0},
+        {"ticker": "AAPL", "target_price": 150.0},
+        {"ticker": "AAPL", "target_price": 120.0},
+        {"ticker": "AAPL", "target_price": 180.0},
+    ])
+
+
+def test_levels_are_sorted_per_ticker(index):
+    assert index.levels("AAPL") == [120.0, 150.0, 180.0]
+    assert index.levels("MSFT") == [300.0]
+    assert index.levels("NVDA") == []
+
+
+def test_triggered_and_newly_triggered_levels(index):
+    assert [a["target_price"] for a in index.triggered("AAPL", 150.0)] == [150.0, 180.0]
+    assert [a["target_price"] for a in index.newly_triggered("AAPL", 140.0, prev_price=190.0)] == [150.0, 180.0]
+    assert [a["target_price"] for a in index.newly_triggered("AAPL", 140.0, prev_price=160.0)] == [150.0]
+    assert index.newly_triggered("AAPL", 160.0, prev_price=140.0) == []
+    assert [a["target_price"] for a in index.newly_triggered("AAPL", 175.0)] == [180.0]
+    assert index.nearest_untriggered("AAPL", 140.0) == 120.0
+    assert index.nearest_untriggered("AAPL", 100.0) is None
+
+
+def test_evaluate_keeps_input_order(index):
+    evaluation = index.evaluate({"AAPL": 150.0, "MSFT": None}, prev_prices={"AAPL": 170.0})
+
+    assert evaluation.has_price().tolist() == [False, True, True, True]
+    assert evaluation.triggered.tolist() == [False, True, False, True]
+    assert evaluation.new.tolist() == [False, True, False, False]
+    assert evaluation.pct_from_target[1] == 0.0
+    assert evaluation.pct_from_target[2] == pytest.approx(25.0)
+
+
+def test_evaluate_matches_linear_scan():
+    rng = np.random.default_rng(7)
+    tickers = [f"T{i}" for i in range(50)]
+    alerts = [
+        {"ticker": tickers[rng.integers(50)], "target_price": float(rng.uniform(1, 100))}
+        for _ in range(2000)
+    ]
+    prices = {t: float(rng.uniform(1, 100)) for t in tickers[:45]}
+
+    evaluation = AlertIndex(alerts).evaluate(prices)
+
+    expected = [a["ticker"] in prices and prices[a["ticker"]] <= a["target_price"] for a in alerts]
+    assert evaluation.triggered.tolist() == expected
+
+
+def test_empty_index():
+    evaluation = AlertIndex([]).evaluate({"AAPL": 1.0})
+    assert len(evaluation.triggered) == 0
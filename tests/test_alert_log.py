@@ -0,0 +1,109 @@
+"""Tests for the append-only alert event log."""
+import json
+import threading
+from datetime import date, datetime
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from vfinance_news import alert_log, alerts
+
+
+def _event(ticker, ts, price, target=150.0, triggered=True, **extra):
+    return {"ts": ts, "ticker": ticker, "triggered": triggered, "price": price,
+            "target": target, "pct_from_target": round((price - target) / target * 100, 2), **extra}
+
+
+def test_append_indexes_triggers_only():
+    alert_log.append_events([
+        _event("AAPL", "2026-10-19T09:00:00", 145.0),
+        _event("TSLA", "2026-10-19T09:00:00", 210.0, target=200.0, triggered=False),
+    ])
+    alert_log.append_events([_event("AAPL", "2026-10-19T10:00:00", 144.0)])
+
+    index = (alert_log.LOG_DIR / "index.tsv").read_text().splitlines()
+    assert [row.split("\t")[0] for row in index] == ["AAPL", "AAPL"]
+    log = (alert_log.LOG_DIR / "events.ndjson").read_bytes()
+    offset, length = map(int, index[1].split("\t")[1:])
+    assert json.loads(log[offset:offset + length])["price"] == 144.0
+
+
+def test_trigger_history_reads_through_index_without_scanning_log():
+    alert_log.append_events([_event("AAPL", "2026-10-19T09:00:00", 145.0)])
+    with patch.object(alert_log.Path, "read_bytes", side_effect=AssertionError("full log scan")):
+        history = alert_log.trigger_history(["AAPL", "TSLA"])
+    assert history == {"AAPL": [{"date": "2026-10-19", "triggers": 1, "low": 145.0, "targets": [150.0],
+                                 "first_triggered": "2026-10-19T09:00:00"}]}
+
+
+def test_compact_rolls_earlier_days_into_summaries():
+    alert_log.append_events([
+        _event("AAPL", "2026-10-17T09:00:00", 152.0, triggered=False),
+        _event("AAPL", "2026-10-17T10:00:00", 148.0),
+        _event("AAPL", "2026-10-17T11:00:00", 146.0),
+        _event("NVDA", "2026-10-18T09:00:00", 90.0, target=95.0, rule="ma_cross_below"),
+        _event("AAPL", "2026-10-19T09:00:00", 149.0),
+    ])
+    assert alert_log.needs_compaction(date(2026, 10, 19))
+
+    stats = alert_log.compact(date(2026, 10, 19))
+
+    assert stats == {"events": 4, "days": 2}
+    assert not alert_log.needs_compaction(date(2026, 10, 19))
+    summary = alert_log.load_summaries()["AAPL"]["2026-10-17"]
+    assert summary == {"evaluations": 3, "triggers": 2, "low": 146.0, "high": 152.0, "last": 146.0,
+                       "targets": [150.0], "first_triggered": "2026-10-17T10:00:00"}
+    assert len((alert_log.LOG_DIR / "events.ndjson").read_text().splitlines()) == 1
+
+    history = alert_log.trigger_history(["AAPL", "NVDA"])
+    assert [entry["date"] for entry in history["AAPL"]] == ["2026-10-19", "2026-10-17"]
+    assert history["NVDA"][0]["targets"] == ["ma_cross_below"]
+
+
+def test_compact_skips_partial_lines():
+    alert_log.append_events([_event("AAPL", "2026-10-17T09:00:00", 145.0)])
+    with open(alert_log.LOG_DIR / "events.ndjson", "ab") as f:
+        f.write(b'{"ts": "2026-10-1')
+    assert alert_log.compact(date(2026, 10, 19))["events"] == 1
+    assert (alert_log.LOG_DIR / "events.ndjson").read_bytes() == b""
+
+
+
+def test_append_waits_for_running_compaction():
+    alert_log.append_events([_event("AAPL", "2026-10-17T09:00:00", 145.0)])
+    appender = threading.Thread(
+        target=alert_log.append_events, args=([_event("AAPL", "2026-10-19T09:30:00", 144.0)],)
+    )
+    with alert_log._locked():
+        appender.start()
+        appender.join(0.2)
+        # Blocked on the lock, so the compaction below cannot drop its line
+        assert appender.is_alive()
+        stats = alert_log._compact(alert_log._events_path(), "2026-10-19")
+    appender.join(5)
+
+    assert stats["events"] == 1
+    lines = (alert_log.LOG_DIR / "events.ndjson").read_text().splitlines()
+    assert [json.loads(line)["price"] for line in lines] == [144.0]
+
+def test_check_alerts_logs_every_evaluation_and_list_shows_history(tmp_path, monkeypatch, capsys):
+    alerts_file = tmp_path / "alerts.json"
+    monkeypatch.setattr(alerts, "ALERTS_FILE", alerts_file)
+    alerts_file.write_text(json.dumps({"_meta": {"version": 1}, "alerts": [
+        {"ticker": "AAPL", "target_price": 150.0, "currency": "USD"},
+        {"ticker": "TSLA", "target_price": 200.0, "currency": "USD"},
+    ]}))
+    quotes = {"AAPL": {"price": 145.0}, "TSLA": {"price": 210.0}}
+    with patch("vfinance_news.alerts.get_fetch_market_data", return_value=Mock(return_value=quotes)):
+        alerts.check_alerts()
+
+    lines = (alert_log.LOG_DIR / "events.ndjson").read_text().splitlines()
+    events = [json.loads(line) for line in lines]
+    assert [(e["ticker"], e["triggered"], e["target"]) for e in events] == [
+        ("AAPL", True, 150.0), ("TSLA", False, 200.0)
+    ]
+
+    alerts.cmd_list(SimpleNamespace(history=5))
+    out = capsys.readouterr().out
+    today = datetime.now().strftime("%Y-%m-%d")
+    assert f"AAPL {today}: 1× (low $145.00; $150.00)" in out
+    assert "TSLA" not in out.split("### Trigger History")[1]
@@ -0,0 +1,170 @@
+"""Tests for history-based rule alerts."""
+import json
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from vfinance_news import alert_rules, alert_store, alerts, price_store
+
+
+@pytest.fixture
+def store_dir(tmp_path, monkeypatch):
+    path = tmp_path / "prices"
+    monkeypatch.setattr(price_store, "PRICE_STORE_DIR", path)
+    return path
+
+
+@pytest.fixture
+def alerts_file(tmp_path, monkeypatch):
+    path = tmp_path / "alerts.json"
+    path.write_text(json.dumps({"_meta": {"version": 1}, "alerts": []}))
+    monkeypatch.setattr(alerts, "ALERTS_FILE", path)
+    return path
+
+
+def _store(symbol, closes):
+    start = date(2025, 1, 1)
+    price_store.record_closes(symbol, [(start + timedelta(days=i), c) for i, c in enumerate(closes)])
+
+
+def _rule(ticker, rule, **params):
+    return {"ticker": ticker, "target_price": None, "rule": rule, "currency": "USD", **params}
+
+
+def test_rolling_mean_matches_pandas_and_skips_gaps():
+    import pandas as pd
+
+    matrix = np.arange(20, dtype=float).reshape(2, 10)
+    matrix[1, 2] = np.nan
+    means = alert_rules.rolling_mean(matrix, 3)
+    expected = pd.DataFrame(matrix.T).rolling(3).mean().to_numpy().T[:, 2:]
+    np.testing.assert_allclose(means, expected)
+    assert np.isnan(means[1, :3]).all()
+
+
+def test_load_close_matrix_right_aligns_and_pads(store_dir):
+    _store("AAA", [1.0, 2.0, 3.0])
+    _store("BBB", [5.0])
+    matrix = price_store.load_close_matrix(["AAA", "BBB", "CCC"], 3)
+    np.testing.assert_array_equal(matrix[0], [1.0, 2.0, 3.0])
+    assert np.isnan(matrix[1, :2]).all() and matrix[1, 2] == 5.0
+    assert np.isnan(matrix[2]).all()
+
+
+def test_drop_from_high(store_dir):
+    _store("DROP", [100.0] * 5 + [120.0] + [110.0] * 3 + [100.0])
+    _store("FLAT", [100.0] * 10)
+    triggered, watching, hits = alert_rules.evaluate_rules([
+        _rule("DROP", "drop_from_high", window=10, threshold_pct=15),
+        _rule("FLAT", "drop_from_high", window=10, threshold_pct=15),
+    ])
+    assert [t["ticker"] for t in triggered] == ["DROP"]
+    assert triggered[0]["level"] == pytest.approx(102.0)
+    assert hits[0]["ticker"] == "DROP"
+    assert watching[0]["ticker"] == "FLAT"
+    assert watching[0]["pct_from_level"] == pytest.approx(17.65, abs=0.01)
+
+
+def test_ma_cross_below_fires_only_on_crossing_session(store_dir):
+    _store("CROSS", [100.0] * 5 + [90.0])
+    _store("BELOW", [100.0] * 4 + [90.0, 89.0])
+    triggered, watching, _ = alert_rules.evaluate_rules([
+        _rule("CROSS", "ma_cross_below", window=5),
+        _rule("BELOW", "ma_cross_below", window=5),
+    ])
+    assert [t["ticker"] for t in triggered] == ["CROSS"]
+    assert triggered[0]["level"] == pytest.approx(98.0)
+    assert [w["ticker"] for w in watching] == ["BELOW"]
+
+
+def test_low_52w_needs_a_full_prior_window(store_dir):
+    _store("LOW", list(np.linspace(200, 150, 252)) + [140.0])
+    _store("SHORT", [100.0, 90.0])
+    triggered, watching, _ = alert_rules.evaluate_rules([
+        _rule("LOW", "low_52w"),
+        _rule("SHORT", "low_52w"),
+    ])
+    assert [t["ticker"] for t in triggered] == ["LOW"]
+    assert triggered[0]["level"] == pytest.approx(150.0)
+    assert triggered[0]["description"] == "new 52-week low"
+    assert watching == []
+
+
+def test_drawdown_from_cost(store_dir):
+    _store("DD", [100.0, 79.0])
+    triggered, watching, _ = alert_rules.evaluate_rules([
+        _rule("DD", "drawdown_from_cost", cost_basis=100.0, threshold_pct=20),
+        _rule("DD", "drawdown_from_cost", cost_basis=100.0, threshold_pct=25),
+    ])
+    assert [t["level"] for t in triggered] == [80.0]
+    assert [w["level"] for w in watching] == [75.0]
+
+
+def test_evaluate_matrix_matches_per_ticker_loop():
+    rng = np.random.default_rng(7)
+    matrix = 100 * np.cumprod(1 + rng.normal(0, 0.02, (200, 60)), axis=1)
+    alerts_list = [_rule(f"T{i}", "ma_cross_below", window=20) for i in range(200)]
+    evaluation = alert_rules.evaluate_matrix(alerts_list, np.arange(200), matrix)
+
+    for i in range(200):
+        closes = matrix[i]
+        ma_now, ma_prev = closes[-20:].mean(), closes[-21:-1].mean()
+        assert evaluation.level[i] == pytest.approx(ma_now)
+        assert evaluation.triggered[i] == (closes[-2] >= ma_prev and closes[-1] < ma_now)
+
+
+def test_backfill_downloads_only_short_histories(store_dir):
+    import pandas as pd
+
+    _store("FULL", [100.0] * 30)
+    series = pd.Series([1.0, 2.0], index=pd.to_datetime(["2025-02-03", "2025-02-04"]))
+    with patch("vfinance_news.fetch_news._download_closes", return_value={"SHORT": series}) as download:
+        result = alert_rules.backfill_history([
+            _rule("FULL", "drop_from_high", window=20),
+            _rule("SHORT", "low_52w"),
+        ])
+    download.assert_called_once()
+    assert download.call_args[0][:2] == (["SHORT"], "2y")
+    assert result == {"SHORT": 2}
+    assert len(price_store.load_history("SHORT")) == 2
+
+
+def test_cmd_rule_and_check_json(store_dir, alerts_file, capsys):
+    args = SimpleNamespace(ticker="dd", rule="drawdown_from_cost", window=None, pct=20.0, cost=100.0,
+                           note="stop", user="", currency="USD")
+    alerts.cmd_rule(args)
+    alerts.cmd_rule(args)
+    out = capsys.readouterr().out
+    assert "✅ Rule alert set: DD 20% drawdown from cost 100.00" in out
+    assert "already exists" in out
+
+    data = json.loads(alerts_file.read_text())
+    data["alerts"].append({"ticker": "DD", "target_price": 50.0, "currency": "USD"})
+    alerts_file.write_text(json.dumps(data))
+    _store("DD", [100.0, 79.0])
+
+    alerts.cmd_check(SimpleNamespace(json=True, offline=True))
+    results = json.loads(capsys.readouterr().out)
+    assert [w["ticker"] for w in results["watching"]] == ["DD"]
+    assert [t["rule"] for t in results["rules"]["triggered"]] == ["drawdown_from_cost"]
+    saved = json.loads(alerts_file.read_text())["alerts"]
+    assert saved[0]["triggered_count"] == 1
+    assert saved[1].get("triggered_count", 0) == 0
+
+
+def test_rule_alerts_in_store_do_not_block_price_alerts(store_dir, alerts_file, capsys):
+    db_path = alerts_file.with_suffix(".db")
+    alert_store.add(db_path, _rule("NVDA", "ma_cross_below", window=50), unique_ticker=False)
+    assert alert_store.add(db_path, {"ticker": "NVDA", "target_price": 100.0}) is not None
+    assert alert_store.add(db_path, {"ticker": "NVDA", "target_price": 90.0}) is None
+
+    alerts.cmd_list(SimpleNamespace())
+    out = capsys.readouterr().out
+    assert "NVDA: cross below 50-day MA" in out
+    assert "NVDA: $100.00" in out
+
+    alerts.cmd_delete(SimpleNamespace(ticker="NVDA", rule="ma_cross_below"))
+    assert [a["target_price"] for a in alert_store.list_alerts(db_path)] == [100.0]
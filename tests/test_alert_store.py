@@ -0,0 +1,123 @@
+"""Tests for the SQLite alert store."""
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from vfinance_news import alert_store, alerts
+
+
+def _alert(ticker, target, **extra):
+    return {"ticker": ticker, "target_price": target, "currency": "USD", "note": "",
+            "set_by": "", "snooze_until": None, "triggered_count": 0, "last_triggered": None, **extra}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "alerts.db"
+
+
+@pytest.fixture
+def json_file(tmp_path, monkeypatch):
+    path = tmp_path / "alerts.json"
+    path.write_text(json.dumps({"_meta": {"version": 1}, "alerts": [_alert("AAPL", 150.0), _alert("TSLA", 200.0)]}))
+    monkeypatch.setattr(alerts, "ALERTS_FILE", path)
+    return path
+
+
+def test_schema_uses_wal_and_indexes(db_path):
+    conn = alert_store.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        plan = " ".join(row["detail"] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM alerts WHERE snooze_until IS NULL OR snooze_until <= '2026'"
+        ))
+    finally:
+        conn.close()
+    assert {"idx_alerts_ticker", "idx_alerts_snooze"} <= indexes
+    assert "idx_alerts_snooze" in plan
+
+
+def test_add_update_delete(db_path):
+    alert_id = alert_store.add(db_path, _alert("aapl", 150.0))
+    assert alert_store.add(db_path, _alert("AAPL", 140.0)) is None
+    assert alert_store.add(db_path, _alert("AAPL", 140.0), unique_ticker=False)
+
+    assert alert_store.update(db_path, alert_id, target_price=145.0, note="cheaper")
+    assert not alert_store.update(db_path, 999, note="gone")
+    with pytest.raises(ValueError):
+        alert_store.update(db_path, alert_id, bogus=1)
+
+    stored = alert_store.list_alerts(db_path)
+    assert [(a["ticker"], a["target_price"], a["note"]) for a in stored] == [("AAPL", 145.0, "cheaper"), ("AAPL", 140.0, "")]
+    assert alert_store.delete_ticker(db_path, "aapl") == 2
+    assert alert_store.list_alerts(db_path) == []
+
+
+def test_record_triggers_counts_once_per_day(db_path):
+    first = alert_store.add(db_path, _alert("AAPL", 150.0))
+    second = alert_store.add(db_path, _alert("TSLA", 200.0))
+    version = alert_store.version(db_path)
+    morning = datetime(2026, 1, 13, 9, 0)
+
+    alert_store.record_triggers(db_path, [first], morning)
+    alert_store.record_triggers(db_path, [first], morning + timedelta(hours=3))
+    alert_store.record_triggers(db_path, [first], morning + timedelta(days=1))
+
+    by_ticker = {a["ticker"]: a for a in alert_store.list_alerts(db_path)}
+    assert by_ticker["AAPL"]["triggered_count"] == 2
+    assert by_ticker["AAPL"]["last_triggered"] == (morning + timedelta(days=1)).isoformat()
+    assert by_ticker["TSLA"]["triggered_count"] == 0
+    assert second and alert_store.version(db_path) == version + 3
+
+
+def test_active_alerts_skip_snoozed(db_path):
+    now = datetime(2026, 1, 13, 12, 0)
+    alert_store.add(db_path, _alert("AAPL", 150.0, snooze_until=(now + timedelta(days=1)).isoformat()))
+    alert_store.add(db_path, _alert("TSLA", 200.0, snooze_until=(now - timedelta(days=1)).isoformat()))
+    alert_store.add(db_path, _alert("MSFT", 300.0))
+
+    assert [a["ticker"] for a in alert_store.active_alerts(db_path, now)] == ["TSLA", "MSFT"]
+
+
+def test_import_export_round_trip(db_path):
+    data = {"_meta": {"version": 1}, "alerts": [_alert("AAPL", 150.0, set_date="2026-01-02", status="active", custom={"x": 1})]}
+
+    assert alert_store.import_json(db_path, data) == 1
+    assert alert_store.import_json(db_path, data, replace=False) == 1
+    assert alert_store.import_json(db_path, data) == 1
+
+    exported = alert_store.export_json(db_path, meta={"version": 1})
+    assert exported["alerts"] == data["alerts"]
+    assert exported["_meta"]["updated_at"]
+
+
+def test_alerts_commands_switch_to_store_after_import(json_file, monkeypatch, capsys):
+    alerts.cmd_import(SimpleNamespace(source=None, append=False))
+    db_path = json_file.with_suffix(".db")
+    assert alerts.alert_db() == db_path
+    json_before = json_file.read_text()
+
+    monkeypatch.setattr(alerts, "get_quotes", lambda tickers, offline=False: {"AAPL": {"price": 140.0}, "TSLA": {"price": 250.0}})
+    result = alerts.check_alerts()
+
+    assert [t["ticker"] for t in result["triggered"]] == ["AAPL"]
+    assert json_file.read_text() == json_before
+    by_ticker = {a["ticker"]: a for a in alert_store.list_alerts(db_path)}
+    assert by_ticker["AAPL"]["triggered_count"] == 1
+    assert by_ticker["TSLA"]["triggered_count"] == 0
+
+    alerts.cmd_snooze(SimpleNamespace(ticker="tsla", days=3))
+    alerts.cmd_delete(SimpleNamespace(ticker="AAPL"))
+    remaining = alert_store.list_alerts(db_path)
+    assert [a["ticker"] for a in remaining] == ["TSLA"]
+    assert remaining[0]["snooze_until"]
+    assert json_file.read_text() == json_before
+
+    capsys.readouterr()
+    alerts.cmd_export(SimpleNamespace(output=None))
+    exported = json.loads(capsys.readouterr().out)
+    assert [a["ticker"] for a in exported["alerts"]] == ["TSLA"]
+    assert "id" not in exported["alerts"][0]
@@ -0,0 +1,192 @@
+"""Tests for the adaptive alert watch loop."""
+import json
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from vfinance_news import alert_log, alert_watch, alerts
+from vfinance_news.alert_watch import AlertWatcher, WatchSettings, next_market_open, poll_interval
+
+NY = ZoneInfo("America/New_York")
+
+
+def _alert(ticker, target, **extra):
+    return {"ticker": ticker, "target_price": target, "currency": "USD", "note": "",
+            "snooze_until": None, "triggered_count": 0, "last_triggered": None, **extra}
+
+
+@pytest.fixture
+def alerts_file(tmp_path, monkeypatch):
+    path = tmp_path / "alerts.json"
+    monkeypatch.setattr(alerts, "ALERTS_FILE", path)
+    return path
+
+
+def _write(path, *items):
+    path.write_text(json.dumps({"_meta": {"version": 1}, "alerts": list(items)}))
+
+
+class FakeClock:
+    def __init__(self, when: datetime):
+        self.now = when.timestamp()
+
+    def __call__(self):
+        return self.now
+
+
+def test_poll_interval_scales_with_distance_to_target():
+    settings = WatchSettings(min_interval=30, max_interval=600, near_pct=1, far_pct=10)
+    assert poll_interval(99, 100, settings) == 30
+    assert poll_interval(100.5, 100, settings) == 30
+    assert poll_interval(105.5, 100, settings) == pytest.approx(315)
+    assert poll_interval(150, 100, settings) == 600
+
+
+def test_next_market_open_by_exchange():
+    saturday = datetime(2026, 1, 10, 12, 0, tzinfo=NY)
+    assert next_market_open("AAPL", saturday) == datetime(2026, 1, 12, 9, 30, tzinfo=NY)
+    tuesday_open = datetime(2026, 1, 13, 11, 0, tzinfo=NY)
+    assert next_market_open("AAPL", tuesday_open) == tuesday_open
+    # 11:00 New York is after the Tokyo close -> next Tokyo morning
+    tokyo_next = next_market_open("7203.T", tuesday_open)
+    assert tokyo_next.astimezone(ZoneInfo("Asia/Tokyo")) == datetime(2026, 1, 14, 9, 0, tzinfo=ZoneInfo("Asia/Tokyo"))
+    assert next_market_open("BTC-USD", saturday) == saturday
+
+
+def test_watcher_batches_due_tickers_and_adapts_intervals(alerts_file, monkeypatch):
+    _write(alerts_file, _alert("AAPL", 100.0), _alert("MSFT", 100.0))
+    requests = []
+    prices = {"AAPL": 100.5, "MSFT": 150.0}
+    monkeypatch.setattr(alerts, "get_quotes",
+                        lambda tickers: requests.append(list(tickers)) or {t: {"price": prices[t]} for t in tickers})
+    clock = FakeClock(datetime(2026, 1, 13, 11, 0, tzinfo=NY))
+    watcher = AlertWatcher(WatchSettings(market_hours=False), clock=clock)
+
+    assert watcher.tick() == []
+    assert requests == [["AAPL", "MSFT"]]
+    assert watcher.sleep_for() == pytest.approx(30)
+
+    clock.now += 31
+    watcher.tick()
+    assert requests[-1] == ["AAPL"]
+
+    clock.now += 600
+    watcher.tick()
+    assert requests[-1] == ["AAPL", "MSFT"]
+    assert watcher.quote_requests == 3
+
+
+def test_watcher_persists_only_new_triggers(alerts_file, monkeypatch):
+    _write(alerts_file, _alert("AAPL", 100.0), _alert("MSFT", 100.0))
+    monkeypatch.setattr(alerts, "get_quotes", lambda tickers: {t: {"price": 95.0} for t in tickers if t == "AAPL"})
+    clock = FakeClock(datetime(2026, 1, 13, 11, 0, tzinfo=NY))
+    watcher = AlertWatcher(WatchSettings(market_hours=False), clock=clock)
+
+    events = watcher.tick()
+    assert [e["ticker"] for e in events] == ["AAPL"]
+    assert events[0]["pct_from_target"] == -5.0
+
+    # An edit made through the CLI between ticks survives the next write
+    data = json.loads(alerts_file.read_text())
+    data["alerts"][1]["note"] = "edited"
+    alerts_file.write_text(json.dumps(data))
+
+    clock.now += 60
+    assert watcher.tick() == []
+
+    saved = {a["ticker"]: a for a in json.loads(alerts_file.read_text())["alerts"]}
+    assert saved["AAPL"]["triggered_count"] == 1
+    assert saved["AAPL"]["last_triggered"]
+    assert saved["MSFT"]["note"] == "edited"
+    assert saved["MSFT"]["triggered_count"] == 0
+
+
+def test_watcher_pauses_closed_markets(alerts_file, monkeypatch):
+    _write(alerts_file, _alert("AAPL", 100.0), _alert("BTC-USD", 100.0))
+    requests = []
+    monkeypatch.setattr(alerts, "get_quotes",
+                        lambda tickers: requests.append(list(tickers)) or {t: {"price": 200.0} for t in tickers})
+    saturday = datetime(2026, 1, 10, 12, 0, tzinfo=NY)
+    watcher = AlertWatcher(WatchSettings(), clock=FakeClock(saturday))
+
+    watcher.tick()
+
+    assert requests == [["BTC-USD"]]
+    assert watcher.next_due["AAPL"] == datetime(2026, 1, 12, 9, 30, tzinfo=NY).timestamp()
+
+
+def test_watch_loop_emits_events_and_sleeps_between_ticks(alerts_file, monkeypatch):
+    _write(alerts_file, _alert("AAPL", 100.0))
+    monkeypatch.setattr(alerts, "get_quotes", lambda tickers: {"AAPL": {"price": 90.0}})
+    clock = FakeClock(datetime(2026, 1, 13, 11, 0, tzinfo=timezone.utc))
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    events = []
+    alert_watch.watch(WatchSettings(market_hours=False), events.append, clock=clock, sleep=sleep, max_ticks=3)
+
+    assert [e["event"] for e in events] == ["triggered"]
+    assert sleeps == [30, 30]
+
+
+def test_watcher_triggers_each_level_once_as_price_falls(alerts_file, monkeypatch):
+    _write(alerts_file, _alert("AAPL", 150.0, set_by="ana"), _alert("AAPL", 120.0, set_by="ben"))
+    prices = iter([160.0, 140.0, 145.0, 110.0])
+    monkeypatch.setattr(alerts, "get_quotes", lambda tickers: {"AAPL": {"price": next(prices)}})
+    clock = FakeClock(datetime(2026, 1, 13, 11, 0, tzinfo=NY))
+    watcher = AlertWatcher(WatchSettings(market_hours=False), clock=clock)
+
+    seen = []
+    for _ in range(4):
+        seen.append([(e["target_price"], e["set_by"]) for e in watcher.tick()])
+        clock.now += 600
+
+    assert seen == [[], [(150.0, "ana")], [], [(120.0, "ben")]]
+    saved = json.loads(alerts_file.read_text())["alerts"]
+    assert [a["triggered_count"] for a in saved] == [1, 1]
+
+
+def test_alert_added_mid_watch_fires_when_already_in_zone(alerts_file, monkeypatch):
+    _write(alerts_file, _alert("AAPL", 90.0), _alert("MSFT", 90.0))
+    monkeypatch.setattr(alerts, "get_quotes", lambda tickers: {t: {"price": 100.0} for t in tickers})
+    clock = FakeClock(datetime(2026, 1, 13, 11, 0, tzinfo=NY))
+    watcher = AlertWatcher(WatchSettings(market_hours=False), clock=clock)
+    assert watcher.tick() == []
+
+    # Added through the CLI while watching: 105 is already above the last seen price
+    data = json.loads(alerts_file.read_text())
+    data["alerts"].append(_alert("AAPL", 105.0))
+    alerts_file.write_text(json.dumps(data))
+
+    clock.now += 600
+    events = watcher.tick()
+    assert [(e["ticker"], e["target_price"]) for e in events] == [("AAPL", 105.0)]
+    assert "MSFT" in watcher.last_price
+
+    clock.now += 600
+    assert watcher.tick() == []
+
+
+def test_watcher_logs_every_evaluation_after_a_price_move(alerts_file, monkeypatch):
+    _write(alerts_file, _alert("AAPL", 90.0), _alert("AAPL", 100.0), _alert("MSFT", 50.0))
+    prices = {"AAPL": 105.0, "MSFT": 60.0}
+    monkeypatch.setattr(alerts, "get_quotes", lambda tickers: {t: {"price": prices[t]} for t in tickers})
+    clock = FakeClock(datetime(2026, 1, 13, 11, 0, tzinfo=NY))
+    watcher = AlertWatcher(WatchSettings(market_hours=False, min_interval=30, max_interval=30), clock=clock)
+
+    def logged():
+        lines = (alert_log.LOG_DIR / "events.ndjson").read_text().splitlines()
+        return [(e["ticker"], e["target"], e["price"], e["triggered"]) for e in map(json.loads, lines)]
+
+    watcher.tick()
+    assert logged() == [("AAPL", 90.0, 105.0, False), ("AAPL", 100.0, 105.0, False), ("MSFT", 50.0, 60.0, False)]
+
+    # MSFT unchanged adds nothing; AAPL moved through 100
+    prices["AAPL"] = 99.0
+    clock.now += 31
+    watcher.tick()
+    assert logged()[3:] == [("AAPL", 90.0, 99.0, False), ("AAPL", 100.0, 99.0, True)]
@@ -108,6 +108,23 @@ def test_check_alerts_snooze(mock_alerts_data, monkeypatch, tmp_path):
         assert all(t["ticker"] != "AAPL" for t in results["triggered"])
 
 
+def test_check_alerts_offline_uses_price_store(mock_alerts_data, monkeypatch, tmp_path):
+    from vfinance_news import price_store
+
+    alerts_file = tmp_path / "vfinance_news.alerts.json"
+    monkeypatch.setattr("vfinance_news.alerts.ALERTS_FILE", alerts_file)
+    monkeypatch.setattr(price_store, "PRICE_STORE_DIR", tmp_path / "prices")
+    alerts_file.write_text(json.dumps(mock_alerts_data))
+    price_store.record_closes("AAPL", [(datetime(2026, 1, 6).date(), 149.0)])
+
+    with patch("vfinance_news.alerts.get_fetch_market_data") as mock_fmd_getter:
+        results = check_alerts(offline=True)
+
+    mock_fmd_getter.assert_not_called()
+    assert [r["ticker"] for r in results["triggered"]] == ["AAPL"]
+    assert results["watching"] == []
+
+
 def test_alerts_cli_rejects_lang_flag(monkeypatch):
     from vfinance_news import alerts
 
@@ -0,0 +1,127 @@
+"""Tests for the SQLite article store."""
+import sqlite3
+import time
+
+import pytest
+
+from vfinance_news import article_store
+
+
+@pytest.fixture(autouse=True)
+def article_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(article_store, "ARTICLE_DB", tmp_path / "articles.db")
+    return tmp_path / "articles.db"
+
+
+def _article(title, link, published_at=None, description=""):
+    return {"title": title, "link": link, "date": "", "published_at": published_at, "description": description}
+
+
+def test_ingest_upserts_by_link():
+    now = time.time()
+    added = article_store.ingest(
+        [_article("Fed holds rates", "https://x/1", now - 60), _article("Oil jumps", "https://x/2", now - 30)],
+        source_id="wsj", source="WSJ", feed="markets", feed_url="https://wsj/feed",
+    )
+    again = article_store.ingest(
+        [_article("Fed holds rates (updated)", "https://x/1", now - 60, "Details")],
+        source_id="ft", source="FT", feed_url="https://ft/feed",
+    )
+
+    assert added == 2
+    assert again == 0
+    articles = article_store.query_articles()
+    assert [a["title"] for a in articles] == ["Oil jumps", "Fed holds rates"]
+    fed = articles[1]
+    assert fed["source_id"] == "wsj"
+    assert fed["description"] == "Details"
+
+
+def test_ingest_without_link_dedupes_on_title_and_date():
+    article = {"title": "No link story", "link": "", "date": "Mon, 05 Jan 2026"}
+    assert article_store.ingest([article, dict(article)]) == 1
+    assert len(article_store.query_articles()) == 1
+
+
+def test_query_filters_by_window_source_and_limit():
+    now = time.time()
+    article_store.ingest([_article("Old", "https://x/old", now - 3 * 86400)], source_id="wsj")
+    article_store.ingest([_article("New WSJ", "https://x/a", now - 100)], source_id="wsj")
+    article_store.ingest([_article("New FT", "https://x/b", now - 50)], source_id="ft")
+
+    recent = article_store.query_articles(since=now - 86400)
+    wsj = article_store.query_articles(since=now - 86400, sources=["wsj"])
+    newest = article_store.query_articles(limit=1)
+
+    assert [a["title"] for a in recent] == ["New FT", "New WSJ"]
+    assert [a["title"] for a in wsj] == ["New WSJ"]
+    assert [a["title"] for a in newest] == ["New FT"]
+
+
+def test_feed_freshness_tracks_ingest_time():
+    assert article_store.feed_is_fresh("https://wsj/feed", 600) is False
+
+    article_store.ingest([_article("Fed", "https://x/1")], feed_url="https://wsj/feed")
+
+    assert article_store.feed_is_fresh("https://wsj/feed", 600) is True
+    assert [a["title"] for a in article_store.query_articles(feed_url="https://wsj/feed")] == ["Fed"]
+
+
+def test_prune_removes_articles_outside_retention():
+    now = time.time()
+    article_store.ingest([_article("Ancient", "https://x/1", now - 90 * 86400), _article("Fresh", "https://x/2", now)])
+
+    assert article_store.prune(retention_days=30) == 1
+    assert [a["title"] for a in article_store.query_articles()] == ["Fresh"]
+
+
+def test_mention_terms_strip_legal_suffixes_and_ambiguous_tickers():
+    assert article_store.mention_terms("AAPL", "Apple Inc.") == ["Apple", "AAPL"]
+    assert article_store.mention_terms("GOOGL", "Alphabet Inc. Class A") == ["Alphabet", "GOOGL"]
+    assert article_store.mention_terms("8411.T", "Mizuho Financial Group") == ["Mizuho Financial"]
+    assert article_store.mention_terms("NOW", "ServiceNow") == ["ServiceNow"]
+    assert article_store.mention_terms("SAP.DE", "SAP") == ["SAP"]
+
+
+def test_search_mentions_attributes_articles_in_one_query():
+    now = time.time()
+    article_store.ingest([
+        _article("Apple and Nestlé sign supply deal", "https://x/1", now - 60),
+        _article("Chipmakers slide", "https://x/2", now - 30, "NVDA fell 4% after export curbs"),
+        _article("Pineapple prices climb", "https://x/3", now - 20),
+        _article("Apple event recap", "https://x/4", now - 3 * 86400),
+    ], source_id="ft")
+
+    mentions = article_store.search_mentions(
+        {"AAPL": ["Apple", "AAPL"], "NESN.SW": ["Nestle"], "NVDA": ["NVIDIA", "NVDA"], "MSFT": ["Microsoft"]},
+        since=now - 86400,
+    )
+
+    assert [a["title"] for a in mentions["AAPL"]] == ["Apple and Nestlé sign supply deal"]
+    assert [a["link"] for a in mentions["NESN.SW"]] == ["https://x/1"]
+    assert [a["link"] for a in mentions["NVDA"]] == ["https://x/2"]
+    assert "MSFT" not in mentions
+
+
+def test_search_index_tracks_updates_and_prunes():
+    now = time.time()
+    article_store.ingest([_article("Tesla recall", "https://x/1", now - 90 * 86400)])
+    article_store.ingest([_article("Tesla recall", "https://x/1", now - 90 * 86400, "Affects Model Y")])
+
+    assert article_store.search_mentions({"TSLA": ["Model Y"]})["TSLA"][0]["link"] == "https://x/1"
+
+    article_store.prune(retention_days=30)
+
+    assert article_store.search_mentions({"TSLA": ["Tesla"]}) == {}
+
+
+def test_search_index_backfills_existing_database(article_db):
+    article_store.ingest([_article("Siemens wins rail order", "https://x/1", time.time())])
+    with sqlite3.connect(article_db) as conn:
+        conn.executescript(
+            "DROP TRIGGER articles_fts_ai; DROP TRIGGER articles_fts_ad; "
+            "DROP TRIGGER articles_fts_au; DROP TABLE articles_fts;"
+        )
+    article_store._initialized.clear()
+
+    assert "SIE.DE" in article_store.search_mentions({"SIE.DE": ["Siemens"]})
@@ -0,0 +1,155 @@
+"""Tests for batch briefings across several portfolios."""
+import json
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from vfinance_news import batch, briefing, fetch_news, portfolio
+
+
+def _write_portfolio(path, symbols):
+    path.write_text("symbol,name\n" + "".join(f"{s},{s} Inc\n" for s in symbols))
+    return path
+
+
+def _args(**overrides):
+    values = {"style": "briefing", "deadline": None, "fast": False, "llm": False,
+              "debug": False, "json": True, "stream": False, "batch": None}
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def test_load_batch_accepts_list_and_mapping(tmp_path):
+    desks = tmp_path / "desks"
+    desks.mkdir()
+    _write_portfolio(desks / "growth.csv", ["AAPL"])
+    _write_portfolio(desks / "income.csv", ["KO"])
+
+    listed = tmp_path / "list.json"
+    listed.write_text(json.dumps({"portfolios": [{"name": "growth", "path": "desks/growth.csv"},
+                                                 {"path": str(desks / "income.csv")}]}))
+    mapped = tmp_path / "map.json"
+    mapped.write_text(json.dumps({"growth": "desks/growth.csv", "income": "desks/income.csv"}))
+
+    assert batch.load_batch(listed) == [
+        {"name": "growth", "path": desks / "growth.csv"},
+        {"name": "income", "path": desks / "income.csv"},
+    ]
+    assert [e["name"] for e in batch.load_batch(mapped)] == ["growth", "income"]
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["not json", json.dumps([]), json.dumps({"a": "missing.csv"}), json.dumps([{"name": "x"}])],
+)
+def test_load_batch_rejects_invalid_files(tmp_path, content):
+    path = tmp_path / "batch.json"
+    path.write_text(content)
+    with pytest.raises(ValueError):
+        batch.load_batch(path)
+
+
+def test_build_fetch_plan_unions_symbols(tmp_path):
+    entries = [
+        {"name": "a", "path": _write_portfolio(tmp_path / "a.csv", ["AAPL", "MSFT"])},
+        {"name": "b", "path": _write_portfolio(tmp_path / "b.csv", ["msft", "KO"])},
+    ]
+    sources = {"markets": {"us": {"indices": ["^GSPC"]}, "eu": {"indices": ["^GSPC", "^STOXX50E"]}}}
+
+    plan = batch.build_fetch_plan(entries, sources)
+
+    assert plan["symbols"] == ["AAPL", "MSFT", "KO"]
+    assert plan["index_symbols"] == ["^GSPC", "^STOXX50E"]
+    assert plan["per_portfolio"] == {"a": ["AAPL", "MSFT"], "b": ["MSFT", "KO"]}
+
+
+def test_run_batch_fetches_shared_quotes_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_news, "_warm_caches", None)
+    monkeypatch.setattr(fetch_news, "_warm_ttls", {})
+    monkeypatch.setattr(fetch_news, "load_sources", lambda: {"markets": {"us": {"indices": ["^GSPC"]}}})
+    quote_fetches = []
+    monkeypatch.setattr(
+        fetch_news,
+        "_fetch_via_yfinance",
+        lambda symbols, timeout, deadline, mode: quote_fetches.append(list(symbols))
+        or {s: {"price": 1.0, "symbol": s} for s in symbols},
+    )
+
+    def fake_summarize(cmd, timeout, in_process=False):
+        assert in_process and cmd[-1] == "--json"
+        symbols = [p["symbol"] for p in portfolio.load_portfolio()]
+        quotes = fetch_news.fetch_market_data(["^GSPC"] + symbols)
+        document = {"macro_message": "Macro", "portfolio_message": ",".join(quotes)}
+        return subprocess.CompletedProcess(cmd, 0, json.dumps(document), "")
+
+    monkeypatch.setattr(briefing, "_run_summarize", fake_summarize)
+    entries = [
+        {"name": "growth", "path": _write_portfolio(tmp_path / "growth.csv", ["AAPL", "MSFT"])},
+        {"name": "tech", "path": _write_portfolio(tmp_path / "tech.csv", ["MSFT", "NVDA"])},
+    ]
+
+    result = batch.run_batch(entries, _args())
+
+    assert quote_fetches == [["^GSPC", "AAPL", "MSFT", "NVDA"]]
+    assert result["portfolios"]["growth"]["portfolio_message"] == "^GSPC,AAPL,MSFT"
+    assert result["portfolios"]["tech"]["portfolio_message"] == "^GSPC,MSFT,NVDA"
+    assert result["plan"]["unique_symbols"] == 3
+    assert result["plan"]["holdings"] == 4
+    assert portfolio.PORTFOLIO_FILE not in (entries[0]["path"], entries[1]["path"])
+
+
+def test_run_batch_reports_failed_portfolios(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_news, "_warm_caches", None)
+    monkeypatch.setattr(fetch_news, "_warm_ttls", {})
+    monkeypatch.setattr(fetch_news, "load_sources", lambda: {})
+    monkeypatch.setattr(fetch_news, "_fetch_via_yfinance", lambda *a, **k: {})
+
+    def fake_summarize(cmd, timeout, in_process=False):
+        if portfolio.PORTFOLIO_FILE.stem == "bad":
+            return subprocess.CompletedProcess(cmd, 1, "", "❌ boom\n")
+        return subprocess.CompletedProcess(cmd, 0, json.dumps({"macro_message": "ok"}), "")
+
+    monkeypatch.setattr(briefing, "_run_summarize", fake_summarize)
+    entries = [
+        {"name": "good", "path": _write_portfolio(tmp_path / "good.csv", ["AAPL"])},
+        {"name": "bad", "path": _write_portfolio(tmp_path / "bad.csv", ["KO"])},
+    ]
+
+    result = batch.run_batch(entries, _args())
+
+    assert list(result["portfolios"]) == ["good"]
+    assert result["errors"] == {"bad": "❌ boom"}
+
+
+def test_run_batch_stops_after_a_render_times_out(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_news, "_warm_caches", None)
+    monkeypatch.setattr(fetch_news, "_warm_ttls", {})
+    monkeypatch.setattr(fetch_news, "load_sources", lambda: {})
+    monkeypatch.setattr(fetch_news, "_fetch_via_yfinance", lambda *a, **k: {})
+    worker_running = []
+    rendered = []
+
+    def fake_summarize(cmd, timeout, in_process=False):
+        rendered.append(portfolio.PORTFOLIO_FILE.stem)
+        if portfolio.PORTFOLIO_FILE.stem == "broken":
+            raise KeyError("macro_message")
+        if portfolio.PORTFOLIO_FILE.stem == "slow":
+            worker_running.append(True)
+            return subprocess.CompletedProcess(cmd, 1, "", "❌ Briefing generation timed out after 1s\n")
+        return subprocess.CompletedProcess(cmd, 0, json.dumps({"macro_message": "ok"}), "")
+
+    monkeypatch.setattr(briefing, "_run_summarize", fake_summarize)
+    monkeypatch.setattr(briefing, "summarize_worker_running", lambda: bool(worker_running))
+    entries = [
+        {"name": name, "path": _write_portfolio(tmp_path / f"{name}.csv", ["AAPL"])}
+        for name in ("broken", "good", "slow", "after")
+    ]
+
+    result = batch.run_batch(entries, _args())
+
+    assert rendered == ["broken", "good", "slow"]
+    assert list(result["portfolios"]) == ["good"]
+    assert "macro_message" in result["errors"]["broken"]
+    assert "timed out" in result["errors"]["slow"]
+    assert result["errors"]["after"].startswith("skipped")
@@ -1,5 +1,8 @@
+import subprocess
+import io
 import sys
 import json
+import threading
 import pytest
 from unittest.mock import Mock, patch
 
@@ -27,6 +30,7 @@ def test_generate_and_send_success():
         args.llm = False
         args.debug = False
         args.json = True
+        args.stream = False
         
         result = generate_and_send(args)
         
@@ -58,6 +62,7 @@ def test_generate_and_send_llm_forwards_only_llm_flag():
         args.llm = True
         args.debug = False
         args.json = True
+        args.stream = False
 
         generate_and_send(args)
 
@@ -80,6 +85,7 @@ def test_generate_and_send_failure():
         args.llm = False
         args.json = False
         args.debug = False
+        args.stream = False
         
         with pytest.raises(SystemExit):
             generate_and_send(args)
@@ -115,3 +121,115 @@ def test_briefing_cli_rejects_lang_flag(monkeypatch):
     monkeypatch.setattr("sys.argv", ["vfinance-news briefing", LANG_FLAG, "de"])
     with pytest.raises(SystemExit):
         briefing.main()
+
+
+def test_generate_and_send_runs_summarize_in_process_when_serving(monkeypatch, capsys):
+    from vfinance_news import briefing, summarize
+
+    seen = {}
+
+    def fake_summarize_main():
+        seen["argv"] = list(sys.argv)
+        print(json.dumps({"macro_message": "Warm Macro", "portfolio_message": ""}))
+
+    monkeypatch.setattr(briefing, "SUMMARIZE_IN_PROCESS", True)
+    monkeypatch.setattr(summarize, "main", fake_summarize_main)
+
+    args = Mock()
+    args.style = "briefing"
+    args.deadline = None
+    args.fast = True
+    args.llm = False
+    args.debug = False
+    args.json = False
+    args.stream = False
+
+    with patch("vfinance_news.briefing.subprocess.run") as mock_run:
+        result = generate_and_send(args)
+
+    mock_run.assert_not_called()
+    assert result == "Warm Macro"
+    assert seen["argv"] == ["summarize", "--style", "briefing", "--fast", "--json"]
+    assert "Warm Macro" in capsys.readouterr().out
+
+
+
+def test_in_process_summarize_enforces_timeout(monkeypatch):
+    from vfinance_news import briefing, summarize
+
+    # The timeout swaps in stream wrappers; restore pytest's streams afterwards
+    monkeypatch.setattr(sys, "stdout", sys.stdout)
+    monkeypatch.setattr(sys, "stderr", sys.stderr)
+    monkeypatch.setattr(briefing, "_timed_out_worker", None)
+    release = threading.Event()
+
+    def slow_main():
+        release.wait(5)
+        print("late output")
+
+    monkeypatch.setattr(summarize, "main", slow_main)
+    cmd = ["python", "-m", "summarize", "--json"]
+
+    try:
+        result = briefing._run_summarize(cmd, 0.05, in_process=True)
+        assert result.returncode == 1
+        assert "timed out after 0.05s" in result.stderr
+        assert briefing.summarize_worker_running()
+        # Nothing else runs in-process while the timed-out worker is alive
+        blocked = briefing._run_summarize(cmd, 5, in_process=True)
+        assert blocked.returncode == 1
+        assert "still running" in blocked.stderr
+
+        late = io.StringIO()
+        sys.stdout.stream = late
+    finally:
+        release.set()
+    briefing._timed_out_worker.join(5)
+
+    assert late.getvalue() == ""
+    assert not briefing.summarize_worker_running()
+
+
+def test_in_process_summarize_reports_exceptions_as_failures(monkeypatch):
+    from vfinance_news import briefing, summarize
+
+    def broken_main():
+        raise KeyError("macro_message")
+
+    monkeypatch.setattr(summarize, "main", broken_main)
+
+    result = briefing._run_summarize(["python", "-m", "summarize"], 5, in_process=True)
+
+    assert result.returncode == 1
+    assert "KeyError" in result.stderr
+
+def test_generate_and_send_stream_relays_events(capsys, tmp_path):
+    script = tmp_path / "fake_summarize.py"
+    script.write_text(
+        "import json\n"
+        "print(json.dumps({'event': 'markets', 'markets': {}}), flush=True)\n"
+        "print(json.dumps({'event': 'final', 'document': {'macro_message': 'Streamed'}}), flush=True)\n"
+    )
+
+    args = Mock()
+    args.style = "briefing"
+    args.deadline = None
+    args.fast = False
+    args.llm = False
+    args.debug = False
+    args.json = False
+    args.stream = True
+
+    real_popen = subprocess.Popen
+
+    def fake_popen(cmd, **kwargs):
+        assert "--stream" in cmd and "--json" not in cmd
+        return real_popen([sys.executable, str(script)], **kwargs)
+
+    with patch("vfinance_news.briefing.subprocess.Popen", side_effect=fake_popen):
+        result = generate_and_send(args)
+
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [e["event"] for e in events] == ["markets", "final"]
+    assert result == "Streamed"
+
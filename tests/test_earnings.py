@@ -1,8 +1,7 @@
 import sys
 from pathlib import Path
-import json
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 
 from vfinance_news.earnings import (
@@ -40,20 +39,29 @@ def mock_finnhub_response():
     }
 
 def test_fetch_earnings_finnhub_success(mock_finnhub_response):
-    with patch("vfinance_news.earnings.urlopen") as mock_urlopen:
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = json.dumps(mock_finnhub_response).encode("utf-8")
-        mock_resp.__enter__.return_value = mock_resp
-        mock_urlopen.return_value = mock_resp
-        
-        with patch("vfinance_news.earnings.get_finnhub_key", return_value="fake_key"):
-            result = fetch_all_earnings_finnhub(days_ahead=30)
-            
-            assert "AAPL" in result
-            assert result["AAPL"]["date"] == "2026-02-01"
-            assert result["AAPL"]["time"] == "amc"
-            assert "TSLA" in result
-            assert result["TSLA"]["date"] == "2026-01-27"
+    client = Mock()
+    client.earnings_calendar.return_value = mock_finnhub_response["earningsCalendar"]
+
+    with patch("vfinance_news.earnings.get_finnhub_client", return_value=client):
+        result = fetch_all_earnings_finnhub(from_date="2026-01-20", to_date="2026-02-19")
+
+    client.earnings_calendar.assert_called_once_with("2026-01-20", "2026-02-19", ttl=None)
+    assert "AAPL" in result
+    assert result["AAPL"]["date"] == "2026-02-01"
+    assert result["AAPL"]["time"] == "amc"
+    assert "TSLA" in result
+    assert result["TSLA"]["date"] == "2026-01-27"
+
+def test_fetch_earnings_finnhub_error_returns_none():
+    from vfinance_news.finnhub import FinnhubError
+
+    client = Mock()
+    client.earnings_calendar.side_effect = FinnhubError("/calendar/earnings: HTTP 500")
+
+    with patch("vfinance_news.earnings.get_finnhub_client", return_value=client):
+        assert fetch_all_earnings_finnhub(days_ahead=30) is None
+    with patch("vfinance_news.earnings.get_finnhub_client", return_value=None):
+        assert fetch_all_earnings_finnhub(days_ahead=30) == {}
 
 def test_cache_logic(tmp_path, monkeypatch):
     cache_file = tmp_path / "earnings_calendar.json"
@@ -115,3 +123,198 @@ def test_earnings_cli_rejects_lang_flag(monkeypatch):
     monkeypatch.setattr("sys.argv", ["vfinance-news earnings", "check", LANG_FLAG, "de"])
     with pytest.raises(SystemExit):
         earnings.main()
+
+
+def _partitioned_cache(now, ages_hours):
+    """Cache with every window day fetched `ages_hours(offset)` hours ago."""
+    from vfinance_news import earnings
+
+    partitions = {}
+    for offset in range(earnings.EARNINGS_WINDOW_DAYS + 1):
+        day = (now.date() + timedelta(days=offset)).isoformat()
+        partitions[day] = {"fetched_at": (now - timedelta(hours=ages_hours(offset))).isoformat(), "earnings": {}}
+    return {"last_updated": now.isoformat(), "earnings": {}, "partitions": partitions}
+
+
+def test_stale_partitions_refresh_near_term_more_often():
+    from vfinance_news import earnings
+
+    now = datetime(2026, 10, 19, 12, 0)
+    cache = _partitioned_cache(now, lambda offset: 12)
+
+    stale = earnings.stale_partitions(cache, now)
+
+    assert stale == [(now.date() + timedelta(days=d)).isoformat() for d in range(8)]
+    assert earnings.date_ranges(stale) == [("2026-10-19", "2026-10-26")]
+    assert len(earnings.stale_partitions(cache, now, force=True)) == earnings.EARNINGS_WINDOW_DAYS + 1
+
+
+def test_refresh_fetches_only_stale_ranges_and_merges(tmp_path, monkeypatch):
+    from vfinance_news import earnings
+
+    monkeypatch.setattr(earnings, "EARNINGS_CACHE", tmp_path / "earnings_calendar.json")
+    monkeypatch.setattr(earnings, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(earnings, "MANUAL_EARNINGS", tmp_path / "manual.json")
+    now = datetime.now()
+    far_day = (now.date() + timedelta(days=40)).isoformat()
+    near_day = (now.date() + timedelta(days=2)).isoformat()
+    cache = _partitioned_cache(now, lambda offset: 12 if offset <= 7 else 1)
+    cache["partitions"][far_day]["earnings"] = {"MSFT": {"date": far_day}}
+    save_earnings_cache(cache)
+
+    fetched = {"AAPL": {"date": near_day, "time": "amc"}}
+    portfolio = [{"symbol": "AAPL"}, {"symbol": "MSFT"}]
+    with patch("vfinance_news.earnings.get_finnhub_key", return_value="fake_key"), \
+         patch("vfinance_news.earnings.fetch_all_earnings_finnhub", return_value=fetched) as fetch:
+        result = refresh_earnings(portfolio)
+
+    fetch.assert_called_once_with(from_date=now.date().isoformat(),
+                                  to_date=(now.date() + timedelta(days=7)).isoformat())
+    assert result["earnings"] == {"AAPL": {"date": near_day, "time": "amc"}, "MSFT": {"date": far_day}}
+    assert load_earnings_cache()["partitions"][near_day]["earnings"] == fetched
+
+
+def test_rescheduled_symbol_uses_latest_partition_and_failures_keep_cache():
+    from vfinance_news import earnings
+
+    now = datetime(2026, 10, 19, 12, 0)
+    cache = {"partitions": {
+        "2026-10-21": {"fetched_at": "2026-10-17T12:00:00", "earnings": {"AAPL": {"date": "2026-10-21"}}},
+        "2026-10-28": {"fetched_at": "2026-10-19T08:00:00", "earnings": {"AAPL": {"date": "2026-10-28"}}},
+    }}
+    assert earnings.calendar_by_symbol(cache)["AAPL"]["date"] == "2026-10-28"
+
+    with patch("vfinance_news.earnings.get_finnhub_key", return_value="fake_key"), \
+         patch("vfinance_news.earnings.load_earnings_cache", return_value=cache), \
+         patch("vfinance_news.earnings.load_manual_earnings", return_value={}), \
+         patch("vfinance_news.earnings.fetch_all_earnings_finnhub", return_value=None), \
+         patch("vfinance_news.earnings.save_earnings_cache") as mock_save:
+        result = refresh_earnings([{"symbol": "AAPL"}])
+
+    assert result["earnings"]["AAPL"]["date"] == "2026-10-28"
+    assert set(mock_save.call_args[0][0]["partitions"]) == {"2026-10-21", "2026-10-28"}
+
+
+def test_earnings_index_queries_return_typed_records():
+    from datetime import date
+    from vfinance_news.earnings import EarningsIndex, EarningsRecord
+
+    today = date(2026, 10, 21)  # Wednesday
+    portfolio = [{"symbol": "AAPL", "name": "Apple", "category": "Tech"}, {"symbol": "SAP.DE", "name": "SAP"}]
+    earnings = {
+        "AAPL": {"date": "2026-10-21", "time": "amc", "eps_estimate": 1.5},
+        "MSFT": {"date": "2026-10-21", "time": "bmo"},
+        "SAP.DE": {"date": "2026-10-27", "time": ""},
+        "NVDA": {"date": "2026-11-20"},
+        "BAD": {"date": "soon"},
+        "NONE": {},
+    }
+    index = EarningsIndex(earnings, portfolio)
+
+    assert [r.ticker for r in index.on(today)] == ["MSFT", "AAPL"]
+    assert index.on(today)[1] == EarningsRecord("AAPL", "Apple", today, "amc", 1.5, "Tech")
+    assert [r.ticker for r in index.this_week(today)] == ["SAP.DE"]
+    week_start, week_end, records = index.next_week(today)
+    assert (week_start, week_end) == (date(2026, 10, 26), date(2026, 10, 30))
+    assert [r.ticker for r in records] == ["SAP.DE"]
+    assert index.for_ticker("NVDA").name == "NVDA"
+    assert index.for_ticker("BAD") is None
+    assert index.on(today)[1].to_dict()["date"] == "2026-10-21"
+
+
+def test_get_briefing_section_does_not_capture_stdout(capsys):
+    cache = {"last_updated": datetime.now().isoformat(),
+             "earnings": {"AAPL": {"date": (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")}}}
+    with patch("vfinance_news.earnings.load_portfolio", return_value=[{"symbol": "AAPL", "name": "Apple"}]), \
+         patch("vfinance_news.earnings.load_earnings_cache", return_value=cache), \
+         patch("contextlib.redirect_stdout", side_effect=AssertionError("stdout capture")):
+        section = get_briefing_section()
+    assert "EARNINGS THIS WEEK" in section and "AAPL — Apple" in section
+    assert capsys.readouterr().out == ""
+
+
+class _FakeClient:
+    def __init__(self, calendar, quarters):
+        self.calendar = calendar
+        self.quarters = quarters
+        self.calls = []
+
+    def earnings_calendar(self, from_date, to_date, symbol=None, ttl=None):
+        self.calls.append(("calendar", from_date, to_date))
+        return self.calendar
+
+    def earnings_surprises(self, symbol, ttl=None):
+        self.calls.append(("surprises", symbol))
+        return self.quarters.get(symbol, [])
+
+
+def test_pending_results_selects_reported_tickers_without_actuals():
+    from datetime import date
+    from vfinance_news import earnings
+
+    today = date(2026, 10, 19)
+    cache = {
+        "earnings": {
+            "AAPL": {"date": "2026-10-16", "time": "amc"},
+            "MSFT": {"date": "2026-10-19", "time": "bmo"},
+            "NVDA": {"date": "2026-10-19", "time": "amc"},
+            "TSLA": {"date": "2026-09-01"},
+            "AMD": {"date": "2026-10-15"},
+        },
+        "results": {"AMD": {"date": "2026-10-15", "eps_actual": 0.9}},
+    }
+    portfolio = [{"symbol": s} for s in ("AAPL", "MSFT", "NVDA", "TSLA", "AMD")]
+    with patch("vfinance_news.earnings.load_manual_earnings", return_value={}):
+        pending = earnings.pending_results(cache, portfolio, today)
+    assert pending == {"AAPL": "2026-10-16", "MSFT": "2026-10-19"}
+
+
+def test_fetch_actuals_uses_one_calendar_call_then_symbol_fallback():
+    from vfinance_news import earnings
+
+    client = _FakeClient(
+        calendar=[
+            {"symbol": "AAPL", "date": "2026-10-16", "epsActual": 1.6, "epsEstimate": 1.5,
+             "revenueActual": 95e9, "revenueEstimate": 100e9},
+            {"symbol": "MSFT", "date": "2026-10-19", "epsActual": None, "epsEstimate": 3.0},
+        ],
+        quarters={"MSFT": [{"period": "2026-12-31", "actual": 9.9},
+                           {"period": "2026-09-30", "actual": 3.3, "estimate": 3.0}]},
+    )
+    actuals = earnings.fetch_actuals({"AAPL": "2026-10-16", "MSFT": "2026-10-19"}, client)
+    assert client.calls == [("calendar", "2026-10-16", "2026-10-19"), ("surprises", "MSFT")]
+    assert actuals["AAPL"]["revenue_actual"] == 95e9
+    assert actuals["MSFT"]["eps_actual"] == 3.3
+
+    earnings.compute_surprises(actuals)
+    assert actuals["AAPL"]["eps_surprise_pct"] == pytest.approx(6.67)
+    assert actuals["AAPL"]["revenue_surprise_pct"] == pytest.approx(-5.0)
+    assert actuals["MSFT"]["eps_surprise_pct"] == pytest.approx(10.0)
+    assert actuals["MSFT"]["revenue_surprise_pct"] is None
+
+    zero = {"X": {"eps_actual": 0.1, "eps_estimate": 0.0}}
+    earnings.compute_surprises(zero)
+    assert zero["X"]["eps_surprise_pct"] is None
+
+
+def test_enrich_reported_stores_results_in_cache(tmp_path, monkeypatch):
+    from datetime import date
+    from vfinance_news import earnings
+
+    monkeypatch.setattr(earnings, "EARNINGS_CACHE", tmp_path / "earnings_calendar.json")
+    monkeypatch.setattr(earnings, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(earnings, "MANUAL_EARNINGS", tmp_path / "manual.json")
+    save_earnings_cache({"earnings": {"AAPL": {"date": "2026-10-16", "time": "amc"}}})
+    client = _FakeClient([{"symbol": "AAPL", "epsActual": 1.6, "epsEstimate": 1.5}], {})
+
+    now = datetime(2026, 10, 19, 7, 0)
+    added = earnings.enrich_reported([{"symbol": "AAPL"}], client=client, now=now)
+    assert added["AAPL"]["eps_surprise_pct"] == pytest.approx(6.67)
+    stored = earnings.load_earnings_results(today=now.date())
+    assert stored["AAPL"]["fetched_at"] == now.isoformat()
+    assert "AAPL 2026-10-16: EPS 1.60 vs 1.50 est (+6.7%)" == earnings.format_result("AAPL", stored["AAPL"])
+
+    # Already enriched: no further lookups
+    assert earnings.enrich_reported([{"symbol": "AAPL"}], client=client, now=now) == {}
+    assert len(client.calls) == 1
+    assert earnings.load_earnings_results(today=date(2026, 10, 25)) == {}
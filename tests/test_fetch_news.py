@@ -32,6 +32,85 @@ def test_fetch_rss_success(sample_rss_content):
         assert mock_urlopen.call_args.kwargs["timeout"] == 7
 
 
+def test_fetch_rss_reads_fresh_feed_cache(sample_rss_content, monkeypatch, tmp_path):
+    monkeypatch.setattr("vfinance_news.fetch_news.FEED_CACHE_DIR", tmp_path / "feeds")
+    with patch("urllib.request.urlopen") as mock_urlopen:
+        mock_response = MagicMock()
+        mock_response.read.return_value = sample_rss_content
+        mock_response.__enter__.return_value = mock_response
+        mock_urlopen.return_value = mock_response
+
+        warmed = fetch_rss("https://example.com/feed.xml", cache_ttl=0)
+        cached = fetch_rss("https://example.com/feed.xml", cache_ttl=600)
+
+    assert mock_urlopen.call_count == 1
+    assert cached == warmed
+    assert len(list((tmp_path / "feeds").glob("*.xml"))) == 1
+
+
+def test_fetch_rss_refetches_stale_feed_cache(sample_rss_content, monkeypatch, tmp_path):
+    import os
+    from vfinance_news import fetch_news
+
+    monkeypatch.setattr(fetch_news, "FEED_CACHE_DIR", tmp_path / "feeds")
+    fetch_news._write_feed_cache("https://example.com/feed.xml", b"<rss></rss>")
+    cache_file = next((tmp_path / "feeds").glob("*.xml"))
+    os.utime(cache_file, (0, 0))
+
+    with patch("urllib.request.urlopen") as mock_urlopen:
+        mock_response = MagicMock()
+        mock_response.read.return_value = sample_rss_content
+        mock_response.__enter__.return_value = mock_response
+        mock_urlopen.return_value = mock_response
+
+        articles = fetch_rss("https://example.com/feed.xml", cache_ttl=600)
+
+    assert mock_urlopen.call_count == 1
+    assert len(articles) == 2
+    assert cache_file.read_bytes() == sample_rss_content
+
+
+def test_fetch_feed_articles_served_from_store_while_fresh(monkeypatch, tmp_path):
+    from vfinance_news import fetch_news
+
+    monkeypatch.setattr("vfinance_news.article_store.ARTICLE_DB", tmp_path / "articles.db")
+    fetched = []
+
+    def fake_fetch_rss(url, limit, **_kwargs):
+        fetched.append(url)
+        return [{"title": "Stocks rally", "link": "https://x/1", "date": "", "published_at": None, "description": ""}]
+
+    monkeypatch.setattr(fetch_news, "_fetch_feed", fake_fetch_rss)
+
+    first = fetch_news.fetch_feed_articles("https://wsj/feed", 5, source_id="wsj", source="WSJ")
+    second = fetch_news.fetch_feed_articles("https://wsj/feed", 5, source_id="wsj", source="WSJ")
+    fetch_news.fetch_feed_articles("https://wsj/feed", 5, refresh=True)
+
+    assert fetched == ["https://wsj/feed", "https://wsj/feed"]
+    assert second == first
+
+
+
+def test_fetch_feed_articles_marks_empty_feed_fetched(monkeypatch, tmp_path):
+    from vfinance_news import fetch_news
+
+    monkeypatch.setattr("vfinance_news.article_store.ARTICLE_DB", tmp_path / "articles.db")
+    results = {"https://empty/feed": [], "https://down/feed": None}
+    fetched = []
+
+    def fake_fetch_feed(url, limit, **_kwargs):
+        fetched.append(url)
+        return results[url]
+
+    monkeypatch.setattr(fetch_news, "_fetch_feed", fake_fetch_feed)
+
+    for _ in range(2):
+        assert fetch_news.fetch_feed_articles("https://empty/feed", 5) == []
+        assert fetch_news.fetch_feed_articles("https://down/feed", 5) == []
+
+    # The empty feed is fresh after one download; the failed one is retried
+    assert fetched == ["https://empty/feed", "https://down/feed", "https://down/feed"]
+
 def test_fetch_rss_network_error():
     """Test RSS fetch handles network errors."""
     with patch("urllib.request.urlopen", side_effect=Exception("Network error")):
@@ -118,14 +197,157 @@ def test_fetch_market_data_uses_yfinance_only(monkeypatch):
     }
     monkeypatch.setattr(
         "vfinance_news.fetch_news._fetch_via_yfinance",
-        lambda symbols, timeout, deadline: expected if symbols == ["AAPL", "MSFT"] and timeout == 42 and deadline == 99.0 else {},
+        lambda symbols, timeout, deadline, mode: (
+            expected if symbols == ["AAPL", "MSFT"] and timeout == 42 and deadline == 99.0 and mode == "change" else {}
+        ),
     )
 
     result = fetch_market_data(["AAPL", "MSFT"], timeout=42, deadline=99.0, allow_price_fallback=True)
     assert result == expected
 
 
-def test_get_large_portfolio_news_handles_none_change(monkeypatch):
+def test_fetch_market_data_rejects_unknown_mode():
+    with pytest.raises(ValueError):
+        fetch_market_data(["AAPL"], mode="ohlc")
+
+
+def _closes_frame(rows: dict[str, list[float]], days: list[str]):
+    """Build a yfinance-style MultiIndex frame of closes."""
+    import pandas as pd
+
+    columns = pd.MultiIndex.from_tuples([("Close", symbol) for symbol in rows])
+    data = list(zip(*rows.values()))
+    return pd.DataFrame(data, index=pd.to_datetime(days), columns=columns)
+
+
+def test_fetch_via_yfinance_reuses_cached_prev_close(monkeypatch, tmp_path):
+    from vfinance_news import fetch_news
+
+    monkeypatch.setattr(fetch_news, "QUOTE_SESSION_CACHE", tmp_path / "quote_sessions.json")
+    monkeypatch.setattr("vfinance_news.price_store.PRICE_STORE_DIR", tmp_path / "prices")
+    periods = []
+
+    def fake_download(tickers, period, **_kwargs):
+        periods.append((tickers, period))
+        if period == "1d":
+            return _closes_frame({"AAPL": [105.0], "MSFT": [210.0]}, ["2026-01-06"])
+        return _closes_frame({"AAPL": [99.0, 100.0, 104.0], "MSFT": [190.0, 200.0, 205.0]},
+                             ["2026-01-02", "2026-01-05", "2026-01-06"])
+
+    monkeypatch.setattr(fetch_news.yf, "download", fake_download)
+
+    first = fetch_news._fetch_via_yfinance(["AAPL", "MSFT"], 10, None)
+    assert periods == [("AAPL MSFT", "5d")]
+    assert first["AAPL"]["prev_close"] == 100.0
+
+    second = fetch_news._fetch_via_yfinance(["AAPL", "MSFT"], 10, None)
+    assert periods[-1] == ("AAPL MSFT", "1d")
+    assert len(periods) == 2
+    assert second["AAPL"]["price"] == 105.0
+    assert second["AAPL"]["prev_close"] == 100.0
+    assert second["AAPL"]["change_percent"] == pytest.approx(5.0)
+    assert list(second) == ["AAPL", "MSFT"]
+
+
+def test_fetch_via_yfinance_refetches_history_on_new_session(monkeypatch, tmp_path):
+    import json
+    from vfinance_news import fetch_news
+
+    cache = tmp_path / "quote_sessions.json"
+    cache.write_text(json.dumps({"AAPL": {"session": "2026-01-05", "prev_close": 99.0}}))
+    monkeypatch.setattr(fetch_news, "QUOTE_SESSION_CACHE", cache)
+    monkeypatch.setattr("vfinance_news.price_store.PRICE_STORE_DIR", tmp_path / "prices")
+    periods = []
+
+    def fake_download(tickers, period, **_kwargs):
+        periods.append(period)
+        if period == "1d":
+            return _closes_frame({"AAPL": [104.0]}, ["2026-01-06"])
+        return _closes_frame({"AAPL": [100.0, 104.0]}, ["2026-01-05", "2026-01-06"])
+
+    monkeypatch.setattr(fetch_news.yf, "download", fake_download)
+
+    result = fetch_news._fetch_via_yfinance(["AAPL"], 10, None)
+
+    assert periods == ["1d", "5d"]
+    assert result["AAPL"]["prev_close"] == 100.0
+    assert json.loads(cache.read_text())["AAPL"] == {"session": "2026-01-06", "prev_close": 100.0}
+
+
+def test_fetch_via_yfinance_last_mode_fetches_single_bar(monkeypatch, tmp_path):
+    from vfinance_news import fetch_news
+
+    monkeypatch.setattr(fetch_news, "QUOTE_SESSION_CACHE", tmp_path / "quote_sessions.json")
+    monkeypatch.setattr("vfinance_news.price_store.PRICE_STORE_DIR", tmp_path / "prices")
+    periods = []
+
+    def fake_download(tickers, period, **_kwargs):
+        periods.append(period)
+        return _closes_frame({"AAPL": [104.0]}, ["2026-01-06"])
+
+    monkeypatch.setattr(fetch_news.yf, "download", fake_download)
+
+    result = fetch_news._fetch_via_yfinance(["AAPL"], 10, None, mode="last")
+
+    assert periods == ["1d"]
+    assert result["AAPL"]["price"] == 104.0
+    assert result["AAPL"]["prev_close"] == 0.0
+
+
+def test_fetch_via_yfinance_records_price_history(monkeypatch, tmp_path):
+    from vfinance_news import fetch_news, price_store
+
+    monkeypatch.setattr(fetch_news, "QUOTE_SESSION_CACHE", tmp_path / "quote_sessions.json")
+    monkeypatch.setattr(price_store, "PRICE_STORE_DIR", tmp_path / "prices")
+    monkeypatch.setattr(
+        fetch_news.yf,
+        "download",
+        lambda *_a, **_k: _closes_frame({"AAPL": [100.0, 104.0]}, ["2026-01-05", "2026-01-06"]),
+    )
+
+    fetch_news._fetch_via_yfinance(["AAPL"], 10, None)
+
+    assert list(price_store.get_closes("AAPL")) == [100.0, 104.0]
+
+
+def test_record_history_keeps_going_after_a_failed_symbol(monkeypatch, capsys):
+    from vfinance_news import fetch_news, price_store
+
+    recorded = []
+
+    def record_series(symbol, series):
+        if symbol == "AAA":
+            raise OSError("disk full")
+        recorded.append(symbol)
+
+    monkeypatch.setattr(price_store, "record_series", record_series)
+
+    fetch_news._record_history({"AAA": None, "BBB": None, "CCC": None})
+
+    assert recorded == ["BBB", "CCC"]
+    assert "Could not store price history for AAA" in capsys.readouterr().err
+
+
+def test_get_portfolio_movers_offline_reads_price_store(monkeypatch, tmp_path):
+    from datetime import date
+    from vfinance_news import fetch_news, price_store
+
+    monkeypatch.setattr(price_store, "PRICE_STORE_DIR", tmp_path / "prices")
+    monkeypatch.setattr(fetch_news, "get_portfolio_symbols", lambda: ["AAA", "BBB"])
+    monkeypatch.setattr(
+        fetch_news, "fetch_market_data", lambda *_a, **_k: pytest.fail("offline movers must not fetch quotes")
+    )
+    price_store.record_closes("AAA", [(date(2026, 1, 5), 100.0), (date(2026, 1, 6), 105.0)])
+    price_store.record_closes("BBB", [(date(2026, 1, 5), 50.0), (date(2026, 1, 6), 50.1)])
+
+    result = fetch_news.get_portfolio_movers(offline=True)
+
+    assert [m["symbol"] for m in result["movers"]] == ["AAA"]
+    assert result["movers"][0]["change_pct"] == pytest.approx(5.0)
+
+
+def test_get_large_portfolio_news_handles_none_change(monkeypatch, tmp_path):
+    monkeypatch.setattr("vfinance_news.article_store.ARTICLE_DB", tmp_path / "articles.db")
     monkeypatch.setattr("vfinance_news.fetch_news.get_portfolio_symbols", lambda: ["AAA", "BBB", "CCC"])
     monkeypatch.setattr(
         "vfinance_news.fetch_news._fetch_via_yfinance",
@@ -144,7 +366,45 @@ def test_get_large_portfolio_news_handles_none_change(monkeypatch):
     assert set(result["stocks"].keys()) == {"AAA", "BBB", "CCC"}
 
 
-def test_get_large_portfolio_news_respects_top_movers_count(monkeypatch):
+
+def test_normalized_movers_rank_history_less_moves_last(monkeypatch):
+    from vfinance_news import fetch_news, price_store
+
+    monkeypatch.setattr(fetch_news, "get_portfolio_symbols", lambda: ["NEW", "CALM", "WILD"])
+    monkeypatch.setattr(price_store, "load_quotes", lambda symbols: {
+        "NEW": {"price": 103.0, "prev_close": 100.0},
+        "CALM": {"price": 101.5, "prev_close": 100.0},
+        "WILD": {"price": 102.0, "prev_close": 100.0},
+    })
+    stats = {"CALM": {"z_score": 2.5}, "WILD": {"z_score": 0.8}}
+    monkeypatch.setattr(price_store, "move_stats", lambda symbol: stats.get(symbol, {}))
+
+    normalized = fetch_news.get_portfolio_movers(offline=True, volatility_normalized=True)
+    raw = fetch_news.get_portfolio_movers(offline=True)
+
+    assert [m["symbol"] for m in normalized["movers"]] == ["CALM", "WILD", "NEW"]
+    assert [m["symbol"] for m in raw["movers"]] == ["NEW", "WILD", "CALM"]
+
+
+def test_movers_command_passes_flags(monkeypatch, capsys):
+    from vfinance_news import fetch_news
+
+    calls = []
+    monkeypatch.setattr(
+        fetch_news,
+        "get_portfolio_movers",
+        lambda **kwargs: calls.append(kwargs) or {"movers": [{"symbol": "AAA", "change_pct": 2.0, "price": 10.0,
+                                                              "z_score": 2.4}]},
+    )
+    monkeypatch.setattr("sys.argv", ["fetch_news.py", "movers", "--normalized", "--offline"])
+
+    fetch_news.main()
+
+    assert calls[0]["offline"] is True and calls[0]["volatility_normalized"] is True
+    assert "AAA" in capsys.readouterr().out
+
+def test_get_large_portfolio_news_respects_top_movers_count(monkeypatch, tmp_path):
+    monkeypatch.setattr("vfinance_news.article_store.ARTICLE_DB", tmp_path / "articles.db")
     monkeypatch.setattr("vfinance_news.fetch_news.get_portfolio_symbols", lambda: ["AAA", "BBB", "CCC", "DDD"])
     monkeypatch.setattr(
         "vfinance_news.fetch_news._fetch_via_yfinance",
@@ -162,3 +422,36 @@ def test_get_large_portfolio_news_respects_top_movers_count(monkeypatch):
 
     assert result["meta"]["top_movers_count"] == 2
     assert len(result["stocks"]) == 2
+
+
+def test_get_large_portfolio_news_uses_store_mentions(monkeypatch, tmp_path):
+    import time
+    from vfinance_news import article_store
+
+    monkeypatch.setattr("vfinance_news.article_store.ARTICLE_DB", tmp_path / "articles.db")
+    article_store.ingest(
+        [{"title": "Alpha Corp beats estimates", "link": "https://x/1", "published_at": time.time() - 60}],
+        source_id="wsj",
+        source="WSJ",
+    )
+    monkeypatch.setattr("vfinance_news.fetch_news.get_portfolio_symbols", lambda: ["AAA", "BBB"])
+    monkeypatch.setattr(
+        "vfinance_news.fetch_news._fetch_via_yfinance",
+        lambda *_a, **_k: {
+            "AAA": {"change_percent": 5.0, "price": 10.0},
+            "BBB": {"change_percent": -4.0, "price": 20.0},
+        },
+    )
+    fetched = []
+    monkeypatch.setattr(
+        "vfinance_news.fetch_news.fetch_ticker_news",
+        lambda symbol, *_a, **_k: fetched.append(symbol) or [],
+    )
+
+    result = get_large_portfolio_news(
+        limit=2,
+        portfolio_meta={"AAA": {"name": "Alpha Corp"}, "BBB": {"name": "Beta"}},
+    )
+
+    assert [a["source"] for a in result["stocks"]["AAA"]["articles"]] == ["WSJ"]
+    assert fetched == ["BBB"]
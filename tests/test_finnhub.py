@@ -0,0 +1,129 @@
+"""Tests for the Finnhub client against a local stub server."""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from vfinance_news.finnhub import FinnhubClient, FinnhubError, TokenBucket
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.peers.add(self.client_address)
+            rate_limit = server.rate_limit_next
+            server.rate_limit_next = max(0, rate_limit - 1)
+        if self.headers.get("X-Finnhub-Token") != "test-token":
+            return self._reply(401, {"error": "bad token"})
+        if rate_limit:
+            return self._reply(429, {"error": "limit"}, {"Retry-After": "0"})
+        time.sleep(server.delay)
+        if self.path.startswith("/api/v1/stock/earnings"):
+            return self._reply(200, [{"actual": 1.6, "estimate": 1.5, "period": "2026-09-30"}])
+        return self._reply(200, {"earningsCalendar": [{"symbol": "AAPL", "date": "2026-10-30"}]})
+
+    def _reply(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.peers = set()
+    server.rate_limit_next = 0
+    server.delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stub, tmp_path):
+    host, port = stub.server_address
+    client = FinnhubClient("test-token", base_url=f"http://{host}:{port}/api/v1",
+                           rate_per_min=6000, burst=100, cache_dir=tmp_path / "finnhub")
+    yield client
+    client.close()
+
+
+def test_reuses_one_connection_and_sends_token_header(client, stub):
+    assert client.earnings_calendar("2026-10-19", "2026-10-26", ttl=0)[0]["symbol"] == "AAPL"
+    assert client.earnings_surprises("AAPL", ttl=0)[0]["actual"] == 1.6
+    assert len(stub.requests) == 2
+    assert all("token" not in path for path in stub.requests)
+    assert len(stub.peers) == 1
+    assert client.stats["connections"] == 1
+
+
+def test_disk_cache_serves_repeat_calls(client, stub, tmp_path):
+    client.earnings_surprises("AAPL")
+    client.earnings_surprises("AAPL")
+    fresh = FinnhubClient("test-token", base_url="http://127.0.0.1:9/api/v1", cache_dir=tmp_path / "finnhub")
+    assert fresh.earnings_surprises("AAPL")[0]["actual"] == 1.6
+    assert len(stub.requests) == 1
+    assert client.stats["cache_hits"] == 1
+
+
+def test_concurrent_identical_requests_are_coalesced(client, stub):
+    stub.delay = 0.2
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.earnings_surprises("MSFT", ttl=0)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 5 and all(r == results[0] for r in results)
+    assert len(stub.requests) == 1
+    assert client.stats["coalesced"] == 4
+
+
+def test_rate_limited_responses_are_retried(client, stub):
+    stub.rate_limit_next = 2
+    assert client.earnings_surprises("NVDA", ttl=0)[0]["period"] == "2026-09-30"
+    assert len(stub.requests) == 3
+    assert client.stats["rate_limited"] == 2
+
+
+def test_http_errors_raise_and_are_not_cached(stub, tmp_path):
+    host, port = stub.server_address
+    client = FinnhubClient("wrong", base_url=f"http://{host}:{port}/api/v1", cache_dir=tmp_path / "finnhub")
+    with pytest.raises(FinnhubError, match="HTTP 401"):
+        client.earnings_surprises("AAPL")
+    assert not (tmp_path / "finnhub").exists()
+
+
+def test_token_bucket_waits_for_refill():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate_per_sec=1.0, capacity=2, clock=lambda: now[0], sleep=sleep)
+    assert bucket.acquire() == 0 and bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(1.0)
+    now[0] += 0.5
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert sleeps == [pytest.approx(1.0), pytest.approx(0.5)]
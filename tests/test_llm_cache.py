@@ -0,0 +1,62 @@
+"""Tests for the LLM reply cache."""
+import json
+import os
+import time
+
+import pytest
+
+from vfinance_news import llm_cache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_DIR", tmp_path / "llm")
+    monkeypatch.delenv("VFINANCE_NEWS_LLM_CACHE_TTL_SEC", raising=False)
+    monkeypatch.delenv("VFINANCE_NEWS_LLM_CACHE_MAX_ENTRIES", raising=False)
+    llm_cache.reset_stats()
+    return tmp_path / "llm"
+
+
+def test_put_then_get_counts_hits_and_misses():
+    assert llm_cache.get("session", "briefing", "prompt") is None
+
+    llm_cache.put("session", "briefing", "prompt", "reply")
+
+    assert llm_cache.get("session", "briefing", "prompt") == "reply"
+    assert llm_cache.get("session", "analysis", "prompt") is None
+    assert llm_cache.stats() == {"hits": 1, "misses": 2}
+
+
+def test_expired_entries_miss(cache_dir):
+    llm_cache.put("session", "", "prompt", "reply")
+    path = cache_dir / f"{llm_cache.cache_key('session', '', 'prompt')}.json"
+    entry = json.loads(path.read_text())
+    entry["created_at"] = time.time() - llm_cache.DEFAULT_TTL_SEC - 1
+    path.write_text(json.dumps(entry))
+
+    assert llm_cache.get("session", "", "prompt") is None
+
+
+def test_eviction_drops_least_recently_used(cache_dir, monkeypatch):
+    monkeypatch.setenv("VFINANCE_NEWS_LLM_CACHE_MAX_ENTRIES", "2")
+    llm_cache.put("s", "", "first", "1")
+    llm_cache.put("s", "", "second", "2")
+    first = cache_dir / f"{llm_cache.cache_key('s', '', 'first')}.json"
+    second = cache_dir / f"{llm_cache.cache_key('s', '', 'second')}.json"
+    os.utime(first, (time.time() - 10, time.time() - 10))
+    os.utime(second, (time.time() - 20, time.time() - 20))
+
+    llm_cache.put("s", "", "third", "3")
+
+    assert llm_cache.get("s", "", "first") == "1"
+    assert llm_cache.get("s", "", "second") is None
+    assert llm_cache.get("s", "", "third") == "3"
+
+
+def test_zero_ttl_disables_cache(cache_dir, monkeypatch):
+    monkeypatch.setenv("VFINANCE_NEWS_LLM_CACHE_TTL_SEC", "0")
+
+    llm_cache.put("s", "", "prompt", "reply")
+
+    assert llm_cache.get("s", "", "prompt") is None
+    assert not cache_dir.exists()
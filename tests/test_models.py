@@ -0,0 +1,61 @@
+"""Tests for the slotted article, quote and portfolio models."""
+import json
+
+from vfinance_news import fetch_news
+from vfinance_news.models import Article, PortfolioEntry, Quote
+from vfinance_news.ranking import rank_headlines
+
+
+def test_article_round_trips_and_interns_shared_strings():
+    raw = json.loads(json.dumps([
+        {"title": "A", "link": "l1", "date": "", "published_at": None, "description": "", "source": "Reuters",
+         "_categories": ["macro"], "_score": 0.5, "sources": ["Reuters"]},
+        {"title": "B", "link": "l2", "date": "", "published_at": 1.0, "description": "d", "source": "Reuters"},
+    ]))
+    assert raw[0]["source"] is not raw[1]["source"]
+
+    first, second = (Article.from_dict(item) for item in raw)
+    assert not hasattr(first, "__dict__")
+    assert first.source is second.source
+    assert first.to_dict() == raw[0]
+    assert second.to_dict() == raw[1]
+    assert Article.from_dict({"title": "C"}, feed="top").to_dict() == {
+        "title": "C", "link": "", "date": "", "published_at": None, "description": "", "feed": "top"}
+
+
+def test_rank_headlines_returns_new_dicts_without_touching_input():
+    headlines = [
+        {"title": "Fed signals rate cut path", "source": "Reuters", "link": "a"},
+        {"title": "Oil rises as OPEC output drops", "source": "Bloomberg", "link": "b"},
+    ]
+    snapshot = json.loads(json.dumps(headlines))
+    result = rank_headlines(headlines)
+    assert headlines == snapshot
+    top = result["must_read"][0]
+    assert top["title"] == "Fed signals rate cut path"
+    assert "macro" in top["_categories"] and top["_score"] > 0
+
+
+def test_quote_and_portfolio_entry_shapes():
+    quote = {"price": 10.0, "change_percent": 2.0, "prev_close": 9.8, "symbol": "AAPL"}
+    assert Quote.from_dict(quote).to_dict() == quote
+    entry = PortfolioEntry.from_row({"symbol": " novo-b.co ", "name": "", "category": None})
+    assert entry.to_dict() == {"symbol": "NOVO-B.CO", "name": "NOVO-B.CO", "category": "", "notes": "",
+                               "type": "Watchlist"}
+
+
+def test_warm_quote_cache_holds_models_and_serves_dicts(monkeypatch):
+    calls = []
+    monkeypatch.setattr(fetch_news, "_warm_caches", None)
+    monkeypatch.setattr(fetch_news, "_warm_ttls", {})
+    fetch_news.enable_warm_caches()
+    monkeypatch.setattr(
+        fetch_news, "_fetch_via_yfinance",
+        lambda symbols, timeout, deadline, mode: calls.append(list(symbols))
+        or {s: {"price": 1.0, "change_percent": 0.0, "prev_close": 1.0, "symbol": s} for s in symbols},
+    )
+    first = fetch_news.fetch_market_data(["AAPL"])
+    second = fetch_news.fetch_market_data(["AAPL"])
+    assert isinstance(fetch_news._warm_get("quotes", ("change", "AAPL")), Quote)
+    assert first == second == {"AAPL": {"price": 1.0, "change_percent": 0.0, "prev_close": 1.0, "symbol": "AAPL"}}
+    assert calls == [["AAPL"]]
@@ -72,3 +72,73 @@ def test_load_portfolio_preserves_fields(tmp_path, monkeypatch):
     assert positions[0]["category"] == "Tech"
     assert positions[0]["notes"] == "Core holding"
     assert positions[0]["type"] == "stock"
+
+
+def test_use_portfolio_file_switches_and_restores(tmp_path, monkeypatch):
+    """Test temporary portfolio switch covers the module and subprocess env."""
+    import os
+    from vfinance_news import portfolio
+
+    monkeypatch.delenv("VFINANCE_NEWS_PORTFOLIO", raising=False)
+    original = portfolio.PORTFOLIO_FILE
+    desk_file = tmp_path / "desk.csv"
+    desk_file.write_text("symbol,name\nKO,Coca-Cola\n")
+
+    with portfolio.use_portfolio_file(desk_file):
+        assert portfolio.PORTFOLIO_FILE == desk_file
+        assert os.environ["VFINANCE_NEWS_PORTFOLIO"] == str(desk_file)
+        assert portfolio._get_portfolio_file() == desk_file
+        assert [p["symbol"] for p in load_portfolio()] == ["KO"]
+
+    assert portfolio.PORTFOLIO_FILE == original
+    assert "VFINANCE_NEWS_PORTFOLIO" not in os.environ
+
+
+def test_load_portfolio_reads_csv_once_and_reuses_snapshot(tmp_path, monkeypatch):
+    """Test the CSV is compiled once and served from the snapshot until it changes."""
+    import os
+    from vfinance_news import portfolio
+
+    portfolio_file = tmp_path / "portfolio.csv"
+    portfolio_file.write_text("symbol,name,category,notes,type,sector\n aapl ,Apple,Tech,,Holding,IT\nAAPL,Dup,,,,\nNOVO-B.CO,,,,,\n")
+    monkeypatch.setattr(portfolio, "PORTFOLIO_FILE", portfolio_file)
+    compiled = []
+    real_compile = portfolio._compile
+    monkeypatch.setattr(portfolio, "_compile", lambda path: compiled.append(path) or real_compile(path))
+
+    assert portfolio.validate_portfolio_csv(portfolio_file) == (True, ["Duplicate symbols found: AAPL"])
+    positions = load_portfolio()
+    assert [p["symbol"] for p in positions] == ["AAPL", "NOVO-B.CO"]
+    assert positions[1] == {"symbol": "NOVO-B.CO", "name": "NOVO-B.CO", "category": "", "notes": "", "type": "Watchlist"}
+    meta = portfolio.portfolio_metadata()
+    assert meta["AAPL"]["sector"] == "IT" and meta["NOVO-B.CO"]["name"] == ""
+    assert portfolio.portfolio_symbols() == ["AAPL", "NOVO-B.CO"]
+    assert len(compiled) == 1
+
+    # A fresh process loads the pickled snapshot without parsing
+    monkeypatch.setattr(portfolio, "_loaded", {})
+    positions[0]["name"] = "mutated"
+    assert load_portfolio()[0]["name"] == "Apple"
+    assert len(compiled) == 1
+
+    # Editing the file invalidates the snapshot
+    portfolio_file.write_text("symbol,name\nKO,Coca-Cola\n")
+    stat = portfolio_file.stat()
+    os.utime(portfolio_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert portfolio.portfolio_symbols() == ["KO"]
+    assert len(compiled) == 2
+
+
+def test_invalid_portfolio_returns_empty(tmp_path, monkeypatch, capsys):
+    """Test empty or non-UTF-8 files are reported and yield no positions."""
+    from vfinance_news import portfolio
+
+    portfolio_file = tmp_path / "portfolio.csv"
+    monkeypatch.setattr(portfolio, "PORTFOLIO_FILE", portfolio_file)
+    portfolio_file.write_bytes(b"symbol,name\nSAP.DE,\xff\n")
+    assert load_portfolio() == []
+    assert "File encoding issue" in capsys.readouterr().err
+
+    portfolio_file.write_text("")
+    assert portfolio.portfolio_symbols() == []
+    assert portfolio.validate_portfolio_csv(portfolio_file) == (False, ["CSV appears to be empty"])
@@ -0,0 +1,104 @@
+"""Tests for cache prefetching ahead of scheduled briefings."""
+import json
+from argparse import Namespace
+
+import pytest
+
+from vfinance_news import prefetch
+
+
+@pytest.mark.parametrize(
+    ("expr", "lead", "expected"),
+    [
+        ("30 6 * * 1-5", 10, "20 6 * * 1-5"),
+        ("0 13 * * 1-5", 10, "50 12 * * 1-5"),
+        ("5 0 * * 1-5", 10, "55 23 * * 0-4"),
+        ("0 0 * * 0,3", 30, "30 23 * * 2,6"),
+        ("0 0 * * *", 15, "45 23 * * *"),
+    ],
+)
+def test_shift_cron(expr, lead, expected):
+    assert prefetch.shift_cron(expr, lead) == expected
+
+
+@pytest.mark.parametrize("expr", ["*/15 6 * * *", "0 0 1 * *", "30 6 * *"])
+def test_shift_cron_rejects_unsupported(expr):
+    with pytest.raises(ValueError):
+        prefetch.shift_cron(expr, 10)
+
+
+def test_build_schedule_uses_enabled_briefing_crons():
+    sources = {
+        "schedule": {
+            "morning": {"enabled": True, "cron": "30 6 * * 1-5", "timezone": "America/Los_Angeles"},
+            "evening": {"enabled": False, "cron": "0 13 * * 1-5"},
+            "prefetch": {"lead_minutes": 10},
+        }
+    }
+
+    entries = prefetch.build_schedule(sources, 10)
+
+    assert entries == [{
+        "name": "morning",
+        "briefing_cron": "30 6 * * 1-5",
+        "cron": "20 6 * * 1-5",
+        "timezone": "America/Los_Angeles",
+    }]
+
+
+def test_print_schedule_reads_lead_from_config(monkeypatch, capsys):
+    monkeypatch.setattr(prefetch, "load_sources", lambda: {
+        "schedule": {
+            "morning": {"enabled": True, "cron": "30 6 * * 1-5", "timezone": "America/Los_Angeles"},
+            "prefetch": {"lead_minutes": 12},
+        }
+    })
+
+    prefetch.print_schedule(Namespace(lead_minutes=None, json=True))
+
+    assert json.loads(capsys.readouterr().out)[0]["cron"] == "18 6 * * 1-5"
+
+
+@pytest.mark.parametrize("lead", [0, 15, 30])
+def test_print_schedule_rejects_lead_past_feed_cache_ttl(monkeypatch, capsys, lead):
+    monkeypatch.setattr(prefetch, "load_sources", lambda: {
+        "schedule": {"morning": {"enabled": True, "cron": "30 6 * * 1-5"}},
+    })
+
+    with pytest.raises(SystemExit):
+        prefetch.print_schedule(Namespace(lead_minutes=lead, json=True))
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "1-14 minutes" in captured.err
+
+
+def test_prefetch_refreshes_feed_ticker_and_quote_caches(monkeypatch, tmp_path):
+    monkeypatch.setattr("vfinance_news.article_store.ARTICLE_DB", tmp_path / "articles.db")
+    monkeypatch.setattr(prefetch, "load_sources", lambda: {
+        "markets": {"us": {"indices": ["^GSPC"]}},
+        "headline_sources": ["wsj", "ft"],
+        "headline_exclude": ["ft"],
+        "rss_feeds": {
+            "wsj": {"name": "WSJ", "markets": "https://wsj.example/feed"},
+            "ft": {"name": "FT", "markets": "https://ft.example/feed"},
+        },
+    })
+    monkeypatch.setattr(prefetch, "get_portfolio_symbols", lambda: ["AAPL", "MSFT", "NVDA"])
+    quote_calls, feed_calls, ticker_calls = [], [], []
+    monkeypatch.setattr(
+        prefetch, "fetch_market_data", lambda symbols, **_k: quote_calls.append(symbols) or {s: {} for s in symbols}
+    )
+    monkeypatch.setattr(
+        prefetch, "fetch_feed_articles", lambda url, limit, **kwargs: feed_calls.append((url, kwargs["refresh"])) or [{}]
+    )
+    monkeypatch.setattr(
+        prefetch, "fetch_ticker_news", lambda symbol, limit, refresh: ticker_calls.append((symbol, refresh)) or [{}]
+    )
+
+    stats = prefetch.prefetch(max_tickers=2)
+
+    assert quote_calls == [["^GSPC", "AAPL", "MSFT", "NVDA"]]
+    assert feed_calls == [("https://wsj.example/feed", True)]
+    assert ticker_calls == [("AAPL", True), ("MSFT", True)]
+    assert stats == {"feeds": 1, "ticker_feeds": 2, "quotes": 4, "errors": 0}
@@ -0,0 +1,78 @@
+"""Tests for the local price history store."""
+from datetime import date
+
+import pytest
+
+from vfinance_news import price_store
+
+
+@pytest.fixture(autouse=True)
+def store_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(price_store, "PRICE_STORE_DIR", tmp_path / "prices")
+    return tmp_path / "prices"
+
+
+def test_load_history_empty_when_nothing_stored():
+    assert len(price_store.load_history("AAPL")) == 0
+    assert price_store.latest_quote("AAPL") is None
+
+
+def test_record_closes_appends_new_sessions():
+    assert price_store.record_closes("AAPL", [(date(2026, 1, 5), 100.0), (date(2026, 1, 6), 101.0)]) == 2
+    assert price_store.record_closes("AAPL", [(date(2026, 1, 7), 102.0)]) == 1
+
+    assert list(price_store.get_closes("AAPL")) == [100.0, 101.0, 102.0]
+    assert list(price_store.get_closes("AAPL", days=2)) == [101.0, 102.0]
+
+
+def test_record_closes_overwrites_latest_session_in_place():
+    price_store.record_closes("AAPL", [(date(2026, 1, 5), 100.0), (date(2026, 1, 6), 101.0)])
+
+    added = price_store.record_closes("AAPL", [(date(2026, 1, 6), 103.5)])
+
+    assert added == 0
+    assert list(price_store.get_closes("AAPL")) == [100.0, 103.5]
+
+
+def test_record_closes_merges_older_sessions():
+    price_store.record_closes("AAPL", [(date(2026, 1, 5), 100.0), (date(2026, 1, 7), 102.0)])
+
+    added = price_store.record_closes("AAPL", [(date(2026, 1, 2), 98.0), (date(2026, 1, 6), 101.0)])
+
+    assert added == 2
+    history = price_store.load_history("AAPL")
+    assert [date.fromordinal(int(d)).day for d in history["day"]] == [2, 5, 6, 7]
+    assert list(history["close"]) == [98.0, 100.0, 101.0, 102.0]
+
+
+def test_record_closes_skips_nan_and_handles_index_symbols(store_dir):
+    price_store.record_closes("^GSPC", [(date(2026, 1, 5), float("nan")), (date(2026, 1, 6), 6000.0)])
+
+    assert (store_dir / "_GSPC.bin").exists()
+    assert list(price_store.get_closes("^GSPC")) == [6000.0]
+
+
+def test_latest_quote_matches_fetch_market_data_shape():
+    price_store.record_closes("AAPL", [(date(2026, 1, 5), 100.0), (date(2026, 1, 6), 102.0)])
+
+    quote = price_store.latest_quote("AAPL")
+
+    assert quote["price"] == 102.0
+    assert quote["prev_close"] == 100.0
+    assert quote["change_percent"] == pytest.approx(2.0)
+    assert quote["as_of"] == "2026-01-06"
+
+
+def test_move_stats_multi_day_change_and_z_score():
+    closes = [100.0, 101.0, 100.0, 101.0, 100.0, 101.0, 110.0]
+    price_store.record_closes("AAPL", [(date(2026, 1, 1 + i), c) for i, c in enumerate(closes)])
+
+    stats = price_store.move_stats("AAPL", sessions=5)
+
+    assert stats["change_5d_pct"] == pytest.approx((110.0 / 101.0 - 1) * 100)
+    assert stats["volatility_pct"] > 0
+    assert stats["z_score"] > 1
+
+
+def test_move_stats_empty_without_history():
+    assert price_store.move_stats("AAPL") == {}
@@ -0,0 +1,78 @@
+"""Tests for token-budgeted prompt compaction."""
+from vfinance_news.prompt_budget import PromptItem, PromptSection, compact_prompt, estimate_tokens
+
+
+def _sections():
+    return [
+        PromptSection("## Market Data", [PromptItem("- S&P 500: 5000 (+1.00%)", label="US", required=True)]),
+        PromptSection("## Headlines", [
+            PromptItem("- Fed holds | WSJ | https://wsj.com/fed", score=3, label="Fed holds",
+                       description="The Federal Reserve left rates unchanged " * 10),
+            PromptItem("- Oil jumps | FT | https://ft.com/oil", score=2, label="Oil jumps"),
+            PromptItem("- Minor story | FT | https://ft.com/minor", score=1, label="Minor story"),
+        ]),
+        PromptSection("## Sources", [PromptItem("[1] https://wsj.com/fed", label="[1]", required=True)]),
+    ]
+
+
+def test_repeated_urls_become_reference_ids():
+    result = compact_prompt(_sections(), budget_tokens=10_000)
+
+    assert result.text.count("https://wsj.com/fed") == 1
+    assert "- Fed holds | WSJ | [L1]" in result.text
+    assert "[1] [L1]" in result.text
+    assert result.text.endswith("[L1] https://wsj.com/fed\n[L2] https://ft.com/oil\n[L3] https://ft.com/minor")
+    assert result.dropped == []
+    assert result.descriptions == "full"
+
+
+def test_descriptions_truncated_before_items_dropped():
+    full = compact_prompt(_sections(), budget_tokens=10_000)
+    result = compact_prompt(_sections(), budget_tokens=full.tokens - 50, description_chars=60)
+
+    assert result.descriptions == "truncated"
+    assert "…" in result.text
+    assert result.dropped == []
+    assert result.tokens <= result.budget
+
+
+def test_lowest_scoring_items_dropped_until_fit():
+    sections = _sections()
+    sections[1].items[0].description = ""
+    no_descriptions = compact_prompt(sections, budget_tokens=10_000)
+    result = compact_prompt(_sections(), budget_tokens=no_descriptions.tokens - 5)
+
+    assert result.descriptions == "removed"
+    assert [d["item"] for d in result.dropped] == ["Minor story"]
+    assert "https://ft.com/minor" not in result.text
+    assert "Minor story" not in [k["item"] for k in result.kept]
+    assert result.tokens <= result.budget
+
+
+def test_required_items_survive_tiny_budget():
+    result = compact_prompt(_sections(), budget_tokens=1)
+
+    assert "S&P 500" in result.text
+    assert "[1] [L1]" in result.text
+    assert {d["item"] for d in result.dropped} == {"Fed holds", "Oil jumps", "Minor story"}
+    assert result.tokens == estimate_tokens(result.text)
+
+
+def test_sections_on_different_scales_are_dropped_by_rank():
+    headlines = PromptSection("## Headlines", [
+        PromptItem(f"- Headline {i} " + "x" * 40, score=float(10 - i), label=f"H{i}") for i in range(10)
+    ])
+    holdings = PromptSection("## Holdings", [
+        PromptItem(f"- HOLD{i} " + "x" * 40, score=0.9 - i / 10, label=f"HOLD{i}") for i in range(4)
+    ], group="portfolio")
+    watchlist = PromptSection("## Watchlist", [
+        PromptItem(f"- WATCH{i} " + "x" * 40, score=0.3 - i / 10, label=f"WATCH{i}") for i in range(2)
+    ], group="portfolio")
+    full = compact_prompt([headlines, holdings, watchlist], budget_tokens=10_000)
+
+    result = compact_prompt([headlines, holdings, watchlist], budget_tokens=full.tokens // 2)
+
+    # Both sides lose their weakest items in step; the portfolio is not wiped out first,
+    # and within its group the watchlist goes before holdings
+    assert [d["item"] for d in result.dropped] == ["H9", "WATCH1", "H8", "H7", "WATCH0", "H6", "HOLD3", "H5", "H4"]
+    assert [k["item"] for k in result.kept] == ["H0", "H1", "H2", "H3", "HOLD0", "HOLD1", "HOLD2"]
@@ -2,6 +2,7 @@
 
 import json
 import sys
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 import subprocess
@@ -16,9 +17,16 @@ from vfinance_news.research import (
     research_with_gemini,
     format_raw_data_report,
     generate_research_content,
+    research_sections_with_minimax,
 )
 
 
+@pytest.fixture(autouse=True)
+def research_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("vfinance_news.research.RESEARCH_CACHE_DIR", tmp_path / "research-cache")
+    return tmp_path / "research-cache"
+
+
 @pytest.fixture
 def sample_market_data():
     """Sample market data for testing."""
@@ -351,3 +359,132 @@ class TestGenerateResearchContent:
                 call_args = mock_gemini.call_args
                 # Focus areas passed as second positional arg
                 assert call_args[0][1] == focus or call_args.kwargs.get("focus_areas") == focus
+
+    def test_compacts_prompt_to_token_budget(self, sample_market_data, sample_portfolio_data):
+        """Send a compacted prompt and report kept/dropped items."""
+        with patch("vfinance_news.research.gemini_available", return_value=True):
+            with patch("vfinance_news.research.research_with_gemini", return_value="Report") as mock_gemini:
+                result = generate_research_content(sample_market_data, sample_portfolio_data, token_budget=1)
+
+        prompt = mock_gemini.call_args[0][0]
+        assert "## Market Data" in prompt
+        assert "## Current Headlines" not in prompt
+        assert result["prompt"]["budget"] == 1
+        assert result["prompt"]["dropped"]
+
+    def test_fans_out_sections_when_requested(self, sample_market_data, sample_portfolio_data):
+        """Use per-section research when sections are given."""
+        with patch("vfinance_news.research.gemini_available", return_value=True):
+            with patch("vfinance_news.research.research_sections_with_minimax", return_value="Sections") as mock_sections:
+                result = generate_research_content(
+                    sample_market_data, sample_portfolio_data, ["tech"], sections=["macro", "risks"]
+                )
+
+        assert result["report"] == "Sections"
+        assert mock_sections.call_args[0][1:] == (["macro", "risks"], ["tech"])
+
+
+class TestResearchSections:
+    """Tests for research_sections_with_minimax()."""
+
+    @staticmethod
+    def _fake_run(delays: dict, failures: dict | None = None):
+        def run(cmd, timeout, **_kwargs):
+            prompt = cmd[1]
+            title = prompt.split('"')[1]
+            time.sleep(delays.get(title, 0))
+            if title in (failures or {}):
+                raise failures[title]
+            return Mock(returncode=0, stdout=f"{title} text\n", stderr="")
+        return run
+
+    def test_runs_sections_concurrently_and_keeps_order(self):
+        """Wall time is about the slowest section; output follows section order."""
+        delays = {"Macro Trends": 0.3, "Sector Analysis": 0.3, "Company News": 0.3, "Risks": 0.3}
+        started = time.monotonic()
+        with patch("subprocess.run", side_effect=self._fake_run(delays)):
+            report = research_sections_with_minimax("content")
+
+        assert time.monotonic() - started < 1.0
+        titles = [line for line in report.splitlines() if line.startswith("## ")]
+        assert titles == ["## Macro Trends", "## Sector Analysis", "## Company News", "## Risks"]
+        assert "Risks text" in report
+
+    def test_slow_section_does_not_sink_report(self):
+        """A timed-out section is marked unavailable; the rest survive."""
+        failures = {"Sector Analysis": subprocess.TimeoutExpired(cmd="minimax-prompt", timeout=90)}
+        with patch("subprocess.run", side_effect=self._fake_run({}, failures)):
+            report = research_sections_with_minimax("content", ["macro", "sectors"])
+
+        assert "Macro Trends text" in report
+        assert "## Sector Analysis\n\n_Section unavailable._" in report
+
+    def test_all_sections_failing_returns_error(self):
+        """Report an error when no section completes."""
+        with patch("subprocess.run", side_effect=FileNotFoundError()):
+            report = research_sections_with_minimax("content", ["macro", "risks"])
+
+        assert report.startswith("⚠️ MiniMax research error")
+
+    def test_rejects_unknown_sections(self):
+        with pytest.raises(ValueError):
+            research_sections_with_minimax("content", ["weather"])
+
+    def test_rejects_empty_sections(self):
+        with pytest.raises(ValueError, match="No research sections"):
+            research_sections_with_minimax("content", [])
+
+
+class TestResearchCache:
+    """Tests for the research report cache."""
+
+    def test_reuses_report_when_only_timestamps_change(self, sample_market_data, sample_portfolio_data):
+        """Inputs differing only in volatile fields hit the cache."""
+        later = json.loads(json.dumps(sample_market_data))
+        later["fetched_at"] = "2026-01-01T10:05:00"
+        for article in later.get("headlines", []):
+            article["published_at"] = 1767261900.0
+        with patch("vfinance_news.research.gemini_available", return_value=True):
+            with patch("vfinance_news.research.research_with_gemini", return_value="Report") as mock_gemini:
+                first = generate_research_content(sample_market_data, sample_portfolio_data)
+                second = generate_research_content(later, sample_portfolio_data)
+
+        mock_gemini.assert_called_once()
+        assert second["report"] == first["report"] == "Report"
+        assert second["cached"] is True
+
+    def test_changed_quotes_miss_cache(self, sample_market_data, sample_portfolio_data):
+        """A moved quote regenerates the report."""
+        moved = json.loads(json.dumps(sample_market_data))
+        moved["markets"]["us"]["indices"]["SPY"]["data"]["price"] = 5300.0
+        with patch("vfinance_news.research.gemini_available", return_value=True):
+            with patch("vfinance_news.research.research_with_gemini", return_value="Report") as mock_gemini:
+                generate_research_content(sample_market_data, sample_portfolio_data)
+                generate_research_content(moved, sample_portfolio_data)
+
+        assert mock_gemini.call_count == 2
+
+    def test_errors_and_partial_reports_not_cached(self, sample_market_data, sample_portfolio_data, research_cache_dir):
+        """Failed or partial reports are regenerated next time."""
+        partial = "## Macro Trends\n\nText\n\n## Risks\n\n_Section unavailable._"
+        with patch("vfinance_news.research.gemini_available", return_value=True):
+            with patch("vfinance_news.research.research_with_gemini", return_value="⚠️ MiniMax research timeout"):
+                generate_research_content(sample_market_data, sample_portfolio_data)
+            with patch("vfinance_news.research.research_sections_with_minimax", return_value=partial):
+                generate_research_content(sample_market_data, sample_portfolio_data, sections=["macro", "risks"])
+
+        assert not list(research_cache_dir.glob("*.json"))
+
+    def test_expired_entries_miss(self, sample_market_data, sample_portfolio_data, research_cache_dir):
+        """Entries older than the TTL are ignored."""
+        with patch("vfinance_news.research.gemini_available", return_value=True):
+            with patch("vfinance_news.research.research_with_gemini", return_value="Report") as mock_gemini:
+                generate_research_content(sample_market_data, sample_portfolio_data)
+                (entry,) = research_cache_dir.glob("*.json")
+                data = json.loads(entry.read_text())
+                data["created_at"] -= 4 * 3600
+                entry.write_text(json.dumps(data))
+                generate_research_content(sample_market_data, sample_portfolio_data)
+
+        assert mock_gemini.call_count == 2
+
@@ -0,0 +1,198 @@
+"""Tests for the serve daemon and its CLI thin client."""
+import json
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from vfinance_news import cli, server
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are length-limited, so avoid pytest's long tmp_path
+    with tempfile.TemporaryDirectory(dir="/tmp") as tmp:
+        yield Path(tmp) / "vf.sock"
+
+
+@pytest.fixture
+def fake_commands(monkeypatch):
+    calls = []
+
+    def fake_main():
+        calls.append(list(sys.argv))
+        print("served output")
+        if "--fail" in sys.argv:
+            sys.exit(3)
+
+    monkeypatch.setattr(server, "_command_entry", lambda command: (fake_main, ["market"] if command == "market" else []))
+    return calls
+
+
+@pytest.fixture
+def running_daemon(socket_path, fake_commands):
+    daemon = server._ThreadingUnixServer(str(socket_path), server._RequestHandler)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    daemon.shutdown()
+    daemon.server_close()
+
+
+@pytest.mark.parametrize(
+    ("command", "argv", "expected"),
+    [
+        ("briefing", ["--json"], True),
+        ("briefing", ["--batch", "portfolios.json"], False),
+        ("market", [], True),
+        ("alerts", ["check", "--json"], True),
+        ("alerts", ["set", "AAPL", "100"], False),
+        ("earnings", ["check"], True),
+        ("earnings", ["refresh"], False),
+        ("portfolio", ["list"], False),
+    ],
+)
+def test_is_served(command, argv, expected):
+    assert server.is_served(command, argv) is expected
+
+
+def test_run_command_captures_output_and_exit_code(fake_commands):
+    ok = server.run_command("market", ["--json"])
+    failed = server.run_command("alerts", ["check", "--fail"])
+
+    assert ok == {"ok": True, "exit_code": 0, "stdout": "served output\n", "stderr": ""}
+    assert fake_commands[0] == ["vfinance-news market", "market", "--json"]
+    assert failed["ok"] is False
+    assert failed["exit_code"] == 3
+
+
+def test_handle_request_rejects_unserved_command(fake_commands):
+    response = server.handle_request({"command": "alerts", "argv": ["delete", "AAPL"]})
+
+    assert response["exit_code"] == 2
+    assert fake_commands == []
+
+
+def test_request_round_trip_over_socket(running_daemon, fake_commands):
+    response = server.request("alerts", ["check", "--json"], socket_path=running_daemon)
+
+    assert response["ok"] is True
+    assert response["stdout"] == "served output\n"
+    assert fake_commands == [["vfinance-news alerts", "check", "--json"]]
+
+
+def test_handle_request_declines_other_portfolio(fake_commands, monkeypatch, tmp_path):
+    monkeypatch.setenv("VFINANCE_NEWS_PORTFOLIO", str(tmp_path / "daemon.csv"))
+    declined = server.handle_request({"command": "market", "argv": [], "portfolio": str(tmp_path / "client.csv")})
+    served = server.handle_request({"command": "market", "argv": [], "portfolio": str(tmp_path / "daemon.csv")})
+
+    assert declined["run_locally"] is True
+    assert served["ok"] is True
+    assert len(fake_commands) == 1
+
+
+def test_request_runs_locally_when_daemon_portfolio_differs(running_daemon, fake_commands, monkeypatch):
+    client_paths = iter(["/client/portfolio.csv"])
+    monkeypatch.setattr(server, "_portfolio_path", lambda: next(client_paths, "/daemon/portfolio.csv"))
+
+    assert server.request("market", [], socket_path=running_daemon) is None
+    assert fake_commands == []
+
+
+def test_busy_daemon_sends_request_back_without_blocking(running_daemon, fake_commands, monkeypatch):
+    monkeypatch.setattr(server, "BUSY_WAIT_SEC", 0.01)
+    with server._run_lock:
+        # A long command holds the lock; ping and other requests still get answers
+        pong = server.request("ping", [], socket_path=running_daemon)
+        declined = server.request("alerts", ["check"], socket_path=running_daemon)
+
+    assert pong["stdout"] == "pong\n"
+    assert declined is None
+    assert fake_commands == []
+
+
+
+def test_daemon_declines_while_timed_out_briefing_runs(fake_commands, monkeypatch):
+    from vfinance_news import briefing
+
+    monkeypatch.setattr(briefing, "summarize_worker_running", lambda: True)
+    response = server.handle_request({"command": "market", "argv": []})
+
+    assert response["run_locally"] is True
+    assert fake_commands == []
+
+def test_request_returns_none_without_daemon(socket_path):
+    assert server.request("market", [], socket_path=socket_path) is None
+
+
+def test_cli_forwards_to_running_daemon(monkeypatch, capsys):
+    monkeypatch.delenv("VFINANCE_NEWS_NO_DAEMON", raising=False)
+    monkeypatch.setattr(
+        server,
+        "request",
+        lambda command, argv: {"ok": True, "exit_code": 0, "stdout": f"{command} {argv}\n", "stderr": ""},
+    )
+    monkeypatch.setattr("sys.argv", ["vfinance-news", "earnings", "check", "--week"])
+
+    cli.main()
+
+    assert capsys.readouterr().out == "earnings ['check', '--week']\n"
+
+
+def test_cli_propagates_daemon_exit_code(monkeypatch):
+    monkeypatch.delenv("VFINANCE_NEWS_NO_DAEMON", raising=False)
+    monkeypatch.setattr(
+        server, "request", lambda *_a: {"ok": False, "exit_code": 1, "stdout": "", "stderr": "❌ failed\n"}
+    )
+    monkeypatch.setattr("sys.argv", ["vfinance-news", "briefing"])
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main()
+    assert exc.value.code == 1
+
+
+def test_cli_runs_locally_when_daemon_disabled(monkeypatch):
+    monkeypatch.setenv("VFINANCE_NEWS_NO_DAEMON", "1")
+    monkeypatch.setattr(server, "request", lambda *_a: pytest.fail("daemon must not be contacted"))
+    called = []
+    from vfinance_news import alerts
+
+    monkeypatch.setattr(alerts, "main", lambda: called.append(list(sys.argv)))
+    monkeypatch.setattr("sys.argv", ["vfinance-news", "alerts", "check"])
+
+    cli.main()
+
+    assert called == [["vfinance-news alerts", "check"]]
+
+
+def test_warm_caches_reuse_parsed_feeds_and_quotes(monkeypatch):
+    from vfinance_news import fetch_news
+
+    monkeypatch.setattr(fetch_news, "_warm_caches", None)
+    fetch_news.enable_warm_caches()
+    feed_fetches = []
+    quote_fetches = []
+    monkeypatch.setattr(
+        fetch_news,
+        "fetch_with_retry",
+        lambda url, **_k: feed_fetches.append(url) or b"<rss><channel><item><title>Stocks rally on Fed</title>"
+        b"<link>https://example.com/a</link></item></channel></rss>",
+    )
+    monkeypatch.setattr(
+        fetch_news,
+        "_fetch_via_yfinance",
+        lambda symbols, timeout, deadline, mode: quote_fetches.append(list(symbols))
+        or {s: {"price": 1.0, "symbol": s} for s in symbols},
+    )
+
+    first = fetch_news.fetch_rss("https://example.com/feed")
+    second = fetch_news.fetch_rss("https://example.com/feed")
+    fetch_news.fetch_market_data(["AAPL"])
+    quotes = fetch_news.fetch_market_data(["AAPL", "MSFT"])
+
+    assert first == second
+    assert feed_fetches == ["https://example.com/feed"]
+    assert quote_fetches == [["AAPL"], ["MSFT"]]
+    assert list(quotes) == ["AAPL", "MSFT"]
@@ -19,6 +19,7 @@ from vfinance_news.stocks import (
     add_to_holdings,
     move_to_holdings,
     remove_stock,
+    StocksStore,
 )
 
 
@@ -233,6 +234,20 @@ class TestMoveToHoldings:
         assert "NVDA" in get_holding_tickers(data)
         assert "NVDA" not in get_watchlist_tickers(data)
 
+    def test_move_already_held_keeps_holding_fields(self, stocks_file, monkeypatch):
+        """Moving a ticker that is already held merges into the holding."""
+        monkeypatch.setattr("vfinance_news.stocks.STOCKS_FILE", stocks_file)
+        add_to_holdings("NVDA", name="NVIDIA", category="Semis", target=700.0, stop=600.0,
+                        alerts=[{"type": "below", "price": 650.0}])
+
+        assert move_to_holdings("NVDA", notes="Added more") is True
+
+        data = load_stocks(stocks_file)
+        holding = next(h for h in data["holdings"] if h["ticker"] == "NVDA")
+        assert holding == {"ticker": "NVDA", "name": "NVIDIA", "category": "Semis", "notes": "Added more",
+                           "target": 700.0, "stop": 600.0, "alerts": [{"type": "below", "price": 650.0}]}
+        assert "NVDA" not in get_watchlist_tickers(data)
+
     def test_move_nonexistent_returns_false(self, stocks_file, monkeypatch):
         """Moving non-existent ticker returns False."""
         monkeypatch.setattr("vfinance_news.stocks.STOCKS_FILE", stocks_file)
@@ -281,3 +296,63 @@ class TestRemoveStock:
 
         data = load_stocks(stocks_file)
         assert "AAPL" not in get_holding_tickers(data)
+
+
+class TestStocksStore:
+    """Tests for StocksStore batched, indexed edits."""
+
+    def test_batch_writes_once(self, stocks_file):
+        """Many mutations in one block produce a single save."""
+        with patch("vfinance_news.stocks.save_stocks", wraps=save_stocks) as mock_save:
+            with StocksStore(stocks_file) as store:
+                for i in range(500):
+                    store.add_to_watchlist(f"T{i:03d}", target=float(i))
+                assert store.move_to_holdings("NVDA", name="NVIDIA") is True
+                assert store.remove("MSFT") is True
+                assert store.get("T042", "watchlist")["target"] == 42.0
+        assert mock_save.call_count == 1
+
+        data = load_stocks(stocks_file)
+        assert [h["ticker"] for h in data["holdings"]] == ["AAPL", "NVDA"]
+        assert len(data["watchlist"]) == 501
+        assert data["watchlist"][0]["ticker"] == "T000" and data["watchlist"][-1]["ticker"] == "TSLA"
+
+    def test_removals_keep_order_and_no_changes_skip_write(self, stocks_file):
+        """Removing keeps file order; a read-only block does not rewrite the file."""
+        stocks_file.write_text(json.dumps({"holdings": [{"ticker": "MSFT"}, {"ticker": "AAPL"}, {"ticker": "KO"}],
+                                           "watchlist": []}))
+        with StocksStore(stocks_file) as store:
+            store.remove("AAPL", from_list="holdings")
+        assert [h["ticker"] for h in load_stocks(stocks_file)["holdings"]] == ["MSFT", "KO"]
+
+        with patch("vfinance_news.stocks.save_stocks") as mock_save:
+            with StocksStore(stocks_file) as store:
+                assert store.tickers("holdings") == {"MSFT", "KO"}
+                assert store.set_alert("NONEXISTENT", target=1.0) is False
+        mock_save.assert_not_called()
+
+    def test_duplicate_and_tickerless_entries_are_kept(self, stocks_file, capsys):
+        """Entries that cannot be indexed are warned about and saved back, not dropped."""
+        stocks_file.write_text(json.dumps({
+            "holdings": [{"ticker": "AAPL", "name": "first"}, {"ticker": "AAPL", "name": "second"},
+                         {"name": "no ticker"}],
+            "watchlist": [],
+        }))
+        with StocksStore(stocks_file) as store:
+            assert store.get("AAPL", "holdings")["name"] == "first"
+            store.add_to_watchlist("KO")
+        assert "2 holdings entries" in capsys.readouterr().err
+
+        holdings = load_stocks(stocks_file)["holdings"]
+        assert [h.get("name") for h in holdings] == ["first", "second", "no ticker"]
+
+        with StocksStore(stocks_file) as store:
+            assert store.remove("AAPL", from_list="holdings") is True
+        assert load_stocks(stocks_file)["holdings"] == [{"name": "no ticker"}]
+
+    def test_failed_write_leaves_file_intact(self, stocks_file, sample_stocks_data):
+        """An error while writing keeps the previous file and no temp file."""
+        with pytest.raises(TypeError):
+            save_stocks({**sample_stocks_data, "holdings": [object()]}, stocks_file)
+        assert json.loads(stocks_file.read_text())["holdings"] == sample_stocks_data["holdings"]
+        assert [p.name for p in stocks_file.parent.iterdir()] == [stocks_file.name]
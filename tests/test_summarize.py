@@ -1,8 +1,12 @@
 """Tests for summarize helpers."""
 import json
 import sys
+import threading
+import time
 from pathlib import Path
 
+import pytest
+
 from datetime import datetime
 
 import vfinance_news.summarize as summarize
@@ -185,11 +189,7 @@ def test_generate_briefing_llm_uses_openclaw(capsys, monkeypatch):
     monkeypatch.setattr(summarize, "get_portfolio_news", lambda *_a, **_k: None)
     monkeypatch.setattr(summarize, "get_portfolio_movers", lambda *_a, **_k: {"movers": []})
     monkeypatch.setattr(summarize, "summarize_with_openclaw", lambda *_a, **_k: "LLM OK")
-    monkeypatch.setattr(
-        summarize,
-        "build_briefing_summary",
-        lambda *_a, **_k: (_ for _ in ()).throw(AssertionError("deterministic summary should not be used")),
-    )
+    monkeypatch.setattr(summarize, "build_briefing_summary", lambda *_a, **_k: "DETERMINISTIC")
 
     args = type(
         "Args",
@@ -211,6 +211,130 @@ def test_generate_briefing_llm_uses_openclaw(capsys, monkeypatch):
     assert output["summary_mode"] == "llm"
     assert output["summary_model_used"] == "openclaw"
     assert output["summary_model_attempts"] == ["openclaw"]
+    assert set(output["generator"]["llm_cache"]) == {"hits", "misses"}
+
+
+def test_generate_briefing_llm_cutoff_returns_deterministic(capsys, monkeypatch):
+    monkeypatch.setattr(
+        summarize,
+        "get_market_news",
+        lambda *_a, **_k: {
+            "headlines": [{"source": "CNBC", "title": "Headline one", "link": "https://example.com/1"}],
+            "markets": {},
+        },
+    )
+    monkeypatch.setattr(summarize, "get_portfolio_news", lambda *_a, **_k: None)
+    monkeypatch.setattr(summarize, "get_portfolio_movers", lambda *_a, **_k: {"movers": []})
+    monkeypatch.setattr(summarize, "build_briefing_summary", lambda *_a, **_k: "DETERMINISTIC")
+    cancelled = []
+
+    def slow_summary(*_args, cancel=None, **_kwargs):
+        cancelled.append(cancel)
+        cancel.wait(5)
+        return "⚠️ OpenClaw briefing error: cancelled"
+
+    monkeypatch.setattr(summarize, "summarize_with_openclaw", slow_summary)
+
+    args = type(
+        "Args",
+        (),
+        {
+            "style": "briefing",
+            "json": True,
+            "research": False,
+            "deadline": None,
+            "fast": False,
+            "llm": True,
+            "llm_cutoff": 0.1,
+            "debug": False,
+        },
+    )()
+
+    summarize.generate_briefing(args)
+    output = json.loads(capsys.readouterr().out)
+    assert output["summary"] == "DETERMINISTIC"
+    assert output["summary_mode"] == "deterministic"
+    assert output["summary_model_used"] == "deterministic_llm_cutoff"
+    assert cancelled[0].is_set()
+
+
+def test_run_cancellable_stops_process_when_cancelled():
+    cancel = threading.Event()
+    timer = threading.Timer(0.1, cancel.set)
+    timer.start()
+    started = time.monotonic()
+
+    with pytest.raises(summarize.ProcessCancelled):
+        summarize.run_cancellable([sys.executable, "-c", "import time; time.sleep(30)"], timeout=30, cancel=cancel)
+
+    assert time.monotonic() - started < 5
+
+
+def test_run_cancellable_captures_output():
+    result = summarize.run_cancellable([sys.executable, "-c", "print('hi')"], timeout=10)
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == "hi"
+
+
+def test_build_prompt_sections_keeps_selected_headlines_under_budget(monkeypatch):
+    monkeypatch.setattr(summarize, "load_portfolio_metadata", lambda: {})
+    shortlist = [
+        {"title": f"Headline {i}", "source": "WSJ", "link": f"https://example.com/{i}", "links": [f"https://example.com/{i}"]}
+        for i in range(8)
+    ]
+    top = [shortlist[5]]
+    portfolio = {"stocks": {"AAPL": {"quote": {"price": 100, "change_percent": 4.0}, "articles": [], "info": {}}}}
+
+    sections = summarize.build_prompt_sections({"markets": {}}, shortlist, top, portfolio, summarize.ENGLISH_LABELS)
+    result = summarize.compact_prompt(sections, budget_tokens=1)
+
+    assert "Headline 5" in result.text
+    assert "[1] [L1]" in result.text
+    assert result.text.count("https://example.com/5") == 1
+    assert {d["item"] for d in result.dropped} == {f"Headline {i}" for i in range(8) if i != 5} | {"AAPL"}
+
+
+
+def test_build_prompt_sections_leaves_out_headline_descriptions(monkeypatch):
+    monkeypatch.setattr(summarize, "load_portfolio_metadata", lambda: {})
+    shortlist = [{"title": "Fed holds", "source": "WSJ", "link": "https://example.com/1",
+                  "description": "Long article summary"}]
+
+    sections = summarize.build_prompt_sections({"markets": {}}, shortlist, [], None, summarize.ENGLISH_LABELS)
+    result = summarize.compact_prompt(sections, budget_tokens=10_000)
+
+    assert "Fed holds" in result.text
+    assert "Long article summary" not in result.text
+
+def test_generate_briefing_stream_final_matches_json(capsys, monkeypatch):
+    monkeypatch.setattr(
+        summarize,
+        "get_market_news",
+        lambda *_a, **_k: {
+            "headlines": [{"source": "CNBC", "title": "Headline one", "link": "https://example.com/1"}],
+            "markets": {
+                "us": {"name": "US Markets", "indices": {"^GSPC": {"name": "S&P 500", "data": {"price": 100, "change_percent": 1.0}}}},
+            },
+        },
+    )
+    monkeypatch.setattr(summarize, "get_portfolio_news", lambda *_a, **_k: None)
+    monkeypatch.setattr(summarize, "get_portfolio_movers", lambda *_a, **_k: {"movers": []})
+    monkeypatch.setattr(summarize, "shorten_url", lambda url: url)
+    monkeypatch.setattr(summarize, "datetime", FixedDateTime)
+
+    def run(**overrides):
+        fields = {"style": "briefing", "json": False, "stream": False, "research": False, "deadline": None,
+                  "fast": False, "llm": False, "debug": False}
+        fields.update(overrides)
+        summarize.generate_briefing(type("Args", (), fields)())
+        return capsys.readouterr().out
+
+    json_output = run(json=True)
+    events = [json.loads(line) for line in run(stream=True).splitlines()]
+
+    assert [e["event"] for e in events] == ["markets", "headlines", "portfolio", "summary", "final"]
+    assert json.dumps(events[-1]["document"], indent=2, ensure_ascii=False) == json_output.strip()
 
 
 def test_extract_agent_reply_reads_nested_payload_text():
@@ -235,6 +359,48 @@ def test_extract_agent_reply_reads_nested_payload_text():
     assert "payloads" not in reply
 
 
+def test_run_agent_prompt_reuses_cached_reply(monkeypatch, tmp_path):
+    from vfinance_news import llm_cache
+
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_DIR", tmp_path / "llm")
+    llm_cache.reset_stats()
+    calls = []
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(cmd)
+        return type("Result", (), {"returncode": 0, "stdout": '{"selected": [1, 2]}', "stderr": ""})()
+
+    monkeypatch.setattr(summarize.subprocess, "run", fake_run)
+
+    first = summarize.run_agent_prompt("Pick headlines", session_id="s")
+    second = summarize.run_agent_prompt("Pick headlines", session_id="s")
+
+    assert first == second == '{"selected": [1, 2]}'
+    assert len(calls) == 1
+    assert llm_cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_summarize_with_openclaw_caches_reply_without_disclaimer(monkeypatch, tmp_path):
+    from vfinance_news import llm_cache
+
+    monkeypatch.setattr(llm_cache, "LLM_CACHE_DIR", tmp_path / "llm")
+    calls = []
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(cmd)
+        return type("Result", (), {"returncode": 0, "stdout": "Markets rose.", "stderr": ""})()
+
+    monkeypatch.setattr(summarize, "run_cancellable", fake_run)
+
+    first = summarize.summarize_with_openclaw("content", "analysis")
+    second = summarize.summarize_with_openclaw("content", "analysis")
+    summarize.summarize_with_openclaw("content", "headlines")
+
+    assert first == second
+    assert first.count(summarize.format_disclaimer().strip()) == 1
+    assert len(calls) == 2
+
+
 # --- Tests for watchpoints feature (Issue #92) ---
 
 
@@ -339,6 +505,20 @@ class TestDetectSectorClusters:
         clusters = detect_sector_clusters(movers, portfolio_meta)
         assert len(clusters) == 0
 
+    def test_cluster_on_multi_day_change(self):
+        movers = [
+            {"symbol": "NVDA", "change_pct": 0.2, "change_5d_pct": -6.0},
+            {"symbol": "AMD", "change_pct": -0.1, "change_5d_pct": -5.0},
+            {"symbol": "INTC", "change_pct": 0.3, "change_5d_pct": -4.0},
+        ]
+        portfolio_meta = {sym: {"category": "Tech"} for sym in ("NVDA", "AMD", "INTC")}
+
+        assert detect_sector_clusters(movers, portfolio_meta) == []
+        clusters = detect_sector_clusters(movers, portfolio_meta, change_key="change_5d_pct")
+        assert len(clusters) == 1
+        assert clusters[0].direction == "down"
+        assert clusters[0].avg_change == -5.0
+
 
 class TestClassifyMoveType:
     def test_earnings_with_keyword(self):
@@ -512,6 +692,23 @@ class TestBuildWatchpointsData:
         # vs_index should be calculated
         assert nvda_mover.vs_index == -5.0 - (-0.5)  # -4.5
 
+    def test_labels_movers_that_reported_earnings(self):
+        movers = [
+            {"symbol": "AAPL", "change_pct": 4.0, "price": 150.0},
+            {"symbol": "XOM", "change_pct": 4.5, "price": 110.0},
+        ]
+        results = {"aapl": {"date": "2026-10-16", "eps_actual": 1.6, "eps_estimate": 1.5,
+                            "eps_surprise_pct": 6.67}}
+        data = build_watchpoints_data(movers, [], {}, 0.0, earnings_results=results)
+
+        aapl = next(m for m in data.movers if m.symbol == "AAPL")
+        xom = next(m for m in data.movers if m.symbol == "XOM")
+        assert aapl.move_type == "earnings" and aapl.earnings["eps_actual"] == 1.6
+        assert xom.move_type != "earnings" and xom.earnings is None
+
+        output = format_watchpoints(data, {})
+        assert "**AAPL** (+4.0%) (vs Index: +4.0%) -- earnings: EPS 1.60 vs 1.50 est (+6.7%)" in output
+
     def test_handles_empty_movers(self):
         result = build_watchpoints_data([], [], {}, 0.0)
         assert result.movers == []
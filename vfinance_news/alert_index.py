@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Price-level index for large alert books.
+
+Alerts are grouped per ticker and sorted by target_price, so the levels a
+quote triggers (every target at or above the price) are one contiguous
+slice found with a bisect. Whole quote batches are evaluated at once with
+NumPy: each alert is compared against its ticker's price in a single
+vectorized pass, in place of a Python loop over every alert.
+
+Benchmark: python -m benchmarks.bench_alert_index
+"""
+
+from bisect import bisect_left
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class Evaluation:
+    """Per-alert results, aligned with the alerts the index was built from.
+
+    Alerts without a quote have price NaN and are neither triggered nor new.
+    """
+    price: np.ndarray
+    pct_from_target: np.ndarray
+    triggered: np.ndarray
+    new: np.ndarray
+
+    def has_price(self) -> np.ndarray:
+        return ~np.isnan(self.price)
+
+
+class AlertIndex:
+    """Alerts grouped by ticker, ascending by target_price within each ticker."""
+
+    def __init__(self, alerts: list[dict]):
+        self.alerts = alerts
+        tickers = np.array([a["ticker"] for a in alerts], dtype=str)
+        targets = np.array([a["target_price"] for a in alerts], dtype=np.float64)
+
+        self.tickers, ticker_ids = np.unique(tickers, return_inverse=True)
+        ticker_ids = ticker_ids.astype(np.intp)
+        order = np.lexsort((targets, ticker_ids))
+        self._order = order
+        self.targets = targets[order]
+        self._ticker_ids = ticker_ids[order]
+        counts = np.bincount(ticker_ids, minlength=len(self.tickers))
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        self._position = {ticker: i for i, ticker in enumerate(self.tickers.tolist())}
+        self._levels: dict[str, list[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.alerts)
+
+    def _span(self, ticker: str) -> tuple[int, int]:
+        pos = self._position.get(ticker)
+        if pos is None:
+            return 0, 0
+        return int(self.offsets[pos]), int(self.offsets[pos + 1])
+
+    def levels(self, ticker: str) -> list[float]:
+        """Sorted target prices for a ticker."""
+        if ticker not in self._levels:
+            start, end = self._span(ticker)
+            self._levels[ticker] = self.targets[start:end].tolist()
+        return self._levels[ticker]
+
+    def _alerts_between(self, ticker: str, lo: int, hi: int) -> list[dict]:
+        start, _ = self._span(ticker)
+        return [self.alerts[i] for i in self._order[start + lo:start + hi]]
+
+    def for_ticker(self, ticker: str) -> list[dict]:
+        """All alerts for ticker, ascending by target."""
+        return self._alerts_between(ticker, 0, len(self.levels(ticker)))
+
+    def triggered(self, ticker: str, price: float) -> list[dict]:
+        """Alerts for ticker whose target is at or above price."""
+        levels = self.levels(ticker)
+        return self._alerts_between(ticker, bisect_left(levels, price), len(levels))
+
+    def newly_triggered(self, ticker: str, price: float, prev_price: float | None = None) -> list[dict]:
+        """Alerts crossed by a move from prev_price down to price (all triggered if no prev_price)."""
+        levels = self.levels(ticker)
+        lo = bisect_left(levels, price)
+        hi = len(levels) if prev_price is None else max(lo, bisect_left(levels, prev_price))
+        return self._alerts_between(ticker, lo, hi)
+
+    def nearest_untriggered(self, ticker: str, price: float) -> float | None:
+        """Highest target below price - the next level a falling price reaches."""
+        levels = self.levels(ticker)
+        idx = bisect_left(levels, price)
+        return levels[idx - 1] if idx else None
+
+    def evaluate(self, prices: dict[str, float], prev_prices: dict[str, float] | None = None) -> Evaluation:
+        """Evaluate every alert against one batch of ticker prices."""
+        def per_alert(values: dict) -> np.ndarray:
+            by_ticker = [values.get(t) for t in self.tickers.tolist()]
+            by_ticker = np.array([np.nan if v is None else v for v in by_ticker], dtype=np.float64)
+            return by_ticker[self._ticker_ids]
+
+        price = per_alert(prices)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            triggered = price <= self.targets
+            pct = np.where(self.targets != 0, (price - self.targets) / self.targets * 100, 0.0)
+            if prev_prices is None:
+                new = triggered.copy()
+            else:
+                prev = per_alert(prev_prices)
+                new = triggered & ~(prev <= self.targets)
+
+        # Back to the caller's alert order
+        inverse = np.empty_like(self._order)
+        inverse[self._order] = np.arange(len(self._order))
+        return Evaluation(
+            price=price[inverse],
+            pct_from_target=pct[inverse],
+            triggered=triggered[inverse],
+            new=new[inverse],
+        )
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Alert Event Log - Append-only history of alert evaluations.
+
+Every `alerts check` evaluation (triggered or still watching), and every
+`alerts watch` evaluation after a price move, is appended as one NDJSON line
+to cache/alert_log/events.ndjson; an append is a single write, never a
+rewrite. Trigger events are also appended to a small tab-separated index
+(ticker, byte offset, length), so a ticker's recent triggers are read by
+seeking into the log instead of scanning it.
+
+Compaction rolls every event from before today into per-ticker daily
+summaries (daily.json) and rewrites the log and index with today's events
+only. `alerts check` compacts once the log holds an earlier day;
+`alerts compact` does it on demand. Appends and compaction hold an
+exclusive flock on a sidecar lock file, so events appended by a concurrent
+`alerts watch` are never dropped by a compaction rewriting the log.
+
+Usage:
+    alerts.py list --history                 # Trigger history per ticker
+    alerts.py compact                        # Roll old events into daily summaries
+"""
+
+import fcntl
+import json
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPT_DIR.parent / "cache"
+LOG_DIR = CACHE_DIR / "alert_log"
+
+DEFAULT_HISTORY_DAYS = 5
+
+
+def _events_path() -> Path:
+    return LOG_DIR / "events.ndjson"
+
+
+def _index_path() -> Path:
+    return LOG_DIR / "index.tsv"
+
+
+def _summary_path() -> Path:
+    return LOG_DIR / "daily.json"
+
+
+@contextmanager
+def _locked():
+    """Hold the log's exclusive lock (blocks until other writers are done)."""
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOG_DIR / "events.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def make_event(result: dict, triggered: bool, now: datetime) -> dict:
+    """Log event for one check result (price or rule alert)."""
+    rule = result.get("rule")
+    event = {
+        "ts": now.isoformat(timespec="seconds"),
+        "ticker": result["ticker"],
+        "triggered": triggered,
+        "price": result["current_price"],
+        "target": result["level"] if rule else result["target_price"],
+        "pct_from_target": result["pct_from_level"] if rule else result["pct_from_target"],
+    }
+    if rule:
+        event["rule"] = rule
+    return event
+
+
+def check_events(results: dict, now: datetime) -> list[dict]:
+    """Events for every alert evaluated by one `check` run."""
+    rules = results.get("rules", {})
+    return (
+        [make_event(r, True, now) for r in results.get("triggered", []) + rules.get("triggered", [])]
+        + [make_event(r, False, now) for r in results.get("watching", []) + rules.get("watching", [])]
+    )
+
+
+def append_events(events: list[dict]) -> int:
+    """Append events to the log (and triggers to the index). Returns the number written."""
+    if not events:
+        return 0
+    lines = [(json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8") for event in events]
+    with _locked():
+        with open(_events_path(), "ab") as f:
+            offset = f.tell()
+            f.write(b"".join(lines))
+
+        index_lines = []
+        for event, line in zip(events, lines):
+            if event.get("triggered"):
+                index_lines.append(f"{event['ticker']}\t{offset}\t{len(line)}\n")
+            offset += len(line)
+        if index_lines:
+            with open(_index_path(), "a", encoding="utf-8") as f:
+                f.write("".join(index_lines))
+    return len(events)
+
+
+def _first_day() -> str | None:
+    """Day of the oldest event still in the log (reads only the first line)."""
+    try:
+        with open(_events_path(), "rb") as f:
+            line = f.readline()
+    except OSError:
+        return None
+    try:
+        return json.loads(line)["ts"][:10]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def needs_compaction(today: date | None = None) -> bool:
+    first = _first_day()
+    return first is not None and first < (today or date.today()).isoformat()
+
+
+def load_summaries() -> dict:
+    """Compacted daily summaries: {ticker: {day: summary}}."""
+    try:
+        return json.loads(_summary_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _summarize(summary: dict | None, event: dict) -> dict:
+    """Fold one event into a ticker's daily summary."""
+    price = event["price"]
+    if summary is None:
+        summary = {"evaluations": 0, "triggers": 0, "low": price, "high": price, "last": price, "targets": []}
+    summary["evaluations"] += 1
+    summary["low"] = min(summary["low"], price)
+    summary["high"] = max(summary["high"], price)
+    summary["last"] = price
+    if event.get("triggered"):
+        summary["triggers"] += 1
+        summary.setdefault("first_triggered", event["ts"])
+        target = event.get("rule") or event["target"]
+        if target not in summary["targets"]:
+            summary["targets"].append(target)
+    return summary
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+def compact(today: date | None = None) -> dict:
+    """Roll events from before today into daily summaries and drop them from the log.
+
+    Returns {"events": events compacted, "days": summary days written}.
+    """
+    cutoff = (today or date.today()).isoformat()
+    with _locked():
+        return _compact(_events_path(), cutoff)
+
+
+def _compact(events_path: Path, cutoff: str) -> dict:
+    try:
+        raw = events_path.read_bytes()
+    except OSError:
+        return {"events": 0, "days": 0}
+
+    summaries = load_summaries()
+    kept: list[tuple[dict, bytes]] = []
+    compacted = 0
+    touched = set()
+    for line in raw.splitlines(keepends=True):
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue  # partial line from an interrupted append
+        day = event["ts"][:10]
+        if day >= cutoff:
+            kept.append((event, line))
+            continue
+        per_ticker = summaries.setdefault(event["ticker"], {})
+        per_ticker[day] = _summarize(per_ticker.get(day), event)
+        touched.add((event["ticker"], day))
+        compacted += 1
+
+    if compacted:
+        _write_atomic(_summary_path(), json.dumps(summaries, ensure_ascii=False).encode("utf-8"))
+
+    index_lines = []
+    offset = 0
+    for event, line in kept:
+        if event.get("triggered"):
+            index_lines.append(f"{event['ticker']}\t{offset}\t{len(line)}\n")
+        offset += len(line)
+    _write_atomic(events_path, b"".join(line for _, line in kept))
+    _write_atomic(_index_path(), "".join(index_lines).encode("utf-8"))
+    return {"events": compacted, "days": len(touched)}
+
+
+def _live_triggers(tickers: set[str]) -> dict[str, list[dict]]:
+    """Trigger events still in the log, read through the index."""
+    try:
+        index = _index_path().read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return {}
+    spans = []
+    for row in index:
+        parts = row.split("\t")
+        if len(parts) == 3 and parts[0] in tickers:
+            spans.append((int(parts[1]), int(parts[2])))
+    if not spans:
+        return {}
+
+    found: dict[str, list[dict]] = {}
+    with open(_events_path(), "rb") as f:
+        for offset, length in spans:
+            f.seek(offset)
+            try:
+                event = json.loads(f.read(length))
+            except ValueError:
+                continue  # index is stale; compaction rebuilds it
+            found.setdefault(event["ticker"], []).append(event)
+    return found
+
+
+def trigger_history(tickers: list[str], days: int = DEFAULT_HISTORY_DAYS) -> dict[str, list[dict]]:
+    """Most recent `days` days with triggers per ticker, newest first.
+
+    Each entry is {"date", "triggers", "targets", "low", "first_triggered"},
+    plus "evaluations" for compacted days.
+    """
+    wanted = set(tickers)
+    summaries = load_summaries()
+    live = _live_triggers(wanted)
+
+    history = {}
+    for ticker in tickers:
+        per_day = {
+            day: dict(summary, date=day)
+            for day, summary in summaries.get(ticker, {}).items()
+            if summary.get("triggers")
+        }
+        for event in live.get(ticker, []):
+            day = event["ts"][:10]
+            entry = per_day.setdefault(day, {"date": day, "triggers": 0, "low": event["price"], "targets": []})
+            entry["triggers"] += 1
+            entry["low"] = min(entry["low"], event["price"])
+            entry.setdefault("first_triggered", event["ts"])
+            target = event.get("rule") or event["target"]
+            if target not in entry["targets"]:
+                entry["targets"].append(target)
+        if per_day:
+            history[ticker] = [per_day[day] for day in sorted(per_day, reverse=True)[:days]]
+    return history
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Rule Alerts - History-based alert rules evaluated in bulk.
+
+Price alerts fire on "price <= target_price". Rule alerts live in the same
+alert book with a "rule" key instead of a target price, and are evaluated
+from daily closes in the local price store:
+
+- drop_from_high:     close at least threshold_pct below the `window`-day high
+- ma_cross_below:     close crosses below its `window`-day moving average
+- low_52w:            close below every close of the previous `window` sessions
+- drawdown_from_cost: close at least threshold_pct below cost_basis
+
+The last closes of every alerted ticker are stacked into one
+(tickers x sessions) matrix, and each rule type is computed for all of its
+alerts at once with NumPy (rolling means via cumulative sums), grouped by
+window - no per-ticker Python loop over the history.
+
+Usage:
+    alerts.py rule CRWD drop_from_high --window 20 --pct 15
+    alerts.py rule NVDA ma_cross_below --window 200
+    alerts.py rule SAP.DE low_52w
+    alerts.py rule TSLA drawdown_from_cost --cost 250 --pct 20
+    alerts.py backfill                       # Download history rules need
+
+Benchmark: python -m benchmarks.bench_alert_rules
+"""
+
+import sys
+from dataclasses import dataclass
+
+import numpy as np
+
+from vfinance_news import price_store
+
+# Default parameters per rule type
+RULES = {
+    "drop_from_high": {"window": 20, "threshold_pct": 10.0},
+    "ma_cross_below": {"window": 50},
+    "low_52w": {"window": 252},
+    "drawdown_from_cost": {"threshold_pct": 10.0},
+}
+BACKFILL_TIMEOUT_SEC = 60
+
+
+@dataclass
+class RuleEvaluation:
+    """Per-alert results, aligned with the evaluated alerts.
+
+    `level` is the price at which the rule fires (N-day high less the
+    threshold, the moving average, the prior low, cost less the threshold).
+    Alerts without enough stored history have NaN price and level.
+    """
+    price: np.ndarray
+    level: np.ndarray
+    triggered: np.ndarray
+
+    def has_history(self) -> np.ndarray:
+        return ~np.isnan(self.price) & ~np.isnan(self.level)
+
+
+def rule_params(alert: dict) -> dict:
+    """Rule parameters with the rule type's defaults filled in."""
+    params = dict(RULES[alert["rule"]])
+    for key in params:
+        if alert.get(key) is not None:
+            params[key] = alert[key]
+    if alert["rule"] == "drawdown_from_cost":
+        params["cost_basis"] = alert.get("cost_basis")
+    return params
+
+
+def sessions_needed(alert: dict) -> int:
+    """Stored sessions a rule needs before it can be evaluated."""
+    rule = alert["rule"]
+    if rule == "drawdown_from_cost":
+        return 1
+    window = int(rule_params(alert)["window"])
+    # Crossing and new-low rules compare today with the window before it
+    return window if rule == "drop_from_high" else window + 1
+
+
+def describe_rule(alert: dict) -> str:
+    """Short human-readable form, e.g. '15% below 20-day high'."""
+    params = rule_params(alert)
+    rule = alert["rule"]
+    if rule == "drop_from_high":
+        return f"{params['threshold_pct']:g}% below {params['window']}-day high"
+    if rule == "ma_cross_below":
+        return f"cross below {params['window']}-day MA"
+    if rule == "low_52w":
+        return "new 52-week low" if params["window"] == 252 else f"new {params['window']}-day low"
+    cost = params.get("cost_basis") or 0.0
+    return f"{params['threshold_pct']:g}% drawdown from cost {cost:,.2f}"
+
+
+def validate_rule(rule: str, window: int | None, threshold_pct: float | None, cost_basis: float | None) -> str | None:
+    """Error message for invalid rule parameters, or None."""
+    if rule not in RULES:
+        return f"Unknown rule {rule}. Use: {', '.join(RULES)}"
+    if window is not None and window < 2:
+        return "Window must be at least 2 sessions"
+    if threshold_pct is not None and not 0 < threshold_pct < 100:
+        return "Threshold must be between 0 and 100 percent"
+    if rule == "drawdown_from_cost" and (cost_basis is None or cost_basis <= 0):
+        return "drawdown_from_cost needs --cost greater than 0"
+    return None
+
+
+def rolling_mean(matrix: np.ndarray, window: int) -> np.ndarray:
+    """Trailing `window`-session means along each row, NaN where the window has gaps.
+
+    Column j of the result averages input columns j .. j + window - 1.
+    """
+    valid = ~np.isnan(matrix)
+    zeros = np.zeros((matrix.shape[0], 1))
+    sums = np.concatenate((zeros, np.cumsum(np.where(valid, matrix, 0.0), axis=1)), axis=1)
+    counts = np.concatenate((zeros, np.cumsum(valid, axis=1)), axis=1)
+    window_sums = sums[:, window:] - sums[:, :-window]
+    window_counts = counts[:, window:] - counts[:, :-window]
+    with np.errstate(invalid="ignore"):
+        return np.where(window_counts == window, window_sums / window, np.nan)
+
+
+def _full(block: np.ndarray) -> np.ndarray:
+    """Rows of a window block without gaps."""
+    return ~np.isnan(block).any(axis=1)
+
+
+def evaluate_matrix(alerts: list[dict], rows: np.ndarray, matrix: np.ndarray) -> RuleEvaluation:
+    """Evaluate rule alerts against a close matrix.
+
+    rows[i] is the matrix row holding alert i's closes; the newest session
+    is the last column.
+    """
+    n = len(alerts)
+    price = matrix[rows, -1] if n else np.empty(0)
+    level = np.full(n, np.nan)
+    triggered = np.zeros(n, dtype=bool)
+    days = matrix.shape[1]
+
+    groups: dict[tuple[str, int], list[int]] = {}
+    thresholds = np.zeros(n)
+    costs = np.zeros(n)
+    for i, alert in enumerate(alerts):
+        params = rule_params(alert)
+        window = int(params.get("window", 0))
+        thresholds[i] = float(params.get("threshold_pct", 0.0))
+        costs[i] = float(params.get("cost_basis") or np.nan)
+        groups.setdefault((alert["rule"], window), []).append(i)
+
+    for (rule, window), members in groups.items():
+        idx = np.array(members, dtype=np.intp)
+        block = matrix[rows[idx]]
+        last = block[:, -1]
+        if rule == "drop_from_high":
+            if window > days:
+                continue
+            recent = block[:, -window:]
+            ok = _full(recent)
+            high = np.max(np.where(ok[:, None], recent, -np.inf), axis=1)
+            hit_level = high * (1 - thresholds[idx] / 100)
+            fired = last <= hit_level
+        elif rule == "ma_cross_below":
+            if window + 1 > days:
+                continue
+            means = rolling_mean(block[:, -(window + 1):], window)
+            ok = ~np.isnan(means).any(axis=1)
+            hit_level = means[:, 1]
+            with np.errstate(invalid="ignore"):
+                fired = (block[:, -2] >= means[:, 0]) & (last < hit_level)
+        elif rule == "low_52w":
+            if window + 1 > days:
+                continue
+            prior = block[:, -(window + 1):-1]
+            ok = _full(prior) & ~np.isnan(last)
+            hit_level = np.min(np.where(ok[:, None], prior, np.inf), axis=1)
+            fired = last < hit_level
+        else:
+            cost = costs[idx]
+            ok = ~np.isnan(last) & (cost > 0)
+            hit_level = cost * (1 - thresholds[idx] / 100)
+            fired = last <= hit_level
+
+        level[idx] = np.where(ok, hit_level, np.nan)
+        triggered[idx] = ok & fired
+    return RuleEvaluation(price=price, level=level, triggered=triggered)
+
+
+def evaluate_rules(alerts: list[dict]) -> tuple[list[dict], list[dict], list[dict]]:
+    """Split rule alerts into (triggered, watching) results plus the triggered alerts.
+
+    Closes come from the local price store; alerts without enough stored
+    history are left out, like price alerts without a quote.
+    """
+    if not alerts:
+        return [], [], []
+    tickers = list(dict.fromkeys(a["ticker"] for a in alerts))
+    row_of = {ticker: i for i, ticker in enumerate(tickers)}
+    days = max(sessions_needed(a) for a in alerts)
+    matrix = price_store.load_close_matrix(tickers, days)
+    rows = np.array([row_of[a["ticker"]] for a in alerts], dtype=np.intp)
+    evaluation = evaluate_matrix(alerts, rows, matrix)
+
+    triggered = []
+    watching = []
+    hits = []
+    for i in evaluation.has_history().nonzero()[0].tolist():
+        alert = alerts[i]
+        price = float(evaluation.price[i])
+        level = float(evaluation.level[i])
+        result = {
+            "ticker": alert["ticker"],
+            "rule": alert["rule"],
+            "description": describe_rule(alert),
+            "current_price": price,
+            "level": round(level, 4),
+            "currency": alert.get("currency", "USD"),
+            "pct_from_level": round((price - level) / level * 100, 2) if level else 0,
+            "note": alert.get("note", ""),
+            "set_by": alert.get("set_by", ""),
+        }
+        if evaluation.triggered[i]:
+            triggered.append(result)
+            hits.append(alert)
+        else:
+            watching.append(result)
+    return triggered, watching, hits
+
+
+def backfill_history(alerts: list[dict], timeout: int = BACKFILL_TIMEOUT_SEC) -> dict[str, int]:
+    """Download daily closes for tickers whose stored history is too short for their rules.
+
+    Returns {ticker: sessions downloaded}.
+    """
+    needed: dict[str, int] = {}
+    for alert in alerts:
+        needed[alert["ticker"]] = max(needed.get(alert["ticker"], 0), sessions_needed(alert))
+    short = [t for t, sessions in needed.items() if len(price_store.load_history(t, sessions)) < sessions]
+    if not short:
+        return {}
+
+    # ~250 sessions per year; the 52-week low needs one more than that
+    period = "2y" if max(needed[t] for t in short) > 240 else "1y"
+    from vfinance_news import fetch_news
+    try:
+        closes = fetch_news._download_closes(short, period, timeout)
+    except Exception as e:
+        print(f"⚠️ History download failed: {e}", file=sys.stderr)
+        return {}
+    fetch_news._record_history(closes)
+    return {symbol: len(series) for symbol, series in closes.items()}
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Alert Store - Transactional SQLite store for price alerts.
+
+An alternative to config/alerts.json for large or concurrently edited alert
+books. It lives next to the JSON file as alerts.db, and the alerts commands
+switch to it once it exists (`alerts import`). WAL mode lets a cron `check`
+read while a chat-driven `alerts set` writes. Every command touches only
+the rows it changes: a trigger is a single-row UPDATE, never a rewrite of
+the whole book.
+
+Active alerts are selected through an index on snooze_until; per-ticker
+lookups use an index on (ticker, target_price). Alert keys without a
+column are kept as JSON in `extra`, so import/export round-trips the JSON
+format. Rule alerts (alert_rules) have no target_price; their rule type
+and parameters live in `extra`.
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS alerts (
+    id INTEGER PRIMARY KEY,
+    ticker TEXT NOT NULL,
+    target_price REAL,
+    currency TEXT NOT NULL DEFAULT 'USD',
+    note TEXT NOT NULL DEFAULT '',
+    set_by TEXT NOT NULL DEFAULT '',
+    set_date TEXT,
+    status TEXT NOT NULL DEFAULT 'active',
+    snooze_until TEXT,
+    triggered_count INTEGER NOT NULL DEFAULT 0,
+    last_triggered TEXT,
+    extra TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_alerts_ticker ON alerts(ticker, target_price);
+CREATE INDEX IF NOT EXISTS idx_alerts_snooze ON alerts(snooze_until);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+ALERT_COLUMNS = (
+    "ticker", "target_price", "currency", "note", "set_by", "set_date",
+    "status", "snooze_until", "triggered_count", "last_triggered",
+)
+COLUMN_DEFAULTS = {"currency": "USD", "note": "", "set_by": "", "status": "active", "triggered_count": 0}
+
+_initialized: set[str] = set()
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open the alert database, creating the schema on first use."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=5)
+    conn.row_factory = sqlite3.Row
+    if str(db_path) not in _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        _initialized.add(str(db_path))
+    return conn
+
+
+def _to_row(alert: dict) -> dict:
+    row = {col: alert.get(col, COLUMN_DEFAULTS.get(col)) for col in ALERT_COLUMNS}
+    for col, default in COLUMN_DEFAULTS.items():
+        if row[col] is None:
+            row[col] = default
+    row["ticker"] = row["ticker"].upper()
+    extra = {k: v for k, v in alert.items() if k not in ALERT_COLUMNS and k != "id"}
+    row["extra"] = json.dumps(extra, ensure_ascii=False)
+    return row
+
+
+def _to_alert(row: sqlite3.Row) -> dict:
+    alert = {"id": row["id"]}
+    alert.update({col: row[col] for col in ALERT_COLUMNS})
+    alert.update(json.loads(row["extra"] or "{}"))
+    return alert
+
+
+def _touch(conn: sqlite3.Connection) -> None:
+    """Bump the change counter that watchers poll instead of file mtimes."""
+    conn.execute(
+        "INSERT INTO meta (key, value) VALUES ('version', '1') "
+        "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+    )
+    conn.execute(
+        "INSERT INTO meta (key, value) VALUES ('updated_at', ?) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (datetime.now().isoformat(),),
+    )
+
+
+def version(db_path: Path) -> int:
+    """Change counter, incremented by every write."""
+    conn = connect(db_path)
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+    finally:
+        conn.close()
+    return int(row["value"]) if row else 0
+
+
+def updated_at(db_path: Path) -> str | None:
+    conn = connect(db_path)
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'updated_at'").fetchone()
+    finally:
+        conn.close()
+    return row["value"] if row else None
+
+
+def list_alerts(db_path: Path) -> list[dict]:
+    """All alerts in insertion order."""
+    conn = connect(db_path)
+    try:
+        rows = conn.execute("SELECT * FROM alerts ORDER BY id").fetchall()
+    finally:
+        conn.close()
+    return [_to_alert(row) for row in rows]
+
+
+def active_alerts(db_path: Path, now: datetime) -> list[dict]:
+    """Alerts that are not snoozed at `now`, via the snooze_until index."""
+    conn = connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT * FROM alerts WHERE snooze_until IS NULL OR snooze_until <= ? ORDER BY id",
+            (now.isoformat(),),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [_to_alert(row) for row in rows]
+
+
+def add(db_path: Path, alert: dict, unique_ticker: bool = True) -> int | None:
+    """Insert an alert; returns its id, or None if the ticker already has a price alert.
+
+    Rule alerts (no target_price) never count as existing price alerts.
+    """
+    row = _to_row(alert)
+    conn = connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        if unique_ticker and conn.execute(
+            "SELECT 1 FROM alerts WHERE ticker = ? AND target_price IS NOT NULL LIMIT 1",
+            (row["ticker"],),
+        ).fetchone():
+            conn.rollback()
+            return None
+        cursor = conn.execute(
+            f"INSERT INTO alerts ({', '.join(row)}) VALUES ({', '.join('?' * len(row))})",
+            tuple(row.values()),
+        )
+        _touch(conn)
+        conn.commit()
+        return cursor.lastrowid
+    finally:
+        conn.close()
+
+
+def update(db_path: Path, alert_id: int, **fields) -> bool:
+    """Update columns of one alert. Returns False if it no longer exists."""
+    unknown = set(fields) - set(ALERT_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown alert fields: {', '.join(sorted(unknown))}")
+    if not fields:
+        return True
+    assignments = ", ".join(f"{col} = ?" for col in fields)
+    conn = connect(db_path)
+    try:
+        with conn:
+            cursor = conn.execute(
+                f"UPDATE alerts SET {assignments} WHERE id = ?",
+                (*fields.values(), alert_id),
+            )
+            if cursor.rowcount:
+                _touch(conn)
+    finally:
+        conn.close()
+    return cursor.rowcount > 0
+
+
+def delete_ticker(db_path: Path, ticker: str, rule: str | None = None) -> int:
+    """Delete every alert for a ticker, or only its alerts of one rule type.
+
+    Returns the number removed.
+    """
+    query = "DELETE FROM alerts WHERE ticker = ?"
+    params = [ticker.upper()]
+    if rule:
+        query += " AND json_extract(extra, '$.rule') = ?"
+        params.append(rule)
+    conn = connect(db_path)
+    try:
+        with conn:
+            cursor = conn.execute(query, params)
+            if cursor.rowcount:
+                _touch(conn)
+    finally:
+        conn.close()
+    return cursor.rowcount
+
+
+def record_triggers(db_path: Path, alert_ids: list[int], now: datetime) -> None:
+    """Mark alerts triggered with one single-row UPDATE each, counting once per day."""
+    if not alert_ids:
+        return
+    today = now.strftime("%Y-%m-%d")
+    conn = connect(db_path)
+    try:
+        with conn:
+            conn.executemany(
+                "UPDATE alerts SET "
+                "triggered_count = triggered_count + "
+                "(last_triggered IS NULL OR substr(last_triggered, 1, 10) != ?), "
+                "last_triggered = ? WHERE id = ?",
+                [(today, now.isoformat(), alert_id) for alert_id in alert_ids],
+            )
+            _touch(conn)
+    finally:
+        conn.close()
+
+
+def import_json(db_path: Path, data: dict, replace: bool = True) -> int:
+    """Load alerts from the alerts.json format. Returns the number imported."""
+    rows = [_to_row(alert) for alert in data.get("alerts", [])]
+    conn = connect(db_path)
+    try:
+        with conn:
+            if replace:
+                conn.execute("DELETE FROM alerts")
+            if rows:
+                columns = list(rows[0])
+                conn.executemany(
+                    f"INSERT INTO alerts ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                    [tuple(row[col] for col in columns) for row in rows],
+                )
+            _touch(conn)
+    finally:
+        conn.close()
+    return len(rows)
+
+
+def export_json(db_path: Path, meta: dict | None = None) -> dict:
+    """Alerts in the alerts.json format (without store ids)."""
+    alerts = []
+    for alert in list_alerts(db_path):
+        alert.pop("id")
+        alerts.append(alert)
+    exported_meta = dict(meta or {})
+    exported_meta["updated_at"] = updated_at(db_path) or datetime.now().isoformat()
+    return {"_meta": exported_meta, "alerts": alerts}
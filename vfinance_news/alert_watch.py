@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Alert Watch - Long-running price alert monitor with adaptive polling.
+
+Each ticker is polled on its own interval: every MIN_INTERVAL_SEC when the
+price is within NEAR_PCT of its next target level (or already in a buy
+zone), every MAX_INTERVAL_SEC beyond FAR_PCT, and linearly in between. Tickers whose
+exchange is closed are paused until the next session open. All tickers due
+in one tick share a single quote request. Levels crossed since the last
+quote are found by bisecting the ticker's sorted targets, and only those
+alerts are written back (single-row updates with the SQLite alert store).
+
+Exchange sessions are weekday open/close times per ticker suffix; exchange
+holidays are not modelled.
+
+Usage:
+    alerts.py watch                          # Poll until interrupted
+    alerts.py watch --json                   # NDJSON trigger events
+    alerts.py watch --min-interval 15 --max-interval 900
+"""
+
+import json
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from datetime import time as dtime
+from zoneinfo import ZoneInfo
+
+from vfinance_news import alert_log, alerts
+from vfinance_news.alert_index import AlertIndex
+
+MIN_INTERVAL_SEC = 30
+MAX_INTERVAL_SEC = 600
+NEAR_PCT = 1.0
+FAR_PCT = 10.0
+# Upper bound on one sleep, so alerts added or deleted meanwhile are picked up
+MAX_SLEEP_SEC = 30
+
+US_SESSION = ("America/New_York", dtime(9, 30), dtime(16, 0))
+# Longest suffix wins; tickers without a listed suffix trade on US hours
+MARKET_SESSIONS = {
+    ".DE": ("Europe/Berlin", dtime(9, 0), dtime(17, 30)),
+    ".F": ("Europe/Berlin", dtime(8, 0), dtime(20, 0)),
+    ".PA": ("Europe/Paris", dtime(9, 0), dtime(17, 30)),
+    ".AS": ("Europe/Amsterdam", dtime(9, 0), dtime(17, 30)),
+    ".MI": ("Europe/Rome", dtime(9, 0), dtime(17, 30)),
+    ".SW": ("Europe/Zurich", dtime(9, 0), dtime(17, 30)),
+    ".CO": ("Europe/Copenhagen", dtime(9, 0), dtime(17, 0)),
+    ".ST": ("Europe/Stockholm", dtime(9, 0), dtime(17, 30)),
+    ".L": ("Europe/London", dtime(8, 0), dtime(16, 30)),
+    ".T": ("Asia/Tokyo", dtime(9, 0), dtime(15, 30)),
+    ".HK": ("Asia/Hong_Kong", dtime(9, 30), dtime(16, 0)),
+    ".SI": ("Asia/Singapore", dtime(9, 0), dtime(17, 0)),
+    ".MX": ("America/Mexico_City", dtime(8, 30), dtime(15, 0)),
+    ".TO": ("America/Toronto", dtime(9, 30), dtime(16, 0)),
+}
+# Crypto, FX and futures quote around the clock
+ALWAYS_OPEN_SUFFIXES = ("-USD", "-EUR", "=X", "=F")
+
+
+@dataclass
+class WatchSettings:
+    min_interval: float = MIN_INTERVAL_SEC
+    max_interval: float = MAX_INTERVAL_SEC
+    near_pct: float = NEAR_PCT
+    far_pct: float = FAR_PCT
+    market_hours: bool = True
+
+
+def market_session(ticker: str) -> tuple[str, dtime, dtime] | None:
+    """(timezone, open, close) for the ticker's exchange, or None if always open."""
+    ticker = ticker.upper()
+    if ticker.endswith(ALWAYS_OPEN_SUFFIXES):
+        return None
+    for suffix in sorted(MARKET_SESSIONS, key=len, reverse=True):
+        if ticker.endswith(suffix):
+            return MARKET_SESSIONS[suffix]
+    return US_SESSION
+
+
+def next_market_open(ticker: str, now: datetime) -> datetime:
+    """`now` if the ticker's exchange is open (aware datetimes), else the next session open."""
+    session = market_session(ticker)
+    if session is None:
+        return now
+    tz_name, open_time, close_time = session
+    local_now = now.astimezone(ZoneInfo(tz_name))
+    day = local_now.date()
+    while True:
+        if day.weekday() < 5:
+            opens = datetime.combine(day, open_time, tzinfo=local_now.tzinfo)
+            closes = datetime.combine(day, close_time, tzinfo=local_now.tzinfo)
+            if local_now < closes:
+                return max(opens, local_now).astimezone(now.tzinfo)
+        day += timedelta(days=1)
+
+
+def poll_interval(price: float, target: float, settings: WatchSettings) -> float:
+    """Seconds until the next poll: short near the target, long far from it."""
+    if price <= target or target <= 0:
+        return settings.min_interval
+    distance = (price - target) / target * 100
+    span = settings.far_pct - settings.near_pct
+    if span <= 0:
+        return settings.min_interval if distance <= settings.near_pct else settings.max_interval
+    weight = min(max((distance - settings.near_pct) / span, 0.0), 1.0)
+    return settings.min_interval + weight * (settings.max_interval - settings.min_interval)
+
+
+class AlertWatcher:
+    """Per-ticker poll schedule and last seen prices across ticks."""
+
+    def __init__(self, settings: WatchSettings, clock=time.time):
+        self.settings = settings
+        self.clock = clock
+        self.next_due: dict[str, float] = {}
+        self.last_price: dict[str, float] = {}
+        self.quote_requests = 0
+        self._alerts: list[dict] = []
+        self._alerts_key = None
+
+    @staticmethod
+    def _file_key():
+        """Changes whenever alerts are edited, in the SQLite store or the JSON file."""
+        db_path = alerts.alert_db()
+        if db_path is not None:
+            from vfinance_news import alert_store
+            return ("db", alert_store.version(db_path))
+        try:
+            stat = alerts.ALERTS_FILE.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _levels_by_ticker(alert_list: list[dict]) -> dict[str, list]:
+        levels: dict[str, list] = {}
+        for alert in alert_list:
+            if not alert.get("rule"):
+                levels.setdefault(alert["ticker"], []).append(alert.get("target_price"))
+        return {ticker: sorted(values, key=lambda v: (v is None, v)) for ticker, values in levels.items()}
+
+    def _reload(self) -> None:
+        """Re-read alerts edited through the CLI and re-poll them on the next tick.
+
+        Tickers whose price levels changed forget their last seen price, so
+        levels added or raised into the zone trigger on the next tick (as
+        they would for a fresh watcher).
+        """
+        key = self._file_key()
+        if key == self._alerts_key:
+            return
+        self._alerts_key = key
+        before = self._levels_by_ticker(self._alerts)
+        self._alerts = alerts.load_alerts().get("alerts", [])
+        after = self._levels_by_ticker(self._alerts)
+        for ticker in set(before) | set(after):
+            if before.get(ticker) != after.get(ticker):
+                self.last_price.pop(ticker, None)
+        self.next_due.clear()
+
+    def active_index(self, now: datetime) -> AlertIndex:
+        """Price-level index over price alerts that are not snoozed.
+
+        Rule alerts work on daily closes and are left to `alerts check`.
+        """
+        self._reload()
+        local_now = now.astimezone().replace(tzinfo=None)
+        return AlertIndex([
+            a for a in self._alerts
+            if not a.get("rule") and not alerts.is_snoozed(a, local_now)
+        ])
+
+    def due(self, tickers: list[str], now_ts: float) -> list[str]:
+        """Tickers whose poll time has come, deferring closed markets."""
+        now = datetime.fromtimestamp(now_ts, tz=timezone.utc)
+        due = []
+        for ticker in tickers:
+            if self.next_due.get(ticker, 0) > now_ts:
+                continue
+            if self.settings.market_hours:
+                opens = next_market_open(ticker, now)
+                if opens > now:
+                    self.next_due[ticker] = opens.timestamp()
+                    continue
+            due.append(ticker)
+        return due
+
+    def _interval(self, index: AlertIndex, ticker: str, price: float) -> float:
+        if index.triggered(ticker, price):
+            return self.settings.min_interval
+        nearest = index.nearest_untriggered(ticker, price)
+        return poll_interval(price, nearest, self.settings) if nearest is not None else self.settings.max_interval
+
+    def tick(self) -> list[dict]:
+        """Poll every due ticker in one quote request. Returns trigger events."""
+        now_ts = self.clock()
+        now = datetime.fromtimestamp(now_ts, tz=timezone.utc)
+        index = self.active_index(now)
+        tickers = index.tickers.tolist()
+        for ticker in set(self.next_due) - set(tickers):
+            self.next_due.pop(ticker)
+            self.last_price.pop(ticker, None)
+
+        due = self.due(tickers, now_ts)
+        if not due:
+            return []
+
+        self.quote_requests += 1
+        try:
+            quotes = alerts.get_quotes(due)
+        except Exception as e:
+            print(f"⚠️ Quote fetch failed: {e}", file=sys.stderr)
+            quotes = {}
+
+        events = []
+        hits = []
+        log_events = []
+        local_now = now.astimezone().replace(tzinfo=None)
+        at = local_now.isoformat(timespec="seconds")
+        for ticker in due:
+            price = quotes.get(ticker, {}).get("price")
+            if price is None:
+                self.next_due[ticker] = now_ts + self.settings.min_interval
+                continue
+            self.next_due[ticker] = now_ts + self._interval(index, ticker, price)
+            newly = index.newly_triggered(ticker, price, self.last_price.get(ticker))
+            if price != self.last_price.get(ticker):
+                # Log every evaluation of a moved price; an unchanged price adds nothing new
+                fired = {id(alert) for alert in newly}
+                log_events.extend(
+                    _log_event(alert, price, id(alert) in fired, at) for alert in index.for_ticker(ticker)
+                )
+            for alert in newly:
+                target = alert["target_price"]
+                hits.append(alert)
+                events.append({
+                    "event": "triggered",
+                    "ticker": ticker,
+                    "target_price": target,
+                    "current_price": price,
+                    "currency": alert.get("currency", "USD"),
+                    "pct_from_target": round((price - target) / target * 100, 2) if target else 0,
+                    "note": alert.get("note", ""),
+                    "set_by": alert.get("set_by", ""),
+                    "at": at,
+                })
+            self.last_price[ticker] = price
+
+        try:
+            alert_log.append_events(log_events)
+        except OSError as e:
+            print(f"⚠️ Could not write alert event log: {e}", file=sys.stderr)
+        if hits:
+            # Only the triggered alerts are written back; CLI edits made meanwhile survive
+            alerts.save_triggers(hits, local_now)
+            self._alerts = alerts.load_alerts().get("alerts", [])
+            self._alerts_key = self._file_key()
+        return events
+
+    def sleep_for(self) -> float:
+        """Seconds until the earliest due ticker, bounded to [1, MAX_SLEEP_SEC]."""
+        if not self.next_due:
+            return MAX_SLEEP_SEC
+        wait = min(self.next_due.values()) - self.clock()
+        return min(max(wait, 1.0), MAX_SLEEP_SEC)
+
+
+def _log_event(alert: dict, price: float, triggered: bool, at: str) -> dict:
+    """Alert log event (alert_log.make_event shape) for one evaluated price alert."""
+    target = alert["target_price"]
+    return {
+        "ts": at,
+        "ticker": alert["ticker"],
+        "triggered": triggered,
+        "price": price,
+        "target": target,
+        "pct_from_target": round((price - target) / target * 100, 2) if target else 0,
+    }
+
+
+def watch(settings: WatchSettings, emit, clock=time.time, sleep=time.sleep, max_ticks: int | None = None) -> AlertWatcher:
+    """Poll until interrupted (or for max_ticks ticks), passing trigger events to emit."""
+    watcher = AlertWatcher(settings, clock=clock)
+    ticks = 0
+    while max_ticks is None or ticks < max_ticks:
+        for event in watcher.tick():
+            emit(event)
+        ticks += 1
+        if max_ticks is None or ticks < max_ticks:
+            sleep(watcher.sleep_for())
+    return watcher
+
+
+def _print_event(event: dict) -> None:
+    target_str = alerts.format_price(event["target_price"], event["currency"])
+    current_str = alerts.format_price(event["current_price"], event["currency"])
+    note = f' — "{event["note"]}"' if event.get("note") else ""
+    print(f"🟢 {event['at']} {event['ticker']}: {current_str} (target: {target_str}) ← BUY SIGNAL{note}", flush=True)
+
+
+def cmd_watch(args) -> None:
+    """Watch alerts until interrupted."""
+    settings = WatchSettings(
+        min_interval=args.min_interval,
+        max_interval=max(args.max_interval, args.min_interval),
+        near_pct=args.near_pct,
+        far_pct=args.far_pct,
+        market_hours=not args.ignore_market_hours,
+    )
+    if args.json:
+        def emit(event):
+            print(json.dumps(event), flush=True)
+    else:
+        emit = _print_event
+
+    print(
+        f"👀 Watching alerts every {settings.min_interval:g}-{settings.max_interval:g}s (Ctrl+C to stop)",
+        file=sys.stderr,
+    )
+    try:
+        watch(settings, emit)
+    except KeyboardInterrupt:
+        print("🛑 Watch stopped", file=sys.stderr)
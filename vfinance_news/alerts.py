@@ -4,17 +4,26 @@ Price Target Alerts - Track buy zone alerts for stocks.
 
 Features:
 - Set price target alerts (buy zone triggers)
+- Rule alerts from daily history (drop from high, MA cross, 52-week low, drawdown)
 - Check alerts against current prices
 - Snooze, update, delete alerts
 - Multi-currency support (USD, EUR, JPY, SGD, MXN)
 
 Usage:
     alerts.py list                           # Show all alerts
+    alerts.py list --history                 # ... with recent trigger history
     alerts.py set CRWD 400 --note 'Kaufzone' # Set alert
     alerts.py check                          # Check triggered alerts
+    alerts.py check --offline                # Check against stored prices
     alerts.py delete CRWD                    # Delete alert
     alerts.py snooze CRWD --days 7           # Snooze for 7 days
     alerts.py update CRWD 380                # Update target price
+    alerts.py rule CRWD drop_from_high --pct 15   # Rule alert (see alert_rules)
+    alerts.py backfill                       # Download history for rule alerts
+    alerts.py compact                        # Roll the event log into daily summaries
+    alerts.py watch                          # Poll continuously, faster near targets
+    alerts.py import                         # Move alerts.json into the SQLite store
+    alerts.py export --output alerts.json    # Write the store back as JSON
 """
 
 import argparse
@@ -37,15 +46,36 @@ def get_fetch_market_data():
         fetch_market_data = fmd
     return fetch_market_data
 
+
+def get_quotes(tickers: list[str], offline: bool = False) -> dict:
+    """Latest prices for tickers, from the network or the local price store."""
+    if offline:
+        from vfinance_news.price_store import load_quotes
+        return load_quotes(tickers)
+    return get_fetch_market_data()(tickers, timeout=30, mode="last")
+
 SCRIPT_DIR = Path(__file__).parent
 CONFIG_DIR = SCRIPT_DIR.parent / "config"
 ALERTS_FILE = CONFIG_DIR / "alerts.json"
 
 SUPPORTED_CURRENCIES = ["USD", "EUR", "JPY", "SGD", "MXN"]
+ALERT_EXISTS_MESSAGE = "Alert for {ticker} already exists. Use 'update' to change target."
+
+
+def alert_db() -> Path | None:
+    """The SQLite alert store next to ALERTS_FILE, once `alerts import` has created it."""
+    db_path = ALERTS_FILE.with_suffix(".db")
+    return db_path if db_path.exists() else None
 
 
 def load_alerts() -> dict:
-    """Load alerts from JSON file."""
+    """Load alerts from the SQLite store if present, else the JSON file."""
+    db_path = alert_db()
+    if db_path is not None:
+        from vfinance_news import alert_store
+        meta = {"version": 1, "supported_currencies": SUPPORTED_CURRENCIES,
+                "updated_at": alert_store.updated_at(db_path)}
+        return {"_meta": meta, "alerts": alert_store.list_alerts(db_path)}
     if not ALERTS_FILE.exists():
         return {"_meta": {"version": 1, "supported_currencies": SUPPORTED_CURRENCIES}, "alerts": []}
     return json.loads(ALERTS_FILE.read_text())
@@ -58,14 +88,73 @@ def save_alerts(data: dict) -> None:
 
 
 def get_alert_by_ticker(alerts: list, ticker: str) -> dict | None:
-    """Find alert by ticker."""
+    """Find the price alert for a ticker (rule alerts are skipped)."""
     ticker = ticker.upper()
     for alert in alerts:
-        if alert["ticker"] == ticker:
+        if alert["ticker"] == ticker and not alert.get("rule"):
             return alert
     return None
 
 
+def record_trigger(alert: dict, now: datetime) -> None:
+    """Mark an alert as triggered, counting at most one trigger per day."""
+    last_triggered = alert.get("last_triggered")
+    today = now.strftime("%Y-%m-%d")
+    if not last_triggered or not last_triggered.startswith(today):
+        alert["triggered_count"] = alert.get("triggered_count", 0) + 1
+    alert["last_triggered"] = now.isoformat()
+
+
+def save_triggers(hits: list[dict], now: datetime, data: dict | None = None) -> None:
+    """Persist triggered alerts.
+
+    With the SQLite store every trigger is a single-row update. For the JSON
+    file, `data` (the document the alerts were loaded from) is updated and
+    rewritten; without it the file is re-read first so only these alerts change.
+    """
+    db_path = alert_db()
+    if db_path is not None:
+        from vfinance_news import alert_store
+        alert_store.record_triggers(db_path, [a["id"] for a in hits], now)
+        return
+    if data is None:
+        data = load_alerts()
+        keys = {(a["ticker"], a["target_price"]) for a in hits}
+        hits = [a for a in data.get("alerts", []) if (a["ticker"], a["target_price"]) in keys]
+    for alert in hits:
+        record_trigger(alert, now)
+    save_alerts(data)
+
+
+def load_active_alerts(now: datetime) -> tuple[dict | None, int, list[dict]]:
+    """(JSON document or None for the store, total alert count, alerts not snoozed at now)."""
+    db_path = alert_db()
+    if db_path is not None:
+        from vfinance_news import alert_store
+        active = alert_store.active_alerts(db_path, now)
+        total = len(active) or len(alert_store.list_alerts(db_path))
+        return None, total, active
+    data = load_alerts()
+    alerts = data.get("alerts", [])
+    return data, len(alerts), [a for a in alerts if not is_snoozed(a, now)]
+
+
+def _update_alert(data: dict, alert: dict, **fields) -> None:
+    """Change fields of one loaded alert: a single-row update in the store, else a JSON rewrite."""
+    db_path = alert_db()
+    if db_path is not None:
+        from vfinance_news import alert_store
+        alert_store.update(db_path, alert["id"], **fields)
+        return
+    alert.update(fields)
+    save_alerts(data)
+
+
+def is_snoozed(alert: dict, now: datetime) -> bool:
+    snooze_until = alert.get("snooze_until")
+    return bool(snooze_until) and datetime.fromisoformat(snooze_until) > now
+
+
 def format_price(price: float, currency: str) -> str:
     """Format price with currency symbol."""
     symbols = {"USD": "$", "EUR": "€", "JPY": "¥", "SGD": "S$", "MXN": "MX$"}
@@ -75,6 +164,14 @@ def format_price(price: float, currency: str) -> str:
     return f"{symbol}{price:,.2f}"
 
 
+def _alert_target(alert: dict) -> str:
+    """Target price, or the rule description for rule alerts."""
+    if alert.get("rule"):
+        from vfinance_news.alert_rules import describe_rule
+        return describe_rule(alert)
+    return format_price(alert["target_price"], alert.get("currency", "USD"))
+
+
 def cmd_list(args) -> None:
     """List all alerts."""
     data = load_alerts()
@@ -100,7 +197,7 @@ def cmd_list(args) -> None:
     if active:
         print("### Active Alerts")
         for a in active:
-            target = format_price(a["target_price"], a.get("currency", "USD"))
+            target = _alert_target(a)
             note = f' — "{a["note"]}"' if a.get("note") else ""
             user = f" (by {a['set_by']})" if a.get("set_by") else ""
             print(f"  • {a['ticker']}: {target}{note}{user}")
@@ -109,11 +206,29 @@ def cmd_list(args) -> None:
     if snoozed:
         print("### Snoozed")
         for a in snoozed:
-            target = format_price(a["target_price"], a.get("currency", "USD"))
+            target = _alert_target(a)
             until = datetime.fromisoformat(a["snooze_until"]).strftime("%Y-%m-%d")
             print(f"  • {a['ticker']}: {target} (until {until})")
         print()
 
+    history_days = getattr(args, "history", None)
+    if history_days:
+        from vfinance_news import alert_log
+        tickers = list(dict.fromkeys(a["ticker"] for a in alerts))
+        history = alert_log.trigger_history(tickers, days=history_days)
+        print("### Trigger History")
+        if not history:
+            print("  No triggers logged")
+        for ticker, days in history.items():
+            currency = next((a.get("currency", "USD") for a in alerts if a["ticker"] == ticker), "USD")
+            for entry in days:
+                targets = ", ".join(
+                    t if isinstance(t, str) else format_price(t, currency) for t in entry["targets"]
+                )
+                low = format_price(entry["low"], currency)
+                print(f"  • {ticker} {entry['date']}: {entry['triggers']}× (low {low}; {targets})")
+        print()
+
 
 def cmd_set(args) -> None:
     """Set a new alert."""
@@ -124,7 +239,7 @@ def cmd_set(args) -> None:
     # Check if alert exists
     existing = get_alert_by_ticker(alerts, ticker)
     if existing:
-        print(f"⚠️ Alert for {ticker} already exists. Use 'update' to change target.")
+        print(f"⚠️ {ALERT_EXISTS_MESSAGE.format(ticker=ticker)}")
         return
     
     # Validate target price
@@ -156,7 +271,7 @@ def cmd_set(args) -> None:
     # Fetch current price (optional - may fail if numpy broken)
     current_price = None
     try:
-        quotes = get_fetch_market_data()([ticker], timeout=10)
+        quotes = get_fetch_market_data()([ticker], timeout=10, mode="last")
         if ticker in quotes and quotes[ticker].get("price"):
             current_price = quotes[ticker]["price"]
     except Exception as e:
@@ -175,9 +290,16 @@ def cmd_set(args) -> None:
         "last_triggered": None,
     }
     
-    alerts.append(alert)
-    data["alerts"] = alerts
-    save_alerts(data)
+    db_path = alert_db()
+    if db_path is not None:
+        from vfinance_news import alert_store
+        if alert_store.add(db_path, alert) is None:
+            print(f"⚠️ {ALERT_EXISTS_MESSAGE.format(ticker=ticker)}")
+            return
+    else:
+        alerts.append(alert)
+        data["alerts"] = alerts
+        save_alerts(data)
     
     target_str = format_price(args.target, currency)
     print(f"✅ Alert set: {ticker} under {target_str}")
@@ -193,7 +315,17 @@ def cmd_delete(args) -> None:
     alerts = data.get("alerts", [])
     ticker = args.ticker.upper()
     
-    new_alerts = [a for a in alerts if a["ticker"] != ticker]
+    db_path = alert_db()
+    if db_path is not None:
+        from vfinance_news import alert_store
+        if not alert_store.delete_ticker(db_path, ticker, rule=getattr(args, "rule", None)):
+            print(f"❌ No alert found for {ticker}")
+            return
+        print(f"🗑️ Alert deleted: {ticker}")
+        return
+
+    rule = getattr(args, "rule", None)
+    new_alerts = [a for a in alerts if a["ticker"] != ticker or (rule and a.get("rule") != rule)]
     if len(new_alerts) == len(alerts):
         print(f"❌ No alert found for {ticker}")
         return
@@ -216,8 +348,7 @@ def cmd_snooze(args) -> None:
     
     days = args.days or 7
     snooze_until = datetime.now() + timedelta(days=days)
-    alert["snooze_until"] = snooze_until.isoformat()
-    save_alerts(data)
+    _update_alert(data, alert, snooze_until=snooze_until.isoformat())
     print(f"😴 Alert snoozed: {ticker} until {snooze_until.strftime('%Y-%m-%d')}")
 
 
@@ -238,10 +369,10 @@ def cmd_update(args) -> None:
         return
     
     old_target = alert["target_price"]
-    alert["target_price"] = args.target
+    fields = {"target_price": args.target}
     if args.note:
-        alert["note"] = args.note
-    save_alerts(data)
+        fields["note"] = args.note
+    _update_alert(data, alert, **fields)
     
     currency = alert.get("currency", "USD")
     old_str = format_price(old_target, currency)
@@ -249,82 +380,111 @@ def cmd_update(args) -> None:
     print(f"✏️ Alert updated: {ticker} {old_str} → {new_str}")
 
 
+def evaluate_alerts(active_alerts: list[dict], quotes: dict) -> tuple[list[dict], list[dict], list[dict]]:
+    """Split alerts with a quote into (triggered, watching) results plus the triggered alerts.
+
+    Triggers are evaluated for all alerts at once through a price-level index.
+    """
+    from vfinance_news.alert_index import AlertIndex
+
+    index = AlertIndex(active_alerts)
+    evaluation = index.evaluate({t: (q or {}).get("price") for t, q in quotes.items()})
+
+    triggered = []
+    watching = []
+    hits = []
+    for i in evaluation.has_price().nonzero()[0].tolist():
+        alert = active_alerts[i]
+        result = {
+            "ticker": alert["ticker"],
+            "target_price": alert["target_price"],
+            "current_price": quotes[alert["ticker"]]["price"],
+            "currency": alert.get("currency", "USD"),
+            "pct_from_target": round(float(evaluation.pct_from_target[i]), 2),
+            "note": alert.get("note", ""),
+            "set_by": alert.get("set_by", ""),
+        }
+        if evaluation.triggered[i]:
+            triggered.append(result)
+            hits.append(alert)
+        else:
+            watching.append(result)
+    return triggered, watching, hits
+
+
+def log_results(results: dict, now: datetime) -> None:
+    """Append a check run to the alert event log, compacting earlier days first."""
+    from vfinance_news import alert_log
+    try:
+        if alert_log.needs_compaction(now.date()):
+            alert_log.compact(now.date())
+        alert_log.append_events(alert_log.check_events(results, now))
+    except OSError as e:
+        print(f"⚠️ Could not write alert event log: {e}", file=sys.stderr)
+
+
+def run_checks(active_alerts: list[dict], offline: bool = False) -> tuple[dict, list[dict]]:
+    """Evaluate price and rule alerts; returns (results, triggered alerts).
+
+    Quotes are fetched for rule tickers too, so today's close is in the
+    price store before rules read it. Online checks also backfill history
+    that rules are missing.
+    """
+    price_alerts = [a for a in active_alerts if not a.get("rule")]
+    rule_alerts = [a for a in active_alerts if a.get("rule")]
+
+    tickers = list(dict.fromkeys(a["ticker"] for a in active_alerts))
+    quotes = get_quotes(tickers, offline=offline)
+    triggered, watching, hits = evaluate_alerts(price_alerts, quotes)
+
+    rule_triggered, rule_watching = [], []
+    if rule_alerts:
+        from vfinance_news import alert_rules
+        if not offline:
+            alert_rules.backfill_history(rule_alerts)
+        rule_triggered, rule_watching, rule_hits = alert_rules.evaluate_rules(rule_alerts)
+        hits += rule_hits
+
+    results = {
+        "triggered": triggered,
+        "watching": watching,
+        "rules": {"triggered": rule_triggered, "watching": rule_watching},
+    }
+    return results, hits
+
+
+def _empty_results() -> dict:
+    return {"triggered": [], "watching": [], "rules": {"triggered": [], "watching": []}}
+
+
 def cmd_check(args) -> None:
     """Check alerts against current prices."""
-    data = load_alerts()
-    alerts = data.get("alerts", [])
+    now = datetime.now()
+    data, total, active_alerts = load_active_alerts(now)
     
-    if not alerts:
+    if not total:
         if args.json:
-            print(json.dumps({"triggered": [], "watching": []}))
+            print(json.dumps(_empty_results()))
         else:
             print("📭 No alerts to check")
         return
     
-    now = datetime.now()
-    active_alerts = []
-    for alert in alerts:
-        snooze_until = alert.get("snooze_until")
-        if snooze_until and datetime.fromisoformat(snooze_until) > now:
-            continue
-        active_alerts.append(alert)
-    
     if not active_alerts:
         if args.json:
-            print(json.dumps({"triggered": [], "watching": []}))
+            print(json.dumps(_empty_results()))
         else:
             print("📭 All alerts snoozed")
         return
     
-    # Fetch prices for all active alerts
-    tickers = [a["ticker"] for a in active_alerts]
-    quotes = get_fetch_market_data()(tickers, timeout=30)
+    results, hits = run_checks(active_alerts, offline=getattr(args, "offline", False))
+    triggered, watching = results["triggered"], results["watching"]
+    rules = results["rules"]
     
-    triggered = []
-    watching = []
-    
-    for alert in active_alerts:
-        ticker = alert["ticker"]
-        target = alert["target_price"]
-        currency = alert.get("currency", "USD")
-        
-        quote = quotes.get(ticker, {})
-        price = quote.get("price")
-        
-        if price is None:
-            continue
-        
-        # Divide-by-zero protection
-        if target == 0:
-            pct_diff = 0
-        else:
-            pct_diff = ((price - target) / target) * 100
-        
-        result = {
-            "ticker": ticker,
-            "target_price": target,
-            "current_price": price,
-            "currency": currency,
-            "pct_from_target": round(pct_diff, 2),
-            "note": alert.get("note", ""),
-            "set_by": alert.get("set_by", ""),
-        }
-        
-        if price <= target:
-            triggered.append(result)
-            # Update triggered count (only once per day to avoid inflation)
-            last_triggered = alert.get("last_triggered")
-            today = now.strftime("%Y-%m-%d")
-            if not last_triggered or not last_triggered.startswith(today):
-                alert["triggered_count"] = alert.get("triggered_count", 0) + 1
-            alert["last_triggered"] = now.isoformat()
-        else:
-            watching.append(result)
-    
-    save_alerts(data)
+    save_triggers(hits, now, data)
+    log_results(results, now)
     
     if args.json:
-        print(json.dumps({"triggered": triggered, "watching": watching}, indent=2))
+        print(json.dumps(results, indent=2))
         return
 
     labels = {
@@ -360,76 +520,167 @@ def cmd_check(args) -> None:
             print(f"• {w['ticker']}: {current_str} ({labels['target']}: {target_str}) — {labels['to_target']} {abs(w['pct_from_target']):.1f}%")
         print()
 
-    if not triggered and not watching:
+    if rules["triggered"]:
+        print("📐 RULES TRIGGERED:\n")
+        for t in rules["triggered"]:
+            current_str = format_price(t["current_price"], t["currency"])
+            level_str = format_price(t["level"], t["currency"])
+            note = f'\n   "{t["note"]}"' if t.get("note") else ""
+            user = f" — {t['set_by']}" if t.get("set_by") else ""
+            print(f"• {t['ticker']}: {current_str} — {t['description']} (level: {level_str}){note}{user}")
+        print()
+
+    if rules["watching"]:
+        print("📐 RULES WATCHING:\n")
+        for w in sorted(rules["watching"], key=lambda x: x["pct_from_level"]):
+            current_str = format_price(w["current_price"], w["currency"])
+            level_str = format_price(w["level"], w["currency"])
+            print(f"• {w['ticker']}: {current_str} — {w['description']} (level: {level_str}, {w['pct_from_level']:+.1f}%)")
+        print()
+
+    if not triggered and not watching and not rules["triggered"] and not rules["watching"]:
         print(f"📭 {labels['no_data']}")
 
 
-def check_alerts() -> dict:
+def check_alerts(offline: bool = False) -> dict:
     """
     Check alerts and return results for briefing integration.
-    Returns: {"triggered": [...], "watching": [...]}
+    With offline=True prices come from the local price store.
+    Returns: {"triggered": [...], "watching": [...],
+              "rules": {"triggered": [...], "watching": [...]}}
     """
-    data = load_alerts()
-    alerts = data.get("alerts", [])
-    
-    if not alerts:
-        return {"triggered": [], "watching": []}
-    
     now = datetime.now()
-    active_alerts = [
-        a for a in alerts
-        if not a.get("snooze_until") or datetime.fromisoformat(a["snooze_until"]) <= now
-    ]
-    
-    if not active_alerts:
-        return {"triggered": [], "watching": []}
+    data, total, active_alerts = load_active_alerts(now)
     
-    tickers = [a["ticker"] for a in active_alerts]
-    quotes = get_fetch_market_data()(tickers, timeout=30)
+    if not total:
+        return _empty_results()
     
-    triggered = []
-    watching = []
+    if not active_alerts:
+        return _empty_results()
     
-    for alert in active_alerts:
-        ticker = alert["ticker"]
-        target = alert["target_price"]
-        currency = alert.get("currency", "USD")
-        
-        quote = quotes.get(ticker, {})
-        price = quote.get("price")
-        
-        if price is None:
-            continue
-        
-        # Divide-by-zero protection
-        if target == 0:
-            pct_diff = 0
-        else:
-            pct_diff = ((price - target) / target) * 100
-        
-        result = {
-            "ticker": ticker,
-            "target_price": target,
-            "current_price": price,
-            "currency": currency,
-            "pct_from_target": round(pct_diff, 2),
-            "note": alert.get("note", ""),
-            "set_by": alert.get("set_by", ""),
-        }
-        
-        if price <= target:
-            triggered.append(result)
-            # Update triggered count (only once per day to avoid inflation)
-            last_triggered = alert.get("last_triggered")
-            today = now.strftime("%Y-%m-%d")
-            if not last_triggered or not last_triggered.startswith(today):
-                alert["triggered_count"] = alert.get("triggered_count", 0) + 1
-            alert["last_triggered"] = now.isoformat()
-        else:
-            watching.append(result)
+    results, hits = run_checks(active_alerts, offline=offline)
     
-    save_alerts(data)
-    return {"triggered": triggered, "watching": watching}
+    save_triggers(hits, now, data)
+    log_results(results, now)
+    return results
+
+
+def cmd_rule(args) -> None:
+    """Set a history-based rule alert."""
+    from vfinance_news import alert_rules
+
+    ticker = args.ticker.upper()
+    error = alert_rules.validate_rule(args.rule, args.window, args.pct, args.cost)
+    if error:
+        print(f"❌ {error}")
+        return
+    currency = args.currency.upper() if args.currency else "USD"
+    if currency not in SUPPORTED_CURRENCIES:
+        print(f"❌ Currency {currency} not supported. Use: {', '.join(SUPPORTED_CURRENCIES)}")
+        return
+
+    alert = {
+        "ticker": ticker,
+        "target_price": None,
+        "rule": args.rule,
+        "currency": currency,
+        "note": args.note or "",
+        "set_by": args.user or "",
+        "set_date": datetime.now().strftime("%Y-%m-%d"),
+        "status": "active",
+        "snooze_until": None,
+        "triggered_count": 0,
+        "last_triggered": None,
+    }
+    params = alert_rules.RULES[args.rule]
+    if args.window is not None and "window" in params:
+        alert["window"] = args.window
+    if args.pct is not None and "threshold_pct" in params:
+        alert["threshold_pct"] = args.pct
+    if args.rule == "drawdown_from_cost":
+        alert["cost_basis"] = args.cost
+
+    data = load_alerts()
+    alerts = data.get("alerts", [])
+    duplicate = any(
+        a["ticker"] == ticker and a.get("rule") == args.rule
+        and alert_rules.rule_params(a) == alert_rules.rule_params(alert)
+        for a in alerts
+    )
+    if duplicate:
+        print(f"⚠️ Rule alert for {ticker} ({alert_rules.describe_rule(alert)}) already exists")
+        return
+
+    db_path = alert_db()
+    if db_path is not None:
+        from vfinance_news import alert_store
+        alert_store.add(db_path, alert, unique_ticker=False)
+    else:
+        alerts.append(alert)
+        data["alerts"] = alerts
+        save_alerts(data)
+    print(f"✅ Rule alert set: {ticker} {alert_rules.describe_rule(alert)}")
+
+
+def cmd_compact(args) -> None:
+    """Roll logged alert events from before today into daily summaries."""
+    from vfinance_news import alert_log
+    stats = alert_log.compact()
+    print(f"✅ Compacted {stats['events']} events into {stats['days']} daily summaries")
+
+
+def cmd_backfill(args) -> None:
+    """Download the daily history rule alerts need into the price store."""
+    from vfinance_news import alert_rules
+
+    rule_alerts = [a for a in load_alerts().get("alerts", []) if a.get("rule")]
+    if not rule_alerts:
+        print("📭 No rule alerts set")
+        return
+    downloaded = alert_rules.backfill_history(rule_alerts, timeout=args.timeout)
+    if not downloaded:
+        print("✅ Stored history already covers all rule alerts")
+        return
+    for symbol, sessions in downloaded.items():
+        print(f"  • {symbol}: {sessions} sessions")
+    print(f"✅ Backfilled {len(downloaded)} tickers")
+
+
+def cmd_import(args) -> None:
+    """Import alerts from the JSON format into the SQLite store."""
+    from vfinance_news import alert_store
+
+    source = Path(args.source) if args.source else ALERTS_FILE
+    if not source.exists():
+        print(f"❌ Alerts file not found: {source}")
+        return
+    try:
+        data = json.loads(source.read_text())
+    except json.JSONDecodeError as e:
+        print(f"❌ Invalid alerts JSON: {e}")
+        return
+    db_path = ALERTS_FILE.with_suffix(".db")
+    count = alert_store.import_json(db_path, data, replace=not args.append)
+    print(f"✅ Imported {count} alerts into {db_path}")
+    print(f"   Alerts commands now use {db_path.name}; {ALERTS_FILE.name} is no longer read")
+
+
+def cmd_export(args) -> None:
+    """Export the SQLite store in the alerts.json format."""
+    from vfinance_news import alert_store
+
+    db_path = alert_db()
+    if db_path is None:
+        print(f"❌ No alert store at {ALERTS_FILE.with_suffix('.db')} (run 'alerts import' first)")
+        return
+    data = alert_store.export_json(
+        db_path, meta={"version": 1, "supported_currencies": SUPPORTED_CURRENCIES}
+    )
+    if not args.output:
+        print(json.dumps(data, indent=2))
+        return
+    Path(args.output).write_text(json.dumps(data, indent=2))
+    print(f"✅ Exported {len(data['alerts'])} alerts to {args.output}")
 
 
 def main():
@@ -437,7 +688,10 @@ def main():
     subparsers = parser.add_subparsers(dest="command", required=True)
     
     # list
-    subparsers.add_parser("list", help="List all alerts")
+    from vfinance_news import alert_log
+    list_parser = subparsers.add_parser("list", help="List all alerts")
+    list_parser.add_argument("--history", type=int, nargs="?", const=alert_log.DEFAULT_HISTORY_DAYS, metavar="DAYS",
+                             help="Show trigger history for the last DAYS days with triggers")
     
     # set
     set_parser = subparsers.add_parser("set", help="Set new alert")
@@ -450,6 +704,7 @@ def main():
     # delete
     del_parser = subparsers.add_parser("delete", help="Delete alert")
     del_parser.add_argument("ticker", help="Stock ticker")
+    del_parser.add_argument("--rule", help="Only delete this ticker's rule alerts of this type")
     
     # snooze
     snooze_parser = subparsers.add_parser("snooze", help="Snooze alert")
@@ -465,6 +720,46 @@ def main():
     # check
     check_parser = subparsers.add_parser("check", help="Check alerts against prices")
     check_parser.add_argument("--json", action="store_true", help="JSON output")
+    check_parser.add_argument("--offline", action="store_true", help="Use stored prices instead of fetching")
+
+    # rule alerts
+    from vfinance_news import alert_rules
+    rule_parser = subparsers.add_parser("rule", help="Set a history-based rule alert")
+    rule_parser.add_argument("ticker", help="Stock ticker")
+    rule_parser.add_argument("rule", choices=list(alert_rules.RULES), help="Rule type")
+    rule_parser.add_argument("--window", type=int, help="Sessions in the rule window (high, MA or low)")
+    rule_parser.add_argument("--pct", type=float, help="Threshold in percent (drop or drawdown)")
+    rule_parser.add_argument("--cost", type=float, help="Cost basis for drawdown_from_cost")
+    rule_parser.add_argument("--note", help="Note/reason")
+    rule_parser.add_argument("--user", help="Who set the alert")
+    rule_parser.add_argument("--currency", default="USD", help="Currency (USD, EUR, JPY, SGD, MXN)")
+    backfill_parser = subparsers.add_parser("backfill", help="Download daily history for rule alerts")
+    backfill_parser.add_argument("--timeout", type=int, default=alert_rules.BACKFILL_TIMEOUT_SEC,
+                                 help="Download timeout in seconds")
+
+    subparsers.add_parser("compact", help="Roll the alert event log into daily summaries")
+
+    # import / export (SQLite alert store)
+    import_parser = subparsers.add_parser("import", help="Import alerts.json into the SQLite alert store")
+    import_parser.add_argument("--from", dest="source", help="JSON file to import (default: alerts.json)")
+    import_parser.add_argument("--append", action="store_true", help="Keep alerts already in the store")
+    export_parser = subparsers.add_parser("export", help="Export the SQLite alert store as alerts.json format")
+    export_parser.add_argument("--output", help="Write to this file instead of stdout")
+
+    # watch
+    from vfinance_news import alert_watch
+    watch_parser = subparsers.add_parser("watch", help="Continuously poll alerts with adaptive intervals")
+    watch_parser.add_argument("--json", action="store_true", help="NDJSON trigger events")
+    watch_parser.add_argument("--min-interval", type=float, default=alert_watch.MIN_INTERVAL_SEC,
+                              help="Seconds between polls for tickers at or near their target")
+    watch_parser.add_argument("--max-interval", type=float, default=alert_watch.MAX_INTERVAL_SEC,
+                              help="Seconds between polls for tickers far from their target")
+    watch_parser.add_argument("--near-pct", type=float, default=alert_watch.NEAR_PCT,
+                              help="Distance to target (%%) polled at the minimum interval")
+    watch_parser.add_argument("--far-pct", type=float, default=alert_watch.FAR_PCT,
+                              help="Distance to target (%%) polled at the maximum interval")
+    watch_parser.add_argument("--ignore-market-hours", action="store_true",
+                              help="Keep polling while the ticker's exchange is closed")
     
     args = parser.parse_args()
     
@@ -480,6 +775,18 @@ def main():
         cmd_update(args)
     elif args.command == "check":
         cmd_check(args)
+    elif args.command == "rule":
+        cmd_rule(args)
+    elif args.command == "backfill":
+        cmd_backfill(args)
+    elif args.command == "compact":
+        cmd_compact(args)
+    elif args.command == "import":
+        cmd_import(args)
+    elif args.command == "export":
+        cmd_export(args)
+    elif args.command == "watch":
+        alert_watch.cmd_watch(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Article Store - Durable SQLite store for ingested feed articles.
+
+Articles are upserted by their dedupe key (link, or title|date when there is
+no link - the same rule as `deduplicate_news`), so re-ingesting a feed only
+refreshes `last_seen`. Consumers query by time window, source or feed through
+indexes instead of re-downloading feeds while a feed is still fresh.
+
+Titles and descriptions are also indexed with FTS5 (kept in sync by
+triggers), so company/ticker mentions across every ingested feed can be
+found with a single MATCH query.
+"""
+
+import re
+import sqlite3
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPT_DIR.parent / "cache"
+ARTICLE_DB = CACHE_DIR / "articles.db"
+
+ARTICLE_RETENTION_DAYS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    link TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    date TEXT NOT NULL DEFAULT '',
+    published_at REAL,
+    ts REAL NOT NULL,
+    source_id TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT '',
+    feed TEXT NOT NULL DEFAULT '',
+    feed_url TEXT NOT NULL DEFAULT '',
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_articles_ts ON articles(ts);
+CREATE INDEX IF NOT EXISTS idx_articles_source_ts ON articles(source_id, ts);
+CREATE INDEX IF NOT EXISTS idx_articles_feed_url_ts ON articles(feed_url, ts);
+CREATE TABLE IF NOT EXISTS feed_fetches (
+    feed_url TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL
+);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE articles_fts USING fts5(
+    title, description,
+    content='articles', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER articles_fts_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+CREATE TRIGGER articles_fts_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+END;
+CREATE TRIGGER articles_fts_au AFTER UPDATE OF title, description ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO articles_fts(rowid, title, description) VALUES (new.id, new.title, new.description);
+END;
+INSERT INTO articles_fts(articles_fts) VALUES ('rebuild');
+"""
+
+ARTICLE_COLUMNS = ("title", "link", "date", "published_at", "description", "source_id", "source", "feed")
+
+# Legal-form suffixes dropped from portfolio names before searching
+NAME_SUFFIXES = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "ltd", "limited",
+    "plc", "ag", "se", "sa", "nv", "n.v", "spa", "ab", "asa", "holdings", "holding",
+    "group", "the", "class", "a", "b", "c", "adr",
+}
+# Tickers that are everyday words; these symbols are searched by name only
+AMBIGUOUS_TICKERS = {
+    "ALL", "ANY", "ARE", "BIG", "CAN", "CAR", "CAT", "FOR", "FUN", "HAS", "KEY", "LOW",
+    "NEW", "NOW", "ONE", "OUT", "RUN", "SEE", "TOP", "TWO", "USA", "WELL", "LIFE",
+    "REAL", "OPEN", "PLAY", "CASH", "GOOD", "FAST", "TRUE", "BEST", "HOME", "MAIN",
+}
+
+_initialized: set[str] = set()
+
+
+def article_key(article: dict) -> str:
+    """Dedupe key: the article URL, falling back to title+date."""
+    url = article.get('link', '')
+    if not url:
+        return f"{article.get('title', '')}|{article.get('date', '')}"
+    return url
+
+
+def connect() -> sqlite3.Connection:
+    """Open the article database, creating the schema on first use."""
+    ARTICLE_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(ARTICLE_DB, timeout=5)
+    conn.row_factory = sqlite3.Row
+    if str(ARTICLE_DB) not in _initialized:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(SCHEMA)
+        _ensure_fts(conn)
+        _initialized.add(str(ARTICLE_DB))
+    return conn
+
+
+def _ensure_fts(conn: sqlite3.Connection) -> None:
+    """Create the FTS5 index (backfilling existing rows) if it is missing."""
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+    ).fetchone()
+    if exists:
+        return
+    try:
+        conn.executescript(f"BEGIN;\n{FTS_SCHEMA}\nCOMMIT;")
+    except sqlite3.OperationalError as e:
+        conn.rollback()
+        print(f"⚠️ Article search index unavailable: {e}", file=sys.stderr)
+
+
+def ingest(
+    articles: list[dict],
+    source_id: str = "",
+    source: str = "",
+    feed: str = "",
+    feed_url: str = "",
+) -> int:
+    """Upsert articles and mark the feed as fetched. Returns the number of new articles."""
+    now = time.time()
+    rows = []
+    for article in articles:
+        title = (article.get('title') or '').strip()
+        if not title:
+            continue
+        published_at = article.get('published_at')
+        rows.append((
+            article_key(article),
+            article.get('link', '') or '',
+            title,
+            article.get('description', '') or '',
+            article.get('date', '') or '',
+            published_at,
+            published_at or now,
+            article.get('source_id') or source_id,
+            article.get('source') or source,
+            article.get('feed') or feed,
+            feed_url,
+            now,
+            now,
+        ))
+
+    with connect() as conn:
+        # Refresh known articles, then insert the rest; the insert's rowcount
+        # is the number of new articles, without counting the table.
+        conn.executemany(
+            """
+            UPDATE articles SET
+                last_seen = ?,
+                description = CASE WHEN description = '' THEN ? ELSE description END
+            WHERE key = ?
+            """,
+            [(now, row[3], row[0]) for row in rows],
+        )
+        added = conn.executemany(
+            """
+            INSERT INTO articles (key, link, title, description, date, published_at, ts,
+                                  source_id, source, feed, feed_url, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(key) DO NOTHING
+            """,
+            rows,
+        ).rowcount
+        if feed_url:
+            conn.execute(
+                "INSERT INTO feed_fetches (feed_url, fetched_at) VALUES (?, ?) "
+                "ON CONFLICT(feed_url) DO UPDATE SET fetched_at = excluded.fetched_at",
+                (feed_url, now),
+            )
+    conn.close()
+    return added
+
+
+def feed_fetched_at(feed_url: str) -> float | None:
+    """When a feed was last ingested (epoch seconds), or None."""
+    conn = connect()
+    try:
+        row = conn.execute("SELECT fetched_at FROM feed_fetches WHERE feed_url = ?", (feed_url,)).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def feed_is_fresh(feed_url: str, max_age_sec: float) -> bool:
+    fetched_at = feed_fetched_at(feed_url)
+    return fetched_at is not None and time.time() - fetched_at < max_age_sec
+
+
+def query_articles(
+    since: float | None = None,
+    until: float | None = None,
+    sources: list[str] | None = None,
+    feed_url: str | None = None,
+    limit: int | None = None,
+) -> list[dict]:
+    """Articles in a time window (epoch seconds), newest first.
+
+    Articles without a publish date are windowed by when they were first seen.
+    """
+    clauses = []
+    params: list = []
+    if since is not None:
+        clauses.append("ts >= ?")
+        params.append(since)
+    if until is not None:
+        clauses.append("ts < ?")
+        params.append(until)
+    if sources:
+        clauses.append(f"source_id IN ({', '.join('?' * len(sources))})")
+        params.extend(sources)
+    if feed_url is not None:
+        clauses.append("feed_url = ?")
+        params.append(feed_url)
+
+    sql = f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM articles"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY ts DESC, id"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    conn = connect()
+    try:
+        return [dict(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+
+def prune(retention_days: int = ARTICLE_RETENTION_DAYS) -> int:
+    """Delete articles older than the retention window. Returns rows removed."""
+    cutoff = time.time() - retention_days * 86400
+    with connect() as conn:
+        removed = conn.execute("DELETE FROM articles WHERE ts < ?", (cutoff,)).rowcount
+    conn.close()
+    return removed
+
+
+def _tokens(text: str) -> list[str]:
+    """Lowercase word tokens with diacritics removed (mirrors the FTS tokenizer)."""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return re.findall(r"\w+", text.lower())
+
+
+def mention_terms(symbol: str, name: str = "") -> list[str]:
+    """Search phrases for a portfolio entry: its company name and, when
+    unambiguous, its ticker (exchange suffixes like .T or .DE are dropped)."""
+    terms = []
+    base = symbol.upper().split(".")[0]
+    words = (name or "").replace(",", " ").split()
+    while words and words[-1].lower().strip(".") in NAME_SUFFIXES:
+        words.pop()
+    while words and words[0].lower() == "the":
+        words.pop(0)
+    company = " ".join(words).strip()
+    if len(company) >= 3 and company.upper() not in (symbol.upper(), base):
+        terms.append(company)
+
+    if base.isalpha() and len(base) >= 3 and base not in AMBIGUOUS_TICKERS:
+        terms.append(base)
+    return terms
+
+
+def _fts_phrase(tokens: tuple[str, ...]) -> str:
+    return '"' + " ".join(tokens) + '"'
+
+
+def search_mentions(
+    terms: dict[str, list[str]],
+    since: float | None = None,
+    per_symbol: int | None = None,
+) -> dict[str, list[dict]]:
+    """Articles mentioning each symbol's terms, newest first.
+
+    Every symbol is covered by one FTS5 query (an OR of phrases); matched
+    rows are then attributed to symbols by phrase, so an article naming two
+    companies is listed under both.
+    """
+    phrases: dict[tuple[str, ...], set[str]] = {}
+    for symbol, symbol_terms in terms.items():
+        for term in symbol_terms:
+            tokens = tuple(_tokens(term))
+            if tokens:
+                phrases.setdefault(tokens, set()).add(symbol)
+    if not phrases:
+        return {}
+
+    by_first: dict[str, list[tuple[tuple[str, ...], set[str]]]] = {}
+    for tokens, symbols in phrases.items():
+        by_first.setdefault(tokens[0], []).append((tokens, symbols))
+
+    sql = (
+        f"SELECT {', '.join('a.' + c for c in ARTICLE_COLUMNS)} FROM articles_fts "
+        "JOIN articles a ON a.id = articles_fts.rowid WHERE articles_fts MATCH ?"
+    )
+    params: list = [" OR ".join(_fts_phrase(tokens) for tokens in phrases)]
+    if since is not None:
+        sql += " AND a.ts >= ?"
+        params.append(since)
+    sql += " ORDER BY a.ts DESC, a.id"
+
+    conn = connect()
+    try:
+        rows = [dict(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+    mentions: dict[str, list[dict]] = {}
+    for article in rows:
+        tokens = _tokens(f"{article['title']} {article['description']}")
+        matched: set[str] = set()
+        for i, token in enumerate(tokens):
+            for phrase, symbols in by_first.get(token, ()):
+                if tuple(tokens[i:i + len(phrase)]) == phrase:
+                    matched |= symbols
+        for symbol in matched:
+            bucket = mentions.setdefault(symbol, [])
+            if per_symbol is None or len(bucket) < per_symbol:
+                bucket.append(article)
+    return mentions
+
+
+def safe_ingest(articles: list[dict], **kwargs) -> None:
+    """Ingest without letting store errors break a fetch."""
+    try:
+        ingest(articles, **kwargs)
+    except sqlite3.Error as e:
+        print(f"⚠️ Article store ingest failed: {e}", file=sys.stderr)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Batch Briefings - Render briefings for several portfolios from one shared fetch.
+
+A batch file lists one portfolio CSV per desk. The union of index and
+portfolio symbols is quoted once up front, and every feed and quote is kept
+in in-process caches that do not expire for the run. Each portfolio's
+briefing is then rendered in-process from that shared data, so fetch cost
+scales with unique symbols and feeds rather than with portfolio count.
+If a render times out, the remaining portfolios are skipped (reported under
+"errors"): the timed-out render keeps running and would share their data.
+
+Batch file (relative paths resolve against the batch file's directory):
+    {"portfolios": [{"name": "growth", "path": "desks/growth.csv"}, ...]}
+    {"growth": "desks/growth.csv", "income": "desks/income.csv"}
+
+Usage:
+    vfinance-news briefing --batch portfolios.json
+    vfinance-news briefing --batch portfolios.json --json
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from vfinance_news import briefing, fetch_news, portfolio
+from vfinance_news.utils import clamp_timeout, compute_deadline
+
+QUOTE_TIMEOUT_SEC = 30
+
+
+def load_batch(path: Path) -> list[dict]:
+    """Parse a batch file into [{"name", "path"}] entries.
+
+    Raises ValueError for malformed files, duplicate names or missing CSVs.
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except OSError as e:
+        raise ValueError(f"Cannot read batch file: {e}") from e
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid batch file JSON: {e}") from e
+
+    if isinstance(data, dict) and "portfolios" in data:
+        data = data["portfolios"]
+    if isinstance(data, dict):
+        raw = [{"name": name, "path": csv_path} for name, csv_path in data.items()]
+    elif isinstance(data, list):
+        raw = data
+    else:
+        raise ValueError("Batch file must be a list or an object of portfolios")
+
+    base_dir = Path(path).parent
+    entries = []
+    seen = set()
+    for item in raw:
+        if not isinstance(item, dict) or not item.get("path"):
+            raise ValueError(f"Batch entry needs a path: {item!r}")
+        csv_path = Path(item["path"]).expanduser()
+        if not csv_path.is_absolute():
+            csv_path = base_dir / csv_path
+        name = str(item.get("name") or csv_path.stem)
+        if name in seen:
+            raise ValueError(f"Duplicate portfolio name: {name}")
+        if not csv_path.exists():
+            raise ValueError(f"Portfolio file not found for {name}: {csv_path}")
+        seen.add(name)
+        entries.append({"name": name, "path": csv_path})
+    if not entries:
+        raise ValueError("Batch file lists no portfolios")
+    return entries
+
+
+def build_fetch_plan(entries: list[dict], sources: dict) -> dict:
+    """Union of index and portfolio symbols across the batch, in first-seen order."""
+    index_symbols = [s for market in sources.get("markets", {}).values() for s in market.get("indices", [])]
+    per_portfolio = {
+        entry["name"]: [position["symbol"] for position in portfolio.load_portfolio(entry["path"])]
+        for entry in entries
+    }
+    symbols = list(dict.fromkeys(s for held in per_portfolio.values() for s in held))
+    return {
+        "index_symbols": list(dict.fromkeys(index_symbols)),
+        "symbols": symbols,
+        "per_portfolio": per_portfolio,
+    }
+
+
+def prefetch_plan(plan: dict, deadline: float | None = None) -> dict:
+    """Quote every index and portfolio symbol in one batch into the shared cache."""
+    quote_symbols = list(dict.fromkeys(plan["index_symbols"] + plan["symbols"]))
+    try:
+        quotes = fetch_news.fetch_market_data(
+            quote_symbols,
+            timeout=clamp_timeout(QUOTE_TIMEOUT_SEC, deadline),
+            deadline=deadline,
+        )
+    except TimeoutError:
+        quotes = {}
+    return {"requested": len(quote_symbols), "fetched": len(quotes)}
+
+
+def render_portfolio(entry: dict, args) -> dict:
+    """Render one portfolio's --json briefing document from the shared caches."""
+    cmd = briefing.build_summarize_cmd(args) + ["--json"]
+    with portfolio.use_portfolio_file(entry["path"]):
+        result = briefing._run_summarize(cmd, briefing.summarize_timeout(args), in_process=True)
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()
+        raise RuntimeError(error[-1] if error else f"summarize exited with {result.returncode}")
+    try:
+        return json.loads(result.stdout.strip())
+    except json.JSONDecodeError as e:
+        raise RuntimeError(f"Failed to parse briefing JSON: {e}") from e
+
+
+def run_batch(entries: list[dict], args) -> dict:
+    """Fetch the union of inputs once, then render every portfolio from it."""
+    fetch_news.enable_warm_caches(feed_ttl=None, quote_ttl=None)
+    plan = build_fetch_plan(entries, fetch_news.load_sources())
+    holdings = sum(len(held) for held in plan["per_portfolio"].values())
+    print(
+        f"📦 Batch: {len(entries)} portfolios, {len(plan['symbols'])} unique symbols ({holdings} holdings)",
+        file=sys.stderr,
+    )
+    quotes = prefetch_plan(plan, compute_deadline(args.deadline))
+
+    documents = {}
+    errors = {}
+    for entry in entries:
+        if briefing.summarize_worker_running():
+            # A timed-out render still reads the portfolio and caches; do not start another
+            errors[entry["name"]] = "skipped: an earlier briefing timed out and is still running"
+            continue
+        print(f"📊 Rendering {entry['name']} briefing...", file=sys.stderr)
+        try:
+            documents[entry["name"]] = render_portfolio(entry, args)
+        except Exception as e:
+            print(f"⚠️ {entry['name']} briefing failed: {e}", file=sys.stderr)
+            errors[entry["name"]] = str(e)
+    if briefing.summarize_worker_running():
+        print("⚠️ Batch stopped: a briefing timed out and is still running", file=sys.stderr)
+
+    return {
+        "plan": {
+            "portfolios": len(entries),
+            "unique_symbols": len(plan["symbols"]),
+            "holdings": holdings,
+            "index_symbols": len(plan["index_symbols"]),
+            "quotes": quotes,
+        },
+        "portfolios": documents,
+        "errors": errors,
+    }
+
+
+def main(args) -> int:
+    """Entry point for `briefing --batch`; returns the process exit code."""
+    try:
+        entries = load_batch(Path(args.batch).expanduser())
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    result = run_batch(entries, args)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for name, data in result["portfolios"].items():
+            print(f"\n{'=' * 20} {name} {'=' * 20}\n")
+            if data.get('macro_message'):
+                print(data['macro_message'])
+            if data.get('portfolio_message'):
+                print("\n" + "=" * 20 + "\n")
+                print(data['portfolio_message'])
+    return 1 if not result["portfolios"] else 0
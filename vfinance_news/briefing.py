@@ -5,24 +5,155 @@ Generates market briefings for terminal/JSON output.
 """
 
 import argparse
+import io
 import json
 import subprocess
 import sys
+import threading
+from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime
 
 from vfinance_news.utils import ensure_venv
 
 ensure_venv()
 
+# Set by the serve daemon so summarize runs in-process against its warm caches.
+SUMMARIZE_IN_PROCESS = False
 
-def generate_and_send(args):
-    """Generate briefing output."""
+# In-process summarize that outlived its timeout (threads cannot be killed)
+_timed_out_worker: threading.Thread | None = None
 
-    # Hard cutoff: morning before 12:00 local time, evening from 12:00 onward.
-    hour = datetime.now().hour
-    briefing_time = 'morning' if hour < 12 else 'evening'
-    
-    # Generate the briefing
+
+class _DropThreadOutput(io.TextIOBase):
+    """Stream wrapper that discards writes from one thread and passes the rest through."""
+
+    def __init__(self, stream, thread: threading.Thread):
+        self.stream = stream
+        self.thread = thread
+
+    def write(self, text: str) -> int:
+        if threading.current_thread() is self.thread:
+            return len(text)
+        return self.stream.write(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+
+def summarize_worker_running() -> bool:
+    """Whether an in-process summarize that timed out is still running.
+
+    While it runs it still reads sys.argv, the portfolio and the warm caches,
+    so callers must not start another in-process command (the serve daemon
+    declines requests, batches stop).
+    """
+    return _timed_out_worker is not None and _timed_out_worker.is_alive()
+
+
+def _run_summarize(cmd: list[str], timeout: int, in_process: bool = False) -> subprocess.CompletedProcess:
+    """Run the summarize command as a subprocess, or in-process when serving or batching."""
+    global _timed_out_worker
+    if not (in_process or SUMMARIZE_IN_PROCESS):
+        return subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+            timeout=timeout
+        )
+
+    if summarize_worker_running():
+        return subprocess.CompletedProcess(cmd, 1, "", "❌ A timed-out briefing is still running in this process\n")
+
+    from vfinance_news import summarize
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    outcome = {"returncode": 0}
+
+    def run():
+        try:
+            summarize.main()
+        except SystemExit as e:
+            outcome["returncode"] = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception as e:
+            stderr.write(f"❌ summarize failed: {type(e).__name__}: {e}\n")
+            outcome["returncode"] = 1
+
+    worker = threading.Thread(target=run, name="summarize", daemon=True)
+    saved_argv = sys.argv
+    saved_stdout, saved_stderr = sys.stdout, sys.stderr
+    sys.argv = ["summarize"] + cmd[3:]
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            worker.start()
+            worker.join(timeout)
+    finally:
+        sys.argv = saved_argv
+    if worker.is_alive():
+        # Keep its late output out of whatever runs next
+        _timed_out_worker = worker
+        sys.stdout = _DropThreadOutput(saved_stdout, worker)
+        sys.stderr = _DropThreadOutput(saved_stderr, worker)
+        return subprocess.CompletedProcess(
+            cmd, 1, stdout.getvalue(), stderr.getvalue() + f"❌ Briefing generation timed out after {timeout}s\n"
+        )
+    return subprocess.CompletedProcess(cmd, outcome["returncode"], stdout.getvalue(), stderr.getvalue())
+
+
+def _stream_summarize(cmd: list[str], timeout: int) -> tuple[int, dict | None]:
+    """Run summarize --stream, relaying each NDJSON event as it arrives.
+
+    Returns (returncode, final document or None).
+    """
+    document = None
+
+    def relay(line: str) -> None:
+        nonlocal document
+        line = line.strip()
+        if not line:
+            return
+        print(line, flush=True)
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        if event.get("event") == "final":
+            document = event.get("document")
+
+    if SUMMARIZE_IN_PROCESS:
+        result = _run_summarize(cmd, timeout)
+        sys.stderr.write(result.stderr)
+        for line in result.stdout.splitlines():
+            relay(line)
+        return result.returncode, document
+
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stdin=subprocess.DEVNULL,
+        text=True,
+    )
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            relay(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+    if timed_out.is_set():
+        print(f"❌ Briefing generation timed out after {timeout}s", file=sys.stderr)
+    return returncode, document
+
+
+def build_summarize_cmd(args) -> list[str]:
+    """Summarize command line for the briefing options, without an output flag."""
     cmd = [
         sys.executable, '-m', 'vfinance_news.summarize',
         '--style', args.style,
@@ -36,26 +167,49 @@ def generate_and_send(args):
 
     if args.llm:
         cmd.append('--llm')
+        llm_cutoff = getattr(args, 'llm_cutoff', None)
+        if isinstance(llm_cutoff, (int, float)):
+            cmd.extend(['--llm-cutoff', str(llm_cutoff)])
 
     if args.debug:
         cmd.append('--debug')
+    return cmd
+
+
+def summarize_timeout(args) -> int:
+    """Subprocess timeout: the deadline plus a little slack, else 300s."""
+    timeout = args.deadline if args.deadline is not None else 300
+    timeout = max(1, int(timeout))
+    if args.deadline is not None:
+        timeout = timeout + 5
+    return timeout
+
+
+def generate_and_send(args):
+    """Generate briefing output."""
+
+    # Hard cutoff: morning before 12:00 local time, evening from 12:00 onward.
+    hour = datetime.now().hour
+    briefing_time = 'morning' if hour < 12 else 'evening'
     
+    # Generate the briefing
+    cmd = build_summarize_cmd(args)
+
     # Always use JSON for internal processing to handle splits
-    cmd.append('--json')
+    cmd.append('--stream' if args.stream else '--json')
     
     print(f"📊 Generating {briefing_time} briefing...", file=sys.stderr)
     
-    timeout = args.deadline if args.deadline is not None else 300
-    timeout = max(1, int(timeout))
-    if args.deadline is not None:
-        timeout = timeout + 5
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        stdin=subprocess.DEVNULL,
-        timeout=timeout
-    )
+    timeout = summarize_timeout(args)
+
+    if args.stream:
+        returncode, document = _stream_summarize(cmd, timeout)
+        if returncode != 0:
+            print("❌ Briefing generation failed", file=sys.stderr)
+            sys.exit(1)
+        return (document or {}).get('macro_message', '')
+
+    result = _run_summarize(cmd, timeout)
     
     if result.returncode != 0:
         print(f"❌ Briefing generation failed: {result.stderr}", file=sys.stderr)
@@ -89,15 +243,26 @@ def main():
                         default='briefing', help='Summary style')
     parser.add_argument('--json', action='store_true',
                         help='Output as JSON')
+    parser.add_argument('--stream', action='store_true',
+                        help='Output NDJSON events as stages complete (last event holds the --json document)')
     parser.add_argument('--deadline', type=int, default=None,
                         help='Overall deadline in seconds')
     parser.add_argument('--llm', action='store_true', help='Use LLM summary')
+    parser.add_argument('--llm-cutoff', type=float, default=None,
+                        help='Seconds to wait for the LLM before using the deterministic briefing')
     parser.add_argument('--fast', action='store_true',
                         help='Use fast mode (shorter timeouts, fewer items)')
     parser.add_argument('--debug', action='store_true',
                         help='Write debug log with sources')
+    parser.add_argument('--batch', metavar='FILE', default=None,
+                        help='Render briefings for every portfolio in a JSON batch file from one shared fetch')
     
     args = parser.parse_args()
+    if args.batch:
+        if args.stream:
+            parser.error('--stream cannot be combined with --batch')
+        from vfinance_news import batch
+        sys.exit(batch.main(args))
     generate_and_send(args)
 
 
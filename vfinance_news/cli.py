@@ -1,8 +1,30 @@
 """Python CLI entrypoint for vfinance-news."""
 
 import argparse
+import os
 import sys
 
+def _forward_to_daemon(command: str, argv: list[str]) -> bool:
+    """Run a command through a running serve daemon; False if it must run locally."""
+    if os.environ.get("VFINANCE_NEWS_NO_DAEMON") or "-h" in argv or "--help" in argv:
+        return False
+
+    from vfinance_news import server
+
+    if not server.is_served(command, argv):
+        return False
+    response = server.request(command, argv)
+    if response is None:
+        return False
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    exit_code = response.get("exit_code", 0)
+    if exit_code:
+        raise SystemExit(exit_code)
+    return True
+
+
 def _news_command(symbol: str) -> int:
     from vfinance_news import fetch_news
 
@@ -26,6 +48,7 @@ def _build_parser() -> argparse.ArgumentParser:
     subparsers.add_parser("market", help="Market overview")
     subparsers.add_parser("portfolio", help="News for portfolio stocks")
     subparsers.add_parser("portfolio-only", help="Top gainers/losers from portfolio")
+    subparsers.add_parser("movers", help="Top portfolio movers, optionally volatility-normalized")
 
     news_parser = subparsers.add_parser("news", help="News for specific ticker")
     news_parser.add_argument("symbol", help="Ticker symbol")
@@ -33,6 +56,9 @@ def _build_parser() -> argparse.ArgumentParser:
     subparsers.add_parser("alerts", help="Price target alerts")
     subparsers.add_parser("earnings", help="Earnings calendar")
 
+    subparsers.add_parser("prefetch", help="Warm feed/quote caches ahead of scheduled briefings")
+    subparsers.add_parser("serve", help="Run daemon serving briefing/alerts/earnings/market over a Unix socket")
+
     return parser
 
 
@@ -47,6 +73,9 @@ def main() -> None:
         parser.print_help()
         return
 
+    if _forward_to_daemon(args.command, list(remaining)):
+        return
+
     if args.command == "setup":
         from vfinance_news import setup
 
@@ -93,6 +122,12 @@ def main() -> None:
         sys.argv = ["vfinance-news portfolio-only", "portfolio-only"] + remaining
         fetch_news.main()
         return
+    if args.command == "movers":
+        from vfinance_news import fetch_news
+
+        sys.argv = ["vfinance-news movers", "movers"] + remaining
+        fetch_news.main()
+        return
     if args.command == "news":
         _news_command(args.symbol)
         return
@@ -110,6 +145,19 @@ def main() -> None:
         earnings.main()
         return
 
+    if args.command == "prefetch":
+        from vfinance_news import prefetch
+
+        sys.argv = ["vfinance-news prefetch"] + remaining
+        prefetch.main()
+        return
+    if args.command == "serve":
+        from vfinance_news import server
+
+        sys.argv = ["vfinance-news serve"] + remaining
+        server.main()
+        return
+
     raise SystemExit(f"Unknown command: {args.command}")
 
 
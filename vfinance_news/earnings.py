@@ -6,22 +6,25 @@ Features:
 - Fetch earnings dates from Finnhub API
 - Show upcoming earnings in daily briefing
 - Alert 24h before earnings release
-- Cache results to avoid API spam
+- Fetch actuals after the report and compute EPS/revenue surprise %
+- Cache the calendar per date partition; only stale partitions are refetched
+  (near-term days more often than far-out ones) and merged in
 
 Usage:
     earnings.py list              # Show all upcoming earnings
     earnings.py check             # Check what's reporting today/this week
     earnings.py refresh           # Force refresh earnings data
+    earnings.py results           # Fetch actuals and surprise % for reported stocks
 """
 
 import argparse
-import csv
 import json
 import os
 import sys
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from urllib.request import urlopen, Request
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -29,42 +32,44 @@ CONFIG_DIR = SCRIPT_DIR.parent / "config"
 CACHE_DIR = SCRIPT_DIR.parent / "cache"
 
 
-def _get_portfolio_file() -> Path:
-    """Get portfolio CSV path with PORTFOLIOS_DIR env var support.
-
-    Priority:
-    1. Shared location ($PORTFOLIOS_DIR/watchlists/portfolio.csv) if env var set
-    2. Legacy config/portfolio.csv (backward compatibility)
-    """
-    env_dir = os.environ.get("PORTFOLIOS_DIR", "").strip()
-    if env_dir:
-        # If env var is set, always use shared path (even if file doesn't exist yet)
-        return Path(os.path.expanduser(env_dir)) / "watchlists" / "portfolio.csv"
-    # Fallback to legacy path
-    return CONFIG_DIR / "portfolio.csv"
-
-
-PORTFOLIO_FILE = _get_portfolio_file()
 EARNINGS_CACHE = CACHE_DIR / "earnings_calendar.json"
 MANUAL_EARNINGS = CONFIG_DIR / "manual_earnings.json"  # For JP/other stocks not in Finnhub
 
+# Calendar window kept in the cache (one quarter ahead)
+EARNINGS_WINDOW_DAYS = 90
+# Partition max age by days until the report date: (up to N days out, TTL)
+PARTITION_TTLS = (
+    (7, timedelta(hours=6)),
+    (30, timedelta(hours=24)),
+    (None, timedelta(hours=72)),
+)
+# Past partitions are kept (never refetched) for this many days
+PAST_RETENTION_DAYS = 14
+# Reports this recent label a mover's price change as earnings-driven
+EARNINGS_MOVE_DAYS = 3
+# Per-symbol fallbacks per results run, on top of the one bulk calendar call
+MAX_SYMBOL_LOOKUPS = 50
+RESULTS_CACHE_TTL_SEC = 3600
+
 def load_portfolio() -> list[dict]:
     """Load portfolio from CSV."""
-    if not PORTFOLIO_FILE.exists():
-        return []
-    with open(PORTFOLIO_FILE, 'r') as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+    from vfinance_news import portfolio
+
+    return portfolio.load_portfolio()
 
 
 def load_earnings_cache() -> dict:
-    """Load cached earnings data."""
+    """Load cached earnings data.
+
+    {"last_updated", "earnings": {ticker: data} for the portfolio,
+     "partitions": {date: {"fetched_at", "earnings": {symbol: data}}}}
+    """
     if EARNINGS_CACHE.exists():
         try:
             return json.loads(EARNINGS_CACHE.read_text())
         except Exception:
             pass
-    return {"last_updated": None, "earnings": {}}
+    return {"last_updated": None, "earnings": {}, "partitions": {}}
 
 
 def load_manual_earnings() -> dict:
@@ -101,41 +106,58 @@ def get_finnhub_key() -> str:
     return key
 
 
-def fetch_all_earnings_finnhub(days_ahead: int = 60) -> dict:
+_finnhub_client = None
+
+
+def get_finnhub_client():
+    """Shared rate-limited Finnhub client for per-symbol lookups (None without an API key)."""
+    global _finnhub_client
+    if _finnhub_client is None:
+        key = get_finnhub_key()
+        if not key:
+            return None
+        from vfinance_news.finnhub import FinnhubClient
+        _finnhub_client = FinnhubClient(key)
+    return _finnhub_client
+
+
+def fetch_all_earnings_finnhub(
+    days_ahead: int = 60,
+    from_date: str | None = None,
+    to_date: str | None = None,
+) -> dict | None:
     """
-    Fetch all earnings for the next N days from Finnhub.
-    Returns dict keyed by symbol: {"AAPL": {...}, ...}
+    Fetch all earnings for the next N days (or from_date..to_date) from Finnhub.
+    Returns dict keyed by symbol: {"AAPL": {...}, ...}, or None if the request failed.
     """
-    finnhub_key = get_finnhub_key()
-    if not finnhub_key:
+    client = get_finnhub_client()
+    if client is None:
         return {}
     
-    from_date = datetime.now().strftime("%Y-%m-%d")
-    to_date = (datetime.now() + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
-    
-    url = f"https://finnhub.io/api/v1/calendar/earnings?from={from_date}&to={to_date}&token={finnhub_key}"
+    from_date = from_date or datetime.now().strftime("%Y-%m-%d")
+    to_date = to_date or (datetime.now() + timedelta(days=days_ahead)).strftime("%Y-%m-%d")
     
+    from vfinance_news.finnhub import FinnhubError
     try:
-        req = Request(url, headers={"User-Agent": "vfinance-news/1.0"})
-        with urlopen(req, timeout=30) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-            
-            earnings_by_symbol = {}
-            for entry in data.get("earningsCalendar", []):
-                symbol = entry.get("symbol")
-                if symbol:
-                    earnings_by_symbol[symbol] = {
-                        "date": entry.get("date"),
-                        "time": entry.get("hour", ""),  # bmo/amc
-                        "eps_estimate": entry.get("epsEstimate"),
-                        "revenue_estimate": entry.get("revenueEstimate"),
-                        "quarter": entry.get("quarter"),
-                        "year": entry.get("year"),
-                    }
-            return earnings_by_symbol
-    except Exception as e:
+        # The calendar cache below decides when to refetch, so skip the client's disk cache
+        entries = client.earnings_calendar(from_date, to_date, ttl=None)
+    except FinnhubError as e:
         print(f"❌ Finnhub error: {e}", file=sys.stderr)
-        return {}
+        return None
+
+    earnings_by_symbol = {}
+    for entry in entries:
+        symbol = entry.get("symbol")
+        if symbol:
+            earnings_by_symbol[symbol] = {
+                "date": entry.get("date"),
+                "time": entry.get("hour", ""),  # bmo/amc
+                "eps_estimate": entry.get("epsEstimate"),
+                "revenue_estimate": entry.get("revenueEstimate"),
+                "quarter": entry.get("quarter"),
+                "year": entry.get("year"),
+            }
+    return earnings_by_symbol
 
 
 def normalize_ticker_for_lookup(ticker: str) -> list[str]:
@@ -158,18 +180,8 @@ def normalize_ticker_for_lookup(ticker: str) -> list[str]:
     return variants
 
 
-def fetch_earnings_for_portfolio(portfolio: list[dict]) -> dict:
-    """
-    Fetch earnings dates for portfolio stocks using Finnhub bulk API.
-    More efficient than per-ticker calls.
-    """
-    # Get all earnings for next 60 days
-    all_earnings = fetch_all_earnings_finnhub(days_ahead=60)
-    
-    if not all_earnings:
-        return {}
-    
-    # Match portfolio tickers to earnings data
+def match_portfolio(all_earnings: dict, portfolio: list[dict]) -> dict:
+    """Pick each portfolio ticker's entry from symbol-keyed calendar data."""
     results = {}
     for stock in portfolio:
         ticker = stock["symbol"]
@@ -183,6 +195,111 @@ def fetch_earnings_for_portfolio(portfolio: list[dict]) -> dict:
     return results
 
 
+def fetch_earnings_for_portfolio(portfolio: list[dict]) -> dict:
+    """
+    Fetch earnings dates for portfolio stocks using Finnhub bulk API.
+    More efficient than per-ticker calls.
+    """
+    all_earnings = fetch_all_earnings_finnhub(days_ahead=EARNINGS_WINDOW_DAYS)
+    if not all_earnings:
+        return {}
+    return match_portfolio(all_earnings, portfolio)
+
+
+def partition_ttl(days_out: int) -> timedelta | None:
+    """Max age of a date partition `days_out` days ahead (None: past, never refetched)."""
+    if days_out < 0:
+        return None
+    for max_days, ttl in PARTITION_TTLS:
+        if max_days is None or days_out <= max_days:
+            return ttl
+    return None
+
+
+def stale_partitions(cache: dict, now: datetime, force: bool = False) -> list[str]:
+    """Dates in the calendar window whose partition is missing or past its TTL."""
+    partitions = cache.get("partitions") or {}
+    today = now.date()
+    stale = []
+    for offset in range(EARNINGS_WINDOW_DAYS + 1):
+        day = (today + timedelta(days=offset)).isoformat()
+        fetched_at = (partitions.get(day) or {}).get("fetched_at")
+        if force or not fetched_at:
+            stale.append(day)
+            continue
+        try:
+            age = now - datetime.fromisoformat(fetched_at)
+        except ValueError:
+            stale.append(day)
+            continue
+        if age >= partition_ttl(offset):
+            stale.append(day)
+    return stale
+
+
+def date_ranges(days: list[str]) -> list[tuple[str, str]]:
+    """Collapse sorted ISO dates into contiguous (from, to) ranges - one request each."""
+    ranges = []
+    for day in days:
+        if ranges and datetime.fromisoformat(day) - datetime.fromisoformat(ranges[-1][1]) == timedelta(days=1):
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
+
+
+def merge_partitions(cache: dict, fetched: dict, from_date: str, to_date: str, now: datetime) -> None:
+    """Replace the partitions of one fetched range with its entries, bucketed by date."""
+    partitions = cache.setdefault("partitions", {})
+    day = datetime.fromisoformat(from_date).date()
+    end = datetime.fromisoformat(to_date).date()
+    while day <= end:
+        partitions[day.isoformat()] = {"fetched_at": now.isoformat(), "earnings": {}}
+        day += timedelta(days=1)
+    for symbol, data in fetched.items():
+        report_day = (data or {}).get("date")
+        if not report_day:
+            continue
+        partition = partitions.setdefault(report_day, {"fetched_at": now.isoformat(), "earnings": {}})
+        partition["earnings"][symbol] = data
+
+    cutoff = (now.date() - timedelta(days=PAST_RETENTION_DAYS)).isoformat()
+    for old_day in [d for d in partitions if d < cutoff]:
+        del partitions[old_day]
+
+
+def calendar_by_symbol(cache: dict) -> dict:
+    """Merge partitions into one symbol-keyed calendar.
+
+    A symbol listed on several dates (a rescheduled report) keeps the entry
+    from the most recently fetched partition.
+    """
+    merged = {}
+    fetched = {}
+    for day in sorted((cache.get("partitions") or {})):
+        partition = cache["partitions"][day]
+        fetched_at = partition.get("fetched_at") or ""
+        for symbol, data in partition.get("earnings", {}).items():
+            if symbol not in merged or fetched_at > fetched[symbol]:
+                merged[symbol] = data
+                fetched[symbol] = fetched_at
+    return merged
+
+
+def portfolio_earnings(cache: dict, portfolio: list[dict]) -> dict:
+    """Portfolio earnings from the partitioned calendar, plus manual entries filling gaps.
+
+    Caches written before partitioning only carry the "earnings" view.
+    """
+    if not cache.get("partitions"):
+        return cache.get("earnings", {})
+    earnings = match_portfolio(calendar_by_symbol(cache), portfolio)
+    for ticker, data in load_manual_earnings().items():
+        if ticker not in earnings:
+            earnings[ticker] = data
+    return earnings
+
+
 def refresh_earnings(portfolio: list[dict], force: bool = False) -> dict:
     """Refresh earnings data for all portfolio stocks."""
     finnhub_key = get_finnhub_key()
@@ -191,29 +308,34 @@ def refresh_earnings(portfolio: list[dict], force: bool = False) -> dict:
         return {}
     
     cache = load_earnings_cache()
-    
-    # Check if cache is fresh (< 6 hours old)
-    if not force and cache.get("last_updated"):
-        try:
+    cache.setdefault("partitions", {})
+    now = datetime.now()
+    
+    # Only partitions past their TTL are refetched
+    stale = stale_partitions(cache, now, force=force)
+    if not stale:
+        cache["earnings"] = portfolio_earnings(cache, portfolio)
+        if cache.get("last_updated"):
             last = datetime.fromisoformat(cache["last_updated"])
-            if datetime.now() - last < timedelta(hours=6):
-                print(f"📦 Using cached data (updated {last.strftime('%H:%M')})")
-                return cache
-        except Exception:
-            pass
+            print(f"📦 Using cached data (updated {last.strftime('%H:%M')})")
+        return cache
     
-    print(f"🔄 Fetching earnings calendar from Finnhub...")
+    ranges = date_ranges(stale)
+    print(f"🔄 Fetching {len(stale)} earnings calendar days from Finnhub ({len(ranges)} requests)...")
     
-    # Use bulk fetch - much more efficient
-    earnings = fetch_earnings_for_portfolio(portfolio)
+    fetched_any = False
+    for from_date, to_date in ranges:
+        fetched = fetch_all_earnings_finnhub(from_date=from_date, to_date=to_date)
+        if fetched is None:
+            continue  # keep the stale partitions rather than dropping their entries
+        merge_partitions(cache, fetched, from_date, to_date, now)
+        fetched_any = True
     
-    # Merge manual earnings (for JP stocks not in Finnhub)
+    # Manual earnings (for JP stocks not in Finnhub) fill gaps
     manual = load_manual_earnings()
     if manual:
         print(f"📝 Merging {len(manual)} manual entries...")
-        for ticker, data in manual.items():
-            if ticker not in earnings:  # Manual data fills gaps
-                earnings[ticker] = data
+    earnings = portfolio_earnings(cache, portfolio)
     
     found = len(earnings)
     total = len(portfolio)
@@ -223,10 +345,9 @@ def refresh_earnings(portfolio: list[dict], force: bool = False) -> dict:
         for ticker, data in sorted(earnings.items(), key=lambda x: x[1].get("date", "")):
             print(f"  • {ticker}: {data.get('date', '?')}")
     
-    cache = {
-        "last_updated": datetime.now().isoformat(),
-        "earnings": earnings
-    }
+    cache["earnings"] = earnings
+    if fetched_any:
+        cache["last_updated"] = now.isoformat()
     save_earnings_cache(cache)
     
     return cache
@@ -255,6 +376,7 @@ def list_earnings(args):
     print(f"\n📅 Upcoming Earnings ({len(sorted_earnings)} stocks)\n")
     
     today = datetime.now().date()
+    names = {s["symbol"]: s.get("name") for s in reversed(portfolio)}
     
     for ticker, data in sorted_earnings:
         date_str = data["date"]
@@ -292,7 +414,7 @@ def list_earnings(args):
                 eps_str = f" | Est: ${data['eps_estimate']:.2f}"
             
             # Stock name from portfolio
-            stock_name = next((s["name"] for s in portfolio if s["symbol"] == ticker), ticker)
+            stock_name = names.get(ticker) or ticker
             
             print(f"{emoji} {date_str} ({timing}): **{ticker}** — {stock_name}{time_str}{eps_str}")
             
@@ -302,189 +424,388 @@ def list_earnings(args):
     print()
 
 
-def check_earnings(args):
-    """Check earnings for today and this week (briefing format)."""
-    portfolio = load_portfolio()
-    if not portfolio:
-        return
+REPORT_TIME_ORDER = {"bmo": 0, "amc": 1}
+
+
+@dataclass(frozen=True)
+class EarningsRecord:
+    """One portfolio stock's upcoming (or recent) report."""
+    ticker: str
+    name: str
+    date: date
+    time: str = ""  # "bmo" (pre-market), "amc" (after close) or ""
+    eps_estimate: float | None = None
+    category: str = ""
+
+    def to_dict(self) -> dict:
+        return {
+            "ticker": self.ticker,
+            "name": self.name,
+            "date": self.date.isoformat(),
+            "time": self.time,
+            "eps_estimate": self.eps_estimate,
+            "category": self.category,
+        }
+
 
+class EarningsIndex:
+    """Portfolio earnings indexed by report date (sorted, bisected) and by ticker.
+
+    Built once in O(entries + portfolio); range queries cost O(log n + k).
+    """
+
+    def __init__(self, earnings: dict, portfolio: list[dict]):
+        stocks = {}
+        for stock in portfolio:
+            stocks.setdefault(stock["symbol"], stock)
+
+        records = []
+        for ticker, data in earnings.items():
+            if not data.get("date"):
+                continue
+            try:
+                report_date = datetime.strptime(data["date"], "%Y-%m-%d").date()
+            except ValueError:
+                continue
+            stock = stocks.get(ticker)
+            records.append(EarningsRecord(
+                ticker=ticker,
+                name=(stock or {}).get("name") or ticker,
+                date=report_date,
+                time=data.get("time") or "",
+                eps_estimate=data.get("eps_estimate"),
+                category=(stock or {}).get("category", "") or "",
+            ))
+        records.sort(key=lambda r: r.date)
+        self.records = records
+        self._days = [r.date.toordinal() for r in records]
+        self._by_ticker = {r.ticker: r for r in records}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def between(self, start: date, end: date) -> list[EarningsRecord]:
+        """Records reporting from start to end (inclusive), by date."""
+        lo = bisect_left(self._days, start.toordinal())
+        hi = bisect_right(self._days, end.toordinal())
+        return self.records[lo:hi]
+
+    def on(self, day: date) -> list[EarningsRecord]:
+        """Records reporting on one day: pre-market, then after-close, then unknown time."""
+        return sorted(self.between(day, day), key=lambda r: REPORT_TIME_ORDER.get(r.time, len(REPORT_TIME_ORDER)))
+
+    def for_ticker(self, ticker: str) -> EarningsRecord | None:
+        return self._by_ticker.get(ticker)
+
+    def this_week(self, today: date) -> list[EarningsRecord]:
+        """Reports in the 7 days after today."""
+        return self.between(today + timedelta(days=1), today + timedelta(days=7))
+
+    def next_week(self, today: date) -> tuple[date, date, list[EarningsRecord]]:
+        """(Monday, Friday, reports) of the upcoming trading week."""
+        week_start, week_end = next_week_range(today)
+        return week_start, week_end, self.between(week_start, week_end)
+
+
+def next_week_range(today: date) -> tuple[date, date]:
+    """Mon-Fri of the upcoming week (this week when today is Monday)."""
+    # weekday() returns 0=Mon, 6=Sun. (7 - weekday) % 7 gives days until next Monday.
+    days_until_monday = (7 - today.weekday()) % 7
+    week_start = today + timedelta(days=days_until_monday)
+    return week_start, week_start + timedelta(days=4)
+
+
+def load_earnings(portfolio: list[dict]) -> dict:
+    """Portfolio earnings from the cache, refreshing stale partitions first."""
     cache = load_earnings_cache()
 
-    # Auto-refresh if cache is stale
-    if not cache.get("last_updated"):
-        cache = refresh_earnings(portfolio, force=False)
-    else:
+    # Auto-refresh when any date partition is past its TTL (only those are refetched)
+    if not cache.get("last_updated") or (cache.get("partitions") and stale_partitions(cache, datetime.now())):
+        cache = refresh_earnings(portfolio, force=False) or cache
+    elif not cache.get("partitions"):
+        # Cache from before partitioning: refresh on the old 12h schedule
         try:
             last = datetime.fromisoformat(cache["last_updated"])
             if datetime.now() - last > timedelta(hours=12):
-                cache = refresh_earnings(portfolio, force=False)
+                cache = refresh_earnings(portfolio, force=False) or cache
         except Exception:
-            cache = refresh_earnings(portfolio, force=False)
+            cache = refresh_earnings(portfolio, force=False) or cache
 
-    earnings = cache.get("earnings", {})
-    if not earnings:
+    return portfolio_earnings(cache, portfolio)
+
+
+def earnings_index(portfolio: list[dict] | None = None) -> EarningsIndex:
+    """Query index over the portfolio's cached earnings (loads the portfolio if not given)."""
+    if portfolio is None:
+        portfolio = load_portfolio()
+    if not portfolio:
+        return EarningsIndex({}, [])
+    return EarningsIndex(load_earnings(portfolio), portfolio)
+
+
+def format_earnings_section(
+    today_records: list[EarningsRecord],
+    week_records: list[EarningsRecord],
+    week_range: tuple[date, date] | None = None,
+    date_str: str | None = None,
+) -> str:
+    """Briefing text for today's and the week's reports (week_range: weekly preview mode)."""
+    labels = {
+        "today": "EARNINGS TODAY",
+        "week": "EARNINGS THIS WEEK",
+        "week_preview": "EARNINGS NEXT WEEK",
+        "pre": "pre-market",
+        "post": "after-close",
+        "pre_short": "pre",
+        "post_short": "post",
+        "est": "Est",
+    }
+    date_str = date_str or datetime.now().strftime("%b %d, %Y")
+    output = []
+
+    if today_records:
+        output.append(f"📅 {labels['today']} — {date_str}\n")
+        for e in today_records:
+            time_str = f" ({labels['pre']})" if e.time == "bmo" else f" ({labels['post']})" if e.time == "amc" else ""
+            eps_str = f" — {labels['est']}: ${e.eps_estimate:.2f}" if e.eps_estimate else ""
+            output.append(f"• {e.ticker} — {e.name}{time_str}{eps_str}")
+        output.append("")
+
+    if week_records:
+        if week_range:
+            # Show date range for weekly preview
+            span = f"{week_range[0].strftime('%b %d')} - {week_range[1].strftime('%b %d')}"
+            output.append(f"📅 {labels['week_preview']} ({span})\n")
+        else:
+            output.append(f"📅 {labels['week']}\n")
+        for e in week_records:
+            day_name = e.date.strftime("%a %d.%m")
+            time_str = f" ({labels['pre_short']})" if e.time == "bmo" else f" ({labels['post_short']})" if e.time == "amc" else ""
+            output.append(f"• {day_name}: {e.ticker} — {e.name}{time_str}")
+        output.append("")
+
+    return "\n".join(output)
+
+
+def check_earnings(args):
+    """Check earnings for today and this week (briefing format)."""
+    portfolio = load_portfolio()
+    if not portfolio:
+        return
+
+    index = earnings_index(portfolio)
+    if not len(index):
         return
 
     today = datetime.now().date()
     week_only = getattr(args, 'week', False)
 
     # For weekly mode (Sunday cron), show Mon-Fri of upcoming week
-    # Calculation: weekday() returns 0=Mon, 6=Sun. (7 - weekday) % 7 gives days until next Monday.
-    # Special case: if today is Monday (result=0), we want next Monday (7 days), not today.
     if week_only:
-        days_until_monday = (7 - today.weekday()) % 7
-        if days_until_monday == 0 and today.weekday() != 0:
-            days_until_monday = 7
-        week_start = today + timedelta(days=days_until_monday)
-        week_end = week_start + timedelta(days=4)  # Mon-Fri
+        week_start, week_end, week_list = index.next_week(today)
+        today_list = []
     else:
-        week_end = today + timedelta(days=7)
-
-    today_list = []
-    week_list = []
-
-    for ticker, data in earnings.items():
-        if not data.get("date"):
-            continue
-        try:
-            ed = datetime.strptime(data["date"], "%Y-%m-%d").date()
-            stock = next((s for s in portfolio if s["symbol"] == ticker), None)
-            name = stock["name"] if stock else ticker
-            category = stock.get("category", "") if stock else ""
-
-            entry = {
-                "ticker": ticker,
-                "name": name,
-                "date": ed,
-                "time": data.get("time", ""),
-                "eps_estimate": data.get("eps_estimate"),
-                "category": category,
-            }
+        today_list = index.on(today)
+        week_list = index.this_week(today)
 
-            if week_only:
-                # Weekly mode: only show week range
-                if week_start <= ed <= week_end:
-                    week_list.append(entry)
-            else:
-                # Daily mode: today + this week
-                if ed == today:
-                    today_list.append(entry)
-                elif today < ed <= week_end:
-                    week_list.append(entry)
-        except ValueError:
-            continue
-    
     # Handle JSON output
     if getattr(args, 'json', False):
         if week_only:
             result = {
                 "week_start": week_start.isoformat(),
                 "week_end": week_end.isoformat(),
-                "earnings": [
-                    {
-                        "ticker": e["ticker"],
-                        "name": e["name"],
-                        "date": e["date"].isoformat(),
-                        "time": e["time"],
-                        "eps_estimate": e.get("eps_estimate"),
-                        "category": e.get("category", ""),
-                    }
-                    for e in sorted(week_list, key=lambda x: x["date"])
-                ],
+                "earnings": [e.to_dict() for e in week_list],
             }
         else:
             result = {
-                "today": [
-                    {
-                        "ticker": e["ticker"],
-                        "name": e["name"],
-                        "date": e["date"].isoformat(),
-                        "time": e["time"],
-                        "eps_estimate": e.get("eps_estimate"),
-                        "category": e.get("category", ""),
-                    }
-                    for e in sorted(today_list, key=lambda x: x.get("time", "zzz"))
-                ],
-                "this_week": [
-                    {
-                        "ticker": e["ticker"],
-                        "name": e["name"],
-                        "date": e["date"].isoformat(),
-                        "time": e["time"],
-                        "eps_estimate": e.get("eps_estimate"),
-                        "category": e.get("category", ""),
-                    }
-                    for e in sorted(week_list, key=lambda x: x["date"])
-                ],
+                "today": [e.to_dict() for e in today_list],
+                "this_week": [e.to_dict() for e in week_list],
             }
         print(json.dumps(result, indent=2))
         return
 
-    labels = {
-        "today": "EARNINGS TODAY",
-        "week": "EARNINGS THIS WEEK",
-        "week_preview": "EARNINGS NEXT WEEK",
-        "pre": "pre-market",
-        "post": "after-close",
-        "pre_short": "pre",
-        "post_short": "post",
-        "est": "Est",
-        "none": "No earnings this week",
-        "none_week": "No earnings next week",
+    output = format_earnings_section(today_list, week_list, (week_start, week_end) if week_only else None)
+    if output:
+        print(output)
+    elif args.verbose:
+        print(f"📅 {'No earnings next week' if week_only else 'No earnings this week'}")
+
+
+def get_briefing_section() -> str:
+    """Get earnings section for daily briefing (called by briefing.py)."""
+    index = earnings_index()
+    today = datetime.now().date()
+    section = format_earnings_section(index.on(today), index.this_week(today))
+    return section + "\n" if section else ""
+
+
+def reported(data: dict, today: date) -> bool:
+    """Whether a calendar entry's report is out: before today, or today pre-market."""
+    try:
+        report_date = datetime.strptime(data.get("date") or "", "%Y-%m-%d").date()
+    except ValueError:
+        return False
+    return report_date < today or (report_date == today and data.get("time") == "bmo")
+
+
+def pending_results(cache: dict, portfolio: list[dict], today: date) -> dict[str, str]:
+    """Portfolio tickers that have reported (within retention) but have no actuals yet.
+
+    Returns {ticker: report date}.
+    """
+    cutoff = (today - timedelta(days=PAST_RETENTION_DAYS)).isoformat()
+    results = cache.get("results") or {}
+    pending = {}
+    for ticker, data in portfolio_earnings(cache, portfolio).items():
+        if not reported(data, today) or data["date"] < cutoff:
+            continue
+        known = results.get(ticker) or {}
+        if known.get("date") == data["date"] and known.get("eps_actual") is not None:
+            continue
+        pending[ticker] = data["date"]
+    return pending
+
+
+def _result_entry(report_date: str, eps_actual, eps_estimate, revenue_actual=None, revenue_estimate=None) -> dict:
+    return {
+        "date": report_date,
+        "eps_actual": eps_actual,
+        "eps_estimate": eps_estimate,
+        "revenue_actual": revenue_actual,
+        "revenue_estimate": revenue_estimate,
     }
 
-    # Date header
-    date_str = datetime.now().strftime("%b %d, %Y")
 
-    # Output for briefing
-    output = []
+def fetch_actuals(pending: dict[str, str], client) -> dict[str, dict]:
+    """Actuals for reported tickers: one calendar call spanning all their report dates.
 
-    # Daily mode: show today's earnings
-    if not week_only and today_list:
-        output.append(f"📅 {labels['today']} — {date_str}\n")
-        for e in sorted(today_list, key=lambda x: x.get("time", "zzz")):
-            time_str = f" ({labels['pre']})" if e["time"] == "bmo" else f" ({labels['post']})" if e["time"] == "amc" else ""
-            eps_str = f" — {labels['est']}: ${e['eps_estimate']:.2f}" if e.get("eps_estimate") else ""
-            output.append(f"• {e['ticker']} — {e['name']}{time_str}{eps_str}")
-        output.append("")
+    Tickers the calendar has no actual for fall back to per-symbol lookups
+    (at most MAX_SYMBOL_LOOKUPS per run, rate-limited by the client).
+    """
+    if not pending:
+        return {}
+    entries = client.earnings_calendar(min(pending.values()), max(pending.values()), ttl=RESULTS_CACHE_TTL_SEC)
+    by_symbol = {e["symbol"]: e for e in entries if e.get("symbol") and e.get("epsActual") is not None}
+
+    found = {}
+    for ticker, report_date in pending.items():
+        for variant in normalize_ticker_for_lookup(ticker):
+            entry = by_symbol.get(variant)
+            if entry:
+                found[ticker] = _result_entry(
+                    report_date, entry["epsActual"], entry.get("epsEstimate"),
+                    entry.get("revenueActual"), entry.get("revenueEstimate"),
+                )
+                break
 
-    if week_list:
-        # Use different header for weekly preview mode
-        week_label = labels['week_preview'] if week_only else labels['week']
-        if week_only:
-            # Show date range for weekly preview
-            week_range = f"{week_start.strftime('%b %d')} - {week_end.strftime('%b %d')}"
-            output.append(f"📅 {week_label} ({week_range})\n")
-        else:
-            output.append(f"📅 {week_label}\n")
-        for e in sorted(week_list, key=lambda x: x["date"]):
-            day_name = e["date"].strftime("%a %d.%m")
-            time_str = f" ({labels['pre_short']})" if e["time"] == "bmo" else f" ({labels['post_short']})" if e["time"] == "amc" else ""
-            output.append(f"• {day_name}: {e['ticker']} — {e['name']}{time_str}")
-        output.append("")
+    missing = [t for t in pending if t not in found][:MAX_SYMBOL_LOOKUPS]
+    for ticker in missing:
+        report_date = pending[ticker]
+        quarters = client.earnings_surprises(ticker, ttl=RESULTS_CACHE_TTL_SEC)
+        # Latest quarter ending before the report (and not a year-old one)
+        for quarter in quarters:
+            period = quarter.get("period") or ""
+            if quarter.get("actual") is None or not period or period > report_date:
+                continue
+            if (datetime.fromisoformat(report_date) - datetime.fromisoformat(period)).days <= 120:
+                found[ticker] = _result_entry(report_date, quarter["actual"], quarter.get("estimate"))
+            break
+    return found
+
+
+def compute_surprises(results: dict[str, dict]) -> None:
+    """Add eps/revenue surprise % to every result in one vectorized pass."""
+    import numpy as np
+
+    if not results:
+        return
+    tickers = list(results)
+    for field in ("eps", "revenue"):
+        actual = np.array([results[t].get(f"{field}_actual") for t in tickers], dtype=np.float64)
+        estimate = np.array([results[t].get(f"{field}_estimate") for t in tickers], dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            surprise = (actual - estimate) / np.abs(estimate) * 100
+        surprise = np.round(surprise, 2)
+        valid = np.isfinite(surprise)
+        for ticker, pct, ok in zip(tickers, surprise.tolist(), valid.tolist()):
+            results[ticker][f"{field}_surprise_pct"] = pct if ok else None
+
+
+def enrich_reported(portfolio: list[dict], client=None, now: datetime | None = None) -> dict:
+    """Fetch actuals for reported portfolio tickers and store them under the cache's "results".
+
+    Returns the newly stored results.
+    """
+    now = now or datetime.now()
+    cache = load_earnings_cache()
+    pending = pending_results(cache, portfolio, now.date())
+    if not pending:
+        return {}
+    client = client or get_finnhub_client()
+    if client is None:
+        print("❌ FINNHUB_API_KEY not found", file=sys.stderr)
+        return {}
 
-    if output:
-        print("\n".join(output))
-    else:
-        if args.verbose:
-            no_earnings_label = labels['none_week'] if week_only else labels['none']
-            print(f"📅 {no_earnings_label}")
+    from vfinance_news.finnhub import FinnhubError
+    try:
+        actuals = fetch_actuals(pending, client)
+    except FinnhubError as e:
+        print(f"⚠️ Finnhub results lookup failed: {e}", file=sys.stderr)
+        return {}
+    compute_surprises(actuals)
+
+    results = cache.setdefault("results", {})
+    for result in actuals.values():
+        result["fetched_at"] = now.isoformat()
+    results.update(actuals)
+    cutoff = (now.date() - timedelta(days=PAST_RETENTION_DAYS)).isoformat()
+    cache["results"] = {t: r for t, r in results.items() if (r.get("date") or "") >= cutoff}
+    save_earnings_cache(cache)
+    return actuals
 
 
-def get_briefing_section() -> str:
-    """Get earnings section for daily briefing (called by briefing.py)."""
-    from io import StringIO
-    import contextlib
+def load_earnings_results(days: int = EARNINGS_MOVE_DAYS, today: date | None = None) -> dict:
+    """Stored results for reports in the last `days` days: {ticker: result}."""
+    today = today or datetime.now().date()
+    cutoff = (today - timedelta(days=days)).isoformat()
+    results = load_earnings_cache().get("results") or {}
+    return {t: r for t, r in results.items() if cutoff <= (r.get("date") or "") <= today.isoformat()}
+
 
-    # Capture check output
-    class Args:
-        verbose = False
+def format_result(ticker: str, result: dict) -> str:
+    """One line per result, e.g. 'AAPL 2026-10-16: EPS 1.60 vs 1.50 est (+6.7%)'."""
+    eps = f"EPS {result['eps_actual']:.2f}"
+    if result.get("eps_estimate") is not None:
+        eps += f" vs {result['eps_estimate']:.2f} est"
+    if result.get("eps_surprise_pct") is not None:
+        eps += f" ({result['eps_surprise_pct']:+.1f}%)"
+    if result.get("revenue_surprise_pct") is not None:
+        eps += f", revenue {result['revenue_surprise_pct']:+.1f}%"
+    return f"{ticker} {result['date']}: {eps}"
 
-    f = StringIO()
-    with contextlib.redirect_stdout(f):
-        check_earnings(Args())
 
-    return f.getvalue()
+def results_earnings(args):
+    """Fetch actuals for reported portfolio stocks and list recent results."""
+    portfolio = load_portfolio()
+    if not portfolio:
+        print("📂 Portfolio empty")
+        return
+    added = enrich_reported(portfolio)
+    results = load_earnings_results(days=PAST_RETENTION_DAYS)
+    if getattr(args, "json", False):
+        print(json.dumps(results, indent=2))
+        return
+    if added:
+        print(f"✅ Fetched results for {len(added)} stocks")
+    if not results:
+        print("📭 No reported earnings in the last two weeks")
+        return
+    print(f"\n📊 Reported Earnings ({len(results)} stocks)\n")
+    for ticker, result in sorted(results.items(), key=lambda x: x[1]["date"], reverse=True):
+        surprise = result.get("eps_surprise_pct")
+        emoji = "⚪" if surprise is None else "🟢" if surprise >= 0 else "🔴"
+        print(f"{emoji} {format_result(ticker, result)}")
+    print()
 
 
 def main():
@@ -507,6 +828,11 @@ def main():
     refresh_parser = subparsers.add_parser("refresh", help="Force refresh all data")
     refresh_parser.set_defaults(func=lambda a: refresh_earnings(load_portfolio(), force=True))
     
+    # results command
+    results_parser = subparsers.add_parser("results", help="Fetch actuals for reported stocks")
+    results_parser.add_argument("--json", action="store_true", help="JSON output")
+    results_parser.set_defaults(func=results_earnings)
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -4,9 +4,11 @@ News Fetcher - Aggregate news from multiple sources.
 """
 
 import argparse
+import hashlib
 import json
 import os
 import shutil
+import sqlite3
 import subprocess
 import sys
 import time
@@ -19,6 +21,8 @@ import urllib.request
 import yfinance as yf
 import pandas as pd
 
+from vfinance_news import article_store, price_store
+from vfinance_news.models import Article, Quote
 from vfinance_news.utils import clamp_timeout, compute_deadline, ensure_venv, time_left
 
 # Retry configuration
@@ -102,6 +106,27 @@ DEFAULT_SOURCE_WEIGHTS = {
 LARGE_PORTFOLIO_FALLBACK_MULTIPLIER = 4
 LARGE_PORTFOLIO_FALLBACK_MIN_SYMBOLS = 20
 LARGE_PORTFOLIO_FALLBACK_TIMEOUT_CAP_SEC = 10
+# Window for portfolio mentions found in already-ingested feeds
+PORTFOLIO_MENTION_HOURS = 24
+
+# Quote modes: "change" needs latest price + previous close, "last" only the latest price
+QUOTE_MODE_CHANGE = "change"
+QUOTE_MODE_LAST = "last"
+QUOTE_MODES = (QUOTE_MODE_CHANGE, QUOTE_MODE_LAST)
+# Smallest Yahoo range that always spans two sessions across weekends/holidays
+CHANGE_HISTORY_PERIOD = "5d"
+QUOTE_SESSION_CACHE = CACHE_DIR / "quote_sessions.json"
+
+# Raw feed bytes cached on disk (filled by `prefetch`, read by briefing runs)
+FEED_CACHE_DIR = CACHE_DIR / "feeds"
+FEED_CACHE_TTL_SEC = 15 * 60
+FEED_ARTICLE_KEYS = ("title", "link", "date", "published_at", "description")
+
+# In-process caches kept warm by the serve daemon; one-shot CLI runs leave them disabled.
+WARM_FEED_TTL_SEC = 300
+WARM_QUOTE_TTL_SEC = 60
+_warm_caches: dict | None = None
+_warm_ttls: dict = {}
 
 
 ensure_venv()
@@ -135,12 +160,57 @@ def ensure_portfolio_config():
 ensure_portfolio_config()
 
 
+def enable_warm_caches(
+    feed_ttl: float | None = WARM_FEED_TTL_SEC,
+    quote_ttl: float | None = WARM_QUOTE_TTL_SEC,
+) -> None:
+    """Keep config, parsed feeds and quotes in memory between calls.
+
+    Used by the serve daemon; entries expire after WARM_FEED_TTL_SEC /
+    WARM_QUOTE_TTL_SEC, and file-backed entries when the file changes.
+    Batch briefings pass None so every feed and quote is fetched once per run.
+    """
+    global _warm_caches, _warm_ttls
+    _warm_caches = {"feeds": {}, "quotes": {}, "files": {}}
+    _warm_ttls = {"feeds": feed_ttl, "quotes": quote_ttl}
+
+
+def _warm_get(bucket: str, key):
+    """Return a warm cache entry, or None when disabled, missing or expired."""
+    if _warm_caches is None:
+        return None
+    ttl = _warm_ttls.get(bucket)
+    hit = _warm_caches[bucket].get(key)
+    if hit is None or (ttl is not None and time.monotonic() - hit[0] >= ttl):
+        return None
+    return hit[1]
+
+
+def _warm_put(bucket: str, key, value) -> None:
+    if _warm_caches is not None:
+        _warm_caches[bucket][key] = (time.monotonic(), value)
+
+
+def _file_key(path: Path):
+    """Cache key that changes whenever the file is modified."""
+    try:
+        return (str(path), path.stat().st_mtime_ns)
+    except OSError:
+        return (str(path), None)
+
+
 def load_sources():
     """Load source configuration."""
     config_path = CONFIG_DIR / "config.json"
     if config_path.exists():
+        key = _file_key(config_path)
+        cached = _warm_get("files", key)
+        if cached is not None:
+            return cached
         with open(config_path, 'r') as f:
-            return json.load(f)
+            sources = json.load(f)
+        _warm_put("files", key, sources)
+        return sources
     legacy_path = CONFIG_DIR / "sources.json"
     if legacy_path.exists():
         print("⚠️ config/config.json missing; falling back to config/sources.json", file=sys.stderr)
@@ -196,25 +266,76 @@ def is_generic_headline(title: str) -> bool:
     return any(normalized.startswith(prefix) for prefix in generic_prefixes)
 
 
+def _feed_cache_path(url: str) -> Path:
+    return FEED_CACHE_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.xml"
+
+
+def _read_feed_cache(url: str, max_age_sec: float) -> bytes | None:
+    """Return cached feed bytes if younger than max_age_sec."""
+    path = _feed_cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime >= max_age_sec:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _write_feed_cache(url: str, content: bytes) -> None:
+    path = _feed_cache_path(url)
+    try:
+        FEED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(content)
+        tmp_path.replace(path)
+    except OSError as e:
+        print(f"⚠️ Could not cache feed {url}: {e}", file=sys.stderr)
+
+
 def fetch_rss(
     url: str,
     limit: int = 10,
     timeout: int = 15,
     deadline: float | None = None,
     max_age_hours: float | None = None,
+    cache_ttl: float | None = None,
 ) -> list[dict]:
-    """Fetch and parse RSS/Atom feed using feedparser with retry logic."""
-    # Fetch content with retry (returns bytes for feedparser to handle encoding)
-    content = fetch_with_retry(url, timeout=timeout, deadline=deadline)
-    if content is None:
-        return []
+    """Fetch and parse RSS/Atom feed using feedparser with retry logic.
 
-    # Parse with feedparser (handles RSS and Atom formats, auto-detects encoding from bytes)
-    try:
-        parsed = feedparser.parse(content)
-    except Exception as e:
-        print(f"⚠️ Error parsing feed {url}: {e}", file=sys.stderr)
-        return []
+    With `cache_ttl` set, the raw feed is read from the on-disk feed cache
+    when younger than `cache_ttl` seconds, and fresh downloads are written
+    back to it (`cache_ttl=0` always downloads and refreshes the cache).
+    """
+    return _fetch_feed(url, limit, timeout, deadline, max_age_hours, cache_ttl) or []
+
+
+def _fetch_feed(
+    url: str,
+    limit: int,
+    timeout: int,
+    deadline: float | None,
+    max_age_hours: float | None,
+    cache_ttl: float | None,
+) -> list[dict] | None:
+    """fetch_rss, but None when the feed could not be downloaded or parsed."""
+    parsed = _warm_get("feeds", url)
+    if parsed is None:
+        content = _read_feed_cache(url, cache_ttl) if cache_ttl else None
+        if content is None:
+            # Fetch content with retry (returns bytes for feedparser to handle encoding)
+            content = fetch_with_retry(url, timeout=timeout, deadline=deadline)
+            if content is None:
+                return None
+            if cache_ttl is not None:
+                _write_feed_cache(url, content)
+
+        # Parse with feedparser (handles RSS and Atom formats, auto-detects encoding from bytes)
+        try:
+            parsed = feedparser.parse(content)
+        except Exception as e:
+            print(f"⚠️ Error parsing feed {url}: {e}", file=sys.stderr)
+            return None
+        _warm_put("feeds", url, parsed)
 
     items = []
     now_ts = datetime.now().timestamp()
@@ -260,80 +381,155 @@ def fetch_rss(
     return items
 
 
-def _fetch_via_yfinance(
-    symbols: list[str],
-    timeout: int,
-    deadline: float | None,
-) -> dict:
-    """Fetch symbols via yfinance batch download (fallback)."""
-    results = {}
-    if not symbols:
-        return results
+def _load_quote_sessions() -> dict:
+    """Load cached previous closes keyed by symbol."""
+    if not QUOTE_SESSION_CACHE.exists():
+        return {}
+    try:
+        data = json.loads(QUOTE_SESSION_CACHE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
 
+def _save_quote_sessions(sessions: dict) -> None:
+    """Persist cached previous closes."""
     try:
-        if time_left(deadline) is not None and time_left(deadline) <= 0:
-            return results
+        QUOTE_SESSION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        QUOTE_SESSION_CACHE.write_text(json.dumps(sessions, indent=2))
+    except OSError as e:
+        print(f"⚠️ Could not save quote session cache: {e}", file=sys.stderr)
 
-        tickers = " ".join(symbols)
+
+def _download_closes(symbols: list[str], period: str, timeout: int) -> dict[str, pd.Series]:
+    """Download daily closes for symbols, returning a non-empty Close series per symbol."""
+    closes = {}
+    try:
         df = yf.download(
-            tickers,
-            period="5d",
+            " ".join(symbols),
+            period=period,
             progress=False,
             threads=True,
             ignore_tz=True,
             timeout=timeout,
         )
+    except Exception as e:
+        print(f"⚠️ yfinance batch failed: {e}", file=sys.stderr)
+        return closes
 
-        for symbol in symbols:
-            try:
-                if df.empty:
-                    continue
+    if df is None or df.empty:
+        return closes
 
-                # Handle yfinance MultiIndex columns (yfinance >= 0.2.0)
-                if isinstance(df.columns, pd.MultiIndex):
-                    try:
-                        s_df = df.xs(symbol, level=1, axis=1, drop_level=True)
-                    except (KeyError, AttributeError):
-                        continue
-                elif len(symbols) == 1:
-                    # Flat columns only valid for single-symbol requests
-                    s_df = df
-                else:
-                    # Multi-symbol request but flat columns (only one ticker returned data)
-                    # Skip to avoid misattributing prices to wrong symbols
+    for symbol in symbols:
+        try:
+            # Handle yfinance MultiIndex columns (yfinance >= 0.2.0)
+            if isinstance(df.columns, pd.MultiIndex):
+                try:
+                    s_df = df.xs(symbol, level=1, axis=1, drop_level=True)
+                except (KeyError, AttributeError):
                     continue
+            elif len(symbols) == 1:
+                # Flat columns only valid for single-symbol requests
+                s_df = df
+            else:
+                # Multi-symbol request but flat columns (only one ticker returned data)
+                # Skip to avoid misattributing prices to wrong symbols
+                continue
 
-                if s_df.empty:
-                    continue
+            series = s_df['Close'].dropna()
+            if not series.empty:
+                closes[symbol] = series
+        except Exception:
+            continue
 
-                s_df = s_df.dropna(subset=['Close'])
-                if s_df.empty:
-                    continue
+    return closes
 
-                latest = s_df.iloc[-1]
-                price = float(latest['Close'])
 
-                prev_close = 0.0
-                change_percent = 0.0
-                if len(s_df) > 1:
-                    prev_row = s_df.iloc[-2]
-                    prev_close = float(prev_row['Close'])
-                    if prev_close > 0:
-                        change_percent = ((price - prev_close) / prev_close) * 100
-
-                results[symbol] = {
-                    "price": price,
-                    "change_percent": change_percent,
-                    "prev_close": prev_close,
-                    "symbol": symbol
-                }
-            except Exception:
+def _record_history(closes: dict[str, pd.Series]) -> None:
+    """Append downloaded closes to the local price store."""
+    for symbol, series in closes.items():
+        try:
+            price_store.record_series(symbol, series)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not store price history for {symbol}: {e}", file=sys.stderr)
+            continue
+
+
+def _session_of(series: pd.Series) -> str:
+    """Trading day (ISO date) of the latest bar in a close series."""
+    return pd.Timestamp(series.index[-1]).date().isoformat()
+
+
+def _build_quote(symbol: str, price: float, prev_close: float) -> dict:
+    """Build a quote dict, deriving change % from the previous close."""
+    change_percent = ((price - prev_close) / prev_close) * 100 if prev_close > 0 else 0.0
+    return {
+        "price": price,
+        "change_percent": change_percent,
+        "prev_close": prev_close,
+        "symbol": symbol
+    }
+
+
+def _fetch_via_yfinance(
+    symbols: list[str],
+    timeout: int,
+    deadline: float | None,
+    mode: str = QUOTE_MODE_CHANGE,
+) -> dict:
+    """Fetch quotes via yfinance batch download, requesting only the range the mode needs.
+
+    Symbols whose previous close is cached for the current session (and every
+    symbol in ``last`` mode) are fetched with a single daily bar; only the
+    remaining symbols download enough history to derive the previous close.
+    """
+    results = {}
+    if not symbols:
+        return results
+
+    if time_left(deadline) is not None and time_left(deadline) <= 0:
+        return results
+
+    sessions = _load_quote_sessions()
+    sessions_dirty = False
+
+    if mode == QUOTE_MODE_LAST:
+        latest_only = list(symbols)
+        full_history = []
+    else:
+        latest_only = [s for s in symbols if s in sessions]
+        full_history = [s for s in symbols if s not in sessions]
+
+    if latest_only:
+        latest_closes = _download_closes(latest_only, "1d", timeout)
+        _record_history(latest_closes)
+        for symbol, series in latest_closes.items():
+            cached = sessions.get(symbol) or {}
+            if cached.get("session") == _session_of(series):
+                prev_close = float(cached.get("prev_close") or 0.0)
+            elif mode == QUOTE_MODE_CHANGE:
+                # A new session started since the cache was written
+                full_history.append(symbol)
                 continue
+            else:
+                prev_close = 0.0
+            results[symbol] = _build_quote(symbol, float(series.iloc[-1]), prev_close)
 
-    except Exception as e:
-        print(f"⚠️ yfinance batch failed: {e}", file=sys.stderr)
+    if full_history and not (time_left(deadline) is not None and time_left(deadline) <= 0):
+        history_closes = _download_closes(full_history, CHANGE_HISTORY_PERIOD, timeout)
+        _record_history(history_closes)
+        for symbol, series in history_closes.items():
+            prev_close = 0.0
+            if len(series) > 1:
+                prev_close = float(series.iloc[-2])
+                sessions[symbol] = {"session": _session_of(series), "prev_close": prev_close}
+                sessions_dirty = True
+            results[symbol] = _build_quote(symbol, float(series.iloc[-1]), prev_close)
+
+    if sessions_dirty:
+        _save_quote_sessions(sessions)
 
-    return results
+    return {symbol: results[symbol] for symbol in symbols if symbol in results}
 
 
 def fetch_market_data(
@@ -341,55 +537,102 @@ def fetch_market_data(
     timeout: int = 30,
     deadline: float | None = None,
     allow_price_fallback: bool = False,
+    mode: str = QUOTE_MODE_CHANGE,
 ) -> dict:
     """Fetch market data via yfinance.
 
+    ``mode`` selects what is fetched: ``change`` (latest price plus previous
+    close) or ``last`` (latest price only, for alerts).
     `allow_price_fallback` is retained for API compatibility and is ignored.
     """
+    if mode not in QUOTE_MODES:
+        raise ValueError(f"Unknown quote mode: {mode}")
     if not symbols:
         return {}
+    return _fetch_quotes(symbols, timeout, deadline, mode)
 
-    return _fetch_via_yfinance(symbols, timeout, deadline)
 
+def _fetch_quotes(symbols: list[str], timeout: int, deadline: float | None, mode: str) -> dict:
+    """Fetch quotes, serving and filling the warm quote cache when enabled."""
+    if _warm_caches is None:
+        return _fetch_via_yfinance(symbols, timeout, deadline, mode=mode)
 
-def fetch_ticker_news(symbol: str, limit: int = 5) -> list[dict]:
-    """Fetch news for a specific ticker via Yahoo Finance RSS."""
-    url = f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={symbol}&region=US&lang=en-US"
-    return fetch_rss(url, limit)
+    quotes = {}
+    for symbol in symbols:
+        cached = _warm_get("quotes", (mode, symbol))
+        if cached is not None:
+            quotes[symbol] = cached.to_dict()
+    missing = [s for s in symbols if s not in quotes]
+    if missing:
+        fetched = _fetch_via_yfinance(missing, timeout, deadline, mode=mode)
+        for symbol, quote in fetched.items():
+            # Held as a slotted Quote between daemon requests
+            _warm_put("quotes", (mode, symbol), Quote.from_dict(quote))
+        quotes.update(fetched)
+    return {symbol: quotes[symbol] for symbol in symbols if symbol in quotes}
 
 
-def get_cached_news(cache_key: str) -> dict | None:
-    """Get cached news if fresh (< 15 minutes)."""
-    cache_file = CACHE_DIR / f"{cache_key}.json"
-    
-    if cache_file.exists():
-        mtime = datetime.fromtimestamp(cache_file.stat().st_mtime)
-        if datetime.now() - mtime < timedelta(minutes=15):
-            with open(cache_file, 'r') as f:
-                return json.load(f)
-    
-    return None
+def ticker_news_url(symbol: str) -> str:
+    """Yahoo Finance RSS URL for a ticker."""
+    return f"https://feeds.finance.yahoo.com/rss/2.0/headline?s={symbol}&region=US&lang=en-US"
 
 
-def save_cache(cache_key: str, data: dict):
-    """Save news to cache."""
-    cache_file = CACHE_DIR / f"{cache_key}.json"
-    with open(cache_file, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
+def fetch_feed_articles(
+    url: str,
+    limit: int = 10,
+    source_id: str = "",
+    source: str = "",
+    feed: str = "",
+    timeout: int = 15,
+    deadline: float | None = None,
+    max_age_hours: float | None = None,
+    refresh: bool = False,
+) -> list[dict]:
+    """Articles for one feed, served from the article store while the feed is fresh.
+
+    Stale feeds (or `refresh=True`) are downloaded via fetch_rss and ingested
+    into the store. Articles have the same shape as fetch_rss output.
+    """
+    if not refresh:
+        try:
+            if article_store.feed_is_fresh(url, FEED_CACHE_TTL_SEC):
+                since = time.time() - max_age_hours * 3600 if max_age_hours is not None else None
+                stored = article_store.query_articles(since=since, feed_url=url, limit=limit)
+                return [{key: article[key] for key in FEED_ARTICLE_KEYS} for article in stored]
+        except sqlite3.Error as e:
+            print(f"⚠️ Article store query failed: {e}", file=sys.stderr)
+
+    articles = _fetch_feed(
+        url,
+        limit,
+        timeout=timeout,
+        deadline=deadline,
+        max_age_hours=max_age_hours,
+        cache_ttl=0 if refresh else FEED_CACHE_TTL_SEC,
+    )
+    if articles is None:
+        return []
+    # Ingest even an empty feed so it is marked fetched and not downloaded again while fresh
+    article_store.safe_ingest(articles, source_id=source_id, source=source, feed=feed, feed_url=url)
+    return articles
+
+
+def fetch_ticker_news(symbol: str, limit: int = 5, refresh: bool = False) -> list[dict]:
+    """Fetch news for a specific ticker via Yahoo Finance RSS (served from the article store when fresh)."""
+    return fetch_feed_articles(
+        ticker_news_url(symbol),
+        limit,
+        source_id="yahoo",
+        source="Yahoo Finance",
+        feed=symbol,
+        refresh=refresh,
+    )
 
 
 def fetch_all_news(args):
-    """Fetch news from all configured sources."""
+    """Fetch news from all configured sources (fresh feeds come from the article store)."""
     sources = load_sources()
-    cache_key = f"all_news_{datetime.now().strftime('%Y%m%d_%H')}"
-    
-    # Check cache first
-    if not args.force:
-        cached = get_cached_news(cache_key)
-        if cached:
-            print(json.dumps(cached, indent=2))
-            return
-    
+
     news = {
         'fetched_at': datetime.now().isoformat(),
         'sources': {}
@@ -410,23 +653,29 @@ def fetch_all_news(args):
             if feed_name in ('name', 'enabled', 'note'):
                 continue
             
-            articles = fetch_rss(feed_url, args.limit)
-            for article in articles:
-                article['feed'] = feed_name
-            news['sources'][source_id]['articles'].extend(articles)
-    
-    # Save to cache
-    save_cache(cache_key, news)
+            articles = fetch_feed_articles(
+                feed_url,
+                args.limit,
+                source_id=source_id,
+                source=feeds.get('name', source_id),
+                feed=feed_name,
+                refresh=args.force,
+            )
+            news['sources'][source_id]['articles'].extend(
+                Article.from_dict(article, feed=feed_name) for article in articles
+            )
     
     if args.json:
+        for source_data in news['sources'].values():
+            source_data['articles'] = [article.to_dict() for article in source_data['articles']]
         print(json.dumps(news, indent=2))
     else:
         for source_id, source_data in news['sources'].items():
             print(f"\n### {source_data['name']}\n")
             for article in source_data['articles'][:args.limit]:
-                print(f"• {article['title']}")
-                if args.verbose and article.get('description'):
-                    print(f"  {article['description'][:100]}...")
+                print(f"• {article.title}")
+                if args.verbose and article.description:
+                    print(f"  {article.description[:100]}...")
 
 
 def get_market_news(
@@ -497,9 +746,11 @@ def get_market_news(
                     effective_timeout = clamp_timeout(rss_timeout, deadline)
                 except TimeoutError:
                     break
-                articles = fetch_rss(
+                articles = fetch_feed_articles(
                     feed_url,
                     limit,
+                    source_id=source,
+                    source=feeds.get('name', source),
                     timeout=effective_timeout,
                     deadline=deadline,
                     max_age_hours=headline_max_age_hours,
@@ -539,16 +790,36 @@ def fetch_market_news(args):
 
 def get_portfolio_metadata() -> dict:
     """Get metadata for portfolio symbols."""
-    path = CONFIG_DIR / "portfolio.csv"
-    meta = {}
-    if path.exists():
-        import csv
-        with open(path, 'r') as f:
-            for row in csv.DictReader(f):
-                sym = row.get('symbol', '').strip().upper()
-                if sym:
-                    meta[sym] = row
-    return meta
+    from vfinance_news import portfolio
+
+    return portfolio.portfolio_metadata()
+
+
+def get_portfolio_mentions(
+    portfolio_meta: dict,
+    symbols: list[str] | None = None,
+    hours: int = PORTFOLIO_MENTION_HOURS,
+    per_symbol: int | None = None,
+) -> dict[str, list[dict]]:
+    """Articles from the article store mentioning portfolio companies.
+
+    Uses the name/symbol columns of portfolio.csv; all symbols are looked up
+    in one full-text query. Returns {} if the store cannot be searched.
+    """
+    symbols = symbols if symbols is not None else list(portfolio_meta)
+    terms = {}
+    for symbol in symbols:
+        info = portfolio_meta.get(symbol, {}) or {}
+        terms[symbol] = article_store.mention_terms(symbol, info.get('name', ''))
+    try:
+        return article_store.search_mentions(
+            terms,
+            since=time.time() - hours * 3600,
+            per_symbol=per_symbol,
+        )
+    except sqlite3.Error as e:
+        print(f"⚠️ Article search failed: {e}", file=sys.stderr)
+        return {}
 
 
 def get_portfolio_news(
@@ -558,8 +829,10 @@ def get_portfolio_news(
     subprocess_timeout: int = 30,
 ) -> dict:
     """Get news for portfolio stocks as data."""
-    if not (CONFIG_DIR / "portfolio.csv").exists():
-        raise PortfolioError("Portfolio config missing: config/portfolio.csv")
+    from vfinance_news import portfolio
+
+    if not portfolio.PORTFOLIO_FILE.exists():
+        raise PortfolioError(f"Portfolio config missing: {portfolio.PORTFOLIO_FILE}")
     
     # Get symbols from portfolio
     symbols = get_portfolio_symbols()
@@ -658,20 +931,9 @@ def fetch_portfolio_news(args):
                 print(f"  • {article['title'][:80]}...")
 def get_portfolio_symbols() -> list[str]:
     """Get list of portfolio symbols."""
-    try:
-        result = subprocess.run(
-            ['python3', str(SCRIPT_DIR / 'portfolio.py'), 'symbols'],
-            capture_output=True,
-            text=True,
-            stdin=subprocess.DEVNULL,
-            timeout=10,
-            check=False
-        )
-        if result.returncode == 0:
-            return [s.strip() for s in result.stdout.strip().split(',') if s.strip()]
-    except Exception:
-        pass
-    return []
+    from vfinance_news import portfolio
+
+    return portfolio.portfolio_symbols()
 
 
 def deduplicate_news(articles: list[dict]) -> list[dict]:
@@ -679,11 +941,7 @@ def deduplicate_news(articles: list[dict]) -> list[dict]:
     seen = set()
     unique = []
     for article in articles:
-        url = article.get('link', '')
-        if not url:
-            key = f"{article.get('title', '')}|{article.get('date', '')}"
-        else:
-            key = url
+        key = article_store.article_key(article)
         if key not in seen:
             seen.add(key)
             unique.append(article)
@@ -758,18 +1016,29 @@ def get_portfolio_movers(
     min_abs_change: float = 1.0,
     deadline: float | None = None,
     subprocess_timeout: int = 30,
+    offline: bool = False,
+    volatility_normalized: bool = False,
 ) -> dict:
-    """Return top portfolio movers without fetching news."""
+    """Return top portfolio movers without fetching news.
+
+    Movers are enriched from the local price store with a multi-day change
+    and a volatility-normalized z-score. With ``offline`` quotes come from
+    the store instead of the network; with ``volatility_normalized`` movers
+    are ranked by |z-score| rather than raw % change.
+    """
     symbols = get_portfolio_symbols()
     if not symbols:
         return {'error': 'No portfolio symbols found', 'movers': []}
 
-    try:
-        effective_timeout = clamp_timeout(subprocess_timeout, deadline)
-    except TimeoutError:
-        return {'error': 'Deadline exceeded while fetching portfolio quotes', 'movers': []}
+    if offline:
+        quotes = price_store.load_quotes(symbols)
+    else:
+        try:
+            effective_timeout = clamp_timeout(subprocess_timeout, deadline)
+        except TimeoutError:
+            return {'error': 'Deadline exceeded while fetching portfolio quotes', 'movers': []}
 
-    quotes = fetch_market_data(symbols, timeout=effective_timeout, deadline=deadline)
+        quotes = fetch_market_data(symbols, timeout=effective_timeout, deadline=deadline)
 
     gainers = []
     losers = []
@@ -787,20 +1056,32 @@ def get_portfolio_movers(
             continue
 
         item = {'symbol': symbol, 'change_pct': change_pct, 'price': price}
+        item.update(price_store.move_stats(symbol))
         if change_pct >= min_abs_change:
             gainers.append(item)
         elif change_pct <= -min_abs_change:
             losers.append(item)
 
-    gainers.sort(key=lambda x: x['change_pct'], reverse=True)
-    losers.sort(key=lambda x: x['change_pct'])
+    if volatility_normalized:
+        # z-scores and raw % moves are not comparable: movers without enough
+        # history for a z-score rank after every normalized one
+        def magnitude(x):
+            if 'z_score' in x:
+                return (1, abs(x['z_score']))
+            return (0, abs(x['change_pct']))
+    else:
+        def magnitude(x):
+            return abs(x['change_pct'])
+
+    gainers.sort(key=magnitude, reverse=True)
+    losers.sort(key=magnitude, reverse=True)
 
     max_each = max_items // 2
     selected = gainers[:max_each] + losers[:max_each]
     if len(selected) < max_items:
         remaining = max_items - len(selected)
         extra = gainers[max_each:] + losers[max_each:]
-        extra.sort(key=lambda x: abs(x['change_pct']), reverse=True)
+        extra.sort(key=magnitude, reverse=True)
         selected.extend(extra[:remaining])
 
     return {
@@ -863,7 +1144,8 @@ def get_large_portfolio_news(
     Tiered fetch for large portfolios.
     1. Batch fetch prices for ALL stocks (fast).
     2. Identify top movers (gainers/losers).
-    3. Fetch news ONLY for top movers.
+    3. Fetch news ONLY for top movers, preferring articles that already
+       mention them in ingested feeds over per-ticker requests.
     """
     symbols = get_portfolio_symbols()
     if not symbols:
@@ -876,7 +1158,7 @@ def get_large_portfolio_news(
          raise PortfolioError("Deadline exceeded before price fetch")
 
     # For large portfolios, start with yfinance batch for predictable runtime.
-    quotes = _fetch_via_yfinance(symbols, timeout=effective_timeout, deadline=deadline)
+    quotes = _fetch_quotes(symbols, effective_timeout, deadline, QUOTE_MODE_CHANGE)
 
     # Re-query a subset of missing symbols with shorter timeout to avoid deadline overruns.
     missing = [sym for sym in symbols if sym not in quotes]
@@ -945,11 +1227,13 @@ def get_large_portfolio_news(
         }
     }
     
+    mentions = get_portfolio_mentions(portfolio_meta or {}, top_symbols, per_symbol=limit)
+
     for symbol in top_symbols:
         if time_left(deadline) is not None and time_left(deadline) <= 0:
             break
             
-        articles = fetch_ticker_news(symbol, limit)
+        articles = mentions.get(symbol) or fetch_ticker_news(symbol, limit)
         quote_data = quotes.get(symbol, {})
         
         news['stocks'][symbol] = {
@@ -1037,6 +1321,32 @@ def fetch_portfolio_only(args):
         print()
 
 
+def fetch_movers(args):
+    """Print top portfolio movers (no news), optionally volatility-normalized or offline."""
+    result = get_portfolio_movers(
+        max_items=args.max,
+        deadline=compute_deadline(args.deadline),
+        offline=args.offline,
+        volatility_normalized=args.normalized,
+    )
+
+    if "error" in result:
+        print(f"\n❌ Error: {result['error']}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+        return
+
+    print(f"\n📊 **Portfolio Movers**{' (volatility-normalized)' if args.normalized else ''}\n")
+    for mover in result['movers']:
+        emoji = '📈' if mover['change_pct'] >= 0 else '📉'
+        line = f"**{mover['symbol']}** {emoji} ${mover['price']:.2f} ({mover['change_pct']:+.2f}%)"
+        if 'z_score' in mover:
+            line += f" {mover['z_score']:+.1f}σ"
+        print(line)
+
+
 def main():
     parser = argparse.ArgumentParser(description='News Fetcher')
     subparsers = parser.add_subparsers(dest='command', required=True)
@@ -1070,6 +1380,17 @@ def main():
     portfolio_only_parser.add_argument('--limit', type=int, default=5, help='Max news items per ticker')
     portfolio_only_parser.set_defaults(func=fetch_portfolio_only)
     
+    # Portfolio movers without news
+    movers_parser = subparsers.add_parser('movers', help='Top portfolio movers (no news)')
+    movers_parser.add_argument('--json', action='store_true', help='Output as JSON')
+    movers_parser.add_argument('--max', type=int, default=8, help='Max movers (default: 8)')
+    movers_parser.add_argument('--normalized', action='store_true',
+                               help='Rank by move relative to recent volatility (z-score) instead of raw %% change')
+    movers_parser.add_argument('--offline', action='store_true',
+                               help='Use the local price store instead of fetching quotes')
+    movers_parser.add_argument('--deadline', type=int, default=None, help='Overall deadline in seconds')
+    movers_parser.set_defaults(func=fetch_movers)
+
     args = parser.parse_args()
     args.func(args)
 
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Finnhub Client - Rate-limited, coalescing Finnhub API client with a disk cache.
+
+The free tier allows 60 requests per minute, which per-symbol lookups
+(EPS actuals, revenue surprises) for a large portfolio exceed quickly.
+Every request goes through:
+
+1. an on-disk response cache (cache/finnhub/, per-call TTL)
+2. in-flight coalescing - concurrent calls for the same request wait for
+   the one already on the wire instead of sending their own
+3. a token-bucket limiter (DEFAULT_RATE_PER_MIN with a small burst), so
+   the client stays under the limit however many threads share it
+4. one persistent HTTP/1.1 connection per thread (keep-alive), in place
+   of a new TLS handshake per call
+
+HTTP 429 responses are retried after Retry-After seconds.
+
+Usage:
+    from vfinance_news.finnhub import FinnhubClient
+    client = FinnhubClient(token)
+    client.earnings_calendar("2026-10-19", "2026-10-26")
+    client.earnings_surprises("AAPL")
+"""
+
+import hashlib
+import http.client
+import json
+import ssl
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPT_DIR.parent / "cache"
+FINNHUB_CACHE_DIR = CACHE_DIR / "finnhub"
+
+BASE_URL = "https://finnhub.io/api/v1"
+# 55/min refill plus a burst of 5 never exceeds 60 requests in any minute
+DEFAULT_RATE_PER_MIN = 55
+DEFAULT_BURST = 5
+DEFAULT_CACHE_TTL_SEC = 6 * 3600
+DEFAULT_TIMEOUT_SEC = 30
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+class FinnhubError(RuntimeError):
+    """A Finnhub request failed (network error, HTTP error or invalid JSON)."""
+
+
+class TokenBucket:
+    """Blocking token-bucket limiter, safe to share between threads."""
+
+    def __init__(self, rate_per_sec: float, capacity: float, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+            waited += wait
+
+
+class _InFlight:
+    """Result slot shared by coalesced callers of one request."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Exception | None = None
+
+
+class FinnhubClient:
+    """Finnhub REST client; share one instance across threads."""
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = BASE_URL,
+        rate_per_min: float = DEFAULT_RATE_PER_MIN,
+        burst: float = DEFAULT_BURST,
+        cache_dir: Path | None = None,
+        timeout: float = DEFAULT_TIMEOUT_SEC,
+    ):
+        self.token = token
+        parts = urlsplit(base_url)
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._prefix = parts.path.rstrip("/")
+        self.limiter = TokenBucket(rate_per_min / 60, burst)
+        self.cache_dir = cache_dir if cache_dir is not None else FINNHUB_CACHE_DIR
+        self.timeout = timeout
+        self.stats = {"requests": 0, "cache_hits": 0, "coalesced": 0, "connections": 0, "rate_limited": 0}
+        self._local = threading.local()
+        self._inflight: dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+
+    # Disk cache
+
+    @staticmethod
+    def _key(path: str, params: dict) -> str:
+        query = urlencode(sorted((k, str(v)) for k, v in params.items() if v is not None))
+        return f"{path}?{query}"
+
+    def _cache_path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+    def _read_cache(self, key: str, ttl: float | None):
+        if not ttl:
+            return None
+        path = self._cache_path(key)
+        try:
+            if time.time() - path.stat().st_mtime >= ttl:
+                return None
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(self, key: str, data) -> None:
+        path = self._cache_path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            print(f"⚠️ Could not cache Finnhub response: {e}", file=sys.stderr)
+
+    # Connection
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._scheme == "https":
+                conn = http.client.HTTPSConnection(
+                    self._host, self._port, timeout=self.timeout, context=ssl.create_default_context()
+                )
+            else:
+                conn = http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+            self._local.conn = conn
+            with self._lock:
+                self.stats["connections"] += 1
+        return conn
+
+    def _drop_connection(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        self._drop_connection()
+
+    def _request_once(self, url: str, headers: dict) -> tuple[int, dict, bytes]:
+        conn = self._connection()
+        try:
+            conn.request("GET", url, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+        except Exception:
+            self._drop_connection()
+            raise
+        if response.will_close:
+            self._drop_connection()
+        return response.status, dict(response.getheaders()), body
+
+    def _send(self, url: str) -> tuple[int, dict, bytes]:
+        """One GET over the thread's kept-alive connection, reconnecting once if it went stale."""
+        headers = {"X-Finnhub-Token": self.token, "User-Agent": "vfinance-news/1.0"}
+        try:
+            return self._request_once(url, headers)
+        except (ConnectionResetError, BrokenPipeError, http.client.CannotSendRequest, http.client.BadStatusLine):
+            # Server closed an idle keep-alive connection (RemoteDisconnected is a reset)
+            return self._request_once(url, headers)
+
+    def _fetch(self, path: str, params: dict):
+        url = f"{self._prefix}{path}?{urlencode({k: v for k, v in params.items() if v is not None})}"
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self.limiter.acquire()
+            with self._lock:
+                self.stats["requests"] += 1
+            try:
+                status, headers, body = self._send(url)
+            except (OSError, http.client.HTTPException) as e:
+                raise FinnhubError(f"{path}: {e}") from e
+            if status == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                with self._lock:
+                    self.stats["rate_limited"] += 1
+                try:
+                    delay = float(headers.get("Retry-After", 1))
+                except ValueError:
+                    delay = 1.0
+                time.sleep(delay)
+                continue
+            if status != 200:
+                raise FinnhubError(f"{path}: HTTP {status}")
+            try:
+                return json.loads(body.decode("utf-8"))
+            except ValueError as e:
+                raise FinnhubError(f"{path}: invalid JSON: {e}") from e
+        raise FinnhubError(f"{path}: rate limited")
+
+    # Public API
+
+    def get(self, path: str, params: dict | None = None, ttl: float | None = DEFAULT_CACHE_TTL_SEC):
+        """GET an API path (e.g. "/calendar/earnings"); ttl=None or 0 skips the disk cache.
+
+        Raises FinnhubError when the request fails.
+        """
+        params = params or {}
+        key = self._key(path, params)
+        cached = self._read_cache(key, ttl)
+        if cached is not None:
+            with self._lock:
+                self.stats["cache_hits"] += 1
+            return cached
+
+        with self._lock:
+            slot = self._inflight.get(key)
+            leader = slot is None
+            if leader:
+                slot = self._inflight[key] = _InFlight()
+            else:
+                self.stats["coalesced"] += 1
+
+        if not leader:
+            slot.done.wait()
+            if slot.error is not None:
+                raise slot.error
+            return slot.result
+
+        try:
+            slot.result = self._fetch(path, params)
+            if ttl:
+                self._write_cache(key, slot.result)
+            return slot.result
+        except FinnhubError as e:
+            slot.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            slot.done.set()
+
+    def earnings_calendar(self, from_date: str, to_date: str, symbol: str | None = None,
+                          ttl: float | None = DEFAULT_CACHE_TTL_SEC) -> list[dict]:
+        """Calendar entries (Finnhub field names) between two ISO dates."""
+        data = self.get("/calendar/earnings", {"from": from_date, "to": to_date, "symbol": symbol}, ttl=ttl)
+        return (data or {}).get("earningsCalendar", [])
+
+    def earnings_surprises(self, symbol: str, ttl: float | None = DEFAULT_CACHE_TTL_SEC) -> list[dict]:
+        """Reported quarters for a symbol, newest first (actual, estimate, surprisePercent, period)."""
+        data = self.get("/stock/earnings", {"symbol": symbol}, ttl=ttl)
+        return data if isinstance(data, list) else []
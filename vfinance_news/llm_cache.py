@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+LLM Cache - Content-addressed cache for openclaw agent replies.
+
+Replies are stored under cache/llm/ as one JSON file per
+sha256(session, style, prompt), so a retried cron or an identical headline
+shortlist is answered without another 45-150s agent call. Entries expire
+after a TTL and the oldest-used entries are evicted beyond a size bound.
+
+Environment:
+    VFINANCE_NEWS_LLM_CACHE_TTL_SEC       Entry lifetime (default 21600, 0 disables)
+    VFINANCE_NEWS_LLM_CACHE_MAX_ENTRIES   Max cached replies (default 200)
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPT_DIR.parent / "cache"
+LLM_CACHE_DIR = CACHE_DIR / "llm"
+
+DEFAULT_TTL_SEC = 6 * 3600
+DEFAULT_MAX_ENTRIES = 200
+
+_stats = {"hits": 0, "misses": 0}
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"⚠️ Invalid {name}; using default {default}", file=sys.stderr)
+        return default
+
+
+def get_ttl() -> int:
+    return _env_int("VFINANCE_NEWS_LLM_CACHE_TTL_SEC", DEFAULT_TTL_SEC)
+
+
+def get_max_entries() -> int:
+    return _env_int("VFINANCE_NEWS_LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+
+
+def cache_key(session: str, style: str, prompt: str) -> str:
+    digest = hashlib.sha256()
+    for part in (session, style, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return LLM_CACHE_DIR / f"{key}.json"
+
+
+def get(session: str, style: str, prompt: str) -> str | None:
+    """Return a cached reply, or None (counted as a miss)."""
+    ttl = get_ttl()
+    if ttl <= 0:
+        return None
+
+    path = _entry_path(cache_key(session, style, prompt))
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        fresh = time.time() - entry["created_at"] < ttl
+    except (OSError, ValueError, KeyError, TypeError):
+        fresh = False
+    if not fresh:
+        _stats["misses"] += 1
+        return None
+
+    # Touch on hit so eviction drops the least recently used entries
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    _stats["hits"] += 1
+    return entry["reply"]
+
+
+def put(session: str, style: str, prompt: str, reply: str) -> None:
+    """Store a successful reply and evict entries beyond the size bound."""
+    if get_ttl() <= 0:
+        return
+    entry = {"created_at": time.time(), "session": session, "style": style, "reply": reply}
+    path = _entry_path(cache_key(session, style, prompt))
+    try:
+        LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+        evict(get_max_entries())
+    except OSError as e:
+        print(f"⚠️ LLM cache write failed: {e}", file=sys.stderr)
+
+
+def evict(max_entries: int) -> int:
+    """Remove the least recently used entries beyond max_entries. Returns count removed."""
+    entries = []
+    for path in LLM_CACHE_DIR.glob("*.json"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    if len(entries) <= max_entries:
+        return 0
+    entries.sort()
+    removed = 0
+    for _, path in entries[:len(entries) - max_entries]:
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+def stats() -> dict:
+    return dict(_stats)
+
+
+def reset_stats() -> None:
+    _stats["hits"] = 0
+    _stats["misses"] = 0
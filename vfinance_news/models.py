@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+In-memory models for articles, quotes and portfolio entries.
+
+The pipeline's wire format stays plain dicts (JSON output, the article
+store, test fixtures); these slotted dataclasses are what long-lived or
+bulk in-memory collections hold instead. Slots drop the per-instance
+__dict__, and the strings repeated across thousands of objects (source,
+feed, categories, portfolio category/type) are interned so every article
+from one outlet shares a single string object.
+
+Convert at the edges with from_dict() / to_dict(); to_dict() returns the
+same shape the dict-based code used, including ranking's _score,
+_categories, _impact, _novelty and _pure_company_specific keys.
+
+Usage:
+    from vfinance_news.models import Article
+    articles = [Article.from_dict(a, source="Reuters") for a in raw]
+    payload = [a.to_dict() for a in articles]
+"""
+
+import sys
+from dataclasses import dataclass
+
+
+def intern(value):
+    """sys.intern for strings; anything else (None, numbers) is returned as is."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Keys every article dict carries (fetch_rss output), even when empty
+_ARTICLE_BASE_KEYS = ("title", "link", "date", "published_at", "description")
+# Keys emitted only when set
+_ARTICLE_OPTIONAL_KEYS = ("source", "source_id", "feed")
+# Ranking results: attribute -> dict key
+_ARTICLE_SCORE_KEYS = (
+    ("score", "_score"),
+    ("impact", "_impact"),
+    ("novelty", "_novelty"),
+    ("categories", "_categories"),
+    ("pure_company_specific", "_pure_company_specific"),
+)
+_ARTICLE_KNOWN_KEYS = frozenset(
+    _ARTICLE_BASE_KEYS + _ARTICLE_OPTIONAL_KEYS + tuple(key for _, key in _ARTICLE_SCORE_KEYS)
+)
+
+
+@dataclass(slots=True)
+class Article:
+    title: str = ""
+    link: str = ""
+    date: str = ""
+    published_at: float | str | None = None
+    description: str = ""
+    source: str | None = None
+    source_id: str | None = None
+    feed: str | None = None
+    # Set by ranking.calculate_score
+    score: float | None = None
+    impact: float | None = None
+    novelty: float | None = None
+    categories: tuple[str, ...] | None = None
+    pure_company_specific: bool | None = None
+    # Any other keys the dict carried (e.g. grouped "sources"/"links")
+    extra: dict | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict, **overrides) -> "Article":
+        """Build from an article dict; keyword overrides (e.g. source=...) win over its keys."""
+        if overrides:
+            data = {**data, **overrides}
+        categories = data.get("_categories")
+        extra = {k: v for k, v in data.items() if k not in _ARTICLE_KNOWN_KEYS}
+        return cls(
+            title=data.get("title") or "",
+            link=data.get("link") or "",
+            date=data.get("date") or "",
+            published_at=data.get("published_at"),
+            description=data.get("description") or "",
+            source=intern(data.get("source")),
+            source_id=intern(data.get("source_id")),
+            feed=intern(data.get("feed")),
+            score=data.get("_score"),
+            impact=data.get("_impact"),
+            novelty=data.get("_novelty"),
+            categories=tuple(intern(c) for c in categories) if categories is not None else None,
+            pure_company_specific=data.get("_pure_company_specific"),
+            extra=extra or None,
+        )
+
+    def to_dict(self) -> dict:
+        """The article as the dict shape used on the wire."""
+        data = {key: getattr(self, key) for key in _ARTICLE_BASE_KEYS}
+        for key in _ARTICLE_OPTIONAL_KEYS:
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        if self.extra:
+            data.update(self.extra)
+        for attr, key in _ARTICLE_SCORE_KEYS:
+            value = getattr(self, attr)
+            if value is not None:
+                data[key] = list(value) if attr == "categories" else value
+        return data
+
+
+@dataclass(slots=True)
+class Quote:
+    symbol: str
+    price: float
+    change_percent: float = 0.0
+    prev_close: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Quote":
+        return cls(
+            symbol=intern(data["symbol"]),
+            price=data["price"],
+            change_percent=data.get("change_percent", 0.0),
+            prev_close=data.get("prev_close", 0.0),
+        )
+
+    def to_dict(self) -> dict:
+        """Same keys as fetch_news._build_quote."""
+        return {
+            "price": self.price,
+            "change_percent": self.change_percent,
+            "prev_close": self.prev_close,
+            "symbol": self.symbol,
+        }
+
+
+@dataclass(slots=True)
+class PortfolioEntry:
+    symbol: str
+    name: str
+    category: str = ""
+    notes: str = ""
+    type: str = "Watchlist"
+
+    @classmethod
+    def from_row(cls, row: dict) -> "PortfolioEntry":
+        """Normalize a portfolio CSV row (symbol upper-cased, name defaults to the symbol)."""
+        symbol = (row.get("symbol") or "").strip().upper()
+        return cls(
+            symbol=intern(symbol),
+            name=row.get("name", symbol) or symbol,
+            category=intern(row.get("category", "") or ""),
+            notes=row.get("notes", "") or "",
+            type=intern(row.get("type", "Watchlist") or "Watchlist"),
+        )
+
+    def to_dict(self) -> dict:
+        """The load_portfolio row shape (portfolio.DEFAULT_COLUMNS)."""
+        return {
+            "symbol": self.symbol,
+            "name": self.name,
+            "category": self.category,
+            "notes": self.notes,
+            "type": self.type,
+        }
@@ -1,22 +1,49 @@
 #!/usr/bin/env python3
 """
 Portfolio Manager - CRUD operations for stock watchlist.
+
+The CSV is read, validated and normalized in one pass and compiled into a
+pickled snapshot under cache/portfolio/, keyed by the file's path, mtime
+and size. Every module loads the portfolio through this snapshot
+(load_portfolio, portfolio_metadata, portfolio_symbols); the CSV is only
+parsed again after it changes.
+
+Usage:
+    portfolio.py list                         # Show portfolio
+    portfolio.py add NVDA --name NVIDIA       # Add a stock
+    portfolio.py symbols [--json]             # Symbols for other scripts
 """
 
 import argparse
 import csv
+import hashlib
+import io
 import os
+import pickle
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 
+from vfinance_news.models import PortfolioEntry
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPT_DIR.parent / "cache"
+SNAPSHOT_DIR = CACHE_DIR / "portfolio"
+# Bump when the snapshot layout changes
+SNAPSHOT_VERSION = 2
+
 
 def _get_portfolio_file() -> Path:
-    """Get portfolio CSV path with PORTFOLIOS_DIR env var support.
+    """Get portfolio CSV path with VFINANCE_NEWS_PORTFOLIO / PORTFOLIOS_DIR env var support.
 
     Priority:
-    1. Shared location ($PORTFOLIOS_DIR/watchlists/portfolio.csv) if env var set
-    2. Legacy config/portfolio.csv (backward compatibility)
+    1. Explicit file ($VFINANCE_NEWS_PORTFOLIO) if env var set
+    2. Shared location ($PORTFOLIOS_DIR/watchlists/portfolio.csv) if env var set
+    3. Legacy config/portfolio.csv (backward compatibility)
     """
+    env_file = os.environ.get("VFINANCE_NEWS_PORTFOLIO", "").strip()
+    if env_file:
+        return Path(os.path.expanduser(env_file))
     env_dir = os.environ.get("PORTFOLIOS_DIR", "").strip()
     if env_dir:
         # If env var is set, always use shared path (even if file doesn't exist yet)
@@ -30,100 +57,168 @@ REQUIRED_COLUMNS = ['symbol', 'name']
 DEFAULT_COLUMNS = ['symbol', 'name', 'category', 'notes', 'type']
 
 
-def validate_portfolio_csv(path: Path) -> tuple[bool, list[str]]:
-    """
-    Validate portfolio CSV file for common issues.
+@contextmanager
+def use_portfolio_file(path: Path):
+    """Temporarily point this process and its subprocesses at another portfolio CSV."""
+    global PORTFOLIO_FILE
+    saved_file = PORTFOLIO_FILE
+    saved_env = os.environ.get("VFINANCE_NEWS_PORTFOLIO")
+    PORTFOLIO_FILE = Path(path)
+    os.environ["VFINANCE_NEWS_PORTFOLIO"] = str(path)
+    try:
+        yield PORTFOLIO_FILE
+    finally:
+        PORTFOLIO_FILE = saved_file
+        if saved_env is None:
+            os.environ.pop("VFINANCE_NEWS_PORTFOLIO", None)
+        else:
+            os.environ["VFINANCE_NEWS_PORTFOLIO"] = saved_env
 
-    Returns:
-        Tuple of (is_valid, list of warnings)
+
+def _compile(path: Path) -> dict:
+    """Read, validate and normalize the CSV in a single pass.
+
+    Returns {"valid", "warnings", "rows", "meta"}: "rows" are normalized
+    PortfolioEntry records (first occurrence of a symbol wins), "meta" maps
+    each symbol to its CSV row as written (all columns).
     """
     warnings = []
-
-    if not path.exists():
-        return True, warnings
+    try:
+        content = path.read_bytes().decode("utf-8")
+    except UnicodeDecodeError:
+        return {"valid": False, "warnings": ["File encoding issue - try saving as UTF-8"], "rows": [], "meta": {}}
+    except OSError as e:
+        return {"valid": False, "warnings": [f"Error reading portfolio: {e}"], "rows": [], "meta": {}}
 
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            # Check for encoding issues
-            content = f.read()
+        reader = csv.DictReader(io.StringIO(content))
+        if reader.fieldnames is None:
+            return {"valid": False, "warnings": ["CSV appears to be empty"], "rows": [], "meta": {}}
+
+        missing_cols = [c for c in REQUIRED_COLUMNS if c not in reader.fieldnames]
+        if missing_cols:
+            warnings.append(f"Missing required columns: {', '.join(missing_cols)}")
+
+        rows = []
+        meta = {}
+        duplicates = []
+        for row in reader:
+            entry = PortfolioEntry.from_row(row)
+            if not entry.symbol:
+                continue
+            if entry.symbol in meta:
+                if entry.symbol not in duplicates:
+                    duplicates.append(entry.symbol)
+                continue
+            meta[entry.symbol] = row
+            rows.append(entry)
+    except csv.Error as e:
+        return {"valid": False, "warnings": [f"Error reading portfolio: {e}"], "rows": [], "meta": {}}
+
+    if duplicates:
+        warnings.append(f"Duplicate symbols found: {', '.join(duplicates)}")
+    return {"valid": True, "warnings": warnings, "rows": rows, "meta": meta}
+
+
+def _snapshot_key(path: Path) -> tuple | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
 
-        with open(path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
 
-            # Check required columns
-            if reader.fieldnames is None:
-                warnings.append("CSV appears to be empty")
-                return False, warnings
+def _snapshot_path(resolved: str) -> Path:
+    return SNAPSHOT_DIR / f"{hashlib.sha1(resolved.encode('utf-8')).hexdigest()[:16]}.pickle"
 
-            missing_cols = set(REQUIRED_COLUMNS) - set(reader.fieldnames or [])
-            if missing_cols:
-                warnings.append(f"Missing required columns: {', '.join(missing_cols)}")
 
-            # Check for duplicate symbols
-            symbols = []
-            for row in reader:
-                symbol = row.get('symbol', '').strip().upper()
-                if symbol:
-                    symbols.append(symbol)
+# Snapshots already loaded by this process, by resolved path
+_loaded: dict[str, dict] = {}
 
-            duplicates = [s for s in set(symbols) if symbols.count(s) > 1]
-            if duplicates:
-                warnings.append(f"Duplicate symbols found: {', '.join(duplicates)}")
 
-    except UnicodeDecodeError:
-        warnings.append("File encoding issue - try saving as UTF-8")
-    except Exception as e:
-        warnings.append(f"Error reading portfolio: {e}")
-        return False, warnings
+def load_snapshot(path: Path | None = None) -> dict | None:
+    """Compiled portfolio for a CSV (default: PORTFOLIO_FILE), or None if it does not exist.
 
-    return True, warnings
+    Served from memory or the pickled snapshot while the file's mtime and
+    size are unchanged; otherwise the CSV is compiled and the snapshot
+    rewritten.
+    """
+    path = Path(path) if path is not None else PORTFOLIO_FILE
+    key = _snapshot_key(path)
+    if key is None:
+        return None
 
+    snapshot = _loaded.get(key[0])
+    if snapshot is not None and snapshot["key"] == key:
+        return snapshot
 
-def load_portfolio() -> list[dict]:
-    """Load portfolio from CSV with validation."""
-    if not PORTFOLIO_FILE.exists():
+    snapshot_file = _snapshot_path(key[0])
+    try:
+        with open(snapshot_file, "rb") as f:
+            snapshot = pickle.load(f)
+        if snapshot.get("version") != SNAPSHOT_VERSION or snapshot.get("key") != key:
+            snapshot = None
+    except Exception:
+        snapshot = None
+
+    if snapshot is None:
+        snapshot = dict(_compile(path), version=SNAPSHOT_VERSION, key=key)
+        try:
+            SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = snapshot_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(snapshot_file)
+        except OSError as e:
+            print(f"⚠️ Could not write portfolio snapshot: {e}", file=sys.stderr)
+
+    _loaded[key[0]] = snapshot
+    return snapshot
+
+
+def validate_portfolio_csv(path: Path) -> tuple[bool, list[str]]:
+    """
+    Validate portfolio CSV file for common issues.
+
+    Returns:
+        Tuple of (is_valid, list of warnings)
+    """
+    snapshot = load_snapshot(path)
+    if snapshot is None:
+        return True, []
+    return snapshot["valid"], list(snapshot["warnings"])
+
+
+def load_portfolio(path: Path | None = None) -> list[dict]:
+    """Load portfolio from CSV with validation (default: PORTFOLIO_FILE)."""
+    snapshot = load_snapshot(path)
+    if snapshot is None:
         return []
 
-    # Validate first
-    is_valid, warnings = validate_portfolio_csv(PORTFOLIO_FILE)
-    for warning in warnings:
+    for warning in snapshot["warnings"]:
         print(f"⚠️ Portfolio warning: {warning}", file=sys.stderr)
 
-    if not is_valid:
+    if not snapshot["valid"]:
         print("⚠️ Portfolio has errors - returning empty", file=sys.stderr)
         return []
 
-    try:
-        with open(PORTFOLIO_FILE, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-
-            # Normalize data
-            portfolio = []
-            seen_symbols = set()
-
-            for row in reader:
-                symbol = row.get('symbol', '').strip().upper()
-                if not symbol:
-                    continue
-
-                # Skip duplicates (keep first occurrence)
-                if symbol in seen_symbols:
-                    continue
-                seen_symbols.add(symbol)
-
-                portfolio.append({
-                    'symbol': symbol,
-                    'name': row.get('name', symbol) or symbol,
-                    'category': row.get('category', '') or '',
-                    'notes': row.get('notes', '') or '',
-                    'type': row.get('type', 'Watchlist') or 'Watchlist'
-                })
-
-            return portfolio
-
-    except Exception as e:
-        print(f"⚠️ Error loading portfolio: {e}", file=sys.stderr)
+    return [entry.to_dict() for entry in snapshot["rows"]]
+
+
+def portfolio_metadata(path: Path | None = None) -> dict:
+    """CSV rows keyed by upper-cased symbol, all columns as written (default: PORTFOLIO_FILE)."""
+    snapshot = load_snapshot(path)
+    if snapshot is None:
+        return {}
+    return {symbol: dict(row) for symbol, row in snapshot["meta"].items()}
+
+
+def portfolio_symbols(path: Path | None = None) -> list[str]:
+    """Portfolio symbols in file order (default: PORTFOLIO_FILE)."""
+    snapshot = load_snapshot(path)
+    if snapshot is None or not snapshot["valid"]:
         return []
+    return [entry.symbol for entry in snapshot["rows"]]
 
 
 def save_portfolio(portfolio: list[dict]):
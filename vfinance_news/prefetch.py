@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Prefetch - Warm feed, ticker-news and quote caches ahead of scheduled briefings.
+
+Run a few minutes before each briefing so the deadline-bound run mostly reads
+warm caches and only tops up stale entries:
+- headline feeds and ticker news feeds land in the feed cache and article store
+- index and portfolio quotes seed the previous-close session cache and the
+  local price store, so the briefing only fetches the latest bar
+
+Usage:
+    prefetch.py                          # Warm caches now
+    prefetch.py --schedule               # Crontab lines derived from config schedule
+    prefetch.py --schedule --lead-minutes 15
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+
+from vfinance_news import article_store
+from vfinance_news.fetch_news import (
+    FEED_CACHE_TTL_SEC,
+    _get_best_feed_url,
+    fetch_feed_articles,
+    fetch_market_data,
+    fetch_ticker_news,
+    get_portfolio_symbols,
+    load_sources,
+)
+from vfinance_news.utils import clamp_timeout, compute_deadline, time_left
+
+DEFAULT_LEAD_MINUTES = 10
+# Prefetched feeds must still be inside the feed cache TTL when the briefing runs
+MAX_LEAD_MINUTES = FEED_CACHE_TTL_SEC // 60 - 1
+DEFAULT_MAX_TICKERS = 50
+DEFAULT_FEED_LIMIT = 50
+
+
+def _expand_cron_field(field: str, low: int, high: int) -> list[int]:
+    """Expand a numeric cron field (values, ranges, lists) to sorted ints."""
+    values = set()
+    for part in field.split(","):
+        if "-" in part:
+            start, end = part.split("-", 1)
+            values.update(range(int(start), int(end) + 1))
+        else:
+            values.add(int(part))
+    if any(v < low or v > high for v in values):
+        raise ValueError(f"Cron value out of range in '{field}'")
+    return sorted(values)
+
+
+def _compress_days(days: list[int]) -> str:
+    """Format sorted weekdays as a cron field, collapsing runs into ranges."""
+    parts = []
+    start = prev = days[0]
+    for day in days[1:] + [None]:
+        if day is not None and day == prev + 1:
+            prev = day
+            continue
+        parts.append(str(start) if start == prev else f"{start}-{prev}")
+        if day is not None:
+            start = prev = day
+    return ",".join(parts)
+
+
+def shift_cron(expr: str, minutes: int) -> str:
+    """Return a cron expression firing `minutes` earlier than `expr`.
+
+    Supports a fixed minute and hour; when the shift crosses midnight the
+    day-of-week field moves back one day (day-of-month must be '*').
+    """
+    fields = expr.split()
+    if len(fields) != 5:
+        raise ValueError(f"Expected 5 cron fields: '{expr}'")
+    minute, hour, dom, month, dow = fields
+    if not (minute.isdigit() and hour.isdigit()):
+        raise ValueError(f"Only fixed minute/hour schedules can be shifted: '{expr}'")
+
+    total = int(hour) * 60 + int(minute) - minutes
+    if total < 0:
+        total += 24 * 60
+        if dom != "*":
+            raise ValueError(f"Cannot shift day-of-month schedule across midnight: '{expr}'")
+        if dow != "*":
+            days = _expand_cron_field(dow.replace("7", "0"), 0, 6)
+            dow = _compress_days(sorted({(d - 1) % 7 for d in days}))
+    return f"{total % 60} {total // 60} {dom} {month} {dow}"
+
+
+def build_schedule(sources: dict, lead_minutes: int) -> list[dict]:
+    """Derive prefetch cron entries from the enabled briefing schedules."""
+    entries = []
+    for name, config in sources.get("schedule", {}).items():
+        if not isinstance(config, dict) or not config.get("cron") or not config.get("enabled", True):
+            continue
+        try:
+            cron = shift_cron(config["cron"], lead_minutes)
+        except ValueError as e:
+            print(f"⚠️ Skipping {name} schedule: {e}", file=sys.stderr)
+            continue
+        entries.append({
+            "name": name,
+            "briefing_cron": config["cron"],
+            "cron": cron,
+            "timezone": config.get("timezone", ""),
+        })
+    return entries
+
+
+def prefetch(
+    max_tickers: int = DEFAULT_MAX_TICKERS,
+    feed_limit: int = DEFAULT_FEED_LIMIT,
+    deadline: float | None = None,
+    rss_timeout: int = 15,
+    quote_timeout: int = 30,
+) -> dict:
+    """Refresh feed, ticker-news and quote caches. Returns counts per cache."""
+    sources = load_sources()
+    stats = {"feeds": 0, "ticker_feeds": 0, "quotes": 0, "errors": 0}
+
+    # Quotes first: one batch for every index and portfolio symbol
+    symbols = get_portfolio_symbols()
+    index_symbols = [s for market in sources.get("markets", {}).values() for s in market.get("indices", [])]
+    try:
+        quotes = fetch_market_data(
+            list(dict.fromkeys(index_symbols + symbols)),
+            timeout=clamp_timeout(quote_timeout, deadline),
+            deadline=deadline,
+        )
+        stats["quotes"] = len(quotes)
+    except TimeoutError:
+        return stats
+
+    headline_exclude = set(sources.get("headline_exclude", []))
+    for source in sources.get("headline_sources", []):
+        feeds = sources.get("rss_feeds", {}).get(source)
+        if source in headline_exclude or not feeds or not feeds.get("enabled", True):
+            continue
+        feed_url = _get_best_feed_url(feeds)
+        if not feed_url:
+            continue
+        try:
+            timeout = clamp_timeout(rss_timeout, deadline)
+        except TimeoutError:
+            return stats
+        articles = fetch_feed_articles(
+            feed_url,
+            feed_limit,
+            source_id=source,
+            source=feeds.get("name", source),
+            timeout=timeout,
+            deadline=deadline,
+            refresh=True,
+        )
+        if articles:
+            stats["feeds"] += 1
+        else:
+            stats["errors"] += 1
+
+    for symbol in symbols[:max_tickers]:
+        if time_left(deadline) is not None and time_left(deadline) <= 0:
+            break
+        if fetch_ticker_news(symbol, feed_limit, refresh=True):
+            stats["ticker_feeds"] += 1
+        else:
+            stats["errors"] += 1
+
+    try:
+        article_store.prune()
+    except sqlite3.Error as e:
+        print(f"⚠️ Article store prune failed: {e}", file=sys.stderr)
+    return stats
+
+
+def print_schedule(args) -> None:
+    """Print prefetch crontab lines (or JSON) for the configured schedules."""
+    sources = load_sources()
+    lead = args.lead_minutes
+    if lead is None:
+        lead = sources.get("schedule", {}).get("prefetch", {}).get("lead_minutes", DEFAULT_LEAD_MINUTES)
+    lead = int(lead)
+    if not 1 <= lead <= MAX_LEAD_MINUTES:
+        print(
+            f"❌ Prefetch lead must be 1-{MAX_LEAD_MINUTES} minutes, got {lead}: "
+            f"prefetched feeds expire from the cache after {FEED_CACHE_TTL_SEC // 60} minutes",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    entries = build_schedule(sources, lead)
+
+    if args.json:
+        print(json.dumps(entries, indent=2))
+        return
+    if not entries:
+        print("📭 No enabled schedules to derive prefetch jobs from")
+        return
+    for entry in entries:
+        print(f"# {entry['name']}: prefetch {lead} min before briefing ({entry['briefing_cron']})")
+        if entry["timezone"]:
+            print(f"CRON_TZ={entry['timezone']}")
+        print(f"{entry['cron']} vfinance-news prefetch")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prefetch feeds and quotes ahead of briefings")
+    parser.add_argument("--schedule", action="store_true", help="Print prefetch crontab lines instead of fetching")
+    parser.add_argument("--lead-minutes", type=int, default=None,
+                        help=f"Minutes before each briefing, 1-{MAX_LEAD_MINUTES} so prefetched feeds are still "
+                             f"within the {FEED_CACHE_TTL_SEC // 60}-minute feed cache TTL "
+                             f"(default: config or {DEFAULT_LEAD_MINUTES})")
+    parser.add_argument("--max-tickers", type=int, default=DEFAULT_MAX_TICKERS,
+                        help="Max portfolio tickers to prefetch news for")
+    parser.add_argument("--deadline", type=int, default=None, help="Overall deadline in seconds")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    if args.schedule:
+        print_schedule(args)
+        return
+
+    stats = prefetch(max_tickers=args.max_tickers, deadline=compute_deadline(args.deadline))
+    if args.json:
+        print(json.dumps(stats, indent=2))
+    else:
+        print(
+            f"✅ Prefetched {stats['feeds']} headline feeds, {stats['ticker_feeds']} ticker feeds, "
+            f"{stats['quotes']} quotes ({stats['errors']} errors)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Local price history store.
+
+Daily closes are kept per symbol in an append-only file of fixed-width
+(day, close) records under cache/prices/ and read back through a NumPy
+memory map, so downstream code can compute multi-day and volatility-
+normalized moves without touching the network.
+"""
+
+import re
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPT_DIR.parent / "cache"
+PRICE_STORE_DIR = CACHE_DIR / "prices"
+
+# day = proleptic Gregorian ordinal (date.toordinal()), close = daily close
+RECORD_DTYPE = np.dtype([("day", "<i4"), ("close", "<f8")])
+
+DEFAULT_VOLATILITY_WINDOW = 20
+DEFAULT_MULTI_DAY_SESSIONS = 5
+
+
+def _symbol_path(symbol: str) -> Path:
+    """Map a ticker (e.g. ^GSPC, 8411.T) to a safe file name."""
+    safe = re.sub(r"[^A-Za-z0-9._-]", "_", symbol.upper())
+    return PRICE_STORE_DIR / f"{safe}.bin"
+
+
+def load_history(symbol: str, days: int | None = None) -> np.ndarray:
+    """Return stored (day, close) records for a symbol, oldest first.
+
+    Records are read through a read-only memory map; an empty array is
+    returned when nothing has been stored yet.
+    """
+    path = _symbol_path(symbol)
+    try:
+        # Ignore a trailing partial record left by an interrupted write
+        count = path.stat().st_size // RECORD_DTYPE.itemsize
+    except OSError:
+        count = 0
+    if not count:
+        return np.empty(0, dtype=RECORD_DTYPE)
+
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", shape=(count,))
+    if days is not None:
+        records = records[-days:]
+    return np.array(records)
+
+
+def record_closes(symbol: str, rows: list[tuple[date, float]]) -> int:
+    """Store daily closes for a symbol and return the number of new sessions.
+
+    Newer sessions are appended, a close for the latest stored session
+    overwrites it in place (intraday refreshes), and older sessions that are
+    missing trigger a one-off merge rewrite.
+    """
+    if not rows:
+        return 0
+
+    incoming = {}
+    for day, close in rows:
+        if close is None or not np.isfinite(close):
+            continue
+        incoming[day.toordinal()] = float(close)
+    if not incoming:
+        return 0
+
+    path = _symbol_path(symbol)
+    existing = load_history(symbol)
+    last_day = int(existing["day"][-1]) if len(existing) else None
+    new_days = sorted(incoming)
+
+    if last_day is not None and new_days[0] < last_day:
+        merged = {int(d): float(c) for d, c in zip(existing["day"], existing["close"])}
+        added = sum(1 for d in new_days if d not in merged)
+        merged.update(incoming)
+        out = np.array(sorted(merged.items()), dtype=RECORD_DTYPE)
+        PRICE_STORE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        out.tofile(tmp_path)
+        tmp_path.replace(path)
+        return added
+
+    PRICE_STORE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(path, "r+b" if path.exists() else "wb") as f:
+        added = 0
+        f.truncate(len(existing) * RECORD_DTYPE.itemsize)
+        if last_day is not None and new_days[0] == last_day:
+            f.seek((len(existing) - 1) * RECORD_DTYPE.itemsize)
+            np.array([(last_day, incoming[last_day])], dtype=RECORD_DTYPE).tofile(f)
+            new_days = new_days[1:]
+        f.seek(0, 2)
+        if new_days:
+            np.array([(d, incoming[d]) for d in new_days], dtype=RECORD_DTYPE).tofile(f)
+            added = len(new_days)
+    return added
+
+
+def record_series(symbol: str, closes) -> int:
+    """Store a pandas Series of closes indexed by timestamp."""
+    rows = [(ts.date(), float(value)) for ts, value in closes.items()]
+    return record_closes(symbol, rows)
+
+
+def get_closes(symbol: str, days: int | None = None) -> np.ndarray:
+    """Return stored closes for a symbol as a float array, oldest first."""
+    return load_history(symbol, days)["close"]
+
+
+def load_close_matrix(symbols: list[str], days: int) -> np.ndarray:
+    """Stack the last `days` closes of each symbol into an (n, days) array.
+
+    Rows follow `symbols`, the newest session is the last column, and
+    symbols with shorter histories are NaN-padded on the left.
+    """
+    matrix = np.full((len(symbols), days), np.nan)
+    for row, symbol in enumerate(symbols):
+        closes = get_closes(symbol, days)
+        if len(closes):
+            matrix[row, days - len(closes):] = closes
+    return matrix
+
+
+def latest_quote(symbol: str) -> dict | None:
+    """Build a fetch_market_data-style quote from the last two stored sessions."""
+    history = load_history(symbol, 2)
+    if not len(history):
+        return None
+
+    price = float(history["close"][-1])
+    prev_close = float(history["close"][-2]) if len(history) > 1 else 0.0
+    change_percent = ((price - prev_close) / prev_close) * 100 if prev_close > 0 else 0.0
+    return {
+        "price": price,
+        "change_percent": change_percent,
+        "prev_close": prev_close,
+        "symbol": symbol,
+        "as_of": date.fromordinal(int(history["day"][-1])).isoformat(),
+    }
+
+
+def load_quotes(symbols: list[str]) -> dict:
+    """Offline counterpart of fetch_market_data for symbols with stored history."""
+    quotes = {}
+    for symbol in symbols:
+        quote = latest_quote(symbol)
+        if quote:
+            quotes[symbol] = quote
+    return quotes
+
+
+def move_stats(
+    symbol: str,
+    sessions: int = DEFAULT_MULTI_DAY_SESSIONS,
+    window: int = DEFAULT_VOLATILITY_WINDOW,
+) -> dict:
+    """Multi-day change and volatility-normalized move for a symbol.
+
+    Returns a dict with any of:
+    - change_{sessions}d_pct: % change over the last `sessions` sessions
+    - volatility_pct: stdev of daily % returns over `window` sessions
+    - z_score: latest daily return divided by volatility_pct
+    """
+    closes = get_closes(symbol, max(sessions, window) + 1)
+    stats = {}
+    if len(closes) > sessions and closes[-1 - sessions] > 0:
+        stats[f"change_{sessions}d_pct"] = float((closes[-1] / closes[-1 - sessions] - 1) * 100)
+
+    if len(closes) >= 3:
+        returns = np.diff(closes[-(window + 1):]) / closes[-(window + 1):-1] * 100
+        volatility = float(np.std(returns, ddof=1))
+        if volatility > 0:
+            stats["volatility_pct"] = volatility
+            stats["z_score"] = float(returns[-1] / volatility)
+    return stats
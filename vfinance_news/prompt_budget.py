@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Prompt Budget - Fit LLM prompt content into a token budget.
+
+Content is passed as sections of scored items. Compaction:
+1. replaces every URL with a reference ID ([L1], [L2], ...) listed once
+   in a trailing links table, so links repeated across headlines,
+   sources and portfolio news cost tokens only once
+2. truncates item descriptions, then drops them
+3. drops the lowest-ranked optional items until the prompt fits
+
+Scores are only compared within a section (or sections sharing a group).
+Across sections, items are dropped by their rank percentile, so a section
+scored 1..10 cannot crowd out one scored 0..1.
+
+Token counts are estimated (about 4 characters per token) - good enough
+for budgeting without a tokenizer dependency.
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = 3000
+DEFAULT_DESCRIPTION_CHARS = 160
+
+URL_PATTERN = re.compile(r"https?://[^\s|)\]>]+")
+
+
+@dataclass
+class PromptItem:
+    """One droppable unit of prompt content (a headline, a stock block, ...)."""
+    text: str
+    score: float = 0.0
+    label: str = ""
+    description: str = ""
+    required: bool = False
+
+
+@dataclass
+class PromptSection:
+    header: str
+    items: list[PromptItem] = field(default_factory=list)
+    # Sections with the same group are ranked together (e.g. holdings and watchlist)
+    group: str = ""
+
+
+@dataclass
+class CompactPrompt:
+    text: str
+    tokens: int
+    budget: int
+    kept: list[dict]
+    dropped: list[dict]
+    descriptions: str  # "full", "truncated" or "removed"
+
+    def report(self) -> dict:
+        """Summary for debug logs."""
+        return {
+            "tokens": self.tokens,
+            "budget": self.budget,
+            "descriptions": self.descriptions,
+            "kept": self.kept,
+            "dropped": self.dropped,
+        }
+
+
+def region_lines(data: dict, trend_emoji: bool = False) -> list[str]:
+    """Index lines for one market region of a prompt's market data section."""
+    lines = [f"### {data['name']}"]
+    for symbol, idx in data.get('indices', {}).items():
+        if 'data' in idx and idx['data']:
+            price = idx['data'].get('price', 'N/A')
+            change_pct = idx['data'].get('change_percent', 0)
+            line = f"- {idx['name']}: {price} ({change_pct:+.2f}%)"
+            if trend_emoji:
+                line += ' 📈' if change_pct >= 0 else ' 📉'
+            lines.append(line)
+    return lines
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars].rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:") + "…"
+
+
+def _render(sections: list[PromptSection], dropped: set[int], description_chars: int | None) -> str:
+    blocks = []
+    for section in sections:
+        lines = []
+        for item in section.items:
+            if id(item) in dropped:
+                continue
+            lines.append(item.text)
+            description = " ".join(item.description.split())
+            if description and description_chars != 0:
+                if description_chars is not None:
+                    description = _truncate(description, description_chars)
+                lines.append(f"  {description}")
+        if lines:
+            blocks.append(section.header + "\n" + "\n".join(lines))
+    return _link_references("\n\n".join(blocks))
+
+
+def _link_references(text: str) -> str:
+    """Replace URLs with [Ln] IDs and append a table listing each URL once."""
+    refs: dict[str, str] = {}
+
+    def _ref(match: re.Match) -> str:
+        url = match.group(0)
+        if url not in refs:
+            refs[url] = f"[L{len(refs) + 1}]"
+        return refs[url]
+
+    body = URL_PATTERN.sub(_ref, text)
+    if not refs:
+        return body
+    table = "\n".join(f"{ref} {url}" for url, ref in refs.items())
+    return f"{body}\n\n## Links\n{table}"
+
+
+def _item_entry(section: PromptSection, item: PromptItem) -> dict:
+    return {"section": section.header.lstrip("# ").strip(), "item": item.label or item.text[:80], "score": item.score}
+
+
+def _drop_order(sections: list[PromptSection]) -> list[tuple[PromptSection, PromptItem]]:
+    """Optional items, first to drop first: by rank percentile within their group."""
+    groups: dict[str, list[tuple[float, int, PromptSection, PromptItem]]] = {}
+    for order, (section, item) in enumerate((s, i) for s in sections for i in s.items):
+        if not item.required:
+            key = section.group or f"section:{id(section)}"
+            groups.setdefault(key, []).append((item.score, order, section, item))
+
+    ranked = []
+    for entries in groups.values():
+        entries.sort(key=lambda entry: (entry[0], -entry[1]))
+        for rank, (_, order, section, item) in enumerate(entries, start=1):
+            ranked.append((rank / len(entries), -order, section, item))
+    ranked.sort(key=lambda entry: (entry[0], entry[1]))
+    return [(section, item) for _, _, section, item in ranked]
+
+
+def compact_prompt(
+    sections: list[PromptSection],
+    budget_tokens: int = DEFAULT_TOKEN_BUDGET,
+    description_chars: int = DEFAULT_DESCRIPTION_CHARS,
+) -> CompactPrompt:
+    """Render sections into prompt text that fits `budget_tokens` where possible.
+
+    Required items are never dropped, so the result may still exceed the
+    budget if they alone do not fit.
+    """
+    dropped: set[int] = set()
+    levels = [(None, "full"), (description_chars, "truncated"), (0, "removed")]
+    for chars, descriptions in levels:
+        text = _render(sections, dropped, chars)
+        if estimate_tokens(text) <= budget_tokens:
+            break
+
+    dropped_entries = []
+    for section, item in _drop_order(sections):
+        if estimate_tokens(text) <= budget_tokens:
+            break
+        dropped.add(id(item))
+        dropped_entries.append(_item_entry(section, item))
+        text = _render(sections, dropped, chars)
+
+    kept = [
+        _item_entry(section, item)
+        for section in sections
+        for item in section.items
+        if id(item) not in dropped
+    ]
+    return CompactPrompt(
+        text=text,
+        tokens=estimate_tokens(text),
+        budget=budget_tokens,
+        kept=kept,
+        dropped=dropped_entries,
+        descriptions=descriptions,
+    )
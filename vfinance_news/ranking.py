@@ -14,12 +14,18 @@ Scoring Rubric (weights):
 Output:
 - MUST_READ: Top 5 stories
 - SCAN: 3-5 additional stories (if quality threshold met)
+
+Headlines are ranked as slotted Article models; rank_headlines converts
+the incoming dicts once and returns dicts carrying the _score/_categories
+keys, leaving the caller's dicts untouched.
 """
 
 import re
 from datetime import datetime
 from difflib import SequenceMatcher
 
+from vfinance_news.models import Article, intern
+
 
 # Category keywords for classification
 CATEGORY_KEYWORDS = {
@@ -105,17 +111,17 @@ def title_similarity(a: str, b: str) -> float:
     return SequenceMatcher(None, normalize_title(a), normalize_title(b)).ratio()
 
 
-def deduplicate_headlines(headlines: list[dict], threshold: float = 0.7) -> list[dict]:
+def deduplicate_headlines(headlines: list[Article], threshold: float = 0.7) -> list[Article]:
     """Remove duplicate headlines by title similarity."""
     if not headlines:
         return []
     
     unique = []
     for article in headlines:
-        title = article.get("title", "")
+        title = article.title
         is_dupe = False
         for existing in unique:
-            if title_similarity(title, existing.get("title", "")) > threshold:
+            if title_similarity(title, existing.title) > threshold:
                 is_dupe = True
                 break
         if not is_dupe:
@@ -183,9 +189,9 @@ def score_market_impact(title: str, description: str = "") -> float:
     return min(score, 1.0)
 
 
-def score_novelty(article: dict) -> float:
+def score_novelty(article: Article) -> float:
     """Score novelty based on recency (0-1)."""
-    published_at = article.get("published_at")
+    published_at = article.published_at
     if not published_at:
         return 0.5  # Unknown = medium
     
@@ -230,20 +236,30 @@ def score_credibility(source: str) -> float:
     return SOURCE_CREDIBILITY.get(source, 0.5)
 
 
-def calculate_score(article: dict, weights: dict, category_counts: dict) -> float:
-    """Calculate overall score for a headline."""
-    title = article.get("title", "")
-    description = article.get("description", "")
-    source = article.get("source", "")
+def calculate_score(article: Article | dict, weights: dict, category_counts: dict) -> float:
+    """Calculate overall score for a headline.
+
+    The component scores are stored on the article (Article attributes, or
+    the _score/_categories/... keys of a dict).
+    """
+    if isinstance(article, dict):
+        model = Article.from_dict(article)
+        score = calculate_score(model, weights, category_counts)
+        article.update({k: v for k, v in model.to_dict().items() if k.startswith("_")})
+        return score
+
+    title = article.title
+    description = article.description
+    source = article.source or ""
     categories = classify_category(title, description)
-    article["_categories"] = categories  # Store for later use
+    article.categories = tuple(intern(c) for c in categories)  # Store for later use
     pure_company_specific = (
         "company_specific" in categories
         and "equity_broad" not in categories
         and "macro" not in categories
         and "geopolitics" not in categories
     )
-    article["_pure_company_specific"] = pure_company_specific
+    article.pure_company_specific = pure_company_specific
     
     # Component scores
     impact = score_market_impact(title, description)
@@ -271,20 +287,20 @@ def calculate_score(article: dict, weights: dict, category_counts: dict) -> floa
     if pure_company_specific:
         score -= 0.15
     
-    article["_score"] = round(score, 3)
-    article["_impact"] = round(impact, 3)
-    article["_novelty"] = round(novelty, 3)
+    article.score = round(score, 3)
+    article.impact = round(impact, 3)
+    article.novelty = round(novelty, 3)
     
     return score
 
 
-def apply_source_cap(ranked: list[dict], cap: int = 2) -> list[dict]:
+def apply_source_cap(ranked: list[Article], cap: int = 2) -> list[Article]:
     """Apply source cap - max N items per outlet."""
     source_counts = {}
     result = []
     
     for article in ranked:
-        source = article.get("source", "Unknown")
+        source = article.source if article.source is not None else "Unknown"
         if source_counts.get(source, 0) < cap:
             result.append(article)
             source_counts[source] = source_counts.get(source, 0) + 1
@@ -292,20 +308,20 @@ def apply_source_cap(ranked: list[dict], cap: int = 2) -> list[dict]:
     return result
 
 
-def ensure_diversity(selected: list[dict], candidates: list[dict], required: list[str]) -> list[dict]:
+def ensure_diversity(selected: list[Article], candidates: list[Article], required: list[str]) -> list[Article]:
     """Ensure at least one headline from required categories if available."""
     result = list(selected)
     covered = set()
     
     for article in result:
-        for cat in article.get("_categories", []):
+        for cat in article.categories or ():
             covered.add(cat)
     
     for req_cat in required:
         if req_cat not in covered:
             # Find candidate from this category
             for candidate in candidates:
-                if candidate not in result and req_cat in candidate.get("_categories", []):
+                if candidate not in result and req_cat in (candidate.categories or ()):
                     result.append(candidate)
                     covered.add(req_cat)
                     break
@@ -322,7 +338,7 @@ def rank_headlines(headlines: list[dict], config: dict | None = None) -> dict:
         config: Optional config overrides
     
     Returns:
-        {"must_read": [...], "scan": [...]}
+        {"must_read": [...], "scan": [...]} as new dicts with the _score keys
     """
     cfg = {**DEFAULT_CONFIG, **(config or {})}
     weights = cfg.get("weights", DEFAULT_CONFIG["weights"])
@@ -331,25 +347,26 @@ def rank_headlines(headlines: list[dict], config: dict | None = None) -> dict:
         return {"must_read": [], "scan": []}
     
     # Step 1: Deduplicate
-    unique = deduplicate_headlines(headlines, cfg["dedupe_threshold"])
+    articles = [Article.from_dict(article) for article in headlines]
+    unique = deduplicate_headlines(articles, cfg["dedupe_threshold"])
     
     # Step 2: Score all headlines
     category_counts = {}
     for article in unique:
         calculate_score(article, weights, category_counts)
-        for cat in article.get("_categories", []):
+        for cat in article.categories:
             category_counts[cat] = category_counts.get(cat, 0) + 1
     
     # Step 3: Sort by score
-    ranked = sorted(unique, key=lambda x: x.get("_score", 0), reverse=True)
+    ranked = sorted(unique, key=lambda x: x.score, reverse=True)
     
     # Step 4: Apply source cap
     capped = apply_source_cap(ranked, cfg["source_cap"])
     
     # Step 5: Select must_read with diversity quota
     # Leave room for diversity additions by taking count-1 initially
-    must_read_candidates = [a for a in capped if a.get("_score", 0) >= cfg["must_read_min_score"]]
-    broad_candidates = [a for a in must_read_candidates if not a.get("_pure_company_specific")]
+    must_read_candidates = [a for a in capped if a.score >= cfg["must_read_min_score"]]
+    broad_candidates = [a for a in must_read_candidates if not a.pure_company_specific]
     if len(broad_candidates) >= max(1, cfg["must_read_count"] - 1):
         must_read_candidates = broad_candidates
     must_read_count = cfg["must_read_count"]
@@ -365,12 +382,12 @@ def rank_headlines(headlines: list[dict], config: dict | None = None) -> dict:
     must_read = must_read[:must_read_count]  # Final trim to exact count
     
     # Step 6: Select scan (additional items)
-    scan_candidates = [a for a in capped if a not in must_read and a.get("_score", 0) >= cfg["scan_min_score"]]
+    scan_candidates = [a for a in capped if a not in must_read and a.score >= cfg["scan_min_score"]]
     scan = scan_candidates[:cfg["scan_count"]]
     
     return {
-        "must_read": must_read,
-        "scan": scan,
+        "must_read": [article.to_dict() for article in must_read],
+        "scan": [article.to_dict() for article in scan],
         "total_processed": len(headlines),
         "after_dedupe": len(unique),
     }
@@ -6,38 +6,101 @@ Outputs research_report.md for later analysis.
 """
 
 import argparse
+import hashlib
 import json
 import os
 import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from vfinance_news.utils import ensure_venv
 
 from vfinance_news.fetch_news import PortfolioError, get_market_news, get_portfolio_news
+from vfinance_news.prompt_budget import (
+    DEFAULT_TOKEN_BUDGET,
+    PromptItem,
+    PromptSection,
+    compact_prompt,
+    region_lines,
+)
 
 SCRIPT_DIR = Path(__file__).parent
 CONFIG_DIR = SCRIPT_DIR.parent / "config"
 OUTPUT_DIR = SCRIPT_DIR.parent / "research"
 
+RESEARCH_CACHE_DIR = OUTPUT_DIR / ".cache"
+RESEARCH_CACHE_TTL_SEC = 3 * 3600
+# Fields that change between fetches without changing the research input
+VOLATILE_FIELDS = {
+    "fetched_at", "timestamp", "cached_at", "as_of", "date", "published_at",
+    "first_seen", "last_seen", "age_hours",
+}
+
+SECTION_TIMEOUT_SEC = 90
+SECTION_UNAVAILABLE = "_Section unavailable._"
+
+# Focus-area subprompts, assembled in this order
+RESEARCH_SECTIONS = {
+    "macro": (
+        "Macro Trends",
+        "What is driving the market today? Which economic data/decisions matter? "
+        "Note links between news items and asset classes.",
+    ),
+    "sectors": (
+        "Sector Analysis",
+        "Which sectors are performing best/worst? Why?",
+    ),
+    "company_news": (
+        "Company News",
+        "Relevant earnings, M&A, product launches? Which positive developments offer opportunities? "
+        "Concrete setups based on the analysis (not financial advice!).",
+    ),
+    "risks": (
+        "Risks",
+        "What downside risks should be noted?",
+    ),
+}
+DEFAULT_RESEARCH_SECTIONS = list(RESEARCH_SECTIONS)
+
 
 ensure_venv()
 
 
+def _headline_lines(article: dict) -> list[str]:
+    source = article.get('source', 'Unknown')
+    title = article.get('title', '')
+    link = article.get('link', '')
+    lines = [f"- [{source}] {title}"]
+    if link:
+        lines.append(f"  URL: {link}")
+    return lines
+
+
+def _stock_lines(symbol: str, data: dict) -> list[str]:
+    quote = data.get('quote', {})
+    price = quote.get('price', 'N/A')
+    change_pct = quote.get('change_percent', 0)
+
+    lines = [f"### {symbol} (${price}, {change_pct:+.2f}%)"]
+    for article in data.get('articles', [])[:5]:
+        title = article.get('title', '')
+        link = article.get('link', '')
+        lines.append(f"- {title}")
+        if link:
+            lines.append(f"  URL: {link}")
+    return lines
+
+
 def format_market_data(market_data: dict) -> str:
     """Format market data for research prompt."""
     lines = ["## Market Data\n"]
     
     for region, data in market_data.get('markets', {}).items():
-        lines.append(f"### {data['name']}")
-        for symbol, idx in data.get('indices', {}).items():
-            if 'data' in idx and idx['data']:
-                price = idx['data'].get('price', 'N/A')
-                change_pct = idx['data'].get('change_percent', 0)
-                emoji = '📈' if change_pct >= 0 else '📉'
-                lines.append(f"- {idx['name']}: {price} ({change_pct:+.2f}%) {emoji}")
+        lines.extend(region_lines(data, trend_emoji=True))
         lines.append("")
     
     return '\n'.join(lines)
@@ -48,12 +111,7 @@ def format_headlines(headlines: list) -> str:
     lines = ["## Current Headlines\n"]
     
     for article in headlines[:20]:
-        source = article.get('source', 'Unknown')
-        title = article.get('title', '')
-        link = article.get('link', '')
-        lines.append(f"- [{source}] {title}")
-        if link:
-            lines.append(f"  URL: {link}")
+        lines.extend(_headline_lines(article))
     
     return '\n'.join(lines)
 
@@ -63,23 +121,47 @@ def format_portfolio_news(portfolio_data: dict) -> str:
     lines = ["## Portfolio Analysis\n"]
     
     for symbol, data in portfolio_data.get('stocks', {}).items():
-        quote = data.get('quote', {})
-        price = quote.get('price', 'N/A')
-        change_pct = quote.get('change_percent', 0)
-        
-        lines.append(f"### {symbol} (${price}, {change_pct:+.2f}%)")
-        
-        for article in data.get('articles', [])[:5]:
-            title = article.get('title', '')
-            link = article.get('link', '')
-            lines.append(f"- {title}")
-            if link:
-                lines.append(f"  URL: {link}")
+        lines.extend(_stock_lines(symbol, data))
         lines.append("")
     
     return '\n'.join(lines)
 
 
+def build_prompt_sections(market_data: dict, portfolio_data: dict) -> list[PromptSection]:
+    """Research prompt content as scored sections for compaction.
+
+    Index data is always kept; headlines are scored by feed order and
+    portfolio stocks by the size of their move.
+    """
+    sections = []
+    if market_data:
+        sections.append(PromptSection("## Market Data", [
+            PromptItem('\n'.join(region_lines(data, trend_emoji=True)), label=data['name'], required=True)
+            for data in market_data.get('markets', {}).values()
+        ]))
+        headlines = market_data.get('headlines', [])[:20]
+        if headlines:
+            sections.append(PromptSection("## Current Headlines", [
+                PromptItem(
+                    '\n'.join(_headline_lines(article)),
+                    score=float(len(headlines) - rank),
+                    label=article.get('title', ''),
+                    description=article.get('description', '') or '',
+                )
+                for rank, article in enumerate(headlines)
+            ]))
+    if portfolio_data and 'error' not in portfolio_data:
+        sections.append(PromptSection("## Portfolio Analysis", [
+            PromptItem(
+                '\n'.join(_stock_lines(symbol, data)),
+                score=abs(data.get('quote', {}).get('change_percent', 0) or 0),
+                label=symbol,
+            )
+            for symbol, data in portfolio_data.get('stocks', {}).items()
+        ]))
+    return sections
+
+
 def minimax_prompt_available() -> bool:
     return shutil.which('minimax-prompt') is not None
 
@@ -158,6 +240,84 @@ Deliver a substantial report (500-800 words).
         return "⚠️ minimax-prompt not found"
 
 
+def _section_prompt(section: str, content: str, focus_areas: list | None) -> str:
+    title, instructions = RESEARCH_SECTIONS[section]
+    focus_prompt = ""
+    if focus_areas:
+        focus_prompt = f"\nKeep these focus areas in mind: {', '.join(focus_areas)}\n"
+    return f"""You are an experienced investment research analyst.
+
+Write only the "{title}" section of a research report on current market developments.
+{instructions}
+{focus_prompt}
+Market data:
+
+{content}
+
+Be analytical, objective, and opinionated where appropriate.
+Cite original links for further research. Keep it to 150-250 words, without a heading.
+"""
+
+
+def _run_section(section: str, content: str, focus_areas: list | None, timeout: int) -> str:
+    """Run one focus-area subprompt; errors are returned as ⚠️ strings."""
+    try:
+        result = subprocess.run(
+            ['minimax-prompt', _section_prompt(section, content, focus_areas)],
+            capture_output=True,
+            text=True,
+            timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return f"⚠️ timed out after {timeout}s"
+    except FileNotFoundError:
+        return "⚠️ minimax-prompt not found"
+    except OSError as exc:
+        return f"⚠️ {exc}"
+
+    if result.returncode != 0:
+        return f"⚠️ {result.stderr.strip() or 'unknown error'}"
+    return result.stdout.strip()
+
+
+def research_sections_with_minimax(
+    content: str,
+    sections: list[str] | None = None,
+    focus_areas: list = None,
+    timeout: int = SECTION_TIMEOUT_SEC,
+) -> str:
+    """Research each focus area in its own concurrent minimax-prompt process.
+
+    Sections (default: DEFAULT_RESEARCH_SECTIONS) are assembled in the
+    requested order. A section that fails or times out is marked unavailable
+    while the others are kept; only if every section fails is an error returned.
+    """
+    sections = list(DEFAULT_RESEARCH_SECTIONS if sections is None else sections)
+    if not sections:
+        raise ValueError("No research sections requested")
+    unknown = [section for section in sections if section not in RESEARCH_SECTIONS]
+    if unknown:
+        raise ValueError(f"Unknown research sections: {', '.join(unknown)}")
+
+    with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+        results = list(executor.map(lambda section: _run_section(section, content, focus_areas, timeout), sections))
+
+    parts = []
+    errors = []
+    for section, text in zip(sections, results):
+        title = RESEARCH_SECTIONS[section][0]
+        if text.startswith("⚠️"):
+            errors.append(f"{title}: {text[2:].strip()}")
+            print(f"⚠️ Research section '{section}' failed: {text[2:].strip()}", file=sys.stderr)
+            parts.append(f"## {title}\n\n{SECTION_UNAVAILABLE}")
+        else:
+            parts.append(f"## {title}\n\n{text}")
+
+    if len(errors) == len(sections):
+        return f"⚠️ MiniMax research error: {'; '.join(errors)}"
+    return '\n\n'.join(parts)
+
+
 def research_with_gemini(content: str, focus_areas: list = None) -> str:
     """Compatibility alias used by tests and older callers."""
     result = research_with_minimax(content, focus_areas)
@@ -178,7 +338,70 @@ def format_raw_data_report(market_data: dict, portfolio_data: dict) -> str:
     return '\n\n'.join(parts)
 
 
-def generate_research_content(market_data: dict, portfolio_data: dict, focus_areas: list = None) -> dict:
+def _normalize(value):
+    """Drop volatile fields and make containers deterministic for hashing."""
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items() if k not in VOLATILE_FIELDS}
+    if isinstance(value, (set, frozenset)):
+        return sorted(_normalize(v) for v in value)
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def research_cache_key(market_data: dict, portfolio_data: dict, **params) -> str:
+    """Hash of the research input with timestamps and other volatile fields stripped."""
+    snapshot = {
+        "market": _normalize(market_data or {}),
+        "portfolio": _normalize(portfolio_data or {}),
+        "params": _normalize(params),
+    }
+    encoded = json.dumps(snapshot, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def load_cached_research(key: str, ttl: int = RESEARCH_CACHE_TTL_SEC) -> dict | None:
+    path = RESEARCH_CACHE_DIR / f"{key}.json"
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        if time.time() - entry["created_at"] < ttl:
+            return entry["result"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def save_cached_research(key: str, result: dict, ttl: int = RESEARCH_CACHE_TTL_SEC) -> None:
+    """Store a research result and drop expired entries."""
+    try:
+        RESEARCH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        for old in RESEARCH_CACHE_DIR.glob("*.json"):
+            if now - old.stat().st_mtime >= ttl:
+                old.unlink(missing_ok=True)
+        path = RESEARCH_CACHE_DIR / f"{key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"created_at": now, "result": result}, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError as e:
+        print(f"⚠️ Research cache write failed: {e}", file=sys.stderr)
+
+
+def generate_research_content(
+    market_data: dict,
+    portfolio_data: dict,
+    focus_areas: list = None,
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+    sections: list[str] | None = None,
+    use_cache: bool = True,
+) -> dict:
+    """Research report from market and portfolio data.
+
+    With `sections`, each focus area is researched concurrently
+    (see research_sections_with_minimax); otherwise a single prompt covers
+    the whole report. Complete MiniMax reports are cached by a hash of the
+    normalized input, so unchanged feeds and quotes reuse the last report.
+    """
     raw_report = format_raw_data_report(market_data, portfolio_data)
     if not raw_report.strip():
         return {
@@ -186,10 +409,32 @@ def generate_research_content(market_data: dict, portfolio_data: dict, focus_are
             'source': 'none'
         }
     if gemini_available():
-        return {
-            'report': research_with_gemini(raw_report, focus_areas),
-            'source': 'gemini'
+        key = research_cache_key(
+            market_data,
+            portfolio_data,
+            focus_areas=focus_areas,
+            token_budget=token_budget,
+            sections=sections,
+        )
+        cached = load_cached_research(key) if use_cache else None
+        if cached is not None:
+            print("♻️ Using cached research report", file=sys.stderr)
+            return {**cached, 'cached': True}
+
+        prompt = compact_prompt(build_prompt_sections(market_data, portfolio_data), token_budget)
+        if sections:
+            report = research_sections_with_minimax(prompt.text, sections, focus_areas)
+        else:
+            report = research_with_gemini(prompt.text, focus_areas)
+        result = {
+            'report': report,
+            'source': 'gemini',
+            'prompt': prompt.report(),
         }
+        # Only cache complete reports
+        if use_cache and not report.startswith("⚠️") and SECTION_UNAVAILABLE not in report:
+            save_cached_research(key, result)
+        return result
     return {
         'report': raw_report,
         'source': 'raw'
@@ -230,7 +475,25 @@ def generate_research_report(args):
     if hasattr(args, 'focus') and args.focus:
         focus_areas = args.focus.split(',')
 
-    research_result = generate_research_content(market_data, portfolio_data, focus_areas)
+    with open(config_path) as f:
+        token_budget = json.load(f).get('prompt_token_budget', DEFAULT_TOKEN_BUDGET)
+
+    sections_arg = args.sections if hasattr(args, 'sections') else ','.join(DEFAULT_RESEARCH_SECTIONS)
+    sections = [section.strip() for section in sections_arg.split(',') if section.strip()]
+    unknown = [section for section in sections if section not in RESEARCH_SECTIONS]
+    if unknown:
+        print(f"❌ Unknown research sections: {', '.join(unknown)} "
+              f"(choose from {', '.join(RESEARCH_SECTIONS)})", file=sys.stderr)
+        sys.exit(1)
+
+    research_result = generate_research_content(
+        market_data,
+        portfolio_data,
+        focus_areas,
+        token_budget,
+        sections=sections,
+        use_cache=not getattr(args, 'no_cache', False),
+    )
     research_report = research_result['report']
     source = research_result['source']
 
@@ -287,6 +550,10 @@ def main():
     parser.add_argument('--regions', default='us,europe', help='Comma-separated regions')
     parser.add_argument('--max-stocks', type=int, default=10, help='Max portfolio stocks')
     parser.add_argument('--focus', help='Focus areas (comma-separated)')
+    parser.add_argument('--sections', default=','.join(DEFAULT_RESEARCH_SECTIONS),
+                        help=f"Report sections researched in parallel (default: {','.join(DEFAULT_RESEARCH_SECTIONS)}; "
+                             "empty for a single prompt)")
+    parser.add_argument('--no-cache', action='store_true', help='Regenerate even if a cached report matches the input')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
     
     args = parser.parse_args()
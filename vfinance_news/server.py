@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Serve Daemon - Answer briefing, alert, earnings and market requests over a Unix socket.
+
+`vfinance-news serve` keeps the interpreter, imports, config, portfolio
+symbols, parsed feeds and quotes warm between requests. The CLI forwards
+supported commands to a running daemon and runs them locally otherwise.
+
+Protocol (one newline-terminated JSON object each way per connection):
+    request:  {"command": "alerts", "argv": ["check", "--json"], "portfolio": "/abs/portfolio.csv"}
+    response: {"ok": true, "exit_code": 0, "stdout": "...", "stderr": "..."}
+
+The daemon answers {"ok": false, "run_locally": true, ...} instead of running
+the command when the client resolves a different portfolio file (its own
+VFINANCE_NEWS_PORTFOLIO / PORTFOLIOS_DIR / cwd), when another command is
+still running, or while a briefing that timed out is still running in the
+daemon; the client then runs the command locally. Connections are
+handled on threads, but commands swap sys.argv and redirect stdout, so only
+one runs at a time and a long briefing never queues the other clients.
+
+Usage:
+    vfinance-news serve                       # Serve on cache/serve.sock
+    vfinance-news serve --socket /tmp/vf.sock # Custom socket path
+"""
+
+import argparse
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+CACHE_DIR = SCRIPT_DIR.parent / "cache"
+DEFAULT_SOCKET_PATH = CACHE_DIR / "serve.sock"
+
+CONNECT_TIMEOUT_SEC = 0.5
+# Longer than the briefing's own 300s default so the daemon times out first
+REQUEST_TIMEOUT_SEC = 330
+# How long a request waits for a running command before it is sent back to run locally
+BUSY_WAIT_SEC = 1.0
+
+# Commands swap the process-wide sys.argv and stdout/stderr
+_run_lock = threading.Lock()
+
+
+def get_socket_path() -> Path:
+    """Socket path, overridable with VFINANCE_NEWS_SOCKET."""
+    env_path = os.environ.get("VFINANCE_NEWS_SOCKET", "").strip()
+    if env_path:
+        return Path(os.path.expanduser(env_path))
+    return DEFAULT_SOCKET_PATH
+
+
+def is_served(command: str | None, argv: list[str]) -> bool:
+    """Whether the daemon handles this CLI command."""
+    if command == "briefing":
+        # Batches swap the warm caches to run-scoped ones, so keep them local
+        return not any(arg == "--batch" or arg.startswith("--batch=") for arg in argv)
+    if command == "market":
+        return True
+    if command in ("alerts", "earnings"):
+        return bool(argv) and argv[0] == "check"
+    return False
+
+
+def _command_entry(command: str):
+    """Return (module main, argv prefix) for a served command."""
+    if command == "briefing":
+        from vfinance_news import briefing
+        return briefing.main, []
+    if command == "market":
+        from vfinance_news import fetch_news
+        return fetch_news.main, ["market"]
+    if command == "alerts":
+        from vfinance_news import alerts
+        return alerts.main, []
+    from vfinance_news import earnings
+    return earnings.main, []
+
+
+def run_command(command: str, argv: list[str]) -> dict:
+    """Run a served command in-process, capturing its output and exit code."""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    entry, prefix = _command_entry(command)
+    saved_argv = sys.argv
+    sys.argv = [f"vfinance-news {command}"] + prefix + list(argv)
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            entry()
+    except SystemExit as e:
+        if isinstance(e.code, str):
+            stderr.write(e.code + "\n")
+        exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except Exception as e:
+        stderr.write(f"❌ {command} failed: {e}\n")
+        exit_code = 1
+    finally:
+        sys.argv = saved_argv
+
+    return {
+        "ok": exit_code == 0,
+        "exit_code": exit_code,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def _portfolio_path() -> str:
+    """Absolute portfolio CSV path as resolved from this process's env and cwd."""
+    from vfinance_news import portfolio
+    return os.path.abspath(portfolio._get_portfolio_file())
+
+
+def _run_locally(reason: str) -> dict:
+    return {"ok": False, "run_locally": True, "exit_code": 0, "stdout": "", "stderr": f"⚠️ {reason}\n"}
+
+
+def handle_request(request: dict) -> dict:
+    """Validate and dispatch a decoded request."""
+    command = request.get("command")
+    argv = [str(arg) for arg in request.get("argv") or []]
+
+    if command == "ping":
+        return {"ok": True, "exit_code": 0, "stdout": "pong\n", "stderr": ""}
+    if not is_served(command, argv):
+        message = f"❌ Not served by daemon: {command} {' '.join(argv)}\n"
+        return {"ok": False, "exit_code": 2, "stdout": "", "stderr": message}
+    client_portfolio = request.get("portfolio")
+    if client_portfolio is not None and client_portfolio != _portfolio_path():
+        return _run_locally(f"Daemon serves a different portfolio than {client_portfolio}")
+    if not _run_lock.acquire(timeout=BUSY_WAIT_SEC):
+        return _run_locally("Daemon busy with another command")
+    try:
+        from vfinance_news import briefing
+        if briefing.summarize_worker_running():
+            return _run_locally("Daemon unhealthy: a timed-out briefing is still running")
+        return run_command(command, argv)
+    finally:
+        _run_lock.release()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            response = {"ok": False, "exit_code": 2, "stdout": "", "stderr": f"❌ Invalid request: {e}\n"}
+        else:
+            response = handle_request(request)
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def warm_up() -> None:
+    """Import command modules and switch on in-process caches."""
+    from vfinance_news import alerts, briefing, earnings, fetch_news, summarize  # noqa: F401
+
+    fetch_news.enable_warm_caches()
+    briefing.SUMMARIZE_IN_PROCESS = True
+    fetch_news.load_sources()
+    fetch_news.get_portfolio_symbols()
+
+
+def _connect(socket_path: Path) -> socket.socket | None:
+    """Connect to a daemon socket, or return None if nothing is listening."""
+    if not socket_path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT_SEC)
+    try:
+        sock.connect(str(socket_path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def request(command: str, argv: list[str], socket_path: Path | None = None) -> dict | None:
+    """Send a command to a running daemon.
+
+    Returns None when no daemon is reachable, or when it declines (different
+    portfolio, busy), so callers can run locally. Failures after the request
+    was sent are reported as an error response rather than None, to avoid
+    running the command twice.
+    """
+    sock = _connect(socket_path or get_socket_path())
+    if sock is None:
+        return None
+
+    with sock:
+        try:
+            sock.settimeout(REQUEST_TIMEOUT_SEC)
+            payload = {"command": command, "argv": list(argv), "portfolio": _portfolio_path()}
+            sock.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+            response = json.loads(line)
+            if not isinstance(response, dict):
+                raise ValueError("response must be a JSON object")
+        except (OSError, ValueError) as e:
+            return {"ok": False, "exit_code": 1, "stdout": "", "stderr": f"❌ Daemon request failed: {e}\n"}
+    return None if response.get("run_locally") else response
+
+
+def serve(socket_path: Path) -> int:
+    """Run the daemon until interrupted."""
+    probe = _connect(socket_path)
+    if probe is not None:
+        probe.close()
+        print(f"❌ Daemon already running on {socket_path}", file=sys.stderr)
+        return 1
+    socket_path.unlink(missing_ok=True)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    warm_up()
+
+    def _stop(*_args):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, _stop)
+    server = _ThreadingUnixServer(str(socket_path), _RequestHandler)
+    os.chmod(socket_path, 0o600)
+    print(f"🟢 Serving on {socket_path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+        print("🛑 Daemon stopped", file=sys.stderr)
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve daemon")
+    parser.add_argument("--socket", default=None, help="Unix socket path (default: cache/serve.sock)")
+    args = parser.parse_args()
+
+    socket_path = Path(os.path.expanduser(args.socket)) if args.socket else get_socket_path()
+    sys.exit(serve(socket_path))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,11 @@ Single source of truth for:
 Usage:
     from stocks import load_stocks, save_stocks, get_holdings, get_watchlist
     from stocks import add_to_watchlist, add_to_holdings, move_to_holdings
+    from stocks import StocksStore    # batched edits, one write per `with` block
 
 CLI:
     stocks.py list [--holdings|--watchlist]
-    stocks.py add-watchlist TICKER [--target 380] [--notes "Buy zone"]
+    stocks.py add-watchlist TICKER [TICKER ...] [--target 380] [--notes "Buy zone"]
     stocks.py add-holding TICKER --name "Company" [--category "Tech"]
     stocks.py move TICKER  # watchlist → holdings (you bought it)
     stocks.py remove TICKER [--from holdings|watchlist]
@@ -20,6 +21,7 @@ CLI:
 
 import argparse
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -46,12 +48,213 @@ def load_stocks(path: Optional[Path] = None) -> dict:
 
 
 def save_stocks(data: dict, path: Optional[Path] = None):
-    """Save the unified stocks file."""
+    """Save the unified stocks file (written to a temp file, then renamed over it)."""
     path = path or STOCKS_FILE
     data["updated"] = datetime.now().strftime("%Y-%m-%d")
     
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=2)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class StocksStore:
+    """Holdings and watchlist indexed by ticker, written back in one save.
+
+    Lookups and mutations are dict operations; the file is rewritten once
+    per save() (or once when a `with` block exits cleanly), however many
+    stocks were added, moved or removed. List order is kept, and lists that
+    gained a ticker are re-sorted by ticker on save.
+
+        with StocksStore() as store:
+            for ticker in tickers:
+                store.add_to_watchlist(ticker)
+    """
+
+    LISTS = ("holdings", "watchlist")
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or STOCKS_FILE
+        self.data = load_stocks(self.path)
+        self._index: dict[str, dict] = {}
+        # Entries that cannot be indexed (duplicate or missing ticker), saved back as is
+        self._unindexed: dict[str, list] = {}
+        for name in self.LISTS:
+            items = {}
+            unindexed = []
+            for item in self.data.get(name, []):
+                ticker = item.get("ticker")
+                if not ticker or ticker in items:
+                    unindexed.append(item)
+                else:
+                    items[ticker] = item
+            if unindexed:
+                print(
+                    f"⚠️ {len(unindexed)} {name} entries in {self.path.name} have a duplicate or missing "
+                    "ticker; keeping them unchanged",
+                    file=sys.stderr,
+                )
+            self._index[name] = items
+            self._unindexed[name] = unindexed
+        self._resort = set()
+        self.dirty = False
+
+    def __enter__(self) -> "StocksStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None and self.dirty:
+            self.save()
+
+    def get(self, ticker: str, list_name: str) -> Optional[dict]:
+        return self._index[list_name].get(ticker)
+
+    def tickers(self, list_name: str) -> set:
+        return set(self._index[list_name])
+
+    def _put(self, list_name: str, item: dict) -> None:
+        if item["ticker"] not in self._index[list_name]:
+            self._resort.add(list_name)
+        self._index[list_name][item["ticker"]] = item
+        self.dirty = True
+
+    def add_to_watchlist(
+        self,
+        ticker: str,
+        target: Optional[float] = None,
+        stop: Optional[float] = None,
+        notes: str = "",
+        alerts: Optional[list] = None
+    ) -> bool:
+        """Add a stock to the watchlist (or update its target/stop/notes/alerts)."""
+        existing = self.get(ticker, "watchlist")
+        if existing is not None:
+            if target is not None:
+                existing["target"] = target
+            if stop is not None:
+                existing["stop"] = stop
+            if notes:
+                existing["notes"] = notes
+            if alerts is not None:
+                existing["alerts"] = alerts
+            self.dirty = True
+            return True
+
+        self._put("watchlist", {
+            "ticker": ticker,
+            "target": target,
+            "stop": stop,
+            "alerts": alerts or [],
+            "notes": notes
+        })
+        return True
+
+    def add_to_holdings(
+        self,
+        ticker: str,
+        name: str = "",
+        category: str = "",
+        notes: str = "",
+        target: Optional[float] = None,
+        stop: Optional[float] = None,
+        alerts: Optional[list] = None
+    ) -> bool:
+        """Add a stock to holdings (or update it). Target/stop for 'buy more' alerts."""
+        existing = self.get(ticker, "holdings")
+        if existing is not None:
+            if name:
+                existing["name"] = name
+            if category:
+                existing["category"] = category
+            if notes:
+                existing["notes"] = notes
+            if target is not None:
+                existing["target"] = target
+            if stop is not None:
+                existing["stop"] = stop
+            if alerts is not None:
+                existing["alerts"] = alerts
+            self.dirty = True
+            return True
+
+        self._put("holdings", {
+            "ticker": ticker,
+            "name": name,
+            "category": category,
+            "notes": notes,
+            "target": target,
+            "stop": stop,
+            "alerts": alerts or []
+        })
+        return True
+
+    def move_to_holdings(
+        self,
+        ticker: str,
+        name: str = "",
+        category: str = "",
+        notes: str = ""
+    ) -> bool:
+        """Move a stock from watchlist to holdings (you bought it)."""
+        watchlist_item = self._index["watchlist"].pop(ticker, None)
+        if watchlist_item is None:
+            print(f"⚠️ {ticker} not found in watchlist", file=sys.stderr)
+            return False
+
+        self.dirty = True
+        if self.get(ticker, "holdings") is not None:
+            # Already held: keep its target/stop/alerts, update only what was given
+            return self.add_to_holdings(ticker, name=name, category=category, notes=notes)
+        self._put("holdings", {
+            "ticker": ticker,
+            "name": name or watchlist_item.get("notes", ""),
+            "category": category,
+            "notes": notes or f"Bought (was on watchlist with target ${watchlist_item.get('target', 'N/A')})"
+        })
+        return True
+
+    def remove(self, ticker: str, from_list: str = "both") -> bool:
+        """Remove a stock from holdings, watchlist, or both."""
+        removed = False
+        for name in self.LISTS:
+            if from_list not in (name, "both"):
+                continue
+            if self._index[name].pop(ticker, None) is not None:
+                removed = True
+            unindexed = [item for item in self._unindexed[name] if item.get("ticker") != ticker]
+            if len(unindexed) < len(self._unindexed[name]):
+                self._unindexed[name] = unindexed
+                removed = True
+        if removed:
+            self.dirty = True
+        return removed
+
+    def set_alert(self, ticker: str, target: Optional[float] = None, stop: Optional[float] = None) -> bool:
+        """Set buy-more target / stop on an existing holding."""
+        holding = self.get(ticker, "holdings")
+        if holding is None:
+            return False
+        if target is not None:
+            holding["target"] = target
+        if stop is not None:
+            holding["stop"] = stop
+        self.dirty = True
+        return True
+
+    def save(self) -> None:
+        """Write the lists back in one atomic file replace."""
+        for name in self.LISTS:
+            items = list(self._index[name].values()) + self._unindexed[name]
+            if name in self._resort:
+                items.sort(key=lambda x: x.get("ticker") or "")
+            self.data[name] = items
+        save_stocks(self.data, self.path)
+        self._resort.clear()
+        self.dirty = False
 
 
 def get_holdings(data: Optional[dict] = None) -> list:
@@ -88,34 +291,8 @@ def add_to_watchlist(
     alerts: Optional[list] = None
 ) -> bool:
     """Add a stock to the watchlist."""
-    data = load_stocks()
-    
-    # Check if already in watchlist
-    for w in data["watchlist"]:
-        if w.get("ticker") == ticker:
-            # Update existing
-            if target is not None:
-                w["target"] = target
-            if stop is not None:
-                w["stop"] = stop
-            if notes:
-                w["notes"] = notes
-            if alerts is not None:
-                w["alerts"] = alerts
-            save_stocks(data)
-            return True
-    
-    # Add new
-    data["watchlist"].append({
-        "ticker": ticker,
-        "target": target,
-        "stop": stop,
-        "alerts": alerts or [],
-        "notes": notes
-    })
-    data["watchlist"].sort(key=lambda x: x.get("ticker", ""))
-    save_stocks(data)
-    return True
+    with StocksStore() as store:
+        return store.add_to_watchlist(ticker, target, stop, notes, alerts)
 
 
 def add_to_holdings(
@@ -128,40 +305,8 @@ def add_to_holdings(
     alerts: Optional[list] = None
 ) -> bool:
     """Add a stock to holdings. Target/stop for 'buy more' alerts."""
-    data = load_stocks()
-    
-    # Check if already in holdings
-    for h in data["holdings"]:
-        if h.get("ticker") == ticker:
-            # Update existing
-            if name:
-                h["name"] = name
-            if category:
-                h["category"] = category
-            if notes:
-                h["notes"] = notes
-            if target is not None:
-                h["target"] = target
-            if stop is not None:
-                h["stop"] = stop
-            if alerts is not None:
-                h["alerts"] = alerts
-            save_stocks(data)
-            return True
-    
-    # Add new
-    data["holdings"].append({
-        "ticker": ticker,
-        "name": name,
-        "category": category,
-        "notes": notes,
-        "target": target,
-        "stop": stop,
-        "alerts": alerts or []
-    })
-    data["holdings"].sort(key=lambda x: x.get("ticker", ""))
-    save_stocks(data)
-    return True
+    with StocksStore() as store:
+        return store.add_to_holdings(ticker, name, category, notes, target, stop, alerts)
 
 
 def move_to_holdings(
@@ -171,51 +316,14 @@ def move_to_holdings(
     notes: str = ""
 ) -> bool:
     """Move a stock from watchlist to holdings (you bought it)."""
-    data = load_stocks()
-    
-    # Find in watchlist
-    watchlist_item = None
-    for i, w in enumerate(data["watchlist"]):
-        if w.get("ticker") == ticker:
-            watchlist_item = data["watchlist"].pop(i)
-            break
-    
-    if not watchlist_item:
-        print(f"⚠️ {ticker} not found in watchlist", file=sys.stderr)
-        return False
-    
-    # Add to holdings
-    data["holdings"].append({
-        "ticker": ticker,
-        "name": name or watchlist_item.get("notes", ""),
-        "category": category,
-        "notes": notes or f"Bought (was on watchlist with target ${watchlist_item.get('target', 'N/A')})"
-    })
-    data["holdings"].sort(key=lambda x: x.get("ticker", ""))
-    save_stocks(data)
-    return True
+    with StocksStore() as store:
+        return store.move_to_holdings(ticker, name, category, notes)
 
 
 def remove_stock(ticker: str, from_list: str = "both") -> bool:
     """Remove a stock from holdings, watchlist, or both."""
-    data = load_stocks()
-    removed = False
-    
-    if from_list in ("holdings", "both"):
-        original_len = len(data["holdings"])
-        data["holdings"] = [h for h in data["holdings"] if h.get("ticker") != ticker]
-        if len(data["holdings"]) < original_len:
-            removed = True
-    
-    if from_list in ("watchlist", "both"):
-        original_len = len(data["watchlist"])
-        data["watchlist"] = [w for w in data["watchlist"] if w.get("ticker") != ticker]
-        if len(data["watchlist"]) < original_len:
-            removed = True
-    
-    if removed:
-        save_stocks(data)
-    return removed
+    with StocksStore() as store:
+        return store.remove(ticker, from_list)
 
 
 def list_stocks(show_holdings: bool = True, show_watchlist: bool = True):
@@ -251,7 +359,7 @@ def main():
     
     # add-watchlist
     add_watch = subparsers.add_parser("add-watchlist", help="Add to watchlist")
-    add_watch.add_argument("ticker", help="Stock ticker")
+    add_watch.add_argument("tickers", nargs="+", help="Stock ticker(s)")
     add_watch.add_argument("--target", type=float, help="Target price")
     add_watch.add_argument("--stop", type=float, help="Stop loss")
     add_watch.add_argument("--notes", default="", help="Notes")
@@ -293,8 +401,11 @@ def main():
         list_stocks(show_holdings=show_h, show_watchlist=show_w)
     
     elif args.command == "add-watchlist":
-        add_to_watchlist(args.ticker.upper(), args.target, args.stop, args.notes)
-        print(f"✅ Added {args.ticker.upper()} to watchlist")
+        tickers = [t.upper() for t in args.tickers]
+        with StocksStore() as store:
+            for ticker in tickers:
+                store.add_to_watchlist(ticker, args.target, args.stop, args.notes)
+        print(f"✅ Added {', '.join(tickers)} to watchlist")
     
     elif args.command == "add-holding":
         add_to_holdings(args.ticker.upper(), args.name, args.category, args.notes,
@@ -312,19 +423,11 @@ def main():
             print(f"⚠️ {args.ticker.upper()} not found")
     
     elif args.command == "set-alert":
-        data = load_stocks()
-        found = False
-        for h in data["holdings"]:
-            if h.get("ticker") == args.ticker.upper():
-                if args.target is not None:
-                    h["target"] = args.target
-                if args.stop is not None:
-                    h["stop"] = args.stop
-                save_stocks(data)
-                found = True
-                print(f"✅ Set alert on {args.ticker.upper()}: target=${args.target}, stop=${args.stop}")
-                break
-        if not found:
+        with StocksStore() as store:
+            found = store.set_alert(args.ticker.upper(), args.target, args.stop)
+        if found:
+            print(f"✅ Set alert on {args.ticker.upper()}: target=${args.target}, stop=${args.stop}")
+        else:
             print(f"⚠️ {args.ticker.upper()} not found in holdings")
     
     else:
@@ -7,8 +7,13 @@ import argparse
 import json
 import os
 import re
+import signal
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from datetime import datetime
 from difflib import SequenceMatcher
@@ -20,9 +25,18 @@ from vfinance_news.utils import clamp_timeout, compute_deadline, ensure_venv, ti
 
 ensure_venv()
 
+from vfinance_news import llm_cache
 from vfinance_news.fetch_news import PortfolioError, get_market_news, get_portfolio_movers, get_portfolio_news
+from vfinance_news.prompt_budget import (
+    DEFAULT_TOKEN_BUDGET,
+    PromptItem,
+    PromptSection,
+    compact_prompt,
+    estimate_tokens,
+    region_lines,
+)
 from vfinance_news.ranking import rank_headlines
-from vfinance_news.research import generate_research_content
+from vfinance_news.research import DEFAULT_RESEARCH_SECTIONS, generate_research_content
 
 SCRIPT_DIR = Path(__file__).parent
 CONFIG_DIR = SCRIPT_DIR.parent / "config"
@@ -36,6 +50,11 @@ HEADLINE_MERGE_THRESHOLD = 0.82
 HEADLINE_MAX_AGE_HOURS = 72
 WATCHPOINTS_BIG_MOVE_THRESHOLD = 1.0  # Match get_portfolio_movers min_abs_change
 BRIEFING_CUTOFF_HOUR = 12
+BRIEFING_SESSION_ID = "vfinance-news-briefing"
+# Seconds the LLM summary may take before the deterministic one is used
+DEFAULT_LLM_CUTOFF_SEC = 90
+PROCESS_POLL_SEC = 0.2
+PROCESS_TERM_GRACE_SEC = 2
 
 STOPWORDS = {
     "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
@@ -72,6 +91,7 @@ class MoverContext:
     matched_headline: dict | None
     move_type: str  # "earnings" | "company_specific" | "sector" | "market_wide" | "unknown"
     vs_index: float | None
+    earnings: dict | None = None  # recent report with actuals and surprise %
 
 
 @dataclass
@@ -135,19 +155,9 @@ def ticker_to_name(symbol: str, portfolio_meta: dict | None = None) -> str:
 
 def load_portfolio_metadata() -> dict:
     """Load portfolio metadata keyed by upper-cased symbol."""
-    portfolio_meta: dict = {}
-    portfolio_csv = CONFIG_DIR / "portfolio.csv"
-    if not portfolio_csv.exists():
-        return portfolio_meta
+    from vfinance_news import portfolio
 
-    import csv
-
-    with open(portfolio_csv, "r") as f:
-        for row in csv.DictReader(f):
-            sym_key = row.get("symbol", "").strip().upper()
-            if sym_key:
-                portfolio_meta[sym_key] = row
-    return portfolio_meta
+    return portfolio.portfolio_metadata()
 
 
 def format_symbol_display(symbol: str, info: dict | None = None, portfolio_meta: dict | None = None) -> str:
@@ -413,7 +423,12 @@ def run_agent_prompt(prompt: str, deadline: float | None = None, session_id: str
 
     Uses the gateway's configured default model with automatic fallback.
     Model selection is configured in openclaw.json, not per-request.
+    Successful replies are cached by (session, prompt).
     """
+    cached = llm_cache.get(session_id, "", prompt)
+    if cached is not None:
+        return cached
+
     try:
         cli_timeout = clamp_timeout(timeout, deadline)
         proc_timeout = clamp_timeout(timeout + 10, deadline)
@@ -440,7 +455,9 @@ def run_agent_prompt(prompt: str, deadline: float | None = None, session_id: str
         return f"⚠️ LLM error: {exc}"
 
     if result.returncode == 0:
-        return extract_agent_reply(result.stdout)
+        reply = extract_agent_reply(result.stdout)
+        llm_cache.put(session_id, "", prompt, reply)
+        return reply
 
     stderr = result.stderr.strip() or "unknown error"
     return f"⚠️ LLM error: {stderr}"
@@ -533,6 +550,7 @@ def detect_sector_clusters(
     portfolio_meta: dict,
     min_stocks: int = 3,
     min_abs_change: float = 1.0,
+    change_key: str = "change_pct",
 ) -> list[SectorCluster]:
     """Detect sector rotation patterns.
 
@@ -540,6 +558,9 @@ def detect_sector_clusters(
     - 3+ stocks in the same category
     - All moving in the same direction
     - Average move >= min_abs_change
+
+    `change_key` selects the move to cluster on, e.g. "change_5d_pct" for
+    multi-day rotations from the local price store.
     """
     by_category: dict[str, list[dict]] = {}
     for mover in movers:
@@ -555,12 +576,12 @@ def detect_sector_clusters(
             continue
 
         # Split by direction
-        gainers = [s for s in stocks if s.get("change_pct", 0) >= min_abs_change]
-        losers = [s for s in stocks if s.get("change_pct", 0) <= -min_abs_change]
+        gainers = [s for s in stocks if s.get(change_key, 0) >= min_abs_change]
+        losers = [s for s in stocks if s.get(change_key, 0) <= -min_abs_change]
 
         for group, direction in [(gainers, "up"), (losers, "down")]:
             if len(group) >= min_stocks:
-                avg_change = sum(s.get("change_pct", 0) for s in group) / len(group)
+                avg_change = sum(s.get(change_key, 0) for s in group) / len(group)
                 # Create MoverContext objects for stocks in cluster
                 mover_contexts = [
                     MoverContext(
@@ -590,11 +611,16 @@ def classify_move_type(
     in_sector_cluster: bool,
     change_pct: float,
     index_change: float,
+    reported_earnings: bool = False,
 ) -> str:
     """Classify the type of move.
 
     Returns: "earnings" | "sector" | "market_wide" | "company_specific" | "unknown"
     """
+    # Reported in the last few days (earnings results cache)
+    if reported_earnings:
+        return "earnings"
+
     # Check for earnings news
     if matched_headline:
         title_lower = matched_headline.get("title", "").lower()
@@ -620,13 +646,29 @@ def classify_move_type(
     return "unknown"
 
 
+def load_recent_earnings_results() -> dict:
+    """Results of recent reports from the earnings cache (no network)."""
+    from vfinance_news.earnings import load_earnings_results
+    try:
+        return load_earnings_results()
+    except Exception as e:
+        print(f"⚠️ Could not read earnings results: {e}", file=sys.stderr)
+        return {}
+
+
 def build_watchpoints_data(
     movers: list[dict],
     headlines: list[dict],
     portfolio_meta: dict,
     index_change: float,
+    earnings_results: dict | None = None,
 ) -> WatchpointsData:
-    """Build enriched watchpoints data from raw movers and headlines."""
+    """Build enriched watchpoints data from raw movers and headlines.
+
+    earnings_results ({symbol: result} from earnings.load_earnings_results)
+    labels movers that reported recently as earnings-driven.
+    """
+    earnings_results = {k.upper(): v for k, v in (earnings_results or {}).items()}
     # Detect sector clusters first
     sector_clusters = detect_sector_clusters(movers, portfolio_meta)
 
@@ -656,7 +698,10 @@ def build_watchpoints_data(
         in_cluster = symbol_upper in clustered_symbols
 
         # Classify move type
-        move_type = classify_move_type(matched_headline, in_cluster, change_pct, index_change)
+        reported = earnings_results.get(symbol_upper)
+        move_type = classify_move_type(
+            matched_headline, in_cluster, change_pct, index_change, reported_earnings=reported is not None
+        )
 
         # Calculate relative performance
         vs_index = change_pct - index_change
@@ -669,6 +714,7 @@ def build_watchpoints_data(
             matched_headline=matched_headline,
             move_type=move_type,
             vs_index=vs_index,
+            earnings=reported,
         ))
 
     # Sort by absolute change
@@ -685,6 +731,18 @@ def build_watchpoints_data(
     )
 
 
+def _earnings_context(result: dict) -> str:
+    """' -- earnings: EPS 1.60 vs 1.50 est (+6.7%)' for a mover that just reported."""
+    if result.get("eps_actual") is None:
+        return " -- earnings"
+    text = f" -- earnings: EPS {result['eps_actual']:.2f}"
+    if result.get("eps_estimate") is not None:
+        text += f" vs {result['eps_estimate']:.2f} est"
+    if result.get("eps_surprise_pct") is not None:
+        text += f" ({result['eps_surprise_pct']:+.1f}%)"
+    return text
+
+
 def format_watchpoints(
     data: WatchpointsData,
     labels: dict,
@@ -738,6 +796,8 @@ def format_watchpoints(
             source = mover.matched_headline.get("source", "")
             source_str = f" ({source})" if source else ""
             context = f": {headline_text}{source_str}"
+        elif mover.earnings:
+            context = _earnings_context(mover.earnings)
         elif mover.move_type == "market_wide":
             context = labels.get("follows_market", " -- follows market")
         else:
@@ -923,12 +983,65 @@ def select_top_headline_ids(shortlist: list[dict], deadline: float | None) -> li
     return clean[:TOP_HEADLINES_COUNT]
 
 
+class ProcessCancelled(Exception):
+    """Raised when a running subprocess was stopped because its result is no longer needed."""
+
+
+def _stop_process(proc: subprocess.Popen) -> None:
+    """Terminate a process group, escalating to SIGKILL after a grace period."""
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(proc.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            return
+        try:
+            proc.communicate(timeout=PROCESS_TERM_GRACE_SEC)
+            return
+        except subprocess.TimeoutExpired:
+            continue
+
+
+def run_cancellable(
+    cmd: list[str],
+    timeout: float,
+    cancel: threading.Event | None = None,
+) -> subprocess.CompletedProcess:
+    """subprocess.run(capture_output=True, text=True) that can be cancelled.
+
+    The command runs in its own process group so cancellation or timeout
+    also stops anything it spawned.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+    )
+    end = time.monotonic() + timeout
+    while True:
+        try:
+            stdout, stderr = proc.communicate(timeout=PROCESS_POLL_SEC)
+            return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+        except subprocess.TimeoutExpired:
+            if cancel is not None and cancel.is_set():
+                _stop_process(proc)
+                raise ProcessCancelled()
+            if time.monotonic() >= end:
+                _stop_process(proc)
+                raise subprocess.TimeoutExpired(cmd, timeout)
+
+
 def summarize_with_openclaw(
     content: str,
     style: str = "briefing",
     deadline: float | None = None,
+    cancel: threading.Event | None = None,
 ) -> str:
-    """Generate AI summary via OpenClaw agent."""
+    """Generate AI summary via OpenClaw agent.
+
+    Setting `cancel` stops the agent process and returns an error reply.
+    """
     prompt = f"""{STYLE_PROMPTS.get(style, STYLE_PROMPTS['briefing'])}
 
 Use only the following information for the briefing:
@@ -936,21 +1049,26 @@ Use only the following information for the briefing:
 {content}
 """
 
+    cached = llm_cache.get(BRIEFING_SESSION_ID, style, prompt)
+    if cached is not None:
+        return cached + format_disclaimer()
+
     try:
         cli_timeout = clamp_timeout(120, deadline)
         proc_timeout = clamp_timeout(150, deadline)
-        result = subprocess.run(
+        result = run_cancellable(
             [
                 'openclaw', 'agent',
-                '--session-id', 'vfinance-news-briefing',
+                '--session-id', BRIEFING_SESSION_ID,
                 '--message', prompt,
                 '--json',
                 '--timeout', str(cli_timeout)
             ],
-            capture_output=True,
-            text=True,
-            timeout=proc_timeout
+            timeout=proc_timeout,
+            cancel=cancel,
         )
+    except ProcessCancelled:
+        return "⚠️ OpenClaw briefing error: cancelled"
     except subprocess.TimeoutExpired:
         return "⚠️ OpenClaw briefing error: timeout"
     except TimeoutError:
@@ -962,6 +1080,7 @@ Use only the following information for the briefing:
 
     if result.returncode == 0:
         reply = extract_agent_reply(result.stdout)
+        llm_cache.put(BRIEFING_SESSION_ID, style, prompt, reply)
         # Add financial disclaimer
         reply += format_disclaimer()
         return reply
@@ -970,41 +1089,90 @@ Use only the following information for the briefing:
     return f"⚠️ OpenClaw briefing error: {stderr}"
 
 
+def race_llm_summary(
+    content: str,
+    style: str,
+    deadline: float | None,
+    cutoff_sec: float,
+    fallback,
+) -> tuple[str, str]:
+    """Race the LLM summary against a deterministic fallback.
+
+    The LLM runs in the background while `fallback()` builds the
+    deterministic summary. The LLM reply is used if it succeeds within
+    `cutoff_sec` (and the deadline); otherwise its process is stopped and
+    the fallback is returned. Returns (summary, model_used).
+    """
+    started = time.monotonic()
+    cancel = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="llm-summary")
+    future = executor.submit(summarize_with_openclaw, content, style, deadline=deadline, cancel=cancel)
+    try:
+        deterministic = fallback()
+        wait_sec = cutoff_sec - (time.monotonic() - started)
+        remaining = time_left(deadline)
+        if remaining is not None:
+            wait_sec = min(wait_sec, remaining)
+        try:
+            summary = future.result(timeout=max(0.0, wait_sec))
+        except FutureTimeoutError:
+            cancel.set()
+            print(f"⚠️ LLM summary missed {cutoff_sec:g}s cutoff; using deterministic summary", file=sys.stderr)
+            return deterministic, "deterministic_llm_cutoff"
+    finally:
+        executor.shutdown(wait=False)
+
+    if summary.startswith("⚠️"):
+        print(summary, file=sys.stderr)
+        return deterministic, "deterministic_llm_failed"
+    return summary, "openclaw"
+
+
+def resolve_llm_cutoff(args, config: dict) -> float:
+    """LLM cutoff from --llm-cutoff, then config `llm_cutoff_sec`, then the default."""
+    cutoff = getattr(args, "llm_cutoff", None)
+    if cutoff is None:
+        cutoff = config.get("llm_cutoff_sec", DEFAULT_LLM_CUTOFF_SEC)
+    if not isinstance(cutoff, (int, float)) or cutoff <= 0:
+        print(f"⚠️ Invalid LLM cutoff {cutoff!r}; using {DEFAULT_LLM_CUTOFF_SEC}s", file=sys.stderr)
+        return DEFAULT_LLM_CUTOFF_SEC
+    return cutoff
+
+
 def format_market_data(market_data: dict) -> str:
     """Format market data for the prompt."""
     lines = ["## Market Data\n"]
     
     for region, data in market_data.get('markets', {}).items():
-        lines.append(f"### {data['name']}")
-        for symbol, idx in data.get('indices', {}).items():
-            if 'data' in idx and idx['data']:
-                price = idx['data'].get('price', 'N/A')
-                change_pct = idx['data'].get('change_percent', 0)
-                lines.append(f"- {idx['name']}: {price} ({change_pct:+.2f}%)")
+        lines.extend(region_lines(data))
         lines.append("")
     
     return '\n'.join(lines)
 
 
+def _headline_line(article: dict) -> str:
+    source = article.get('source')
+    if not source:
+        sources = article.get('sources')
+        if isinstance(sources, (set, list, tuple)) and sources:
+            source = ", ".join(sorted(sources))
+        else:
+            source = "Unknown"
+    title = article.get('title', '')
+    link = article.get('link', '')
+    if not link:
+        links = article.get('links')
+        if isinstance(links, (set, list, tuple)) and links:
+            link = sorted([str(item).strip() for item in links if str(item).strip()])[0]
+    return f"- {title} | {source} | {link}"
+
+
 def format_headlines(headlines: list) -> str:
     """Format headlines for the prompt."""
     lines = ["## Headlines\n"]
 
     for article in headlines[:MAX_HEADLINES_IN_PROMPT]:
-        source = article.get('source')
-        if not source:
-            sources = article.get('sources')
-            if isinstance(sources, (set, list, tuple)) and sources:
-                source = ", ".join(sorted(sources))
-            else:
-                source = "Unknown"
-        title = article.get('title', '')
-        link = article.get('link', '')
-        if not link:
-            links = article.get('links')
-            if isinstance(links, (set, list, tuple)) and links:
-                link = sorted([str(item).strip() for item in links if str(item).strip()])[0]
-        lines.append(f"- {title} | {source} | {link}")
+        lines.append(_headline_line(article))
 
     return '\n'.join(lines)
 
@@ -1033,21 +1201,16 @@ def format_sources(headlines: list, labels: dict) -> str:
     return "\n".join(lines)
 
 
-def format_portfolio_news(portfolio_data: dict) -> str:
-    """Format portfolio news for the prompt.
+def _portfolio_entries(portfolio_data: dict) -> dict[str, list[tuple[float, str, str]]]:
+    """Formatted portfolio stock entries grouped by type, highest priority first.
 
-    Stocks are sorted by priority score within each type group.
-    Priority factors: position type (40%), price volatility (35%), news volume (25%).
+    Returns {type: [(score, symbol, formatted_entry), ...]}.
     """
-    lines = ["## Portfolio News\n"]
     portfolio_meta = load_portfolio_metadata()
 
-    # Group by type with scores: {type: [(score, formatted_entry), ...]}
-    by_type: dict[str, list[tuple[float, str]]] = {'Holding': [], 'Watchlist': []}
+    by_type: dict[str, list[tuple[float, str, str]]] = {'Holding': [], 'Watchlist': []}
 
     stocks = portfolio_data.get('stocks', {})
-    if not stocks:
-        return ""
 
     for symbol, data in stocks.items():
         info = data.get('info', {})
@@ -1090,23 +1253,87 @@ def format_portfolio_news(portfolio_data: dict) -> str:
                 entry.append(f"- {title}")
         entry.append("")
 
-        by_type[t].append((score, '\n'.join(entry)))
+        by_type[t].append((score, symbol, '\n'.join(entry)))
 
     # Sort each group by score (highest first)
     for stock_type in by_type:
         by_type[stock_type].sort(key=lambda x: x[0], reverse=True)
+    return by_type
+
+
+def format_portfolio_news(portfolio_data: dict) -> str:
+    """Format portfolio news for the prompt.
+
+    Stocks are sorted by priority score within each type group.
+    Priority factors: position type (40%), price volatility (35%), news volume (25%).
+    """
+    if not portfolio_data.get('stocks'):
+        return ""
+
+    lines = ["## Portfolio News\n"]
+    by_type = _portfolio_entries(portfolio_data)
 
     if by_type['Holding']:
         lines.append("### Holdings (Priority)\n")
-        lines.extend(entry for _, entry in by_type['Holding'])
+        lines.extend(entry for _, _, entry in by_type['Holding'])
 
     if by_type['Watchlist']:
         lines.append("### Watchlist\n")
-        lines.extend(entry for _, entry in by_type['Watchlist'])
+        lines.extend(entry for _, _, entry in by_type['Watchlist'])
 
     return '\n'.join(lines)
 
 
+def build_prompt_sections(
+    market_data: dict,
+    headline_shortlist: list[dict],
+    top_headlines: list[dict],
+    portfolio_data: dict | None,
+    labels: dict,
+) -> list[PromptSection]:
+    """LLM prompt content as scored sections for compaction.
+
+    Index data, selected headlines and their source references are always
+    kept; other shortlist headlines are scored by rank and portfolio stocks
+    by priority score (holdings and watchlist ranked together, so holdings
+    go last). Headline descriptions are left out, as in the uncompacted prompt.
+    """
+    sections = []
+    if market_data:
+        sections.append(PromptSection("## Market Data", [
+            PromptItem('\n'.join(region_lines(data)), label=data['name'], required=True)
+            for data in market_data.get('markets', {}).values()
+        ]))
+        shortlist = headline_shortlist[:MAX_HEADLINES_IN_PROMPT]
+        if shortlist:
+            selected = {id(item) for item in top_headlines}
+            sections.append(PromptSection("## Headlines", [
+                PromptItem(
+                    _headline_line(article),
+                    score=float(len(shortlist) - rank),
+                    label=article.get('title', ''),
+                    required=id(article) in selected,
+                )
+                for rank, article in enumerate(shortlist)
+            ]))
+            source_items = []
+            for idx, article in enumerate(top_headlines, start=1):
+                links = sorted({article.get('link', '').strip(), *article.get('links', [])} - {''})
+                if links:
+                    source_items.append(PromptItem(f"[{idx}] {links[0]}", label=f"[{idx}]", required=True))
+            sections.append(PromptSection(f"## {labels.get('sources_header', 'Sources')}", source_items))
+
+    if portfolio_data and portfolio_data.get('stocks'):
+        by_type = _portfolio_entries(portfolio_data)
+        for stock_type, header in (('Holding', "## Portfolio News - Holdings (Priority)"),
+                                   ('Watchlist', "## Portfolio News - Watchlist")):
+            sections.append(PromptSection(header, [
+                PromptItem(entry.rstrip(), score=score, label=symbol)
+                for score, symbol, entry in by_type[stock_type]
+            ], group="portfolio"))
+    return sections
+
+
 def classify_sentiment(market_data: dict, portfolio_data: dict | None = None) -> dict:
     """Classify market sentiment and return details for explanation.
 
@@ -1344,6 +1571,7 @@ def build_briefing_summary(
         headlines=headlines,
         portfolio_meta=portfolio_meta,
         index_change=index_change,
+        earnings_results=load_recent_earnings_results(),
     )
     watchpoints_text = format_watchpoints(watchpoints_data, labels)
     lines.append(watchpoints_text)
@@ -1380,8 +1608,20 @@ def validate_briefing_structure(summary: str, labels: dict) -> tuple[bool, list[
 
 
 def generate_briefing(args):
-    """Generate full market briefing."""
+    """Generate full market briefing.
+
+    With --stream, NDJSON events are printed as stages complete (markets,
+    headlines, portfolio, summary) followed by a `final` event whose
+    `document` is exactly the --json output.
+    """
     config = load_config()
+    stream = getattr(args, "stream", False)
+
+    def emit(event: str, **data) -> None:
+        if stream:
+            print(json.dumps({"event": event, **data}, ensure_ascii=False, default=sorted), flush=True)
+
+    llm_cache.reset_stats()
     briefing_time = infer_briefing_time()
     labels = ENGLISH_LABELS
     fast_mode = args.fast or os.environ.get("VFINANCE_NEWS_FAST") == "1"
@@ -1416,6 +1656,7 @@ def generate_briefing(args):
         subprocess_timeout=subprocess_timeout,
         headline_max_age_hours=headline_max_age,
     )
+    emit("markets", markets=market_data.get("markets", {}))
 
     # Model selection is now handled by the openclaw gateway (configured in openclaw.json)
     # Environment variables for model override are deprecated
@@ -1433,6 +1674,7 @@ def generate_briefing(args):
         deadline=headline_deadline,
         shortlist_size=shortlist_size,
     )
+    emit("headlines", top_headlines=top_headlines, shortlist=headline_shortlist)
     
     # Get portfolio news (limit stocks for performance)
     portfolio_deadline = deadline
@@ -1460,21 +1702,19 @@ def generate_briefing(args):
     except Exception as exc:
         print(f"⚠️ Skipping portfolio movers: {exc}", file=sys.stderr)
         movers = []
-
-    # Build raw content for summarization
-    content_parts = []
-
-    if market_data:
-        content_parts.append(format_market_data(market_data))
-        if headline_shortlist:
-            content_parts.append(format_headlines(headline_shortlist))
-            content_parts.append(format_sources(top_headlines, labels))
-
-    # Only include portfolio if fetch succeeded (no error key)
-    if portfolio_data:
-        content_parts.append(format_portfolio_news(portfolio_data))
-
-    raw_content = '\n\n'.join(content_parts)
+    emit("portfolio", portfolio=portfolio_data, movers=movers)
+
+    # Build raw content for summarization, compacted to the prompt token budget
+    token_budget = config.get("prompt_token_budget", DEFAULT_TOKEN_BUDGET)
+    prompt_sections = build_prompt_sections(
+        market_data,
+        headline_shortlist,
+        top_headlines,
+        portfolio_data,
+        labels,
+    )
+    compacted = compact_prompt(prompt_sections, token_budget)
+    raw_content = compacted.text
 
     debug_written = False
     debug_payload = {}
@@ -1483,6 +1723,7 @@ def generate_briefing(args):
             "selected_headlines": top_headlines,
             "headline_shortlist": headline_shortlist,
             "headline_model_used": headline_model_used,
+            "prompt_compaction": compacted.report(),
         })
 
     def write_debug_once(extra: dict | None = None) -> None:
@@ -1498,27 +1739,42 @@ def generate_briefing(args):
     if not raw_content.strip():
         write_debug_once()
         print("⚠️ No data available for briefing", file=sys.stderr)
+        emit("aborted", reason="No data available for briefing")
         return
 
     if not top_headlines:
         write_debug_once()
         print("⚠️ No headlines available; skipping summary generation", file=sys.stderr)
+        emit("aborted", reason="No headlines available")
         return
 
     remaining = time_left(deadline)
     if remaining is not None and remaining <= 0 and not top_headlines:
         write_debug_once()
         print("⚠️ Deadline exceeded; skipping summary generation", file=sys.stderr)
+        emit("aborted", reason="Deadline exceeded")
         return
 
     research_report = ''
     source = 'none'
     if args.research:
-        research_result = generate_research_content(market_data, portfolio_data)
+        research_result = generate_research_content(
+            market_data,
+            portfolio_data,
+            token_budget=token_budget,
+            sections=DEFAULT_RESEARCH_SECTIONS,
+        )
         research_report = research_result['report']
         source = research_result['source']
+        if args.debug and research_result.get('prompt'):
+            debug_payload["research_prompt_compaction"] = research_result['prompt']
 
     if research_report.strip():
+        # The research report shares the budget with the raw data
+        compacted = compact_prompt(prompt_sections, max(0, token_budget - estimate_tokens(research_report)))
+        raw_content = compacted.text
+        if args.debug:
+            debug_payload["prompt_compaction"] = compacted.report()
         content = f"""# Research Report ({source})
 
 {research_report}
@@ -1553,6 +1809,24 @@ def generate_briefing(args):
                 "summary_model_used": summary_model_used,
                 "summary_model_attempts": summary_attempts,
             })
+    elif args.style == "briefing":
+        # Deterministic summary is built while the LLM runs; the LLM wins only before the cutoff
+        cutoff = resolve_llm_cutoff(args, config)
+        print(f"🤖 Generating AI summary via OpenClaw ({cutoff:g}s cutoff)", file=sys.stderr)
+        summary, summary_model_used = race_llm_summary(
+            content,
+            args.style,
+            deadline,
+            cutoff,
+            lambda: build_briefing_summary(market_data, portfolio_data, movers, top_headlines, labels),
+        )
+        summary_mode = "llm" if summary_model_used == "openclaw" else "deterministic"
+        if args.debug:
+            debug_payload.update({
+                "summary_model_used": summary_model_used,
+                "summary_model_attempts": summary_attempts,
+                "summary_llm_cutoff_sec": cutoff,
+            })
     else:
         print("🤖 Generating AI summary via OpenClaw", file=sys.stderr)
         summary_mode = "llm"
@@ -1573,6 +1847,13 @@ def generate_briefing(args):
     summary_missing_sections: list[str] = []
     if args.style == "briefing":
         summary_structure_ok, summary_missing_sections = validate_briefing_structure(summary, labels)
+    emit(
+        "summary",
+        summary=summary,
+        summary_mode=summary_mode,
+        summary_model_used=summary_model_used,
+        summary_structure_ok=summary_structure_ok,
+    )
     
     # Format output
     now = datetime.now()
@@ -1613,8 +1894,8 @@ def generate_briefing(args):
         
     write_debug_once()
 
-    if args.json:
-        print(json.dumps({
+    if args.json or stream:
+        document = {
             'title': f"{prefix} {title}",
             'date': date_str,
             'time': time_str,
@@ -1629,6 +1910,7 @@ def generate_briefing(args):
                 'style': args.style,
                 'llm_requested': bool(args.llm),
                 'fast_mode': bool(fast_mode),
+                'llm_cache': llm_cache.stats(),
             },
             'macro_message': macro_output,
             'portfolio_message': portfolio_output, # New field
@@ -1640,7 +1922,11 @@ def generate_briefing(args):
                 'market': market_data,
                 'portfolio': portfolio_data
             }
-        }, indent=2, ensure_ascii=False))
+        }
+        if stream:
+            emit("final", document=document)
+        else:
+            print(json.dumps(document, indent=2, ensure_ascii=False))
     else:
         print(macro_output)
         if portfolio_output:
@@ -1653,8 +1939,13 @@ def main():
     parser.add_argument('--style', choices=['briefing', 'analysis', 'headlines'],
                         default='briefing', help='Summary style')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--stream', action='store_true',
+                        help='Output NDJSON events as stages complete; the final event holds the --json document')
     parser.add_argument('--research', action='store_true', help='Include deep research section (slower)')
     parser.add_argument('--llm', action='store_true', help='Use LLM for briefing (default: deterministic)')
+    parser.add_argument('--llm-cutoff', type=float, default=None,
+                        help=f'Seconds to wait for the LLM before using the deterministic briefing '
+                             f'(default: config llm_cutoff_sec or {DEFAULT_LLM_CUTOFF_SEC})')
     parser.add_argument('--deadline', type=int, default=None, help='Overall deadline in seconds')
     parser.add_argument('--fast', action='store_true', help='Use fast mode (shorter timeouts, fewer items)')
     parser.add_argument('--debug', action='store_true', help='Write debug log with sources')